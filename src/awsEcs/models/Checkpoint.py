@@ -0,0 +1,90 @@
+import json
+
+class Checkpoint:
+    """Progress of an input file processed in shards, saved so a stopped task can resume it.
+
+    Every shard's output is appended to one multipart upload of the output
+    file. Each time a part is uploaded, the checkpoint records the part's
+    ETag and the first shard whose output isn't uploaded yet, so a restarted
+    task skips the shards before it. A checkpoint only applies to the same
+    input file (by ETag) split the same way into the same output file.
+
+    Attributes:
+        inputKey (str): key of the input file
+        inputETag (str): ETag of the input file when it was first processed
+        outName (str): name of the output file
+        shardCount (int): number of shards the input file was split into
+        uploadId (str): ID of the output file's multipart upload
+        parts (list[dict]): part number and ETag of each uploaded part, in order
+        nextShard (int): index of the first shard whose output isn't uploaded yet
+        offset (int): byte offset in the input file where that shard starts
+        rowsOut (int): number of rows in the uploaded output
+        size (int): size in bytes of the uploaded output
+        schema (dict[str, str]): type of each column in the output, by name
+        complete (bool): whether the output file's upload has been completed
+    """
+
+    def __init__(self, inputKey: str, inputETag: str, outName: str, shardCount: int, uploadId: str,
+                 parts: list[dict] = None, nextShard: int = 0, offset: int = 0, rowsOut: int = 0, size: int = 0,
+                 schema: dict[str, str] = None, complete: bool = False) -> None:
+        """Constructs a Checkpoint object.
+
+        Args:
+            inputKey (str): key of the input file
+            inputETag (str): ETag of the input file
+            outName (str): name of the output file
+            shardCount (int): number of shards the input file was split into
+            uploadId (str): ID of the output file's multipart upload
+            parts (list[dict], optional): part number and ETag of each uploaded part; defaults to none
+            nextShard (int, optional): index of the first shard whose output isn't uploaded yet; defaults to 0
+            offset (int, optional): byte offset in the input file where that shard starts; defaults to 0
+            rowsOut (int, optional): number of rows in the uploaded output; defaults to 0
+            size (int, optional): size in bytes of the uploaded output; defaults to 0
+            schema (dict[str, str], optional): type of each column in the output, by name; defaults to none
+            complete (bool, optional): whether the output file's upload has been completed; defaults to False
+        """
+        self.inputKey = inputKey
+        self.inputETag = inputETag
+        self.outName = outName
+        self.shardCount = shardCount
+        self.uploadId = uploadId
+        self.parts = list(parts or [])
+        self.nextShard = nextShard
+        self.offset = offset
+        self.rowsOut = rowsOut
+        self.size = size
+        self.schema = dict(schema or {})
+        self.complete = complete
+
+    def matches(self, inputETag: str, outName: str, shardCount: int) -> bool:
+        """Checks whether the checkpoint applies to a run of the task.
+
+        Args:
+            inputETag (str): current ETag of the input file
+            outName (str): name of the output file the run writes
+            shardCount (int): number of shards the run splits the input file into
+
+        Returns:
+            bool: whether the run can resume from the checkpoint
+        """
+        return (self.inputETag, self.outName, self.shardCount) == (inputETag, outName, shardCount)
+
+    def toJson(self) -> bytes:
+        """Serializes the checkpoint.
+
+        Returns:
+            bytes: the checkpoint as UTF-8 JSON
+        """
+        return json.dumps(vars(self)).encode('utf8')
+
+    @classmethod
+    def fromJson(cls, data: bytes) -> 'Checkpoint':
+        """Deserializes a checkpoint.
+
+        Args:
+            data (bytes): the checkpoint as UTF-8 JSON
+
+        Returns:
+            Checkpoint: the checkpoint
+        """
+        return cls(**json.loads(data))
@@ -0,0 +1,113 @@
+from typing import Callable
+
+class CsvShard:
+    """A byte range of a CSV file, holding the rows that start inside it.
+
+    Rows are split on newlines, so a shard can be read with S3 ranged GETs
+    without reading the rest of the file: a shard skips the partial row it
+    starts in (the previous shard finishes it) and reads past its end to
+    finish its own last row. Quoted fields containing newlines aren't
+    supported.
+
+    Attributes:
+        LOOKAHEAD_SIZE (int): bytes read at a time when looking for the end of a row
+        index (int): 0-based position of the shard in the file
+        start (int): first byte of the range (inclusive)
+        end (int): last byte of the range (exclusive)
+        fileSize (int): size of the whole file in bytes
+        header (bytes): the file's header row, including its newline
+    """
+
+    LOOKAHEAD_SIZE = 64 * 1024
+
+    def __init__(self, index: int, start: int, end: int, fileSize: int, header: bytes) -> None:
+        """Constructs a CsvShard object.
+
+        Args:
+            index (int): 0-based position of the shard in the file
+            start (int): first byte of the range (inclusive); at least the length of the header
+            end (int): last byte of the range (exclusive)
+            fileSize (int): size of the whole file in bytes
+            header (bytes): the file's header row, including its newline
+        """
+        self.index = index
+        self.start = start
+        self.end = end
+        self.fileSize = fileSize
+        self.header = header
+
+    @classmethod
+    def split(cls, header: bytes, fileSize: int, count: int) -> list['CsvShard']:
+        """Splits the rows of a CSV file into shards of about the same size.
+
+        Args:
+            header (bytes): the file's header row, including its newline
+            fileSize (int): size of the whole file in bytes
+            count (int): number of shards
+
+        Returns:
+            list[CsvShard]: the shards, in order
+        """
+        dataStart = len(header)
+        bounds = [dataStart + (fileSize - dataStart) * i // count for i in range(count + 1)]
+        return [cls(i, bounds[i], bounds[i + 1], fileSize, header) for i in range(count)]
+
+    @classmethod
+    def readHeader(cls, readRange: Callable[[int, int], bytes], fileSize: int) -> bytes:
+        """Reads the header row of a CSV file.
+
+        Args:
+            readRange (Callable[[int, int], bytes]): reads the bytes between two positions of the file (both inclusive)
+            fileSize (int): size of the whole file in bytes
+
+        Returns:
+            bytes: the header row, including its newline if it has one
+        """
+        return cls._readToNewline(readRange, 0, fileSize)
+
+    def readRows(self, readRange: Callable[[int, int], bytes]) -> bytes:
+        """Reads the rows that start inside the shard.
+
+        Args:
+            readRange (Callable[[int, int], bytes]): reads the bytes between two positions of the file (both inclusive)
+
+        Returns:
+            bytes: the shard's rows, without the header; empty if no row starts inside it
+        """
+        if self.end <= self.start:
+            return b''
+        # A row starts at position p if byte p - 1 is a newline, so read from the byte before the shard
+        data = readRange(self.start - 1, self.end - 1)
+        newline = data.find(b'\n', 0, len(data) - 1)
+        if newline == -1:
+            return b''
+        rows = data[newline + 1:]
+        if rows.endswith(b'\n') or self.end >= self.fileSize:
+            return rows
+        return rows + self._readToNewline(readRange, self.end, self.fileSize)
+
+    @classmethod
+    def _readToNewline(cls, readRange: Callable[[int, int], bytes], start: int, fileSize: int) -> bytes:
+        """Reads from a position of a file through the next newline, or to the end of the file.
+
+        Args:
+            readRange (Callable[[int, int], bytes]): reads the bytes between two positions of the file (both inclusive)
+            start (int): position to start reading at
+            fileSize (int): size of the whole file in bytes
+
+        Returns:
+            bytes: the bytes read, including the newline
+        """
+        data = bytearray()
+        position = start
+        while position < fileSize:
+            chunk = readRange(position, min(position + cls.LOOKAHEAD_SIZE, fileSize) - 1)
+            if not chunk:
+                break
+            newline = chunk.find(b'\n')
+            if newline != -1:
+                data += chunk[:newline + 1]
+                break
+            data += chunk
+            position += len(chunk)
+        return bytes(data)
@@ -0,0 +1,132 @@
+import pandas as pd
+
+class HintSchema:
+    """Declared column types for hint files, so hint data is loaded compactly instead of as Python strings.
+
+    `getDtypes` gives the types the CSV parser can produce directly
+    (categoricals and small integers), and `apply` finishes the columns it
+    can't: dates become datetimes. `apply` also casts data read from formats
+    that store their own types, and leaves columns that already have the right
+    type alone. `prepareCsv` undoes the conversions CSV files can't keep.
+
+    Coordinates are kept as the text they were read as, leading quote and
+    all, so they reach the next app exactly as they were; converting them to
+    floats would change their digits. Schemas made with `parseCoordinates`
+    trade that for memory: `apply` strips the quote and stores coordinates as
+    `COORDINATE_TYPE`, at 4 bytes a value instead of a Python string, and
+    they are written back as plain numbers.
+
+    Attributes:
+        CATEGORY_COLUMNS (list[str]): low-cardinality columns stored as categoricals
+        INTEGER_COLUMNS (dict[str, str]): small integer columns and their nullable integer types
+        COORDINATE_COLUMNS (list[str]): latitude/longitude columns, which may have a leading quote
+        DATETIME_COLUMNS (list[str]): columns of "YYYY-MM-DD HH:MM:SS" timestamps
+        EPOCH_MS_COLUMNS (list[str]): columns of Unix timestamps in milliseconds
+        DATETIME_FORMAT (str): format of the timestamps in `DATETIME_COLUMNS`
+        COORDINATE_TYPE (str): type coordinates are parsed as, by `apply` and NormalizeCoordinatesStage
+        QUOTE (str): character spreadsheets prefix coordinates with to keep them as text
+        parseCoordinates (bool): whether `apply` parses coordinates as numbers instead of keeping their text
+    """
+
+    CATEGORY_COLUMNS = ['hinttype', 'color', 'completedby', 'county', 'project', 'state', 'updatedby']
+    INTEGER_COLUMNS = {'score': 'Int8'}
+    COORDINATE_COLUMNS = ['latitude', 'longitude']
+    DATETIME_COLUMNS = ['dateadded', 'lastmodified']
+    EPOCH_MS_COLUMNS = ['datecompleted']
+    DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+    COORDINATE_TYPE = 'float32'
+    QUOTE = "'"
+
+    def __init__(self, parseCoordinates: bool = False) -> None:
+        """Constructs a HintSchema object.
+
+        Args:
+            parseCoordinates (bool, optional): whether `apply` parses coordinates as `COORDINATE_TYPE`; defaults to False
+        """
+        self.parseCoordinates: bool = parseCoordinates
+
+    def getDtypes(self, columns: list[str] = None) -> dict[str, str]:
+        """Gets the types for the CSV parser to read hint columns as.
+
+        Coordinates are read as strings, so their text is kept or their quote
+        can be stripped, and dates are read as strings for `apply` to convert.
+
+        Args:
+            columns (list[str], optional): columns being read; defaults to all of them
+
+        Returns:
+            dict[str, str]: type of each column being read that has a declared type
+        """
+        dtypes = {column: 'category' for column in self.CATEGORY_COLUMNS}
+        dtypes.update(self.INTEGER_COLUMNS)
+        dtypes.update({column: 'str' for column in self.COORDINATE_COLUMNS + self.DATETIME_COLUMNS})
+        dtypes.update({column: 'Int64' for column in self.EPOCH_MS_COLUMNS})
+        if columns is not None:
+            dtypes = {column: dtype for column, dtype in dtypes.items() if column in columns}
+        return dtypes
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Converts the hint columns of a DataFrame to their declared types.
+
+        Columns that aren't in the DataFrame are skipped.
+
+        Args:
+            df (pd.DataFrame): hint data, read with or without `getDtypes`
+
+        Raises:
+            ValueError: a date, or a coordinate when `parseCoordinates` is on, can't be parsed
+
+        Returns:
+            pd.DataFrame: the same hint data, with declared types
+        """
+        for column in self.CATEGORY_COLUMNS:
+            if column in df and not isinstance(df[column].dtype, pd.CategoricalDtype):
+                df[column] = df[column].astype('category')
+        for column, dtype in self.INTEGER_COLUMNS.items():
+            if column in df and df[column].dtype != dtype:
+                df[column] = df[column].astype(dtype)
+        for column in self.DATETIME_COLUMNS:
+            if column in df and not pd.api.types.is_datetime64_any_dtype(df[column]):
+                df[column] = pd.to_datetime(df[column], format=self.DATETIME_FORMAT)
+        for column in self.EPOCH_MS_COLUMNS:
+            if column in df and not pd.api.types.is_datetime64_any_dtype(df[column]):
+                df[column] = pd.to_datetime(df[column], unit='ms').astype('datetime64[ns]')
+        if self.parseCoordinates:
+            for column in self.COORDINATE_COLUMNS:
+                if column in df and df[column].dtype != self.COORDINATE_TYPE:
+                    values = df[column]
+                    if pd.api.types.is_object_dtype(values) or pd.api.types.is_string_dtype(values):
+                        values = values.str.lstrip(self.QUOTE)
+                    df[column] = pd.to_numeric(values).astype(self.COORDINATE_TYPE)
+        return df
+
+    def prepareCsv(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Converts typed hint data back to the representation its CSV files use.
+
+        Epoch dates are turned back into milliseconds, so CSV output can be
+        read again with `getDtypes` and the next application sees the same
+        columns it always has.
+
+        Args:
+            df (pd.DataFrame): hint data with declared types
+
+        Returns:
+            pd.DataFrame: a copy of the hint data ready to be written as CSV
+        """
+        converted = {}
+        for column in self.EPOCH_MS_COLUMNS:
+            if column in df and pd.api.types.is_datetime64_any_dtype(df[column]):
+                milliseconds = pd.array(df[column].astype('datetime64[ms]').to_numpy().astype('int64'), dtype='Int64')
+                converted[column] = pd.Series(milliseconds, index=df.index).mask(df[column].isna())
+        return df.assign(**converted)
+
+    def memoryUsage(self, df: pd.DataFrame) -> dict[str, int]:
+        """Measures how much memory each column of a DataFrame takes, including the strings it points to.
+
+        Args:
+            df (pd.DataFrame): hint data
+
+        Returns:
+            dict[str, int]: bytes used by each column
+        """
+        return df.memory_usage(index=False, deep=True).to_dict()
@@ -0,0 +1,140 @@
+import hashlib
+import json
+from datetime import datetime, timezone
+from typing import Iterable, Iterator
+
+import pandas as pd
+
+from awsEcs.models.formats.FileFormat import FileFormat
+
+class OutputManifest:
+    """Describes an output file handed to the next app: where it is, what it holds and how to check it.
+
+    Rows and bytes are added as the output is produced, so the manifest is
+    built without reading the output again.
+
+    Attributes:
+        SUFFIX (str): added to the output file's key to get the manifest's key
+        VERSION (int): version of the manifest's layout
+        key (str): key of the output file in the next app's bucket
+        sourceKey (str): key of the input file the output came from
+        fileFormat (FileFormat): format of the output file
+        rows (int): number of rows in the output file
+        size (int): size of the output file in bytes
+        schema (dict[str, str]): type of each column in the output, by name
+    """
+
+    SUFFIX = '.manifest.json'
+    VERSION = 1
+
+    def __init__(self, key: str, sourceKey: str, fileFormat: FileFormat) -> None:
+        """Constructs an OutputManifest object.
+
+        Args:
+            key (str): key of the output file in the next app's bucket
+            sourceKey (str): key of the input file the output came from
+            fileFormat (FileFormat): format of the output file
+        """
+        self.key = key
+        self.sourceKey = sourceKey
+        self.fileFormat = fileFormat
+        self.rows = 0
+        self.size = 0
+        self.schema: dict[str, str] = {}
+        self._sha256 = hashlib.sha256()
+
+    @property
+    def manifestKey(self) -> str:
+        """Key of the manifest, next to the output file."""
+        return self.key + self.SUFFIX
+
+    @property
+    def sha256(self) -> str:
+        """Hex SHA-256 of the output file's bytes added so far."""
+        return self._sha256.hexdigest()
+
+    def addRows(self, rows: int, schema: dict[str, str]) -> None:
+        """Counts rows of the output and records its schema, if it isn't known yet.
+
+        Args:
+            rows (int): number of rows
+            schema (dict[str, str]): type of each column, by name
+        """
+        self.rows += rows
+        if not self.schema:
+            self.schema = dict(schema)
+
+    def addFrame(self, df: pd.DataFrame) -> None:
+        """Counts the rows of a chunk of output data and records its schema.
+
+        Args:
+            df (pd.DataFrame): the chunk, as it is written
+        """
+        self.addRows(len(df), self.getSchema(df))
+
+    def addBytes(self, data: bytes) -> None:
+        """Adds bytes of the output file to its size and checksum.
+
+        Args:
+            data (bytes): the next part of the output file
+        """
+        self.size += len(data)
+        self._sha256.update(data)
+
+    def trackFrames(self, chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """Passes chunks of output data through, counting their rows.
+
+        Args:
+            chunks (Iterable[pd.DataFrame]): the chunks
+
+        Yields:
+            pd.DataFrame: the next chunk, unchanged
+        """
+        for chunk in chunks:
+            self.addFrame(chunk)
+            yield chunk
+
+    def trackBytes(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """Passes parts of the output file through, adding them to its size and checksum.
+
+        Args:
+            chunks (Iterable[bytes]): the parts
+
+        Yields:
+            bytes: the next part, unchanged
+        """
+        for chunk in chunks:
+            self.addBytes(chunk)
+            yield chunk
+
+    def toJson(self) -> bytes:
+        """Serializes the manifest.
+
+        Returns:
+            bytes: the manifest as UTF-8 JSON
+        """
+        return json.dumps({
+            'version': self.VERSION,
+            'key': self.key,
+            'sourceKey': self.sourceKey,
+            'format': self.fileFormat.NAME,
+            'contentType': self.fileFormat.CONTENT_TYPE,
+            'contentEncoding': self.fileFormat.CONTENT_ENCODING,
+            'rows': self.rows,
+            'size': self.size,
+            'sha256': self.sha256,
+            'schema': [{'name': name, 'type': dtype} for name, dtype in self.schema.items()],
+            'createdAt': datetime.now(timezone.utc).isoformat()
+        }, indent=2).encode('utf8')
+
+    @staticmethod
+    def getSchema(df: pd.DataFrame) -> dict[str, str]:
+        """Gets the type of each column of hint data.
+
+        Args:
+            df (pd.DataFrame): hint data
+
+        Returns:
+            dict[str, str]: pandas type of each column, by name
+        """
+        return {str(column): str(dtype) for column, dtype in df.dtypes.items()}
@@ -0,0 +1,113 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable
+
+class StepExecutor:
+    """Runs named steps on a thread pool, starting each one as soon as the steps it depends on have finished.
+
+    Attributes:
+        maxWorkers (int): number of steps that can run at once
+        steps (dict[str, tuple[Callable[[], Any], list[str]]]): function and dependencies of each step, by name
+        timings (dict[str, float]): seconds each finished step took, by name
+    """
+
+    def __init__(self, maxWorkers: int = 4) -> None:
+        """Constructs a StepExecutor object.
+
+        Args:
+            maxWorkers (int, optional): number of steps that can run at once; defaults to 4
+        """
+        self.maxWorkers = maxWorkers
+        self.steps: dict[str, tuple[Callable[[], Any], list[str]]] = {}
+        self.timings: dict[str, float] = {}
+
+    def addStep(self, name: str, func: Callable[[], Any], dependsOn: list[str] = None) -> None:
+        """Adds a step to be run.
+
+        Args:
+            name (str): unique name of the step
+            func (Callable[[], Any]): function to call for the step
+            dependsOn (list[str], optional): names of steps that must finish first; defaults to none
+
+        Raises:
+            ValueError: a step with the same name was already added
+        """
+        if name in self.steps:
+            raise ValueError(f'Step already added: {name}')
+        self.steps[name] = (func, list(dependsOn or []))
+
+    def run(self) -> dict[str, Any]:
+        """Runs all steps, respecting their dependencies, and prints how long each one took.
+
+        If a step fails, no new steps are started; steps already running are
+        allowed to finish, then the first error is raised.
+
+        Raises:
+            ValueError: a step depends on an unknown step, or the dependencies form a cycle
+
+        Returns:
+            dict[str, Any]: return value of each step, by name
+        """
+        for name, (_, dependsOn) in self.steps.items():
+            unknown = [dep for dep in dependsOn if dep not in self.steps]
+            if unknown:
+                raise ValueError(f'Step {name} depends on unknown steps: {unknown}')
+
+        results: dict[str, Any] = {}
+        pending = dict(self.steps)
+        running: dict[Future, str] = {}
+        error: BaseException = None
+        start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.maxWorkers) as executor:
+            while pending or running:
+                if error is None:
+                    ready = [name for name, (_, dependsOn) in pending.items() if all(dep in results for dep in dependsOn)]
+                    for name in ready:
+                        func, _ = pending.pop(name)
+                        running[executor.submit(self._timeStep, name, func)] = name
+                if not running:
+                    if error is None:
+                        raise ValueError(f'Steps have circular dependencies: {list(pending)}')
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except BaseException as e:
+                        if error is None:
+                            error = e
+
+        self._printTimings(time.perf_counter() - start)
+        if error is not None:
+            raise error
+        return results
+
+    def _timeStep(self, name: str, func: Callable[[], Any]) -> Any:
+        """Calls a step's function and records how long it took.
+
+        Args:
+            name (str): name of the step
+            func (Callable[[], Any]): function to call for the step
+
+        Returns:
+            Any: return value of the function
+        """
+        start = time.perf_counter()
+        try:
+            return func()
+        finally:
+            self.timings[name] = time.perf_counter() - start
+
+    def _printTimings(self, total: float) -> None:
+        """Prints how long each finished step took.
+
+        Args:
+            total (float): seconds all steps took together
+        """
+        print('Step timings:')
+        for name, seconds in self.timings.items():
+            print(f'  {name}: {seconds:.3f}s')
+        print(f'  total: {total:.3f}s')
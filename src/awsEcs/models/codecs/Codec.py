@@ -0,0 +1,85 @@
+import io
+from typing import Any, BinaryIO, Iterable, Iterator
+
+from awsEcs.models.codecs.ThreadedReader import ThreadedReader
+
+class Codec:
+    """An abstract base class for a compression applied on top of a file format.
+
+    Subclasses implement `_openDecompressor` and `_createCompressor`.
+    Compressed streams of a codec can be concatenated, so a file compressed
+    in parts (e.g. by shards) decompresses as one.
+
+    Attributes:
+        NAME (str): name used to choose the codec, e.g. the 'zst' of OUTPUT_FORMAT='csv.zst'
+        EXTENSION (str): file extension of the codec, added after the format's
+        CONTENT_ENCODING (str): value of S3's Content-Encoding for the codec
+    """
+
+    NAME = ''
+    EXTENSION = ''
+    CONTENT_ENCODING = ''
+
+    @classmethod
+    def matches(cls, key: str) -> bool:
+        """Checks whether a file's key has this codec's extension.
+
+        Args:
+            key (str): key or name of the file
+
+        Returns:
+            bool: whether the file is compressed with this codec
+        """
+        return key.lower().endswith(cls.EXTENSION)
+
+    def openReader(self, data: BinaryIO) -> BinaryIO:
+        """Opens compressed data for reading, decompressing it on a background thread.
+
+        Args:
+            data (BinaryIO): the compressed data
+
+        Returns:
+            BinaryIO: the decompressed data; closing it closes `data`
+        """
+        return io.BufferedReader(ThreadedReader(self._openDecompressor(data)), ThreadedReader.READ_SIZE)
+
+    def iterCompress(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """Compresses data as it is produced.
+
+        Args:
+            chunks (Iterable[bytes]): the data, a chunk at a time
+
+        Yields:
+            bytes: the next part of the compressed data
+        """
+        compressor = self._createCompressor()
+        for chunk in chunks:
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
+
+    def _openDecompressor(self, data: BinaryIO) -> BinaryIO:
+        """Wraps compressed data in a stream that decompresses it.
+
+        Args:
+            data (BinaryIO): the compressed data
+
+        Raises:
+            NotImplementedError: the subclass must implement this method
+
+        Returns:
+            BinaryIO: the decompressed data
+        """
+        raise NotImplementedError('Subclasses must implement this method.')
+
+    def _createCompressor(self) -> Any:
+        """Creates an object with `compress` and `flush` methods that compresses a stream.
+
+        Raises:
+            NotImplementedError: the subclass must implement this method
+
+        Returns:
+            Any: the compressor
+        """
+        raise NotImplementedError('Subclasses must implement this method.')
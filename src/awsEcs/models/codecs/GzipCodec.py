@@ -0,0 +1,36 @@
+import gzip
+import zlib
+from typing import BinaryIO
+
+from awsEcs.models.codecs.Codec import Codec
+
+class GzipCodec(Codec):
+    """Compresses files with gzip.
+
+    Attributes:
+        COMPRESSION_LEVEL (int): gzip compression level used when writing
+    """
+
+    NAME = 'gz'
+    EXTENSION = '.gz'
+    CONTENT_ENCODING = 'gzip'
+    COMPRESSION_LEVEL = 6
+
+    def _openDecompressor(self, data: BinaryIO) -> BinaryIO:
+        """Wraps gzip data in a stream that decompresses it, member after member.
+
+        Args:
+            data (BinaryIO): the compressed data
+
+        Returns:
+            BinaryIO: the decompressed data
+        """
+        return gzip.GzipFile(fileobj=data, mode='rb')
+
+    def _createCompressor(self) -> 'zlib._Compress':
+        """Creates a compressor that writes one gzip member.
+
+        Returns:
+            zlib._Compress: the compressor
+        """
+        return zlib.compressobj(self.COMPRESSION_LEVEL, zlib.DEFLATED, 31)  # 31: gzip header and trailer
@@ -0,0 +1,100 @@
+import io
+import threading
+from queue import Empty, Full, Queue
+from typing import BinaryIO
+
+class ThreadedReader(io.RawIOBase):
+    """Reads a binary stream ahead on a background thread, so producing the data overlaps with consuming it.
+
+    Used for decompression: the thread reads (and so decompresses) the next
+    blocks while the parser works on the current one. zlib and zstd release
+    the GIL while they work, so the two really run at once. At most
+    `maxBlocks` blocks are read ahead, which bounds the memory used.
+
+    Attributes:
+        READ_SIZE (int): bytes read from the source at a time
+        source (BinaryIO): the stream being read
+    """
+
+    READ_SIZE = 1024 * 1024
+
+    def __init__(self, source: BinaryIO, maxBlocks: int = 4) -> None:
+        """Constructs a ThreadedReader object and starts reading ahead.
+
+        Args:
+            source (BinaryIO): the stream to read
+            maxBlocks (int, optional): number of blocks read ahead at most; defaults to 4
+        """
+        super().__init__()
+        self.source = source
+        self._blocks: Queue = Queue(maxsize=maxBlocks)
+        self._current = memoryview(b'')
+        self._finished = False
+        self._stopEvent = threading.Event()
+        self._thread = threading.Thread(target=self._readAhead, daemon=True)
+        self._thread.start()
+
+    def _readAhead(self) -> None:
+        """Reads blocks from the source into the queue until it ends, fails or the reader is closed."""
+        try:
+            while not self._stopEvent.is_set():
+                block = self.source.read(self.READ_SIZE)
+                self._put(block)
+                if not block:
+                    return
+        except BaseException as e:
+            self._put(e)
+
+    def _put(self, item: bytes | BaseException) -> None:
+        """Puts a block or error in the queue, giving up if the reader is closed while it waits.
+
+        Args:
+            item (bytes | BaseException): the next block, an empty block at the end, or the error that stopped reading
+        """
+        while not self._stopEvent.is_set():
+            try:
+                self._blocks.put(item, timeout=0.1)
+                return
+            except Full:
+                pass
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:
+        """Reads bytes into a buffer, waiting for the thread if no block is ready.
+
+        Args:
+            buffer (bytearray | memoryview): buffer to fill
+
+        Raises:
+            BaseException: the error the source raised
+
+        Returns:
+            int: number of bytes read; 0 at the end of the stream
+        """
+        if not self._current and not self._finished:
+            block = self._blocks.get()
+            if isinstance(block, BaseException):
+                self._finished = True
+                raise block
+            self._finished = not block
+            self._current = memoryview(block)
+        count = min(len(buffer), len(self._current))
+        buffer[:count] = self._current[:count]
+        self._current = self._current[count:]
+        return count
+
+    def readable(self) -> bool:
+        """Returns True, since the stream can be read."""
+        return True
+
+    def close(self) -> None:
+        """Stops reading ahead and closes the source."""
+        if not self.closed:
+            self._stopEvent.set()
+            try:
+                while True:
+                    self._blocks.get_nowait()
+            except Empty:
+                pass
+            self._thread.join()
+            self.source.close()
+        super().close()
@@ -0,0 +1,40 @@
+from typing import Any, BinaryIO
+
+from awsEcs.models.codecs.Codec import Codec
+
+class ZstdCodec(Codec):
+    """Compresses files with Zstandard, which decompresses several times faster than gzip.
+
+    zstandard is only imported when a file is read or written.
+
+    Attributes:
+        COMPRESSION_LEVEL (int): zstd compression level used when writing
+    """
+
+    NAME = 'zst'
+    EXTENSION = '.zst'
+    CONTENT_ENCODING = 'zstd'
+    COMPRESSION_LEVEL = 3
+
+    def _openDecompressor(self, data: BinaryIO) -> BinaryIO:
+        """Wraps zstd data in a stream that decompresses it, frame after frame.
+
+        Args:
+            data (BinaryIO): the compressed data
+
+        Returns:
+            BinaryIO: the decompressed data
+        """
+        import zstandard
+
+        return zstandard.ZstdDecompressor().stream_reader(data, read_across_frames=True)
+
+    def _createCompressor(self) -> Any:
+        """Creates a compressor that writes one zstd frame.
+
+        Returns:
+            Any: the compressor
+        """
+        import zstandard
+
+        return zstandard.ZstdCompressor(level=self.COMPRESSION_LEVEL).compressobj()
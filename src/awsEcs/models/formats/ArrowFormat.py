@@ -0,0 +1,97 @@
+from io import BytesIO
+from typing import BinaryIO, Iterable, Iterator
+
+import pandas as pd
+
+from awsEcs.models.formats.FileFormat import FileFormat
+
+class ArrowFormat(FileFormat):
+    """Reads and writes hint data as Arrow IPC files (also known as Feather v2).
+
+    pyarrow is only imported when an Arrow file is read or written.
+    """
+
+    NAME = 'arrow'
+    EXTENSIONS = ['.arrow', '.feather', '.ipc']
+    CONTENT_TYPE = 'application/vnd.apache.arrow.file'
+    SEEKABLE = True
+
+    def read(self, data: BinaryIO, columns: list[str] = None, dtype: dict[str, str] = None) -> pd.DataFrame:
+        """Reads a whole Arrow file.
+
+        Args:
+            data (BinaryIO): the file's contents
+            columns (list[str], optional): columns to read; defaults to all of them
+            dtype (dict[str, str], optional): ignored, since Arrow files store their own types
+
+        Returns:
+            pd.DataFrame: the file's data
+        """
+        import pyarrow as pa
+
+        table = pa.ipc.open_file(data).read_all()
+        if columns is not None:
+            table = table.select(columns)
+        return table.to_pandas()
+
+    def iterRead(self, data: BinaryIO, chunkSize: int, columns: list[str] = None, dtype: dict[str, str] = None) -> Iterator[pd.DataFrame]:
+        """Reads an Arrow file a chunk of rows at a time, one record batch at a time.
+
+        Args:
+            data (BinaryIO): the file's contents
+            chunkSize (int): number of rows per chunk
+            columns (list[str], optional): columns to read; defaults to all of them
+            dtype (dict[str, str], optional): ignored, since Arrow files store their own types
+
+        Yields:
+            pd.DataFrame: the next chunk of the file's data
+        """
+        import pyarrow as pa
+
+        reader = pa.ipc.open_file(data)
+        for i in range(reader.num_record_batches):
+            batch = reader.get_batch(i)
+            if columns is not None:
+                batch = batch.select(columns)
+            for offset in range(0, batch.num_rows, chunkSize):
+                yield batch.slice(offset, chunkSize).to_pandas()
+
+    def iterWrite(self, chunks: Iterable[pd.DataFrame]) -> Iterator[bytes]:
+        """Writes an Arrow file with one record batch per chunk.
+
+        Every chunk is converted with the first chunk's schema, so a column
+        that happens to be all null in a later chunk keeps its type.
+        Categorical columns are written as plain values, since an Arrow file
+        can't change a column's dictionary from one batch to the next. With
+        no chunks, a file with no columns is written, so the output is still
+        an Arrow file.
+
+        Args:
+            chunks (Iterable[pd.DataFrame]): the data to write, a chunk at a time
+
+        Yields:
+            bytes: the next part of the file (a record batch, then the footer)
+        """
+        import pyarrow as pa
+
+        sink = BytesIO()
+        schema = None
+        writer = None
+        try:
+            for chunk in chunks:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    schema = pa.schema(
+                        [field.with_type(field.type.value_type) if pa.types.is_dictionary(field.type) else field for field in table.schema],
+                        metadata=table.schema.metadata
+                    )
+                    writer = pa.ipc.new_file(sink, schema)
+                table = table.cast(schema)
+                writer.write_table(table)
+                yield self._drain(sink)
+            if writer is None:
+                writer = pa.ipc.new_file(sink, pa.schema([]))
+        finally:
+            if writer is not None:
+                writer.close()
+        yield self._drain(sink)
@@ -0,0 +1,101 @@
+from io import BytesIO
+from typing import BinaryIO, Iterable, Iterator
+
+import pandas as pd
+
+from awsEcs.models.codecs.Codec import Codec
+from awsEcs.models.formats.FileFormat import FileFormat
+
+class CompressedFormat(FileFormat):
+    """Reads and writes hint data in another format, compressed with a codec, e.g. zstd-compressed CSV.
+
+    Files are decompressed on a background thread while the inner format
+    parses them, and compressed as they are written. Its name and
+    extensions join the inner format's and the codec's, e.g. 'csv.zst' and
+    '.csv.zst'; S3 objects written in it get the inner format's Content-Type
+    and the codec's Content-Encoding.
+
+    Attributes:
+        fileFormat (FileFormat): format of the data inside the compression
+        codec (Codec): codec the data is compressed with
+    """
+
+    TEXT = False
+    SEEKABLE = False
+
+    def __init__(self, fileFormat: FileFormat, codec: Codec) -> None:
+        """Constructs a CompressedFormat object.
+
+        Args:
+            fileFormat (FileFormat): format of the data inside the compression
+            codec (Codec): codec the data is compressed with
+        """
+        self.fileFormat = fileFormat
+        self.codec = codec
+        self.NAME = f'{fileFormat.NAME}.{codec.NAME}'
+        self.EXTENSIONS = [extension + codec.EXTENSION for extension in fileFormat.EXTENSIONS]
+        self.CONTENT_TYPE = fileFormat.CONTENT_TYPE
+        self.CONTENT_ENCODING = codec.CONTENT_ENCODING
+
+    def matches(self, key: str) -> bool:
+        """Checks whether a file's key has one of this format's extensions.
+
+        Args:
+            key (str): key or name of the file
+
+        Returns:
+            bool: whether the file is in this format
+        """
+        return key.lower().endswith(tuple(self.EXTENSIONS))
+
+    def read(self, data: BinaryIO, columns: list[str] = None, dtype: dict[str, str] = None) -> pd.DataFrame:
+        """Reads a whole compressed file.
+
+        Args:
+            data (BinaryIO): the file's compressed contents
+            columns (list[str], optional): columns to read; defaults to all of them
+            dtype (dict[str, str], optional): types to parse columns as; formats that store their own types ignore it
+
+        Returns:
+            pd.DataFrame: the file's data
+        """
+        with self.codec.openReader(data) as reader:
+            return self.fileFormat.read(self._prepareInput(reader), columns, dtype)
+
+    def iterRead(self, data: BinaryIO, chunkSize: int, columns: list[str] = None, dtype: dict[str, str] = None) -> Iterator[pd.DataFrame]:
+        """Reads a compressed file a chunk of rows at a time, decompressing it as it goes.
+
+        Args:
+            data (BinaryIO): the file's compressed contents
+            chunkSize (int): number of rows per chunk
+            columns (list[str], optional): columns to read; defaults to all of them
+            dtype (dict[str, str], optional): types to parse columns as; formats that store their own types ignore it
+
+        Yields:
+            pd.DataFrame: the next chunk of the file's data
+        """
+        with self.codec.openReader(data) as reader:
+            yield from self.fileFormat.iterRead(self._prepareInput(reader), chunkSize, columns, dtype)
+
+    def iterWrite(self, chunks: Iterable[pd.DataFrame], **kwargs) -> Iterator[bytes]:
+        """Writes a compressed file from chunks of rows, compressing the inner format's output as it is produced.
+
+        Args:
+            chunks (Iterable[pd.DataFrame]): the data to write, a chunk at a time
+            **kwargs: options of the inner format's `iterWrite`, e.g. `header` for CSV
+
+        Yields:
+            bytes: the next part of the compressed file
+        """
+        yield from self.codec.iterCompress(self.fileFormat.iterWrite(chunks, **kwargs))
+
+    def _prepareInput(self, reader: BinaryIO) -> BinaryIO:
+        """Buffers decompressed data in memory if the inner format needs to seek.
+
+        Args:
+            reader (BinaryIO): the decompressed data
+
+        Returns:
+            BinaryIO: the decompressed data, ready for the inner format to read
+        """
+        return BytesIO(reader.read()) if self.fileFormat.SEEKABLE else reader
@@ -0,0 +1,54 @@
+from typing import BinaryIO, Iterable, Iterator, TextIO
+
+import pandas as pd
+
+from awsEcs.models.formats.FileFormat import FileFormat
+
+class CsvFormat(FileFormat):
+    """Reads and writes hint data as UTF-8 CSV."""
+
+    NAME = 'csv'
+    EXTENSIONS = ['.csv']
+    CONTENT_TYPE = 'text/csv'
+    TEXT = True
+
+    def read(self, data: BinaryIO | TextIO, columns: list[str] = None, dtype: dict[str, str] = None) -> pd.DataFrame:
+        """Reads a whole CSV file.
+
+        Args:
+            data (BinaryIO | TextIO): the file's contents
+            columns (list[str], optional): columns to read; defaults to all of them
+            dtype (dict[str, str], optional): types to parse columns as; defaults to inferring them
+
+        Returns:
+            pd.DataFrame: the file's data
+        """
+        return pd.read_csv(data, usecols=columns, dtype=dtype, encoding='utf8')
+
+    def iterRead(self, data: BinaryIO | TextIO, chunkSize: int, columns: list[str] = None, dtype: dict[str, str] = None) -> Iterator[pd.DataFrame]:
+        """Reads a CSV file a chunk of rows at a time, parsing it incrementally.
+
+        Args:
+            data (BinaryIO | TextIO): the file's contents
+            chunkSize (int): number of rows per chunk
+            columns (list[str], optional): columns to read; defaults to all of them
+            dtype (dict[str, str], optional): types to parse columns as; defaults to inferring them
+
+        Yields:
+            pd.DataFrame: the next chunk of the file's data
+        """
+        with pd.read_csv(data, chunksize=chunkSize, usecols=columns, dtype=dtype, encoding='utf8') as reader:
+            yield from reader
+
+    def iterWrite(self, chunks: Iterable[pd.DataFrame], header: bool = True) -> Iterator[bytes]:
+        """Writes a CSV file from chunks of rows; only the first chunk includes the header.
+
+        Args:
+            chunks (Iterable[pd.DataFrame]): the data to write, a chunk at a time
+            header (bool, optional): whether to write the header, e.g. False for a part of a file after the first; defaults to True
+
+        Yields:
+            bytes: the next chunk as UTF-8 CSV
+        """
+        for i, chunk in enumerate(chunks):
+            yield chunk.to_csv(index=False, header=(header and i == 0)).encode('utf8')
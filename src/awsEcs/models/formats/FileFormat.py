@@ -0,0 +1,111 @@
+from io import BytesIO
+from typing import BinaryIO, Iterable, Iterator
+
+import pandas as pd
+
+class FileFormat:
+    """An abstract base class for reading and writing hint data in one file format.
+
+    Subclasses implement `read`, `iterRead` and `iterWrite`. Reading can be
+    limited to some columns, and `iterRead`/`iterWrite` work a chunk at a
+    time so large files can be streamed.
+
+    Attributes:
+        NAME (str): name used to choose the format, e.g. in INPUT_FORMAT and OUTPUT_FORMAT
+        EXTENSIONS (list[str]): file extensions of the format; the first is used to name output files
+        CONTENT_TYPE (str): MIME type of the format
+        CONTENT_ENCODING (str | None): value of S3's Content-Encoding for files compressed on top of the format; None if they aren't
+        TEXT (bool): whether the format can be read from a text buffer
+        SEEKABLE (bool): whether reading needs a seekable file, so an S3 stream has to be buffered first
+    """
+
+    NAME = ''
+    EXTENSIONS: list[str] = []
+    CONTENT_TYPE = 'application/octet-stream'
+    CONTENT_ENCODING: str = None
+    TEXT = False
+    SEEKABLE = False
+
+    @classmethod
+    def matches(cls, key: str) -> bool:
+        """Checks whether a file's key has one of this format's extensions.
+
+        Args:
+            key (str): key or name of the file
+
+        Returns:
+            bool: whether the file is in this format
+        """
+        return key.lower().endswith(tuple(cls.EXTENSIONS))
+
+    def read(self, data: BinaryIO, columns: list[str] = None, dtype: dict[str, str] = None) -> pd.DataFrame:
+        """Reads a whole file.
+
+        Args:
+            data (BinaryIO): the file's contents
+            columns (list[str], optional): columns to read; defaults to all of them
+            dtype (dict[str, str], optional): types to parse columns as; formats that store their own types ignore it
+
+        Raises:
+            NotImplementedError: the subclass must implement this method
+
+        Returns:
+            pd.DataFrame: the file's data
+        """
+        raise NotImplementedError('Subclasses must implement this method.')
+
+    def iterRead(self, data: BinaryIO, chunkSize: int, columns: list[str] = None, dtype: dict[str, str] = None) -> Iterator[pd.DataFrame]:
+        """Reads a file a chunk of rows at a time.
+
+        Args:
+            data (BinaryIO): the file's contents
+            chunkSize (int): number of rows per chunk
+            columns (list[str], optional): columns to read; defaults to all of them
+            dtype (dict[str, str], optional): types to parse columns as; formats that store their own types ignore it
+
+        Raises:
+            NotImplementedError: the subclass must implement this method
+
+        Yields:
+            pd.DataFrame: the next chunk of the file's data
+        """
+        raise NotImplementedError('Subclasses must implement this method.')
+
+    def write(self, df: pd.DataFrame) -> bytes:
+        """Writes a whole file.
+
+        Args:
+            df (pd.DataFrame): data to write
+
+        Returns:
+            bytes: the file's contents
+        """
+        return b''.join(self.iterWrite([df]))
+
+    def iterWrite(self, chunks: Iterable[pd.DataFrame]) -> Iterator[bytes]:
+        """Writes a file from chunks of rows, yielding its bytes as they are ready.
+
+        Args:
+            chunks (Iterable[pd.DataFrame]): the data to write, a chunk at a time
+
+        Raises:
+            NotImplementedError: the subclass must implement this method
+
+        Yields:
+            bytes: the next part of the file's contents
+        """
+        raise NotImplementedError('Subclasses must implement this method.')
+
+    def _drain(self, sink: BytesIO) -> bytes:
+        """Takes everything written to a buffer so far and empties it.
+
+        Args:
+            sink (BytesIO): the buffer
+
+        Returns:
+            bytes: what had been written to the buffer
+        """
+        value = sink.getvalue()
+        sink.seek(0)
+        sink.truncate()
+        return value
@@ -0,0 +1,106 @@
+from awsEcs.models.codecs.Codec import Codec
+from awsEcs.models.codecs.GzipCodec import GzipCodec
+from awsEcs.models.codecs.ZstdCodec import ZstdCodec
+from awsEcs.models.formats.ArrowFormat import ArrowFormat
+from awsEcs.models.formats.CompressedFormat import CompressedFormat
+from awsEcs.models.formats.CsvFormat import CsvFormat
+from awsEcs.models.formats.FileFormat import FileFormat
+from awsEcs.models.formats.GzipCsvFormat import GzipCsvFormat
+from awsEcs.models.formats.ParquetFormat import ParquetFormat
+
+class FileFormatFactory:
+    """Chooses the FileFormat for a file, by name, by its extension or by its Content-Encoding.
+
+    A format can be compressed with any codec, e.g. 'csv.zst' or
+    'parquet.gz'; 'csv.gz' is GzipCsvFormat.
+
+    Attributes:
+        FORMATS (list[type[FileFormat]]): supported formats, checked in order (longer extensions first)
+        CODECS (list[type[Codec]]): supported compression codecs
+        DEFAULT_FORMAT (type[FileFormat]): format of files whose extension isn't recognized
+    """
+
+    FORMATS: list[type[FileFormat]] = [GzipCsvFormat, CsvFormat, ParquetFormat, ArrowFormat]
+    CODECS: list[type[Codec]] = [GzipCodec, ZstdCodec]
+    DEFAULT_FORMAT: type[FileFormat] = CsvFormat
+
+    @classmethod
+    def getFormat(cls, key: str = '', name: str = None) -> FileFormat:
+        """Gets the format with the given name, or else the format matching a file's extension.
+
+        Args:
+            key (str, optional): key or name of the file; defaults to ''
+            name (str, optional): name of the format, e.g. 'parquet' or 'csv.zst'; defaults to choosing by extension
+
+        Raises:
+            ValueError: no format has the given name
+
+        Returns:
+            FileFormat: the format
+        """
+        if name:
+            for fileFormat in cls.FORMATS:
+                if fileFormat.NAME == name.lower():
+                    return fileFormat()
+            for codec in cls.CODECS:
+                if name.lower().endswith(f'.{codec.NAME}'):
+                    return CompressedFormat(cls.getFormat(name=name[:-len(codec.NAME) - 1]), codec())
+            raise ValueError(
+                f'Unknown file format: {name} (expected one of {[f.NAME for f in cls.FORMATS]}, '
+                f'optionally followed by one of {[f".{c.NAME}" for c in cls.CODECS]})'
+            )
+
+        for fileFormat in cls.FORMATS:
+            if fileFormat.matches(key):
+                return fileFormat()
+        for codec in cls.CODECS:
+            if codec.matches(key):
+                return CompressedFormat(cls.getFormat(key[:-len(codec.EXTENSION)]), codec())
+        return cls.DEFAULT_FORMAT()
+
+    @classmethod
+    def applyContentEncoding(cls, fileFormat: FileFormat, contentEncoding: str | None) -> FileFormat:
+        """Wraps a format in the codec named by a file's Content-Encoding.
+
+        Files whose format already includes the compression (e.g. a '.csv.gz'
+        file served with `Content-Encoding: gzip`) are left as they are, as
+        are unknown encodings such as 'identity'.
+
+        Args:
+            fileFormat (FileFormat): format of the file, e.g. from its extension
+            contentEncoding (str | None): the file's Content-Encoding; None if it has none
+
+        Returns:
+            FileFormat: the format, compressed with the file's codec if it has one
+        """
+        if not contentEncoding:
+            return fileFormat
+        for codec in cls.CODECS:
+            if codec.CONTENT_ENCODING == contentEncoding.lower():
+                if codec.matches(fileFormat.EXTENSIONS[0]):
+                    return fileFormat
+                return CompressedFormat(fileFormat, codec())
+        return fileFormat
+
+    @classmethod
+    def rename(cls, fileName: str, fileFormat: FileFormat) -> str:
+        """Gives a file name the extension of another format.
+
+        Args:
+            fileName (str): name of the file
+            fileFormat (FileFormat): format the file is being converted to
+
+        Returns:
+            str: the file name with any recognized extension (and compression extension) replaced by the format's own
+        """
+        if fileFormat.matches(fileName):
+            return fileName
+        for codec in cls.CODECS:
+            if codec.matches(fileName):
+                fileName = fileName[:-len(codec.EXTENSION)]
+                break
+        for knownFormat in cls.FORMATS:
+            for extension in knownFormat.EXTENSIONS:
+                if fileName.lower().endswith(extension):
+                    return fileName[:-len(extension)] + fileFormat.EXTENSIONS[0]
+        return fileName + fileFormat.EXTENSIONS[0]
@@ -0,0 +1,66 @@
+from typing import BinaryIO, Iterable, Iterator
+
+import pandas as pd
+
+from awsEcs.models.codecs.GzipCodec import GzipCodec
+from awsEcs.models.formats.CsvFormat import CsvFormat
+
+class GzipCsvFormat(CsvFormat):
+    """Reads and writes hint data as gzip-compressed UTF-8 CSV.
+
+    Files are decompressed on a background thread while the CSV parser
+    works, and written as one gzip member.
+
+    Attributes:
+        CODEC (GzipCodec): codec the CSV is compressed with
+    """
+
+    NAME = 'csv.gz'
+    EXTENSIONS = ['.csv.gz']
+    CONTENT_TYPE = 'application/gzip'
+    TEXT = False
+    CODEC = GzipCodec()
+
+    def read(self, data: BinaryIO, columns: list[str] = None, dtype: dict[str, str] = None) -> pd.DataFrame:
+        """Reads a whole gzip CSV file.
+
+        Args:
+            data (BinaryIO): the file's compressed contents
+            columns (list[str], optional): columns to read; defaults to all of them
+            dtype (dict[str, str], optional): types to parse columns as; defaults to inferring them
+
+        Returns:
+            pd.DataFrame: the file's data
+        """
+        with self.CODEC.openReader(data) as reader:
+            return super().read(reader, columns, dtype)
+
+    def iterRead(self, data: BinaryIO, chunkSize: int, columns: list[str] = None, dtype: dict[str, str] = None) -> Iterator[pd.DataFrame]:
+        """Reads a gzip CSV file a chunk of rows at a time, decompressing it as it goes.
+
+        Args:
+            data (BinaryIO): the file's compressed contents
+            chunkSize (int): number of rows per chunk
+            columns (list[str], optional): columns to read; defaults to all of them
+            dtype (dict[str, str], optional): types to parse columns as; defaults to inferring them
+
+        Yields:
+            pd.DataFrame: the next chunk of the file's data
+        """
+        with self.CODEC.openReader(data) as reader:
+            yield from super().iterRead(reader, chunkSize, columns, dtype)
+
+    def iterWrite(self, chunks: Iterable[pd.DataFrame], header: bool = True) -> Iterator[bytes]:
+        """Writes a gzip CSV file from chunks of rows, compressing as it goes.
+
+        The output is one gzip member, so files written in parts can be joined
+        by concatenating them.
+
+        Args:
+            chunks (Iterable[pd.DataFrame]): the data to write, a chunk at a time
+            header (bool, optional): whether to write the header, e.g. False for a part of a file after the first; defaults to True
+
+        Yields:
+            bytes: the next part of the compressed file
+        """
+        yield from self.CODEC.iterCompress(super().iterWrite(chunks, header))
@@ -0,0 +1,99 @@
+from io import BytesIO
+from typing import BinaryIO, Iterable, Iterator
+
+import pandas as pd
+
+from awsEcs.models.formats.FileFormat import FileFormat
+
+class ParquetFormat(FileFormat):
+    """Reads and writes hint data as Parquet.
+
+    pyarrow is only imported when a Parquet file is read or written.
+
+    Attributes:
+        COMPRESSION (str): Parquet compression codec used when writing
+    """
+
+    NAME = 'parquet'
+    EXTENSIONS = ['.parquet', '.pq']
+    CONTENT_TYPE = 'application/vnd.apache.parquet'
+    SEEKABLE = True
+    COMPRESSION = 'snappy'
+
+    def read(self, data: BinaryIO, columns: list[str] = None, dtype: dict[str, str] = None) -> pd.DataFrame:
+        """Reads a whole Parquet file, decoding only the requested columns.
+
+        Args:
+            data (BinaryIO): the file's contents
+            columns (list[str], optional): columns to read; defaults to all of them
+            dtype (dict[str, str], optional): ignored, since Parquet files store their own types
+
+        Returns:
+            pd.DataFrame: the file's data
+        """
+        import pyarrow.parquet as pq
+
+        return pq.read_table(data, columns=columns).to_pandas()
+
+    def iterRead(self, data: BinaryIO, chunkSize: int, columns: list[str] = None, dtype: dict[str, str] = None) -> Iterator[pd.DataFrame]:
+        """Reads a Parquet file a batch of rows at a time, decoding one row group at a time.
+
+        Args:
+            data (BinaryIO): the file's contents
+            chunkSize (int): number of rows per chunk
+            columns (list[str], optional): columns to read; defaults to all of them
+            dtype (dict[str, str], optional): ignored, since Parquet files store their own types
+
+        Yields:
+            pd.DataFrame: the next chunk of the file's data
+        """
+        import pyarrow.parquet as pq
+
+        parquetFile = pq.ParquetFile(data)
+        for batch in parquetFile.iter_batches(batch_size=chunkSize, columns=columns):
+            yield batch.to_pandas()
+
+    def iterWrite(self, chunks: Iterable[pd.DataFrame]) -> Iterator[bytes]:
+        """Writes a Parquet file with one row group per chunk.
+
+        Every chunk is converted with the first chunk's schema, so a column
+        that happens to be all null in a later chunk keeps its type.
+        Categorical columns are given 32-bit dictionary indices, since a later
+        chunk with more categories has wider codes than the first. With no
+        chunks, a file with no columns is written, so the output is still a
+        Parquet file.
+
+        Args:
+            chunks (Iterable[pd.DataFrame]): the data to write, a chunk at a time
+
+        Yields:
+            bytes: the next part of the file (a row group, then the footer)
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        sink = BytesIO()
+        schema = None
+        writer = None
+        try:
+            for chunk in chunks:
+                table = pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+                if writer is None:
+                    schema = pa.schema(
+                        [
+                            field.with_type(pa.dictionary(pa.int32(), field.type.value_type, field.type.ordered))
+                            if pa.types.is_dictionary(field.type) else field
+                            for field in table.schema
+                        ],
+                        metadata=table.schema.metadata
+                    )
+                    writer = pq.ParquetWriter(sink, schema, compression=self.COMPRESSION)
+                    table = table.cast(schema)
+                writer.write_table(table)
+                yield self._drain(sink)
+            if writer is None:
+                writer = pq.ParquetWriter(sink, pa.schema([]), compression=self.COMPRESSION)
+        finally:
+            if writer is not None:
+                writer.close()
+        yield self._drain(sink)
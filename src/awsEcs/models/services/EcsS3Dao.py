@@ -1,12 +1,30 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import chain
+from typing import BinaryIO, Iterable, Iterator
+
+from botocore.exceptions import ClientError
+
+from awsEcs.models.services.S3RangeReader import S3RangeReader
 from common.models.services.S3Dao import S3Dao
 
 class EcsS3Dao(S3Dao):
     """Contains methods for communicating with S3.
 
     Attributes:
+        MIN_PART_SIZE (int): smallest size in bytes S3 allows for every part of a multipart upload but the last
+        DEFAULT_PART_SIZE (int): default size in bytes of each part of a multipart upload
+        DEFAULT_MAX_CONCURRENCY (int): default number of parts uploaded at once
+        DEFAULT_DOWNLOAD_PART_SIZE (int): default size in bytes of each byte range of a parallel download
+        DEFAULT_DOWNLOAD_CONCURRENCY (int): default number of byte ranges downloaded at once
         client: AWS client object for Amazon S3
     """
-    
+
+    MIN_PART_SIZE = 5 * 1024 * 1024
+    DEFAULT_PART_SIZE = 8 * 1024 * 1024
+    DEFAULT_MAX_CONCURRENCY = 4
+    DEFAULT_DOWNLOAD_PART_SIZE = 8 * 1024 * 1024
+    DEFAULT_DOWNLOAD_CONCURRENCY = 8
+
     def __init__(self) -> None:
         """Constructs an EcsS3Dao object."""
         super().__init__()
@@ -27,13 +45,120 @@ class EcsS3Dao(S3Dao):
         )
         return response
 
-    def writeFile(self, bucket: str, key: str, data: bytes) -> dict:
+    def readFileParallel(self, bucket: str, key: str,
+                         partSize: int = DEFAULT_DOWNLOAD_PART_SIZE,
+                         maxConcurrency: int = DEFAULT_DOWNLOAD_CONCURRENCY,
+                         spoolThreshold: int = None) -> S3RangeReader:
+        """Opens file in S3 bucket as a seekable binary file, downloading it as concurrent byte ranges.
+
+        A single GET stream is limited to well under the network's bandwidth,
+        so large files download faster as several ranges at once. The whole
+        file is held in memory (or in a memory-mapped temporary file, if it is
+        larger than `spoolThreshold`), and the download fails if the file is
+        overwritten before it finishes.
+
+        Args:
+            bucket (str): name of bucket to read file from
+            key (str): key of file
+            partSize (int, optional): size in bytes of each byte range; defaults to DEFAULT_DOWNLOAD_PART_SIZE
+            maxConcurrency (int, optional): number of byte ranges downloaded at once; defaults to DEFAULT_DOWNLOAD_CONCURRENCY
+            spoolThreshold (int, optional): size in bytes above which the file is downloaded to disk; defaults to never
+
+        Returns:
+            S3RangeReader: the file's contents, readable while the download continues
+        """
+        return S3RangeReader(self.client, bucket, key, partSize, maxConcurrency, spoolThreshold)
+
+    def readFileRange(self, bucket: str, key: str, start: int, end: int) -> dict:
+        """Returns a byte range of file data from S3 bucket.
+
+        Args:
+            bucket (str): name of bucket to read file from
+            key (str): key of file
+            start (int): first byte to read (inclusive)
+            end (int): last byte to read (inclusive)
+
+        Returns:
+            dict: response of `S3.Client.get_object` operation
+        """
+        response: dict = self.client.get_object(
+            Bucket=bucket,
+            Key=key,
+            Range=f'bytes={start}-{end}'
+        )
+        return response
+
+    def getContentEncoding(self, bucket: str, key: str) -> str | None:
+        """Returns the Content-Encoding of a file in S3 bucket.
+
+        Args:
+            bucket (str): name of bucket the file is in
+            key (str): key of file
+
+        Returns:
+            str | None: the file's Content-Encoding, e.g. 'gzip'; None if it has none
+        """
+        response: dict = self.client.head_object(
+            Bucket=bucket,
+            Key=key
+        )
+        return response.get('ContentEncoding')
+
+    def getETag(self, bucket: str, key: str) -> str:
+        """Returns the ETag of a file in S3 bucket, which changes whenever the file is overwritten.
+
+        Args:
+            bucket (str): name of bucket the file is in
+            key (str): key of file
+
+        Returns:
+            str: the file's ETag
+        """
+        response: dict = self.client.head_object(
+            Bucket=bucket,
+            Key=key
+        )
+        return response['ETag']
+
+    def deleteFile(self, bucket: str, key: str) -> dict:
+        """Deletes file from S3 bucket.
+
+        Args:
+            bucket (str): name of bucket the file is in
+            key (str): key of file
+
+        Returns:
+            dict: response of `S3.Client.delete_object` operation
+        """
+        return self.client.delete_object(
+            Bucket=bucket,
+            Key=key
+        )
+
+    def getFileSize(self, bucket: str, key: str) -> int:
+        """Returns the size of a file in S3 bucket.
+
+        Args:
+            bucket (str): name of bucket the file is in
+            key (str): key of file
+
+        Returns:
+            int: size of the file in bytes
+        """
+        response: dict = self.client.head_object(
+            Bucket=bucket,
+            Key=key
+        )
+        return response['ContentLength']
+
+    def writeFile(self, bucket: str, key: str, data: bytes | BinaryIO, extraArgs: dict = None) -> dict:
         """Puts file in S3 bucket.
 
         Args:
-            bucket (str): name of bucket to put file in 
+            bucket (str): name of bucket to put file in
             key (str): key of file
-            data (bytes): data of file 
+            data (bytes | BinaryIO): data of file, or a binary file to stream it from
+            extraArgs (dict, optional): other arguments of `put_object`, e.g. ContentType and ContentEncoding; defaults to none
 
         Returns:
             dict: response of `S3.Client.put_object` operation
@@ -41,6 +166,191 @@ class EcsS3Dao(S3Dao):
         response = self.client.put_object(
             Bucket=bucket,
             Key=key,
-            Body=data
+            Body=data,
+            **(extraArgs or {})
         )
         return response
+
+    def writeFileMultipart(self, bucket: str, key: str, data: bytes | BinaryIO | Iterable[bytes],
+                           partSize: int = DEFAULT_PART_SIZE,
+                           maxConcurrency: int = DEFAULT_MAX_CONCURRENCY,
+                           extraArgs: dict = None) -> dict:
+        """Streams file into S3 bucket with a parallel multipart upload.
+
+        Data is consumed one part at a time and at most `maxConcurrency` parts
+        are uploading at once, so memory use is bounded by the part size rather
+        than the file size. Data that fits in a single part is written with one
+        `put_object` call instead. If any part fails, the multipart upload is
+        aborted so no orphaned parts are left in the bucket.
+
+        Args:
+            bucket (str): name of bucket to put file in
+            key (str): key of file
+            data (bytes | BinaryIO | Iterable[bytes]): data, binary file or iterator of byte chunks to upload
+            partSize (int, optional): size in bytes of each part; defaults to DEFAULT_PART_SIZE
+            maxConcurrency (int, optional): number of parts uploaded at once; defaults to DEFAULT_MAX_CONCURRENCY
+            extraArgs (dict, optional): other arguments of `put_object`/`create_multipart_upload`, e.g. ContentType and ContentEncoding; defaults to none
+
+        Raises:
+            ValueError: part size is smaller than S3 allows
+
+        Returns:
+            dict: response of `S3.Client.complete_multipart_upload` operation,
+                  or of `S3.Client.put_object` if the data fit in a single part
+        """
+        if partSize < self.MIN_PART_SIZE:
+            raise ValueError(f'Part size must be at least {self.MIN_PART_SIZE} bytes: {partSize}')
+
+        parts = self._iterParts(data, partSize)
+        firstPart = next(parts, b'')
+        secondPart = next(parts, None)
+        if secondPart is None:
+            return self.writeFile(bucket, key, firstPart, extraArgs)
+
+        uploadId = self.createMultipartUpload(bucket, key, extraArgs)
+        try:
+            completedParts: list[dict] = []
+            with ThreadPoolExecutor(max_workers=maxConcurrency) as executor:
+                inFlight: set[Future] = set()
+                for partNumber, body in enumerate(chain([firstPart, secondPart], parts), start=1):
+                    if len(inFlight) >= maxConcurrency:
+                        done, inFlight = wait(inFlight, return_when=FIRST_COMPLETED)
+                        completedParts.extend(future.result() for future in done)
+                    inFlight.add(executor.submit(self.uploadPart, bucket, key, uploadId, partNumber, body))
+                completedParts.extend(future.result() for future in inFlight)
+
+            completedParts.sort(key=lambda part: part['PartNumber'])
+            response = self.completeMultipartUpload(bucket, key, uploadId, completedParts)
+        except BaseException:
+            self.abortMultipartUpload(bucket, key, uploadId)
+            raise
+        return response
+
+    def createMultipartUpload(self, bucket: str, key: str, extraArgs: dict = None) -> str:
+        """Starts a multipart upload.
+
+        Args:
+            bucket (str): name of bucket to put file in
+            key (str): key of file
+            extraArgs (dict, optional): other arguments of `create_multipart_upload`, e.g. ContentType and ContentEncoding; defaults to none
+
+        Returns:
+            str: ID of the multipart upload
+        """
+        response: dict = self.client.create_multipart_upload(Bucket=bucket, Key=key, **(extraArgs or {}))
+        return response['UploadId']
+
+    def completeMultipartUpload(self, bucket: str, key: str, uploadId: str, parts: list[dict]) -> dict:
+        """Completes a multipart upload, joining its parts into the file.
+
+        Args:
+            bucket (str): name of bucket the file is being uploaded to
+            key (str): key of file
+            uploadId (str): ID of the multipart upload
+            parts (list[dict]): part number and ETag of each part, in order
+
+        Returns:
+            dict: response of `S3.Client.complete_multipart_upload` operation
+        """
+        return self.client.complete_multipart_upload(
+            Bucket=bucket,
+            Key=key,
+            UploadId=uploadId,
+            MultipartUpload={'Parts': parts}
+        )
+
+    def abortMultipartUpload(self, bucket: str, key: str, uploadId: str) -> dict:
+        """Aborts a multipart upload, deleting its uploaded parts.
+
+        Args:
+            bucket (str): name of bucket the file was being uploaded to
+            key (str): key of file
+            uploadId (str): ID of the multipart upload
+
+        Returns:
+            dict: response of `S3.Client.abort_multipart_upload` operation
+        """
+        return self.client.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=uploadId)
+
+    def hasMultipartUpload(self, bucket: str, key: str, uploadId: str) -> bool:
+        """Checks whether a multipart upload can still be added to, i.e. it hasn't been completed or aborted.
+
+        Args:
+            bucket (str): name of bucket the file is being uploaded to
+            key (str): key of file
+            uploadId (str): ID of the multipart upload
+
+        Raises:
+            ClientError: S3 failed for another reason
+
+        Returns:
+            bool: whether the upload is still in progress
+        """
+        try:
+            self.client.list_parts(Bucket=bucket, Key=key, UploadId=uploadId, MaxParts=1)
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'NoSuchUpload':
+                return False
+            raise
+        return True
+
+    def uploadPart(self, bucket: str, key: str, uploadId: str, partNumber: int, body: bytes) -> dict:
+        """Uploads one part of a multipart upload.
+
+        Args:
+            bucket (str): name of bucket the file is being uploaded to
+            key (str): key of file
+            uploadId (str): ID of the multipart upload
+            partNumber (int): 1-based number of the part
+            body (bytes): data of the part
+
+        Returns:
+            dict: part number and ETag of the uploaded part
+        """
+        response = self.client.upload_part(
+            Bucket=bucket,
+            Key=key,
+            UploadId=uploadId,
+            PartNumber=partNumber,
+            Body=body
+        )
+        return {'PartNumber': partNumber, 'ETag': response['ETag']}
+
+    def _iterParts(self, data: bytes | BinaryIO | Iterable[bytes], partSize: int) -> Iterator[bytes]:
+        """Regroups data into parts of exactly `partSize` bytes (except the last).
+
+        Bytes are sliced through a memoryview, so each part is copied once
+        (botocore only takes bytes, bytearrays or files as a part's body)
+        rather than the rest of the data being shifted down after every
+        part. Files and iterators are regrouped in a buffer that is only
+        trimmed once per chunk read.
+
+        Args:
+            data (bytes | BinaryIO | Iterable[bytes]): data, binary file or iterator of byte chunks
+            partSize (int): size in bytes of each part
+
+        Yields:
+            bytes: the next part of the data
+        """
+        if isinstance(data, (bytes, bytearray)):
+            with memoryview(data) as view:
+                for start in range(0, len(view), partSize):
+                    yield bytes(view[start:start + partSize])
+            return
+        if hasattr(data, 'read'):
+            fileObj = data
+            data = iter(lambda: fileObj.read(partSize), b'')
+
+        buffer = bytearray()
+        for chunk in data:
+            buffer += chunk
+            if len(buffer) < partSize:
+                continue
+            start = 0
+            with memoryview(buffer) as view:
+                while len(view) - start >= partSize:
+                    yield bytes(view[start:start + partSize])
+                    start += partSize
+            del buffer[:start]
+        if buffer:
+            yield bytes(buffer)
@@ -1,4 +1,7 @@
-from io import StringIO
+from typing import BinaryIO, Iterable
+
+from botocore.exceptions import ClientError
+from botocore.response import StreamingBody
 
 from awsEcs.models.services.EcsS3Dao import EcsS3Dao
 from common.models.services.S3Service import S3Service
@@ -12,6 +15,11 @@ class EcsS3Service(S3Service):
         env (EnvVar): instance of EnvVar to access environment vars
         dataBucketName (str): name of S3 data bucket
         nextAppDataBucketName (str): name of next app's S3 data bucket
+        uploadPartSize (int): size in bytes of each part of a multipart upload
+        uploadConcurrency (int): number of parts of a multipart upload sent at once
+        downloadPartSize (int): size in bytes of each byte range of a parallel download
+        downloadConcurrency (int): number of byte ranges of a parallel download fetched at once
+        spoolThreshold (int | None): size in bytes above which downloads are staged on disk; None to keep them in memory
     """
 
     def __init__(self) -> None:
@@ -19,6 +27,17 @@ class EcsS3Service(S3Service):
         super().__init__()
         self.nextAppDataBucketName = f'{NEXT_APP_NAME}-data-{self.env["ENV"]}'
 
+        partSizeMb = self.env.get('UPLOAD_PART_SIZE_MB')
+        self.uploadPartSize = int(partSizeMb) * 1024 * 1024 if partSizeMb else EcsS3Dao.DEFAULT_PART_SIZE
+        concurrency = self.env.get('UPLOAD_CONCURRENCY')
+        self.uploadConcurrency = int(concurrency) if concurrency else EcsS3Dao.DEFAULT_MAX_CONCURRENCY
+        partSizeMb = self.env.get('DOWNLOAD_PART_SIZE_MB')
+        self.downloadPartSize = int(partSizeMb) * 1024 * 1024 if partSizeMb else EcsS3Dao.DEFAULT_DOWNLOAD_PART_SIZE
+        concurrency = self.env.get('DOWNLOAD_CONCURRENCY')
+        self.downloadConcurrency = int(concurrency) if concurrency else EcsS3Dao.DEFAULT_DOWNLOAD_CONCURRENCY
+        spoolThresholdMb = self.env.get('SPOOL_THRESHOLD_MB')
+        self.spoolThreshold: int | None = int(spoolThresholdMb) * 1024 * 1024 if spoolThresholdMb else None
+
     def _createS3Dao(self) -> EcsS3Dao:
         """Factory method to create S3Dao instance.
 
@@ -29,39 +48,289 @@ class EcsS3Service(S3Service):
         """
         return EcsS3Dao()
         
-    def readFile(self, key: str) -> StringIO:
+    def readFile(self, key: str) -> BinaryIO:
         """Reads data from file in S3 data bucket.
 
+        The file is downloaded as concurrent byte ranges with `readFileParallel`
+        and returned as bytes, not decoded: the CSV parser decodes UTF-8 and
+        handles universal newlines itself, so the file isn't copied into a
+        string first.
+
+        Args:
+            key (str): key of file
+
+        Returns:
+            BinaryIO: hint data from file as a binary file
+        """
+        return self.readFileParallel(key)
+
+    def readFileParallel(self, key: str) -> BinaryIO:
+        """Opens file in S3 data bucket as a seekable binary file, downloading it as concurrent byte ranges.
+
+        Files larger than `spoolThreshold` are downloaded to the task's
+        ephemeral storage and memory-mapped instead of held in memory.
+
         Args:
             key (str): key of file
 
         Returns:
-            StringIO: hint data from file as string buffer
+            BinaryIO: the file's contents, readable while the download continues
+        """
+        return self.s3Dao.readFileParallel(
+            self.dataBucketName, key, self.downloadPartSize, self.downloadConcurrency, self.spoolThreshold
+        )
+
+    def readFileStream(self, key: str) -> StreamingBody:
+        """Opens file in S3 data bucket for incremental reading.
+
+        Unlike `readFile`, the file is not loaded into memory; its bytes are
+        pulled from S3 as the caller reads them.
+
+        Args:
+            key (str): key of file
+
+        Returns:
+            StreamingBody: binary stream of the file's contents
         """
         response: dict = self.s3Dao.readFile(self.dataBucketName, key)
-        rawData: bytes = response['Body']
-        fileContents = StringIO(rawData.read().decode('utf8'), newline=None) # 'newLine=None' means we use universal newlines support)
-        return fileContents
+        return response['Body']
     
-    def writeOutputFile(self, data: StringIO, fileName: str) -> tuple[dict, dict]:
-        """Writes data to output file in S3 bucket.
+    def readFileRange(self, key: str, start: int, end: int) -> bytes:
+        """Reads a byte range of a file in S3 data bucket with a ranged GET.
+
+        Args:
+            key (str): key of file
+            start (int): first byte to read (inclusive)
+            end (int): last byte to read (inclusive)
+
+        Returns:
+            bytes: the bytes in the range
+        """
+        response: dict = self.s3Dao.readFileRange(self.dataBucketName, key, start, end)
+        return response['Body'].read()
+
+    def getFileSize(self, key: str) -> int:
+        """Gets the size of a file in S3 data bucket.
+
+        Args:
+            key (str): key of file
+
+        Returns:
+            int: size of the file in bytes
+        """
+        return self.s3Dao.getFileSize(self.dataBucketName, key)
+    
+    def getContentEncoding(self, key: str) -> str | None:
+        """Gets the Content-Encoding of a file in S3 data bucket.
+
+        Args:
+            key (str): key of file
+
+        Returns:
+            str | None: the file's Content-Encoding, e.g. 'zstd'; None if it has none
+        """
+        return self.s3Dao.getContentEncoding(self.dataBucketName, key)
+
+    def getETag(self, key: str) -> str:
+        """Gets the ETag of a file in S3 data bucket.
+
+        Args:
+            key (str): key of file
+
+        Returns:
+            str: the file's ETag, which changes whenever the file is overwritten
+        """
+        return self.s3Dao.getETag(self.dataBucketName, key)
+
+    def readCheckpoint(self, key: str) -> bytes | None:
+        """Reads the checkpoint of an input file from S3 data bucket.
+
+        Args:
+            key (str): key of the input file
+
+        Raises:
+            ClientError: S3 failed for a reason other than there being no checkpoint
+
+        Returns:
+            bytes | None: the checkpoint, or None if the input file has none
+        """
+        try:
+            response: dict = self.s3Dao.readFile(self.dataBucketName, f'Checkpoints/{key}.json')
+        except ClientError as e:
+            if self._isNonexistentFileError(e):
+                return None
+            raise
+        return response['Body'].read()
+
+    def writeCheckpoint(self, key: str, data: bytes) -> dict:
+        """Writes the checkpoint of an input file to S3 data bucket.
+
+        Args:
+            key (str): key of the input file
+            data (bytes): the checkpoint as JSON
+
+        Returns:
+            dict: response of `S3.Client.put_object` operation
+        """
+        return self.s3Dao.writeFile(self.dataBucketName, f'Checkpoints/{key}.json', data, {'ContentType': 'application/json'})
+
+    def deleteCheckpoint(self, key: str) -> dict:
+        """Deletes the checkpoint of an input file from S3 data bucket.
+
+        Args:
+            key (str): key of the input file
+
+        Returns:
+            dict: response of `S3.Client.delete_object` operation
+        """
+        return self.s3Dao.deleteFile(self.dataBucketName, f'Checkpoints/{key}.json')
+
+    def createOutputUpload(self, fileName: str, extraArgs: dict = None) -> str:
+        """Starts a multipart upload of an output file in the current process's data bucket.
+
+        Args:
+            fileName (str): name of file (including its extension)
+            extraArgs (dict, optional): other arguments of the upload, e.g. ContentType and ContentEncoding; defaults to none
 
-        This will write the output data to the current process's data bucket.
-        Then, it will try to write data to the next process's data bucket.
+        Returns:
+            str: ID of the multipart upload
+        """
+        return self.s3Dao.createMultipartUpload(self.dataBucketName, f'Output/{fileName}', extraArgs)
+
+    def uploadOutputPart(self, fileName: str, uploadId: str, partNumber: int, body: bytes) -> dict:
+        """Uploads one part of an output file's multipart upload.
+
+        Args:
+            fileName (str): name of file (including its extension)
+            uploadId (str): ID of the multipart upload
+            partNumber (int): 1-based number of the part
+            body (bytes): data of the part
+
+        Returns:
+            dict: part number and ETag of the uploaded part
+        """
+        return self.s3Dao.uploadPart(self.dataBucketName, f'Output/{fileName}', uploadId, partNumber, body)
+
+    def completeOutputUpload(self, fileName: str, uploadId: str, parts: list[dict]) -> dict:
+        """Completes an output file's multipart upload.
 
         Args:
-            data (StringIO): data to write to output file
             fileName (str): name of file (including its extension)
+            uploadId (str): ID of the multipart upload
+            parts (list[dict]): part number and ETag of each part, in order
 
         Returns:
-            tuple[dict, dict]:
-                dict: response of `S3.Client.put_object` operation for data bucket
-                dict: response of `S3.Client.put_object` operation for next process's data bucket
+            dict: response of `S3.Client.complete_multipart_upload` operation
+        """
+        return self.s3Dao.completeMultipartUpload(self.dataBucketName, f'Output/{fileName}', uploadId, parts)
+
+    def abortOutputUpload(self, fileName: str, uploadId: str) -> dict:
+        """Aborts an output file's multipart upload.
+
+        Args:
+            fileName (str): name of file (including its extension)
+            uploadId (str): ID of the multipart upload
+
+        Returns:
+            dict: response of `S3.Client.abort_multipart_upload` operation
+        """
+        return self.s3Dao.abortMultipartUpload(self.dataBucketName, f'Output/{fileName}', uploadId)
+
+    def hasOutputUpload(self, fileName: str, uploadId: str) -> bool:
+        """Checks whether an output file's multipart upload is still in progress.
+
+        Args:
+            fileName (str): name of file (including its extension)
+            uploadId (str): ID of the multipart upload
+
+        Returns:
+            bool: whether parts can still be added to the upload
+        """
+        return self.s3Dao.hasMultipartUpload(self.dataBucketName, f'Output/{fileName}', uploadId)
+
+    def writeOutput(self, data: bytes | BinaryIO | Iterable[bytes], fileName: str, extraArgs: dict = None) -> dict:
+        """Writes data to output file in the current process's data bucket only.
+
+        Data is streamed with a parallel multipart upload.
+
+        Args:
+            data (bytes | BinaryIO | Iterable[bytes]): data, binary file or iterator of byte chunks to write
+            fileName (str): name of file (including its extension)
+            extraArgs (dict, optional): other arguments of the upload, e.g. ContentType and ContentEncoding; defaults to none
+
+        Returns:
+            dict: response of `S3.Client.complete_multipart_upload` operation
+                  (or `S3.Client.put_object` if the data fit in a single part)
         """
         outKey = f'Output/{fileName}'
-        outData: bytes = data.read().encode('utf8')
-        response = self.s3Dao.writeFile(self.dataBucketName, outKey, outData)
+        return self.s3Dao.writeFileMultipart(
+            self.dataBucketName, outKey, data, self.uploadPartSize, self.uploadConcurrency, extraArgs
+        )
+
+    def writeNextAppInput(self, data: bytes | BinaryIO | Iterable[bytes], fileName: str, extraArgs: dict = None) -> dict:
+        """Writes data to input file in the next process's data bucket only.
+
+        Data is streamed with a parallel multipart upload.
+
+        Args:
+            data (bytes | BinaryIO | Iterable[bytes]): data, binary file or iterator of byte chunks to write
+            fileName (str): name of file (including its extension)
+            extraArgs (dict, optional): other arguments of the upload, e.g. ContentType and ContentEncoding; defaults to none
+
+        Returns:
+            dict: response of `S3.Client.complete_multipart_upload` operation
+                  (or `S3.Client.put_object` if the data fit in a single part)
+        """
         nextAppOutKey = f'ToDo/{fileName}'
-        nextAppResponse = self.s3Dao.writeFile(self.nextAppDataBucketName, nextAppOutKey, outData)
-        
-        return response, nextAppResponse
+        return self.s3Dao.writeFileMultipart(
+            self.nextAppDataBucketName, nextAppOutKey, data, self.uploadPartSize, self.uploadConcurrency, extraArgs
+        )
+
+    def writeNextAppManifest(self, data: bytes, key: str) -> dict:
+        """Writes a manifest to the next process's data bucket.
+
+        Args:
+            data (bytes): the manifest as JSON
+            key (str): key of the manifest
+
+        Returns:
+            dict: response of `S3.Client.put_object` operation
+        """
+        return self.s3Dao.writeFile(self.nextAppDataBucketName, key, data, {'ContentType': 'application/json'})
+
+    def listNextAppFiles(self, prefix: str) -> list[str]:
+        """Lists the keys of every file in the next process's data bucket under a prefix.
+
+        Args:
+            prefix (str): prefix the keys must start with
+
+        Returns:
+            list[str]: keys of the files
+        """
+        return self.s3Dao.listFiles(self.nextAppDataBucketName, prefix)
+
+    def readNextAppFile(self, key: str) -> bytes:
+        """Reads a file in the next process's data bucket.
+
+        Args:
+            key (str): key of file
+
+        Returns:
+            bytes: the file's contents
+        """
+        response: dict = self.s3Dao.readFile(self.nextAppDataBucketName, key)
+        return response['Body'].read()
+
+    def copyOutputToNextApp(self, fileName: str) -> dict:
+        """Copies output file to the next process's data bucket on the S3 side.
+
+        Args:
+            fileName (str): name of file (including its extension)
+
+        Returns:
+            dict: response of `S3.Client.copy_object` operation
+                  (or `S3.Client.complete_multipart_upload` for files over 5 GB)
+        """
+        outKey = f'Output/{fileName}'
+        nextAppOutKey = f'ToDo/{fileName}'
+        return self.s3Dao.copyFile(self.dataBucketName, outKey, self.nextAppDataBucketName, nextAppOutKey)
@@ -0,0 +1,56 @@
+import json
+import os
+import tempfile
+
+from awsEcs.models.OutputManifest import OutputManifest
+from awsEcs.models.services.ManifestStore import ManifestStore
+
+class LocalManifestStore(ManifestStore):
+    """A ManifestStore in a local directory, laid out like the next app's bucket.
+
+    Meant for tests and local runs.
+
+    Attributes:
+        directory (str): directory standing in for the next app's bucket
+    """
+
+    def __init__(self, directory: str) -> None:
+        """Constructs a LocalManifestStore object.
+
+        Args:
+            directory (str): directory standing in for the next app's bucket
+        """
+        self.directory = directory
+
+    def write(self, manifest: OutputManifest) -> None:
+        """Writes a manifest under the directory, replacing it in one step so it is never seen half written.
+
+        Args:
+            manifest (OutputManifest): the manifest
+        """
+        path = os.path.join(self.directory, manifest.manifestKey)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=os.path.dirname(path), delete=False) as file:
+            file.write(manifest.toJson())
+        os.replace(file.name, path)
+
+    def list(self, prefix: str = 'ToDo/') -> list[dict]:
+        """Lists the manifests under the directory.
+
+        Args:
+            prefix (str, optional): prefix of the manifests' keys; defaults to 'ToDo/'
+
+        Returns:
+            list[dict]: the manifests, ordered by key
+        """
+        manifests = []
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                key = os.path.relpath(os.path.join(root, name), self.directory).replace(os.sep, '/')
+                if key.startswith(prefix) and key.endswith(OutputManifest.SUFFIX):
+                    manifests.append(key)
+        result = []
+        for key in sorted(manifests):
+            with open(os.path.join(self.directory, key), 'rb') as file:
+                result.append(json.load(file))
+        return result
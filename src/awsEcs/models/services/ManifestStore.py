@@ -0,0 +1,34 @@
+from awsEcs.models.OutputManifest import OutputManifest
+
+class ManifestStore:
+    """An abstract base class for where output manifests are handed to the next app.
+
+    This class is meant to implement the Strategy pattern: the ECS task only
+    uses this interface, so the next app's bucket can be swapped for a local
+    directory in tests and local runs.
+    """
+
+    def write(self, manifest: OutputManifest) -> None:
+        """Writes a manifest next to its output file.
+
+        Args:
+            manifest (OutputManifest): the manifest
+
+        Raises:
+            NotImplementedError: the subclass must implement this method
+        """
+        raise NotImplementedError('Subclasses must implement this method.')
+
+    def list(self, prefix: str = 'ToDo/') -> list[dict]:
+        """Lists the manifests waiting for the next app, as it would discover them.
+
+        Args:
+            prefix (str, optional): prefix of the manifests' keys; defaults to 'ToDo/'
+
+        Raises:
+            NotImplementedError: the subclass must implement this method
+
+        Returns:
+            list[dict]: the manifests, ordered by key
+        """
+        raise NotImplementedError('Subclasses must implement this method.')
@@ -0,0 +1,128 @@
+import json
+import threading
+
+from awsEcs.models.services.NextAppFacade import NextAppFacade
+
+class NextAppBatcher:
+    """Collects input files for the next app and starts it on them in batches.
+
+    Waiting files are sent with `NextAppFacade.runBatch` once `maxKeys` of
+    them have been added, once another key would take the request past
+    `maxBytes`, or `maxDelay` seconds after the first of them was added,
+    whichever comes first. Adding a file never raises; errors from any batch
+    are raised by `close`.
+
+    Attributes:
+        DEFAULT_MAX_BYTES (int): default most bytes of keys sent in one request
+        DEFAULT_MAX_DELAY (float): default most seconds a file waits to be sent
+        nextAppFacade (NextAppFacade): facade batches are sent through
+        maxKeys (int): most files sent in one request
+        maxBytes (int): most bytes of keys sent in one request
+        maxDelay (float): most seconds a file waits to be sent
+        sent (int): number of files sent so far
+        requests (int): number of batches sent so far
+        errors (list[Exception]): errors of the batches that failed
+    """
+
+    DEFAULT_MAX_BYTES = 64 * 1024
+    DEFAULT_MAX_DELAY = 5.0
+
+    def __init__(self, nextAppFacade: NextAppFacade, maxKeys: int,
+                 maxBytes: int = DEFAULT_MAX_BYTES, maxDelay: float = DEFAULT_MAX_DELAY) -> None:
+        """Constructs a NextAppBatcher object.
+
+        Args:
+            nextAppFacade (NextAppFacade): facade to send batches through
+            maxKeys (int): most files sent in one request
+            maxBytes (int, optional): most bytes of keys sent in one request; defaults to DEFAULT_MAX_BYTES
+            maxDelay (float, optional): most seconds a file waits to be sent; defaults to DEFAULT_MAX_DELAY
+        """
+        self.nextAppFacade = nextAppFacade
+        self.maxKeys = maxKeys
+        self.maxBytes = maxBytes
+        self.maxDelay = maxDelay
+        self.sent = 0
+        self.requests = 0
+        self.errors: list[Exception] = []
+        self._pending: list[str] = []
+        self._pendingBytes = 0
+        self._timer: threading.Timer = None
+        self._inFlight = 0  # batches taken but not yet sent
+        self._condition = threading.Condition()
+
+    def add(self, infile: str) -> None:
+        """Adds an input file for the next app, sending the waiting files if they make a full batch.
+
+        Args:
+            infile (str): key of input file in next app's S3 bucket
+        """
+        size = len(json.dumps(infile)) + 1
+        batches: list[list[str]] = []
+        with self._condition:
+            if self._pending and self._pendingBytes + size > self.maxBytes:
+                batches.append(self._takePending())
+            self._pending.append(infile)
+            self._pendingBytes += size
+            if len(self._pending) >= self.maxKeys:
+                batches.append(self._takePending())
+            elif self._timer is None:
+                self._timer = threading.Timer(self.maxDelay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        for batch in batches:
+            self._send(batch)
+
+    def flush(self) -> None:
+        """Sends the files waiting to be sent, if there are any."""
+        with self._condition:
+            batch = self._takePending()
+        if batch:
+            self._send(batch)
+
+    def close(self) -> None:
+        """Sends the files waiting to be sent, waits for batches still being sent, and raises the first error from any batch.
+
+        Raises:
+            Exception: a batch failed
+        """
+        self.flush()
+        with self._condition:
+            self._condition.wait_for(lambda: self._inFlight == 0)
+        print(f'\nStarted next app on {self.sent} files in {self.requests} requests')
+        if self.errors:
+            raise self.errors[0]
+
+    def _takePending(self) -> list[str]:
+        """Takes the files waiting to be sent and stops the timer; the caller holds `_condition`.
+
+        Returns:
+            list[str]: the files that were waiting
+        """
+        batch, self._pending, self._pendingBytes = self._pending, [], 0
+        if batch:
+            self._inFlight += 1
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        return batch
+
+    def _send(self, batch: list[str]) -> None:
+        """Sends a batch of files to the next app, keeping any error for `close`.
+
+        Args:
+            batch (list[str]): keys of the files to send
+        """
+        try:
+            self.nextAppFacade.runBatch(batch)
+        except Exception as e:
+            print(f'\nFailed to start next app on {len(batch)} files: {e}')
+            with self._condition:
+                self.errors.append(e)
+        else:
+            with self._condition:
+                self.sent += len(batch)
+        finally:
+            with self._condition:
+                self.requests += 1
+                self._inFlight -= 1
+                self._condition.notify_all()
@@ -1,18 +1,56 @@
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
 
+from common.models.EnvVar import EnvVar
 from common.Names import NEXT_APP_SUBDOMAIN
 
 class NextAppFacade:
-    """Contains a method for running the next application.
-    
+    """Contains methods for running the next application.
+
+    Requests go through one keep-alive session shared by every facade in the
+    process, so an ECS worker running many jobs reuses its connections to the
+    next app's API. Every request has connect and read timeouts, so a slow
+    API can't hang the task. Responses with status 429 or 5xx, and
+    connections that fail, are retried with jittered exponential backoff;
+    when every attempt fails, an error is raised instead of the handoff
+    being dropped.
+
+    Several input files can be passed to the next app in one request with
+    `runBatch`. If the next app doesn't accept batches, their files are
+    passed one at a time instead, and later batches are too.
+
     Attributes:
-        NEXT_GS_RUN_ENDPOINT (str): API endpoint for running next app 
+        RETRY_STATUSES (frozenset[int]): response statuses that are retried
+        BATCH_UNSUPPORTED_STATUSES (frozenset[int]): response statuses meaning the next app doesn't accept batches
+        POOL_SIZE (int): most connections kept open to the next app's API
+        BACKOFF_BASE (float): seconds waited before the first retry, doubled for each retry after it (before jitter)
+        BACKOFF_MAX (float): most seconds waited before one retry
+        NEXT_GS_RUN_ENDPOINT (str): API endpoint for running next app
         ORIGIN (str): origin for the request to run next app
+        connectTimeout (float): seconds to wait for a connection to the API
+        readTimeout (float): seconds to wait for the API to respond
+        maxRetries (int): number of times a failed request is retried
     """
 
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    BATCH_UNSUPPORTED_STATUSES = frozenset({400, 404, 405, 415, 422})
+    POOL_SIZE = 10
+    BACKOFF_BASE = 0.5
+    BACKOFF_MAX = 20.0
+
+    _session: requests.Session = None
+    _executor: ThreadPoolExecutor = None
+    _lock = threading.Lock()
+    _batchUnsupported: set[str] = set()  # endpoints that rejected a batch
+
     def __init__(self, env: str) -> None:
         """Constructs a NextAppFacade object.
-        
+
         Args:
             env (str): version of next app to run
         """
@@ -26,20 +64,176 @@ class NextAppFacade:
         self.NEXT_GS_RUN_ENDPOINT = f'https://api.{NEXT_APP_SUBDOMAIN}.{subdomainEnv}.byu.edu/run'
         self.ORIGIN = f'https://{NEXT_APP_SUBDOMAIN}.{subdomainEnv}.byu.edu'
 
-    def run(self, infile: str) -> None:
+        envVar = EnvVar()
+        self.connectTimeout = float(envVar.get('NEXT_APP_CONNECT_TIMEOUT', '5'))
+        self.readTimeout = float(envVar.get('NEXT_APP_READ_TIMEOUT', '30'))
+        self.maxRetries = int(envVar.get('NEXT_APP_MAX_RETRIES', '4'))
+
+    @classmethod
+    def _getSession(cls) -> requests.Session:
+        """Gets the session shared by every facade in the process, creating it on first use.
+
+        Returns:
+            requests.Session: session with a pool of keep-alive connections
+        """
+        with cls._lock:
+            if cls._session is None:
+                session = requests.Session()
+                session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=cls.POOL_SIZE))
+                cls._session = session
+            return cls._session
+
+    @classmethod
+    def _getExecutor(cls) -> ThreadPoolExecutor:
+        """Gets the thread pool `runAsync` sends requests on, creating it on first use.
+
+        Returns:
+            ThreadPoolExecutor: the thread pool
+        """
+        with cls._lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(max_workers=cls.POOL_SIZE, thread_name_prefix='NextAppFacade')
+            return cls._executor
+
+    def run(self, infile: str) -> requests.Response:
         """Starts next app by calling its API, passing the key of the infile.
 
         Args:
             infile (str): key of input file in next app's S3 bucket
+
+        Raises:
+            requests.HTTPError: the API responded with an error, on the last attempt if it was retryable
+            requests.RequestException: the API couldn't be reached, or didn't respond in time
+
+        Returns:
+            requests.Response: the API's response
         """
-        res = requests.post(
-            self.NEXT_GS_RUN_ENDPOINT,
-            json={'inputFile': infile},
-            headers={'origin': self.ORIGIN}
-        )
-        if res.status_code != 200:
-            print('\nError running next app:')
-            print(f'Status code: {res.status_code}')
-            print(f'Response: {res.text}')
-        else:
-            print('Next app ran successfully!')
+        return self._post({'inputFile': infile})
+
+    def runBatch(self, infiles: list[str]) -> None:
+        """Starts next app on several input files with one call to its API.
+
+        If the API rejects the batch as unsupported (or too large), each file
+        is passed with `run` instead; after an unsupported response, later
+        batches to the same endpoint go straight to `run`.
+
+        Args:
+            infiles (list[str]): keys of input files in next app's S3 bucket
+
+        Raises:
+            requests.HTTPError: the API responded to the batch with an error, on the last attempt if it was retryable
+            requests.RequestException: the API couldn't be reached, or didn't respond in time
+            RuntimeError: some of the files failed when passed one at a time
+        """
+        if len(infiles) == 1:
+            self.run(infiles[0])
+            return
+        if self.NEXT_GS_RUN_ENDPOINT in self._batchUnsupported:
+            self._runEach(infiles)
+            return
+        try:
+            self._post({'inputFiles': infiles})
+        except requests.HTTPError as e:
+            if e.response is None or e.response.status_code not in self.BATCH_UNSUPPORTED_STATUSES | {413}:
+                raise
+            if e.response.status_code != 413:
+                print('Next app doesn\'t accept batches; passing input files one at a time')
+                with self._lock:
+                    self._batchUnsupported.add(self.NEXT_GS_RUN_ENDPOINT)
+            self._runEach(infiles)
+
+    def _runEach(self, infiles: list[str]) -> None:
+        """Starts next app on each of several input files with its own call to the API.
+
+        Every file is tried even if some fail.
+
+        Args:
+            infiles (list[str]): keys of input files in next app's S3 bucket
+
+        Raises:
+            RuntimeError: some of the files failed
+        """
+        failures: dict[str, Exception] = {}
+        for infile in infiles:
+            try:
+                self.run(infile)
+            except Exception as e:
+                failures[infile] = e
+        if failures:
+            raise RuntimeError(f'Running next app failed for {len(failures)} of {len(infiles)} input files: {list(failures)}') from next(iter(failures.values()))
+
+    def _post(self, payload: dict) -> requests.Response:
+        """Calls the next app's API, retrying throttled, failed and unreachable requests.
+
+        A request that fails with a retryable status or a connection error is
+        retried up to `maxRetries` times. A read timeout isn't retried, since
+        the next app may already have started.
+
+        Args:
+            payload (dict): JSON body of the request
+
+        Raises:
+            requests.HTTPError: the API responded with an error, on the last attempt if it was retryable
+            requests.RequestException: the API couldn't be reached, or didn't respond in time
+
+        Returns:
+            requests.Response: the API's response
+        """
+        start = time.perf_counter()
+        for attempt in range(self.maxRetries + 1):
+            try:
+                res = self._getSession().post(
+                    self.NEXT_GS_RUN_ENDPOINT,
+                    json=payload,
+                    headers={'origin': self.ORIGIN},
+                    timeout=(self.connectTimeout, self.readTimeout)
+                )
+            except requests.ConnectionError as e:
+                if attempt == self.maxRetries:
+                    raise
+                print(f'\nCouldn\'t reach next app ({e}); retrying...')
+                time.sleep(self._getBackoff(attempt))
+                continue
+
+            if res.status_code in self.RETRY_STATUSES and attempt < self.maxRetries:
+                print(f'\nNext app responded with status {res.status_code}; retrying...')
+                time.sleep(self._getBackoff(attempt, res.headers.get('Retry-After')))
+                continue
+            if res.status_code != 200:
+                print('\nError running next app:')
+                print(f'Status code: {res.status_code}')
+                print(f'Response: {res.text}')
+                raise requests.HTTPError(f'Next app responded with status {res.status_code}', response=res)
+
+            print(f'Next app ran successfully! ({time.perf_counter() - start:.2f}s, {attempt + 1} attempt(s))')
+            return res
+
+    def runAsync(self, infile: str) -> Future:
+        """Starts next app like `run`, without waiting for it.
+
+        Args:
+            infile (str): key of input file in next app's S3 bucket
+
+        Returns:
+            Future: resolves to the API's response, or raises the error `run` would
+        """
+        return self._getExecutor().submit(self.run, infile)
+
+    def _getBackoff(self, attempt: int, retryAfter: str = None) -> float:
+        """Gets how long to wait before retrying a request.
+
+        The wait is random up to an exponentially growing cap ("full jitter"),
+        so tasks that fail together don't retry together, but never shorter
+        than the API's Retry-After.
+
+        Args:
+            attempt (int): 0-based number of the attempt that failed
+            retryAfter (str, optional): the response's Retry-After header, in seconds; defaults to none
+
+        Returns:
+            float: seconds to wait
+        """
+        backoff = random.uniform(0, min(self.BACKOFF_MAX, self.BACKOFF_BASE * 2 ** attempt))
+        if retryAfter and retryAfter.isdigit():
+            backoff = max(backoff, min(float(retryAfter), self.BACKOFF_MAX))
+        return backoff
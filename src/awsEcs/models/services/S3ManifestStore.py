@@ -0,0 +1,44 @@
+import json
+
+from awsEcs.models.OutputManifest import OutputManifest
+from awsEcs.models.services.EcsS3Service import EcsS3Service
+from awsEcs.models.services.ManifestStore import ManifestStore
+
+class S3ManifestStore(ManifestStore):
+    """A ManifestStore in the next app's S3 data bucket.
+
+    Manifests are written once their output file is, so the next app can
+    find work by listing its bucket or from S3 event notifications on the
+    manifest suffix.
+
+    Attributes:
+        s3 (EcsS3Service): service for working with Amazon S3
+    """
+
+    def __init__(self, s3: EcsS3Service) -> None:
+        """Constructs an S3ManifestStore object.
+
+        Args:
+            s3 (EcsS3Service): service for working with Amazon S3
+        """
+        self.s3 = s3
+
+    def write(self, manifest: OutputManifest) -> None:
+        """Writes a manifest next to its output file in the next app's bucket.
+
+        Args:
+            manifest (OutputManifest): the manifest
+        """
+        self.s3.writeNextAppManifest(manifest.toJson(), manifest.manifestKey)
+
+    def list(self, prefix: str = 'ToDo/') -> list[dict]:
+        """Lists the manifests in the next app's bucket.
+
+        Args:
+            prefix (str, optional): prefix of the manifests' keys; defaults to 'ToDo/'
+
+        Returns:
+            list[dict]: the manifests, ordered by key
+        """
+        keys = sorted(key for key in self.s3.listNextAppFiles(prefix) if key.endswith(OutputManifest.SUFFIX))
+        return [json.loads(self.s3.readNextAppFile(key)) for key in keys]
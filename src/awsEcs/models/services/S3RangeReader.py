@@ -0,0 +1,195 @@
+import io
+import mmap
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from botocore.client import BaseClient
+from botocore.exceptions import ClientError
+
+class S3RangeReader(io.RawIOBase):
+    """Reads an S3 object as a seekable binary file, downloading it as concurrent byte ranges.
+
+    The object's size and ETag are looked up first, then every part is
+    requested at once on a thread pool, each written straight into its
+    place in a buffer the size of the object. Reads only wait for the parts
+    they cover, so the start of the file can be read while the rest is
+    still downloading. Every ranged GET is conditional on the ETag, so an
+    object overwritten mid-download fails instead of mixing two versions.
+
+    Objects larger than a spool threshold are downloaded to a temporary file
+    on the task's ephemeral storage instead, memory-mapped so the same
+    writes and reads work on it. The kernel can then page the object out
+    rather than it counting against the task's memory.
+
+    Attributes:
+        READ_SIZE (int): bytes read from a part's response body at a time
+        client (BaseClient): AWS client object for Amazon S3
+        bucket (str): name of bucket the object is in
+        key (str): key of the object
+        size (int): size of the object in bytes
+        etag (str): ETag of the object when the download started
+        partSize (int): size in bytes of each byte range
+        spooled (bool): whether the object is downloaded to disk rather than memory
+    """
+
+    READ_SIZE = 1024 * 1024
+
+    def __init__(self, client: BaseClient, bucket: str, key: str, partSize: int, maxConcurrency: int,
+                 spoolThreshold: int = None) -> None:
+        """Constructs an S3RangeReader object and starts downloading the object.
+
+        Args:
+            client (BaseClient): AWS client object for Amazon S3
+            bucket (str): name of bucket the object is in
+            key (str): key of the object
+            partSize (int): size in bytes of each byte range
+            maxConcurrency (int): number of byte ranges downloaded at once
+            spoolThreshold (int, optional): size in bytes above which the object is downloaded to disk; defaults to never
+        """
+        super().__init__()
+        self.client = client
+        self.bucket = bucket
+        self.key = key
+        head: dict = client.head_object(Bucket=bucket, Key=key)
+        self.size: int = head['ContentLength']
+        self.etag: str = head['ETag']
+        self.partSize = partSize
+
+        self.spooled: bool = spoolThreshold is not None and self.size > spoolThreshold
+        self._spoolFile = None
+        self._buffer: bytearray | mmap.mmap
+        if self.spooled:
+            self._spoolFile = tempfile.TemporaryFile()
+            self._spoolFile.truncate(self.size)
+            self._buffer = mmap.mmap(self._spoolFile.fileno(), self.size)
+        else:
+            self._buffer = bytearray(self.size)
+        self._view = memoryview(self._buffer)
+        self._position = 0
+        self._executor = ThreadPoolExecutor(max_workers=maxConcurrency)
+        self._parts: list[Future] = [
+            self._executor.submit(self._fetchPart, start, min(start + partSize, self.size))
+            for start in range(0, self.size, partSize)
+        ]
+
+    def _fetchPart(self, start: int, end: int) -> None:
+        """Downloads one byte range into its place in the buffer.
+
+        Args:
+            start (int): first byte of the range (inclusive)
+            end (int): last byte of the range (exclusive)
+
+        Raises:
+            RuntimeError: the object changed since the download started, or the range came back short
+        """
+        try:
+            response: dict = self.client.get_object(
+                Bucket=self.bucket,
+                Key=self.key,
+                Range=f'bytes={start}-{end - 1}',
+                IfMatch=self.etag
+            )
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in ('PreconditionFailed', '412'):
+                raise RuntimeError(f'{self.key} was overwritten while it was being downloaded') from e
+            raise
+        if response.get('ETag', self.etag) != self.etag:
+            raise RuntimeError(f'{self.key} was overwritten while it was being downloaded')
+
+        body = response['Body']
+        try:
+            position = start
+            while position < end:
+                chunk = body.read(min(self.READ_SIZE, end - position))
+                if not chunk:
+                    break
+                self._view[position:position + len(chunk)] = chunk
+                position += len(chunk)
+        finally:
+            body.close()
+        if position != end:
+            raise RuntimeError(f'Byte range {start}-{end - 1} of {self.key} ended after {position - start} bytes')
+
+    def _waitFor(self, start: int, end: int) -> None:
+        """Waits until the parts covering a range of the object have downloaded.
+
+        Args:
+            start (int): first byte of the range (inclusive)
+            end (int): last byte of the range (exclusive)
+        """
+        for part in self._parts[start // self.partSize:-(-end // self.partSize)]:
+            part.result()
+        if end >= self.size:
+            self._executor.shutdown(wait=False)  # every part has been waited for, so the threads can go
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:
+        """Reads bytes from the current position into a buffer.
+
+        Args:
+            buffer (bytearray | memoryview): buffer to fill
+
+        Returns:
+            int: number of bytes read; 0 at the end of the object
+        """
+        count = max(0, min(len(buffer), self.size - self._position))
+        if count:
+            self._waitFor(self._position, self._position + count)
+            buffer[:count] = self._view[self._position:self._position + count]
+            self._position += count
+        return count
+
+    def readall(self) -> bytes:
+        """Reads from the current position to the end of the object.
+
+        Returns:
+            bytes: the rest of the object
+        """
+        start = self._position
+        self._waitFor(start, self.size)
+        self._position = max(start, self.size)
+        return bytes(self._view[start:])
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """Moves the current position.
+
+        Args:
+            offset (int): offset to move by
+            whence (int, optional): what the offset is relative to; defaults to the start of the object
+
+        Raises:
+            ValueError: the position would be negative
+
+        Returns:
+            int: the new position
+        """
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._position, io.SEEK_END: self.size}[whence]
+        if base + offset < 0:
+            raise ValueError(f'Negative seek position: {base + offset}')
+        self._position = base + offset
+        return self._position
+
+    def tell(self) -> int:
+        """Gets the current position.
+
+        Returns:
+            int: the current position
+        """
+        return self._position
+
+    def readable(self) -> bool:
+        """Returns True, since the object can be read."""
+        return True
+
+    def seekable(self) -> bool:
+        """Returns True, since the object can be read from any position."""
+        return True
+
+    def close(self) -> None:
+        """Stops any downloads that haven't started and releases the buffer, deleting it from disk if it was spooled."""
+        if not self.closed:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._view.release()
+            if self._spoolFile is not None:
+                self._buffer.close()
+                self._spoolFile.close()
+        super().close()
@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+
+from awsEcs.models.stages.TransformStage import TransformStage
+
+class DedupeStage(TransformStage):
+    """Drops hints whose key columns repeat an earlier hint, including hints in earlier chunks.
+
+    Keys are remembered as 64-bit hashes of the key columns, so the state
+    kept between chunks is 8 bytes per distinct key rather than the keys
+    themselves. Each chunk's hashes are looked up in and merged into the
+    sorted array with binary searches, so only the chunk is sorted rather
+    than every hash seen so far.
+
+    Attributes:
+        columns (list[str]): columns that together identify a hint
+        seen (np.ndarray): sorted hashes of the keys already kept
+    """
+
+    NAME = 'dedupe'
+    DEFAULT_COLUMNS = ['ark', 'pid']
+
+    def __init__(self, columns: list[str] = None, name: str = None) -> None:
+        """Constructs a DedupeStage object.
+
+        Args:
+            columns (list[str], optional): columns that together identify a hint; defaults to ark and pid
+            name (str, optional): name the stage's timings are reported under; defaults to 'dedupe'
+        """
+        super().__init__(name)
+        self.columns: list[str] = list(columns or self.DEFAULT_COLUMNS)
+        self.seen: np.ndarray = np.array([], dtype=np.uint64)
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Keeps the first hint with each key.
+
+        Key columns that aren't in the DataFrame are left out of the key; if
+        none of them are, every hint is kept.
+
+        Args:
+            df (pd.DataFrame): hint data
+
+        Returns:
+            pd.DataFrame: the hints whose keys haven't been seen before
+        """
+        columns = [column for column in self.columns if column in df]
+        if not columns or df.empty:
+            return df
+
+        hashes = pd.util.hash_pandas_object(df[columns], index=False).to_numpy()
+        keep = ~pd.Series(hashes).duplicated().to_numpy()
+        positions = np.searchsorted(self.seen, hashes)
+        found = positions < len(self.seen)
+        found[found] = self.seen[positions[found]] == hashes[found]
+        keep &= ~found
+
+        new = np.sort(hashes[keep])
+        self.seen = np.insert(self.seen, np.searchsorted(self.seen, new), new)
+        return df[keep]
@@ -0,0 +1,35 @@
+from typing import Any, Callable
+
+import pandas as pd
+
+from awsEcs.models.stages.TransformStage import TransformStage
+
+class EnrichStage(TransformStage):
+    """Adds or replaces columns computed from the rest of the hint data.
+
+    Attributes:
+        columns (dict[str, Callable[[pd.DataFrame], Any] | Any]): new columns, as vectorized functions of the data or constants
+    """
+
+    NAME = 'enrich'
+
+    def __init__(self, columns: dict[str, Callable[[pd.DataFrame], Any] | Any], name: str = None) -> None:
+        """Constructs an EnrichStage object.
+
+        Args:
+            columns (dict[str, Callable[[pd.DataFrame], Any] | Any]): new columns, e.g. `{'hasFamily': lambda df: df['familyid'].notna()}`
+            name (str, optional): name the stage's timings are reported under; defaults to 'enrich'
+        """
+        super().__init__(name)
+        self.columns = columns
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Adds the stage's columns, in order, so later ones can use earlier ones.
+
+        Args:
+            df (pd.DataFrame): hint data
+
+        Returns:
+            pd.DataFrame: hint data with the new columns
+        """
+        return df.assign(**self.columns)
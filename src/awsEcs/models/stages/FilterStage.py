@@ -0,0 +1,40 @@
+from typing import Callable
+
+import pandas as pd
+
+from awsEcs.models.stages.TransformStage import TransformStage
+
+class FilterStage(TransformStage):
+    """Keeps the hints matching a vectorized condition.
+
+    Attributes:
+        condition (Callable[[pd.DataFrame], pd.Series]): gives a boolean mask of the rows to keep
+    """
+
+    NAME = 'filter'
+
+    def __init__(self, condition: Callable[[pd.DataFrame], pd.Series], name: str = None) -> None:
+        """Constructs a FilterStage object.
+
+        Args:
+            condition (Callable[[pd.DataFrame], pd.Series]): gives a boolean mask of the rows to keep, e.g. `lambda df: df['score'] > 1`
+            name (str, optional): name the stage's timings are reported under; defaults to 'filter'
+        """
+        super().__init__(name)
+        self.condition = condition
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Drops the hints that don't match the condition.
+
+        Missing values in the mask count as not matching.
+
+        Args:
+            df (pd.DataFrame): hint data
+
+        Returns:
+            pd.DataFrame: the hints matching the condition
+        """
+        mask = self.condition(df)
+        if isinstance(mask, pd.Series):
+            mask = mask.fillna(False).astype(bool)
+        return df[mask]
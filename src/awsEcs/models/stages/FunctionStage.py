@@ -0,0 +1,33 @@
+from typing import Callable
+
+import pandas as pd
+
+from awsEcs.models.stages.TransformStage import TransformStage
+
+class FunctionStage(TransformStage):
+    """Transforms hint data with a function of the whole DataFrame.
+
+    Attributes:
+        func (Callable[[pd.DataFrame], pd.DataFrame]): vectorized function that transforms the data
+    """
+
+    def __init__(self, name: str, func: Callable[[pd.DataFrame], pd.DataFrame]) -> None:
+        """Constructs a FunctionStage object.
+
+        Args:
+            name (str): name the stage's timings are reported under
+            func (Callable[[pd.DataFrame], pd.DataFrame]): vectorized function that transforms the data
+        """
+        super().__init__(name)
+        self.func = func
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Transforms hint data with the stage's function.
+
+        Args:
+            df (pd.DataFrame): hint data
+
+        Returns:
+            pd.DataFrame: transformed hint data
+        """
+        return self.func(df)
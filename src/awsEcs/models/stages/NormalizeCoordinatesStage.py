@@ -0,0 +1,39 @@
+import pandas as pd
+
+from awsEcs.models.HintSchema import HintSchema
+from awsEcs.models.stages.TransformStage import TransformStage
+
+class NormalizeCoordinatesStage(TransformStage):
+    """Turns latitude and longitude into numbers, dropping values that aren't valid coordinates.
+
+    The leading quote spreadsheets add is stripped, and values that can't be
+    parsed or are out of range become missing.
+
+    Attributes:
+        RANGES (dict[str, tuple[float, float]]): valid range of each coordinate column
+    """
+
+    NAME = 'normalizeCoordinates'
+    RANGES = {'latitude': (-90.0, 90.0), 'longitude': (-180.0, 180.0)}
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Normalizes the coordinate columns of hint data.
+
+        Columns that aren't in the DataFrame are skipped.
+
+        Args:
+            df (pd.DataFrame): hint data
+
+        Returns:
+            pd.DataFrame: hint data with numeric coordinates
+        """
+        normalized = {}
+        for column, (low, high) in self.RANGES.items():
+            if column not in df:
+                continue
+            values = df[column]
+            if pd.api.types.is_object_dtype(values) or pd.api.types.is_string_dtype(values):
+                values = values.str.lstrip(HintSchema.QUOTE)
+            values = pd.to_numeric(values, errors='coerce').astype(HintSchema.COORDINATE_TYPE)
+            normalized[column] = values.where(values.between(low, high))
+        return df.assign(**normalized)
@@ -0,0 +1,37 @@
+import pandas as pd
+
+class TransformStage:
+    """An abstract base class for one vectorized step of processing hint data.
+
+    Subclasses implement `transform`, which takes a DataFrame and returns a
+    new one. In streaming mode it is called once per chunk, so a stage that
+    needs to remember earlier chunks (e.g. to drop duplicates across them)
+    keeps that state on itself. A new stage is made for every input file.
+
+    Attributes:
+        name (str): name the stage's timings are reported under
+    """
+
+    NAME = ''
+
+    def __init__(self, name: str = None) -> None:
+        """Constructs a TransformStage object.
+
+        Args:
+            name (str, optional): name the stage's timings are reported under; defaults to `NAME`
+        """
+        self.name: str = name or self.NAME
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Transforms hint data.
+
+        Args:
+            df (pd.DataFrame): hint data (the whole file, or one chunk of it in streaming mode)
+
+        Raises:
+            NotImplementedError: the subclass must implement this method
+
+        Returns:
+            pd.DataFrame: transformed hint data
+        """
+        raise NotImplementedError('Subclasses must implement this method.')
@@ -1,61 +1,740 @@
-from io import StringIO
+import json
+import multiprocessing
+import tempfile
+import traceback
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
+from functools import partial
+from io import BytesIO
+from typing import BinaryIO, Callable, Iterator
 
 import pandas as pd
-from PyBugReporter.src.BugReporter import BugReporter
 
+from awsEcs.models.Checkpoint import Checkpoint
+from awsEcs.models.CsvShard import CsvShard
+from awsEcs.models.HintSchema import HintSchema
+from awsEcs.models.OutputManifest import OutputManifest
+from awsEcs.models.StepExecutor import StepExecutor
+from awsEcs.models.formats.CompressedFormat import CompressedFormat
+from awsEcs.models.formats.CsvFormat import CsvFormat
+from awsEcs.models.formats.FileFormat import FileFormat
+from awsEcs.models.formats.FileFormatFactory import FileFormatFactory
+from awsEcs.models.stages.FunctionStage import FunctionStage
+from awsEcs.models.stages.TransformStage import TransformStage
 from awsEcs.models.services.EcsS3Service import EcsS3Service
+from awsEcs.models.services.ManifestStore import ManifestStore
+from awsEcs.models.services.NextAppBatcher import NextAppBatcher
 from awsEcs.models.services.NextAppFacade import NextAppFacade
+from awsEcs.models.services.S3ManifestStore import S3ManifestStore
+from awsEcs.presenters.HintPipeline import HintPipeline
+from awsEcs.presenters.ShardWorker import ShardWorker
 from common.models.EnvVar import EnvVar
-from common.models.services.ParameterService import ParameterService
-from common.Names import PROJECT_NAME
+from common.models.services.BugReporterFacade import BugReporterFacade
 
 class EcsTask:
     """Contains methods for running the ECS task.
 
     Attributes:
-        INFILE_KEY (str): key of input file
-        INFILE_NAME (str): name of input file
+        INFILE_KEY (str): key of input file, a JSON list of keys, or a prefix ending in "/" to process every file under
+        INFILE_NAME (str): name of input file, when INFILE_KEY is a single key
+        MAX_CONCURRENT_FILES (int): number of input files processed at once when there are several
+        NEXT_APP_BATCH_SIZE (int): most output files the next app is started on per request when there are several input files; 1 to start it once per file
+        NEXT_APP_HANDOFF (str): how output files are handed to the next app: 'http' calls its API, 'manifest' writes a manifest next to each output for it to discover
+        INPUT_FORMAT (str | None): name of the input files' format; None to choose by extension
+        COLUMNS (list[str] | None): columns to read from input files; None to read all of them
+        outputFormat (FileFormat): format output files are written in (CSV unless OUTPUT_FORMAT is set, e.g. to 'parquet' or 'csv.zst')
+        schema (HintSchema | None): declared types hint data is loaded with, if HINT_SCHEMA is on (parsing coordinates as numbers if PARSE_COORDINATES is on too)
+        CHUNK_SIZE (int | None): number of rows per chunk in streaming mode; None if streaming is off
+        SERVER_SIDE_COPY (bool): whether output is uploaded once and copied to the next app's bucket by S3
+        PARALLEL_WORKERS (int): number of processes a CSV input file is split across; 1 if parallel mode is off
+        CHECKPOINTS (bool): whether progress through a CSV input file is saved in S3, so a restarted task resumes it
+        SPOOL_THRESHOLD (int | None): size in bytes above which inputs and outputs are staged on disk; None to keep them in memory
+        STAGING_CHUNK_SIZE (int): number of rows serialized at a time when output may be staged on disk
+        MIN_SHARD_SIZE (int): smallest shard in bytes; smaller files aren't split
+        MAX_SHARD_SIZE (int): largest shard in bytes, which bounds each worker's memory
+        test (bool): whether the task is being tested
         s3 (EcsS3Service): service for working with Amazon S3
         nextAppFacade (NextAppFacade): facade for running the next application
+        nextAppBatcher (NextAppBatcher | None): batches next app triggers while several input files are processed
+        manifestStore (ManifestStore | None): where output manifests are written, if NEXT_APP_HANDOFF is 'manifest'
     """
 
-    def __init__(self, test: bool = False) -> None:
+    MIN_SHARD_SIZE = 1024 * 1024
+    MAX_SHARD_SIZE = 64 * 1024 * 1024
+    STAGING_CHUNK_SIZE = 100000
+
+    def __init__(self, test: bool = False, infile: str = None) -> None:
         """Constructs an ECS Task object.
-        
+
         Args:
             test (bool, optional): whether the task is being tested; defaults to False
+            infile (str, optional): input file(s) to process, in the same forms as INFILE; defaults to INFILE
         """
         envVar = EnvVar()
 
-        self.INFILE_KEY: str = envVar['INFILE']
+        self.INFILE_KEY: str = infile if infile is not None else envVar['INFILE']
         self.INFILE_NAME: str = self.INFILE_KEY.split('/')[-1]
         env: str = envVar['ENV']
         env = env.lower()
-        
+
+        chunkSize = envVar.get('CHUNK_SIZE')
+        self.CHUNK_SIZE: int | None = int(chunkSize) if chunkSize else None
+        self.SERVER_SIDE_COPY: bool = envVar.get('SERVER_SIDE_COPY', 'false').lower() == 'true'
+        self.MAX_CONCURRENT_FILES: int = int(envVar.get('MAX_CONCURRENT_FILES', '1'))
+        self.NEXT_APP_BATCH_SIZE: int = int(envVar.get('NEXT_APP_BATCH_SIZE', '1'))
+        self.NEXT_APP_HANDOFF: str = envVar.get('NEXT_APP_HANDOFF', 'http').lower()
+        if self.NEXT_APP_HANDOFF not in ('http', 'manifest'):
+            raise ValueError(f"NEXT_APP_HANDOFF must be 'http' or 'manifest': {self.NEXT_APP_HANDOFF}")
+        self.INPUT_FORMAT: str | None = envVar.get('INPUT_FORMAT')
+        columns = envVar.get('COLUMNS')
+        self.COLUMNS: list[str] | None = [column.strip() for column in columns.split(',')] if columns else None
+        self.outputFormat: FileFormat = FileFormatFactory.getFormat(name=envVar.get('OUTPUT_FORMAT', CsvFormat.NAME))
+        parseCoordinates = envVar.get('PARSE_COORDINATES', 'false').lower() == 'true'
+        self.schema: HintSchema | None = HintSchema(parseCoordinates) if envVar.get('HINT_SCHEMA', 'false').lower() == 'true' else None
+        parallelWorkers = envVar.get('PARALLEL_WORKERS', '1')
+        self.PARALLEL_WORKERS: int = ShardWorker.getCpuCount() if parallelWorkers.lower() == 'auto' else int(parallelWorkers)
+        self.CHECKPOINTS: bool = envVar.get('CHECKPOINTS', 'false').lower() == 'true'
+        spoolThresholdMb = envVar.get('SPOOL_THRESHOLD_MB')
+        self.SPOOL_THRESHOLD: int | None = int(spoolThresholdMb) * 1024 * 1024 if spoolThresholdMb else None
+        self.test = test
+
         self.s3 = EcsS3Service()
         self.nextAppFacade = NextAppFacade(env)
-        parameterService = ParameterService()
-        BugReporter.setVars(parameterService.getGithubCredentials(), PROJECT_NAME, 'byuawsfhtl', test)
+        self.nextAppBatcher: NextAppBatcher | None = None
+        self.manifestStore: ManifestStore | None = S3ManifestStore(self.s3) if self.NEXT_APP_HANDOFF == 'manifest' else None
+        BugReporterFacade.setVars(test)
 
-    @BugReporter(extraInfo=True, env=EnvVar()['ENV'], infile=EnvVar()['INFILE'])
+    @BugReporterFacade(extraInfo=True, env=EnvVar()['ENV'], infile=EnvVar().get('INFILE'))
     def run(self) -> None:
-        """Runs the ECS Task."""
-        print(f'\nLoading data from input file ({self.INFILE_KEY})...')
-        inCsvData: StringIO = self.s3.readFile(self.INFILE_KEY)
-        df: pd.DataFrame = pd.read_csv(inCsvData)
+        """Runs the ECS Task on every input file it was given.
+
+        With several input files, up to `MAX_CONCURRENT_FILES` are processed
+        at once, sharing this task's S3 clients and interpreter. A file that
+        fails doesn't stop the others; once all have been tried, an error
+        listing the failed files is raised. With `NEXT_APP_BATCH_SIZE` above 1,
+        the next app is started on their outputs in batches rather than
+        once per file.
+
+        Raises:
+            RuntimeError: some of several input files failed
+            Exception: starting the next app on a batch of output files failed
+        """
+        keys = self._getInfileKeys()
+        if len(keys) == 0:
+            print(f'\nNo input files found for {self.INFILE_KEY}')
+            return
+        if len(keys) == 1:
+            self._runFile(keys[0])
+            return
+
+        print(f'\nProcessing {len(keys)} input files, {self.MAX_CONCURRENT_FILES} at a time...')
+        if self.NEXT_APP_BATCH_SIZE > 1 and not self.manifestStore:
+            self.nextAppBatcher = NextAppBatcher(self.nextAppFacade, self.NEXT_APP_BATCH_SIZE)
+        failures: dict[str, Exception] = {}
+        try:
+            with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_FILES) as executor:
+                futures = {executor.submit(self._runFile, key): key for key in keys}
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        print(f'\nFailed to process {futures[future]}:')
+                        print(''.join(traceback.format_exception(e)))
+                        failures[futures[future]] = e
+        finally:
+            if self.nextAppBatcher:
+                batcher, self.nextAppBatcher = self.nextAppBatcher, None
+                batcher.close()
+
+        if failures:
+            raise RuntimeError(f'{len(failures)} of {len(keys)} input files failed: {list(failures)}') from next(iter(failures.values()))
+
+    def _getInfileKeys(self) -> list[str]:
+        """Gets the keys of the input files from `INFILE_KEY`.
+
+        `INFILE_KEY` may be a single key, a JSON list of keys, or a prefix
+        ending in "/" whose files are all processed.
+
+        Raises:
+            ValueError: `INFILE_KEY` is a JSON value but not a list of keys
+
+        Returns:
+            list[str]: keys of the input files
+        """
+        if self.INFILE_KEY.startswith('['):
+            keys = json.loads(self.INFILE_KEY)
+            if not isinstance(keys, list) or not all(isinstance(key, str) for key in keys):
+                raise ValueError(f'INFILE must be a key, a JSON list of keys, or a prefix: {self.INFILE_KEY}')
+            return keys
+        if self.INFILE_KEY.endswith('/'):
+            return self.s3.listFiles(self.INFILE_KEY)
+        return [self.INFILE_KEY]
+
+    def _runFile(self, key: str) -> None:
+        """Processes one input file and hands its output to the next app.
+
+        After processing, the output writes, the move to the "Done" folder and
+        the handoff to the next app run as concurrent steps; the handoff only
+        waits for the write to the next app's bucket. The handoff is a call to
+        the next app's API or, if NEXT_APP_HANDOFF is 'manifest', a manifest
+        written next to the output.
+
+        With CHECKPOINTS on, a sharded input's output is uploaded as it is
+        produced and progress is saved after each part, so running the task
+        again on the same file resumes where it stopped. The checkpoint is
+        deleted once every step has succeeded.
+
+        Args:
+            key (str): key of the input file
+        """
+        name = key.split('/')[-1]
+        inFormat = self._getInputFormat(key)
+        outName = FileFormatFactory.rename(name, self.outputFormat) if self.outputFormat.NAME != inFormat.NAME else name
+        uploadArgs = self._getUploadArgs()
+        manifest = OutputManifest(f'ToDo/{outName}', key, self.outputFormat) if self.manifestStore else None
+        print(f'\nLoading data from input file ({key})...')
+        shards = self._planShards(key, inFormat)
+        if shards:
+            print(f'Processing {len(shards)} shards in {self.PARALLEL_WORKERS} processes...')
+        elif self.CHUNK_SIZE:
+            print(f'Streaming in chunks of {self.CHUNK_SIZE} rows...')
+
+        checkpointed = bool(shards) and self.CHECKPOINTS
+        steps = StepExecutor()
+        with ExitStack() as stack:
+            outFile = None
+            if checkpointed:
+                self._writeCheckpointedOutput(key, outName, shards, uploadArgs, manifest)
+            elif (self.CHUNK_SIZE or shards) and self.SERVER_SIDE_COPY:
+                # In streaming mode, processed chunks are uploaded as they are produced
+                outData = self._iterOutput(key, inFormat, shards, manifest)
+            elif self.CHUNK_SIZE or shards:
+                outData = outFile = stack.enter_context(self._processStream(key, inFormat, shards, manifest))
+            else:
+                outData = self._processFile(key, inFormat, manifest)
+                if not isinstance(outData, bytes):
+                    outFile = stack.enter_context(outData)
+
+            if checkpointed:
+                steps.addStep('writeNextAppInput', partial(self.s3.copyOutputToNextApp, outName))
+            elif self.SERVER_SIDE_COPY:
+                print('\nWriting hints to output bucket...')
+                self.s3.writeOutput(outData, outName, **uploadArgs)
+                steps.addStep('writeNextAppInput', partial(self.s3.copyOutputToNextApp, outName))
+            elif outFile:
+                writeOutput = partial(self.s3.writeOutput, **uploadArgs)
+                writeNextAppInput = partial(self.s3.writeNextAppInput, **uploadArgs)
+                steps.addStep('writeOutput', partial(self._uploadStagedFile, writeOutput, outFile.name, outName))
+                steps.addStep('writeNextAppInput', partial(self._uploadStagedFile, writeNextAppInput, outFile.name, outName))
+            else:
+                steps.addStep('writeOutput', partial(self.s3.writeOutput, outData, outName, **uploadArgs))
+                steps.addStep('writeNextAppInput', partial(self.s3.writeNextAppInput, outData, outName, **uploadArgs))
+
+            steps.addStep('moveToDone', partial(self.s3.moveFile, key, f'Done/{name}'))
+            if self.manifestStore:
+                steps.addStep('writeManifest', partial(self.manifestStore.write, manifest), dependsOn=['writeNextAppInput'])
+            else:
+                steps.addStep(
+                    'runNextApp',
+                    partial(self.nextAppBatcher.add if self.nextAppBatcher else self.nextAppFacade.run, f'ToDo/{outName}'),
+                    dependsOn=['writeNextAppInput']
+                )
+
+            print(f'\nWriting hints, moving {name} to "Done" folder and handing off to the next application...')
+            steps.run()
+        if checkpointed:
+            self.s3.deleteCheckpoint(key)
+
+    def _getInputFormat(self, key: str) -> FileFormat:
+        """Gets the format of an input file, from INPUT_FORMAT or else its extension.
+
+        A file compressed with a supported codec is read through it, whether
+        the compression shows in its extension (e.g. '.csv.zst') or only in
+        its Content-Encoding.
+
+        Args:
+            key (str): key of the input file
+
+        Returns:
+            FileFormat: format of the input file
+        """
+        inFormat = FileFormatFactory.getFormat(key, self.INPUT_FORMAT)
+        return FileFormatFactory.applyContentEncoding(inFormat, self.s3.getContentEncoding(key))
+
+    def _getUploadArgs(self) -> dict:
+        """Gets the extra arguments output files are uploaded with.
+
+        Compressed output is labeled with the Content-Type of the data inside
+        it and the Content-Encoding of its compression.
+
+        Returns:
+            dict: keyword arguments of `writeOutput` and `writeNextAppInput`; empty if the output isn't compressed
+        """
+        if not self.outputFormat.CONTENT_ENCODING:
+            return {}
+        return {'extraArgs': {'ContentType': self.outputFormat.CONTENT_TYPE, 'ContentEncoding': self.outputFormat.CONTENT_ENCODING}}
+
+    def _isCsv(self, fileFormat: FileFormat) -> bool:
+        """Checks whether a format is CSV, compressed or not.
+
+        Args:
+            fileFormat (FileFormat): the format
+
+        Returns:
+            bool: whether the format writes CSV
+        """
+        if isinstance(fileFormat, CompressedFormat):
+            fileFormat = fileFormat.fileFormat
+        return isinstance(fileFormat, CsvFormat)
+
+    def _openInput(self, key: str, inFormat: FileFormat) -> BinaryIO:
+        """Opens an input file for its format to read.
+
+        Text formats are read through `readFile`; formats that need to seek
+        are downloaded in parallel byte ranges; others are read straight
+        from the S3 stream. Either way the parser gets the file's bytes and
+        decodes them itself.
+
+        Args:
+            key (str): key of the input file
+            inFormat (FileFormat): format of the input file
+
+        Returns:
+            BinaryIO: the input file's contents
+        """
+        if inFormat.TEXT and not self.CHUNK_SIZE:
+            return self.s3.readFile(key)
+        if inFormat.SEEKABLE:
+            return self.s3.readFileParallel(key)
+        return self.s3.readFileStream(key)
+
+    def _processFile(self, key: str, inFormat: FileFormat, manifest: OutputManifest = None) -> bytes | BinaryIO:
+        """Reads the whole input file, processes it and serializes the result.
+
+        Args:
+            key (str): key of the input file
+            inFormat (FileFormat): format of the input file
+            manifest (OutputManifest, optional): manifest to describe the output in; defaults to none
+
+        Returns:
+            bytes | BinaryIO: processed hint data in the output format, or a temporary file holding it if it was staged on disk
+        """
+        inData = self._openInput(key, inFormat)
+        try:
+            df: pd.DataFrame = self._applySchema(inFormat.read(inData, self.COLUMNS, self._getDtypes()))
+        finally:
+            inData.close()
+        if self.schema:
+            self._printMemoryUsage(df)
 
         # print('\nProcessing hints...')
+        pipeline = HintPipeline(self.getStages())
+        outData = pipeline.run(df)
+        pipeline.printTimings()
+        outData = self._prepareOutput(outData)
+        if manifest:
+            manifest.addFrame(outData)
+        return self._stageOutput(outData, manifest)
+
+    def _stageOutput(self, df: pd.DataFrame, manifest: OutputManifest = None) -> bytes | BinaryIO:
+        """Serializes processed hint data, moving it to disk once it grows past `SPOOL_THRESHOLD`.
+
+        The data is serialized `STAGING_CHUNK_SIZE` rows at a time, so its
+        serialized form is never held in memory whole once it is staged.
+        A staged file is flushed and rewound, and is deleted when it is closed.
+
+        Args:
+            df (pd.DataFrame): processed hint data
+            manifest (OutputManifest, optional): manifest to add the output's size and checksum to; defaults to none
+
+        Returns:
+            bytes | BinaryIO: the data in the output format, or a named temporary file holding it
+        """
+        if self.SPOOL_THRESHOLD is None:
+            outData = self.outputFormat.write(df)
+            if manifest:
+                manifest.addBytes(outData)
+            return outData
+
+        size = self.STAGING_CHUNK_SIZE
+        chunks = (df[i:i + size] for i in range(0, len(df), size)) if len(df) > size else [df]
+        outChunks = self.outputFormat.iterWrite(chunks)
+        buffer = BytesIO()
+        outFile = None
+        try:
+            for outChunk in manifest.trackBytes(outChunks) if manifest else outChunks:
+                if outFile is None and buffer.tell() + len(outChunk) > self.SPOOL_THRESHOLD:
+                    outFile = tempfile.NamedTemporaryFile()
+                    outFile.write(buffer.getvalue())
+                    buffer = None
+                (outFile or buffer).write(outChunk)
+        except Exception:
+            if outFile is not None:
+                outFile.close()
+            raise
+        if outFile is None:
+            return buffer.getvalue()
+        print(f'Staged {outFile.tell() / 1e6:.1f} MB of output on disk')
+        outFile.flush()
+        outFile.seek(0)
+        return outFile
+
+    def _getDtypes(self) -> dict[str, str] | None:
+        """Gets the types to parse input columns as.
+
+        Returns:
+            dict[str, str] | None: declared types of the columns being read, or None to infer them
+        """
+        return self.schema.getDtypes(self.COLUMNS) if self.schema else None
+
+    def _applySchema(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Converts hint data to its declared types, if HINT_SCHEMA is on.
+
+        Args:
+            df (pd.DataFrame): hint data as read
+
+        Returns:
+            pd.DataFrame: hint data with declared types
+        """
+        return self.schema.apply(df) if self.schema else df
+
+    def _prepareOutput(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Converts typed hint data back to its CSV representation when the output is CSV.
+
+        Args:
+            df (pd.DataFrame): processed hint data
+
+        Returns:
+            pd.DataFrame: processed hint data ready for the output format
+        """
+        if self.schema and self._isCsv(self.outputFormat):
+            return self.schema.prepareCsv(df)
+        return df
+
+    def _printMemoryUsage(self, df: pd.DataFrame) -> None:
+        """Prints how much memory each column of the hint data takes.
+
+        Args:
+            df (pd.DataFrame): hint data
+        """
+        usage = self.schema.memoryUsage(df)
+        print(f'\nLoaded {len(df)} rows in {sum(usage.values()) / 1e6:.1f} MB:')
+        for column, size in usage.items():
+            print(f'  {column} ({df[column].dtype}): {size / 1e6:.1f} MB')
+
+    def getStages(self) -> list[TransformStage]:
+        """Gets the stages each input file's hint data is processed by, in order.
+
+        This is called once per input file (or once per shard in parallel
+        mode), so it should return new stages; stages such as DedupeStage
+        remember what they have seen in that file or shard.
+        By default the data is only passed through `processData`, e.g.
+        `[FilterStage(lambda df: df['score'] > 1), DedupeStage(), NormalizeCoordinatesStage()]`
+        could be returned instead.
+
+        Returns:
+            list[TransformStage]: stages to process the hint data with
+        """
+        return [FunctionStage('processData', self.processData)]
+
+    def processData(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Processes the hint data.
+
+        In streaming mode this is called once per chunk, so it should not
+        rely on seeing every row of the file at once.
+
+        Args:
+            df (pd.DataFrame): hint data (the whole file, or one chunk of it in streaming mode)
+
+        Returns:
+            pd.DataFrame: processed hint data
+        """
         # TODO: process data
-        outData = df
+        return df
+
+    def _iterOutput(self, key: str, inFormat: FileFormat, shards: list[CsvShard] = None,
+                    manifest: OutputManifest = None) -> Iterator[bytes]:
+        """Streams the input file through the stages from `getStages` in chunks of `CHUNK_SIZE` rows.
+
+        Each processed chunk is serialized as soon as it is ready, so peak
+        memory depends on the chunk size rather than the file size. CSV input
+        is read incrementally from S3; Parquet and Arrow input is downloaded
+        first but only decoded one row group or record batch at a time.
+        If the file was split into shards, they are processed in parallel instead.
+
+        Args:
+            key (str): key of the input file
+            inFormat (FileFormat): format of the input file
+            shards (list[CsvShard], optional): shards from `_planShards`; defaults to streaming in chunks
+            manifest (OutputManifest, optional): manifest to describe the output in; defaults to none
+
+        Yields:
+            bytes: the next part of the processed output file
+        """
+        if shards:
+            outChunks = self._iterShardedOutput(key, shards, manifest)
+            yield from manifest.trackBytes(outChunks) if manifest else outChunks
+            return
+
+        inData = self._openInput(key, inFormat)
+        try:
+            pipeline = HintPipeline(self.getStages())
+            chunks = inFormat.iterRead(inData, self.CHUNK_SIZE, self.COLUMNS, self._getDtypes())
+            outFrames = (self._prepareOutput(outChunk) for outChunk in pipeline.iterRun(self._applySchema(chunk) for chunk in chunks))
+            outChunks = self.outputFormat.iterWrite(manifest.trackFrames(outFrames) if manifest else outFrames)
+            yield from manifest.trackBytes(outChunks) if manifest else outChunks
+            pipeline.printTimings()
+        finally:
+            inData.close()
+
+    def _planShards(self, key: str, inFormat: FileFormat) -> list[CsvShard] | None:
+        """Splits a CSV input file into shards to process in parallel, if parallel mode applies to it.
+
+        Only uncompressed CSV input written as CSV (compressed or not) can be
+        split, since shards are read with ranged GETs and their outputs are
+        joined by concatenation. Files too small for two shards aren't split.
+        With CHECKPOINTS on, files are split even by one process, so progress
+        can be saved after each shard.
+
+        Args:
+            key (str): key of the input file
+            inFormat (FileFormat): format of the input file
+
+        Returns:
+            list[CsvShard] | None: the shards, or None to process the file in one piece
+        """
+        if (self.PARALLEL_WORKERS <= 1 and not self.CHECKPOINTS) or type(inFormat) is not CsvFormat or not self._isCsv(self.outputFormat):
+            return None
+        fileSize = self.s3.getFileSize(key)
+        count = min(max(self.PARALLEL_WORKERS, -(-fileSize // self.MAX_SHARD_SIZE)), fileSize // self.MIN_SHARD_SIZE)
+        if count < 2:
+            return None
+        header = CsvShard.readHeader(partial(self.s3.readFileRange, key), fileSize)
+        return CsvShard.split(header, fileSize, count)
+
+    def _iterShardedOutput(self, key: str, shards: list[CsvShard], manifest: OutputManifest = None) -> Iterator[bytes]:
+        """Processes the shards of an input file in `PARALLEL_WORKERS` processes, yielding their outputs in order.
+
+        Args:
+            key (str): key of the input file
+            shards (list[CsvShard]): the file's shards, in order
+            manifest (OutputManifest, optional): manifest to add the shards' rows and schema to; defaults to none
+
+        Yields:
+            bytes: the output of the next shard
+        """
+        for outData, rowsOut, schema in self._iterShardResults(key, shards):
+            if manifest:
+                manifest.addRows(rowsOut, schema)
+            yield outData
+
+    def _iterShardResults(self, key: str, shards: list[CsvShard]) -> Iterator[tuple[bytes, int, dict[str, str]]]:
+        """Processes shards of an input file in `PARALLEL_WORKERS` processes, yielding their results in order.
+
+        At most two shards per process are waiting or running at once, so
+        finished outputs don't pile up when uploading is slower than processing.
+
+        Args:
+            key (str): key of the input file
+            shards (list[CsvShard]): the shards to process, in order
+
+        Yields:
+            tuple[bytes, int, dict[str, str]]: the next shard's output, its rows out and its output's schema
+        """
+        pipeline = HintPipeline(self.getStages())
+        remaining = iter(shards)
+        pending: deque[Future] = deque()
+        executor = self._createShardExecutor(key)
+        try:
+            for shard in remaining:
+                pending.append(executor.submit(ShardWorker.processShard, key, shard))
+                if len(pending) >= 2 * self.PARALLEL_WORKERS:
+                    break
+            while pending:
+                outData, timings, rowsIn, rowsOut, schema = pending.popleft().result()
+                shard = next(remaining, None)
+                if shard is not None:
+                    pending.append(executor.submit(ShardWorker.processShard, key, shard))
+                pipeline.merge(timings, rowsIn, rowsOut)
+                yield outData, rowsOut, schema
+        finally:
+            executor.shutdown(cancel_futures=True)
+        pipeline.printTimings()
 
-        print('\nWriting hints to output bucket...')
-        outBuffer = StringIO(outData.to_csv(index=False))
-        self.s3.writeOutputFile(outBuffer, self.INFILE_NAME)
+    def _writeCheckpointedOutput(self, key: str, outName: str, shards: list[CsvShard], uploadArgs: dict,
+                                 manifest: OutputManifest = None) -> None:
+        """Uploads the output of a sharded input file as a multipart upload, saving a checkpoint after each part.
 
-        print(f'\nMoving {self.INFILE_NAME} to "Done" folder...')
-        outKey: str = f'Done/{self.INFILE_NAME}'
-        self.s3.moveFile(self.INFILE_KEY, outKey)
+        Shard outputs are buffered until they fill a part of `uploadPartSize`
+        bytes. Once the part is uploaded, the checkpoint records it and the
+        first shard not in the output yet; a task restarted on the same file
+        skips the shards before it and keeps adding to the same upload. If
+        the output was already completed, nothing is processed again.
 
-        print('\nRunning the next application...')
-        outKey: str = f'ToDo/{self.INFILE_NAME}'
-        self.nextAppFacade.run(outKey)
+        Args:
+            key (str): key of the input file
+            outName (str): name of the output file
+            shards (list[CsvShard]): the input file's shards, in order
+            uploadArgs (dict): keyword arguments the output is uploaded with, from `_getUploadArgs`
+            manifest (OutputManifest, optional): manifest to describe the output in; defaults to none
+        """
+        checkpoint = self._loadCheckpoint(key, outName, shards, uploadArgs)
+        resumed = checkpoint.nextShard > 0
+        if manifest:
+            manifest.addRows(checkpoint.rowsOut, checkpoint.schema)
+        if checkpoint.complete:
+            print(f'Output of {key} was already written; skipping to the handoff')
+        elif resumed:
+            print(f'Resuming at shard {checkpoint.nextShard + 1} of {len(shards)} (byte {checkpoint.offset})...')
+
+        if not checkpoint.complete:
+            remaining = shards[checkpoint.nextShard:]
+            buffer = bytearray()
+            rows = 0
+            for i, (outData, rowsOut, schema) in enumerate(self._iterShardResults(key, remaining)):
+                buffer += outData
+                rows += rowsOut
+                if not checkpoint.schema:
+                    checkpoint.schema = dict(schema)
+                if manifest:
+                    manifest.addRows(rowsOut, schema)
+                    if not resumed:
+                        manifest.addBytes(outData)
+                isLast = i == len(remaining) - 1
+                if len(buffer) < self.s3.uploadPartSize and not (isLast and (buffer or not checkpoint.parts)):
+                    continue
+                checkpoint.parts.append(self.s3.uploadOutputPart(outName, checkpoint.uploadId, len(checkpoint.parts) + 1, bytes(buffer)))
+                checkpoint.nextShard = remaining[i].index + 1
+                checkpoint.offset = remaining[i].end
+                checkpoint.rowsOut += rows
+                checkpoint.size += len(buffer)
+                self.s3.writeCheckpoint(key, checkpoint.toJson())
+                buffer.clear()
+                rows = 0
+            self.s3.completeOutputUpload(outName, checkpoint.uploadId, checkpoint.parts)
+            checkpoint.complete = True
+            self.s3.writeCheckpoint(key, checkpoint.toJson())
+
+        if manifest and resumed:
+            # Part of the output was written by an earlier run, so it is read back to checksum it
+            for chunk in self.s3.readFileStream(f'Output/{outName}').iter_chunks():
+                manifest.addBytes(chunk)
+
+    def _loadCheckpoint(self, key: str, outName: str, shards: list[CsvShard], uploadArgs: dict) -> Checkpoint:
+        """Loads the checkpoint of an input file, or starts a new one.
+
+        A saved checkpoint is only used if the input file hasn't changed since
+        it was saved, the output and shards are the same, and its upload can
+        still be added to (or is complete). Otherwise its upload is aborted
+        and a new upload is started.
+
+        Args:
+            key (str): key of the input file
+            outName (str): name of the output file
+            shards (list[CsvShard]): the input file's shards, in order
+            uploadArgs (dict): keyword arguments the output is uploaded with, from `_getUploadArgs`
+
+        Returns:
+            Checkpoint: the checkpoint to continue from
+        """
+        inputETag = self.s3.getETag(key)
+        data = self.s3.readCheckpoint(key)
+        if data:
+            checkpoint = Checkpoint.fromJson(data)
+            if checkpoint.matches(inputETag, outName, len(shards)) and \
+                    (checkpoint.complete or self.s3.hasOutputUpload(outName, checkpoint.uploadId)):
+                return checkpoint
+            print(f'Checkpoint of {key} is out of date; starting over')
+            if not checkpoint.complete:
+                try:
+                    self.s3.abortOutputUpload(checkpoint.outName, checkpoint.uploadId)
+                except Exception as e:
+                    print(f'Couldn\'t abort old upload of {checkpoint.outName}: {e}')
+
+        uploadId = self.s3.createOutputUpload(outName, uploadArgs.get('extraArgs'))
+        checkpoint = Checkpoint(key, inputETag, outName, len(shards), uploadId)
+        self.s3.writeCheckpoint(key, checkpoint.toJson())
+        return checkpoint
+
+    def _createShardExecutor(self, key: str) -> Executor:
+        """Creates the pool of processes shards are processed in.
+
+        Processes are spawned rather than forked, since this process may
+        have other threads (and their locks) running.
+
+        Args:
+            key (str): key of the input file
+
+        Returns:
+            Executor: pool of `PARALLEL_WORKERS` processes, each with its own task
+        """
+        return ProcessPoolExecutor(
+            max_workers=self.PARALLEL_WORKERS,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=ShardWorker.init,
+            initargs=(type(self), self.test, key)
+        )
+
+    def processShard(self, key: str, shard: CsvShard) -> tuple[bytes, dict[str, float], int, int, dict[str, str]]:
+        """Reads one shard of a CSV input file, processes it and serializes the result.
+
+        This runs in a worker process, with stages of its own, so stages that
+        remember earlier rows (e.g. DedupeStage) only see the rows of their shard.
+        Only the first shard's output includes the header.
+
+        Args:
+            key (str): key of the input file
+            shard (CsvShard): the shard to process
+
+        Returns:
+            tuple[bytes, dict[str, float], int, int, dict[str, str]]: the shard's output, its stage timings, its rows in and out, and its output's schema
+        """
+        rows = shard.readRows(partial(self.s3.readFileRange, key))
+        df = self._applySchema(CsvFormat().read(BytesIO(shard.header + rows), self.COLUMNS, self._getDtypes()))
+        pipeline = HintPipeline(self.getStages())
+        outData = self._prepareOutput(pipeline.run(df))
+        outBytes = b''.join(self.outputFormat.iterWrite([outData], header=shard.index == 0))
+        return outBytes, pipeline.timings, pipeline.rowsIn, pipeline.rowsOut, OutputManifest.getSchema(outData)
+
+    def _processStream(self, key: str, inFormat: FileFormat, shards: list[CsvShard] = None,
+                       manifest: OutputManifest = None) -> BinaryIO:
+        """Writes the output of `_iterOutput` to a named temporary file on disk.
+
+        The file is flushed so it can be reopened by name, and is deleted when it is closed.
+
+        Args:
+            key (str): key of the input file
+            inFormat (FileFormat): format of the input file
+            shards (list[CsvShard], optional): shards from `_planShards`; defaults to streaming in chunks
+            manifest (OutputManifest, optional): manifest to describe the output in; defaults to none
+
+        Returns:
+            BinaryIO: temporary file containing the processed data
+        """
+        outFile = tempfile.NamedTemporaryFile()
+        try:
+            for outChunk in self._iterOutput(key, inFormat, shards, manifest):
+                outFile.write(outChunk)
+            outFile.flush()
+        except Exception:
+            outFile.close()
+            raise
+        return outFile
+
+    def _uploadStagedFile(self, upload: Callable[[BinaryIO, str], dict], path: str, fileName: str) -> dict:
+        """Uploads a staged output file through its own file handle.
+
+        Opening a separate handle per upload lets several uploads of the same
+        file run at once.
+
+        Args:
+            upload (Callable[[BinaryIO, str], dict]): EcsS3Service method that writes the data
+            path (str): path of the staged output file
+            fileName (str): name of the output file
+
+        Returns:
+            dict: response of the upload
+        """
+        with open(path, 'rb') as data:
+            return upload(data, fileName)
@@ -0,0 +1,166 @@
+import signal
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from awsEcs.presenters.EcsTask import EcsTask
+from common.models.EnvVar import EnvVar
+from common.models.Job import Job
+from common.models.services.JobQueue import JobQueue
+
+class EcsWorker:
+    """Long-running ECS worker that runs an EcsTask for each job it receives from a JobQueue.
+
+    Up to `maxConcurrency` jobs run at once. While a job runs, its visibility
+    timeout is extended in the background so no other worker picks it up.
+    A job is deleted once its task succeeds; a failed job is left on the
+    queue to be retried (or moved to a dead-letter queue by its redrive
+    policy).
+
+    On SIGTERM (sent by ECS when stopping the task) or SIGINT, the worker
+    stops receiving jobs and waits up to `shutdownTimeout` seconds for the
+    running ones. Jobs still running after that aren't handed back, since
+    their tasks can't be interrupted and would race another worker's on the
+    same input file. Their visibility keeps being extended while their tasks
+    run, so they are still deleted if they finish; once ECS kills the
+    container, the extensions stop and the jobs become visible again when
+    their visibility timeout runs out.
+
+    Attributes:
+        WAIT_SECONDS (int): longest the worker waits for jobs in one poll, which bounds how long a stop takes to notice
+        jobQueue (JobQueue): queue jobs are received from
+        createTask (Callable[[str], EcsTask]): creates the task for a job's input file
+        maxConcurrency (int): number of jobs run at once
+        visibilityTimeout (int): seconds a received job stays hidden, renewed while it runs
+        shutdownTimeout (float): seconds `run` waits for running jobs after a stop is requested
+        processed (int): number of jobs that succeeded
+        failed (int): number of jobs that failed
+    """
+
+    WAIT_SECONDS = 10
+
+    def __init__(self, jobQueue: JobQueue, createTask: Callable[[str], EcsTask] = None) -> None:
+        """Constructs an EcsWorker object.
+
+        Args:
+            jobQueue (JobQueue): queue to receive jobs from
+            createTask (Callable[[str], EcsTask], optional): creates the task for a job's input file; defaults to `EcsTask(infile=...)`
+        """
+        envVar = EnvVar()
+        self.jobQueue = jobQueue
+        self.createTask = createTask or (lambda infile: EcsTask(infile=infile))
+        self.maxConcurrency = int(envVar.get('WORKER_CONCURRENCY', '2'))
+        self.visibilityTimeout = int(envVar.get('VISIBILITY_TIMEOUT', '300'))
+        self.shutdownTimeout = float(envVar.get('SHUTDOWN_TIMEOUT', '25'))
+        self.processed = 0
+        self.failed = 0
+        self._inFlight: dict[str, Job] = {}  # running jobs by receipt
+        self._condition = threading.Condition()
+        self._stopEvent = threading.Event()
+
+    def stop(self, *args) -> None:
+        """Asks the worker to stop after its running jobs finish.
+
+        Can be used directly as a signal handler.
+        """
+        print('\nStop requested; finishing running jobs...')
+        self._stopEvent.set()
+        with self._condition:
+            self._condition.notify_all()
+
+    def run(self) -> None:
+        """Receives and runs jobs until a stop is requested."""
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, self.stop)
+            signal.signal(signal.SIGINT, self.stop)
+
+        print(f'\nWaiting for jobs ({self.maxConcurrency} at a time)...')
+        heartbeat = threading.Thread(target=self._extendVisibility, daemon=True)
+        heartbeat.start()
+        executor = ThreadPoolExecutor(max_workers=self.maxConcurrency)
+        try:
+            while not self._stopEvent.is_set():
+                with self._condition:
+                    self._condition.wait_for(
+                        lambda: len(self._inFlight) < self.maxConcurrency or self._stopEvent.is_set()
+                    )
+                    capacity = self.maxConcurrency - len(self._inFlight)
+                if self._stopEvent.is_set():
+                    break
+
+                try:
+                    jobs = self.jobQueue.receive(capacity, self.WAIT_SECONDS, self.visibilityTimeout)
+                except Exception:
+                    print(traceback.format_exc())
+                    self._stopEvent.wait(self.WAIT_SECONDS)
+                    continue
+
+                for job in jobs:
+                    if self._stopEvent.is_set():
+                        self._release(job)
+                        continue
+                    with self._condition:
+                        self._inFlight[job.receipt] = job
+                    executor.submit(self._runJob, job)
+        finally:
+            self._shutDown()
+            executor.shutdown(wait=False)
+        print(f'\nWorker stopped: {self.processed} jobs succeeded, {self.failed} failed.')
+
+    def _runJob(self, job: Job) -> None:
+        """Runs the task for a job and deletes the job if it succeeded.
+
+        Args:
+            job (Job): the job to run
+        """
+        try:
+            print(f'\nStarting job {job.id}: {job.body}')
+            self.createTask(job.body['inputFile']).run()
+        except Exception:
+            print(f'\nJob {job.id} failed; leaving it on the queue to be retried:')
+            print(traceback.format_exc())
+            with self._condition:
+                self.failed += 1
+        else:
+            with self._condition:
+                self.processed += 1
+            self.jobQueue.delete(job)
+        finally:
+            with self._condition:
+                self._inFlight.pop(job.receipt, None)
+                self._condition.notify_all()
+
+    def _extendVisibility(self) -> None:
+        """Keeps renewing the visibility timeout of running jobs until the worker has stopped and none are left."""
+        while True:
+            with self._condition:
+                if self._condition.wait_for(lambda: self._stopEvent.is_set() and not self._inFlight,
+                                            timeout=self.visibilityTimeout / 3):
+                    return
+                jobs = list(self._inFlight.values())
+            for job in jobs:
+                try:
+                    self.jobQueue.changeVisibility(job, self.visibilityTimeout)
+                except Exception:
+                    print(f'Failed to extend the visibility of job {job.id}:')
+                    print(traceback.format_exc())
+
+    def _shutDown(self) -> None:
+        """Waits for running jobs to finish, leaving any that haven't hidden until they do or the container stops."""
+        with self._condition:
+            self._condition.wait_for(lambda: not self._inFlight, timeout=self.shutdownTimeout)
+            unfinished = list(self._inFlight.values())
+        for job in unfinished:
+            print(f'\nJob {job.id} did not finish in time; it will be retried after its visibility timeout if it is cut off.')
+
+    def _release(self, job: Job) -> None:
+        """Makes a received job visible again right away.
+
+        Args:
+            job (Job): the job to release
+        """
+        try:
+            self.jobQueue.changeVisibility(job, 0)
+        except Exception:
+            print(traceback.format_exc())
@@ -0,0 +1,93 @@
+import time
+from typing import Iterable, Iterator
+
+import pandas as pd
+
+from awsEcs.models.stages.TransformStage import TransformStage
+
+class HintPipeline:
+    """Runs hint data through an ordered list of vectorized stages, timing each one.
+
+    The same pipeline works on a whole file with `run` or on a stream of
+    chunks with `iterRun`; either way each stage sees the output of the one
+    before it. Timings and row counts add up over every chunk, so a pipeline
+    should be made for one input file.
+
+    Attributes:
+        stages (list[TransformStage]): stages to run, in order
+        timings (dict[str, float]): seconds spent in each stage, by name
+        rowsIn (int): number of rows given to the pipeline
+        rowsOut (int): number of rows the pipeline produced
+    """
+
+    def __init__(self, stages: list[TransformStage]) -> None:
+        """Constructs a HintPipeline object.
+
+        Args:
+            stages (list[TransformStage]): stages to run, in order
+
+        Raises:
+            ValueError: two stages have the same name
+        """
+        names = [stage.name for stage in stages]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(f'Stage names must be unique: {duplicates}')
+
+        self.stages = list(stages)
+        self.timings: dict[str, float] = {name: 0.0 for name in names}
+        self.rowsIn = 0
+        self.rowsOut = 0
+
+    def run(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Runs hint data through every stage.
+
+        Args:
+            df (pd.DataFrame): hint data (the whole file, or one chunk of it)
+
+        Returns:
+            pd.DataFrame: processed hint data
+        """
+        self.rowsIn += len(df)
+        for stage in self.stages:
+            start = time.perf_counter()
+            try:
+                df = stage.transform(df)
+            finally:
+                self.timings[stage.name] += time.perf_counter() - start
+        self.rowsOut += len(df)
+        return df
+
+    def iterRun(self, chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """Runs chunks of hint data through every stage, one chunk at a time.
+
+        Args:
+            chunks (Iterable[pd.DataFrame]): hint data, a chunk at a time
+
+        Yields:
+            pd.DataFrame: the next processed chunk
+        """
+        for chunk in chunks:
+            yield self.run(chunk)
+
+    def merge(self, timings: dict[str, float], rowsIn: int, rowsOut: int) -> None:
+        """Adds the timings and row counts of the same stages run elsewhere, e.g. on a shard in another process.
+
+        Args:
+            timings (dict[str, float]): seconds spent in each stage, by name
+            rowsIn (int): number of rows given to the stages
+            rowsOut (int): number of rows the stages produced
+        """
+        for name, seconds in timings.items():
+            self.timings[name] = self.timings.get(name, 0.0) + seconds
+        self.rowsIn += rowsIn
+        self.rowsOut += rowsOut
+
+    def printTimings(self) -> None:
+        """Prints how long each stage took and how many rows went in and out."""
+        if not self.stages:
+            return
+        print(f'Stage timings ({self.rowsIn} rows in, {self.rowsOut} rows out):')
+        for name, seconds in self.timings.items():
+            print(f'  {name}: {seconds:.3f}s')
+        print(f'  total: {sum(self.timings.values()):.3f}s')
@@ -0,0 +1,83 @@
+import os
+
+from awsEcs.models.CsvShard import CsvShard
+
+class ShardWorker:
+    """Processes shards of an input file in a worker process of a ProcessPoolExecutor.
+
+    Each worker process builds its own task once, with its own S3 clients,
+    and reuses it for every shard it is given. The task's class is passed
+    in, so a fork's EcsTask subclass processes shards with its own stages.
+
+    Attributes:
+        CGROUP_V2_CPU_MAX (str): cgroup v2 file holding the container's CPU quota and period
+        CGROUP_V1_CPU_QUOTA (str): cgroup v1 file holding the container's CPU quota
+        CGROUP_V1_CPU_PERIOD (str): cgroup v1 file holding the container's CPU period
+        task (EcsTask | None): the task shards are processed with in this process
+    """
+
+    CGROUP_V2_CPU_MAX = '/sys/fs/cgroup/cpu.max'
+    CGROUP_V1_CPU_QUOTA = '/sys/fs/cgroup/cpu/cpu.cfs_quota_us'
+    CGROUP_V1_CPU_PERIOD = '/sys/fs/cgroup/cpu/cpu.cfs_period_us'
+
+    task = None
+
+    @classmethod
+    def init(cls, taskClass: type, test: bool, infile: str) -> None:
+        """Builds the task for this worker process.
+
+        Args:
+            taskClass (type): class of the EcsTask whose shards are processed
+            test (bool): whether the task is being tested
+            infile (str): key of the input file
+        """
+        cls.task = taskClass(test=test, infile=infile)
+
+    @classmethod
+    def processShard(cls, key: str, shard: CsvShard) -> tuple[bytes, dict[str, float], int, int, dict[str, str]]:
+        """Processes one shard of an input file with this process's task.
+
+        Args:
+            key (str): key of the input file
+            shard (CsvShard): the shard to process
+
+        Returns:
+            tuple[bytes, dict[str, float], int, int, dict[str, str]]: the shard's output, its stage timings, its rows in and out, and its output's schema
+        """
+        return cls.task.processShard(key, shard)
+
+    @classmethod
+    def getCpuCount(cls) -> int:
+        """Gets the number of CPUs this container may use.
+
+        On ECS this is the task's CPU quota from its cgroup (e.g. 2 for
+        `ecs_cpu = 2048`), rounded up; otherwise it is the number of CPUs the
+        process can run on.
+
+        Returns:
+            int: number of CPUs, at least 1
+        """
+        quota = cls._readCgroupQuota()
+        if quota:
+            return max(1, -(-quota[0] // quota[1]))
+        return len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count() or 1
+
+    @classmethod
+    def _readCgroupQuota(cls) -> tuple[int, int] | None:
+        """Reads the container's CPU quota from its cgroup.
+
+        Returns:
+            tuple[int, int] | None: quota and period in microseconds, or None if there is no quota
+        """
+        try:
+            with open(cls.CGROUP_V2_CPU_MAX) as file:
+                quota, period = file.read().split()
+            return (int(quota), int(period)) if quota != 'max' else None
+        except (OSError, ValueError):
+            pass
+        try:
+            with open(cls.CGROUP_V1_CPU_QUOTA) as quotaFile, open(cls.CGROUP_V1_CPU_PERIOD) as periodFile:
+                quota, period = int(quotaFile.read()), int(periodFile.read())
+            return (quota, period) if quota > 0 else None
+        except (OSError, ValueError):
+            return None
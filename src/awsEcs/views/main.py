@@ -4,8 +4,20 @@ src = os.path.dirname(os.path.dirname(currentDir))  # get path to 'src' folder
 sys.path.append(src)  # add to filepath so when code is run from main.py, imports are found properly
 
 from awsEcs.presenters.EcsTask import EcsTask
+from awsEcs.presenters.EcsWorker import EcsWorker
+from common.models.EnvVar import EnvVar
+from common.models.services.SqsJobQueue import SqsJobQueue
 
 if __name__ == '__main__':
-    """Main function for starting the ECS task."""
-    ecsTask = EcsTask()
-    ecsTask.run()
+    """Main function for starting the ECS task.
+
+    If JOB_QUEUE_URL is set, runs as a long-lived worker draining that queue;
+    otherwise, processes INFILE and exits.
+    """
+    queueUrl = EnvVar().get('JOB_QUEUE_URL')
+    if queueUrl:
+        ecsWorker = EcsWorker(SqsJobQueue(queueUrl))
+        ecsWorker.run()
+    else:
+        ecsTask = EcsTask()
+        ecsTask.run()
@@ -1,30 +1,53 @@
 import json
-import sys
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 
-import boto3
 from botocore.exceptions import ClientError
-from PyBugReporter.src.BugReporter import BugReporter
 
+from common.models.AwsSession import AwsSession
 from common.models.EnvVar import EnvVar
-from common.models.services.ParameterService import ParameterService
+from common.models.TtlCache import TtlCache
+from common.models.services.BugReporterFacade import BugReporterFacade
+from common.models.services.JobQueue import JobQueue
 from common.models.services.S3Service import S3Service
+from common.models.services.SqsJobQueue import SqsJobQueue
 from common.Names import PROJECT_NAME
 
 class EcsPresenter:
     """A presenter that runs an ECS task with the given key as an environment variable.
 
+    The task definition ARN and security group ID are cached at class level,
+    so warm Lambda invocations skip the `list_task_definitions` and
+    `describe_security_groups` calls.
+
     Attributes:
+        TASK_DEFINITION_FAMILY: the family prefix of the task definitions
+        MAX_BATCH_SIZE (int): most input files one batch request can start tasks for
+        MAX_CONCURRENT_SUBMISSIONS (int): number of tasks submitted at once
+        MAX_INFILE_LENGTH (int): longest INFILE value passed to a task, well under ECS's 8 KiB override limit
+        PIPELINE_FOLDERS (tuple[str, ...]): folders of the data bucket the pipeline writes to, which batches can't take input files from
+        taskDefinitionCache (TtlCache): task definition ARNs by family prefix, shared across invocations
+        securityGroupCache (TtlCache): security group IDs by VPC ID and group name, shared across invocations
         PRIVATE_SUBNET_A_ID: the ID of the first private subnet in the VPC
         PRIVATE_SUBNET_B_ID: the ID of the second private subnet in the VPC
         VPC_ID: the ID of the VPC
+        filesPerTask (int): most batch files given to one task
+        jobQueue (JobQueue | None): queue of jobs for long-running ECS workers; None to start a task per job instead
         ecsClient (boto3.client): the ECS client object
         ec2Client (boto3.client): the EC2 client object
         securityGroupName (str): the security group name for the cluster
         s3 (S3Service): the S3 service object
         event (dict): the event from the API Gateway request to Lambda
     """
-     
+
+    TASK_DEFINITION_FAMILY = f'{PROJECT_NAME}-def'
+    MAX_BATCH_SIZE = 500
+    MAX_CONCURRENT_SUBMISSIONS = 10
+    MAX_INFILE_LENGTH = 4096
+    PIPELINE_FOLDERS = ('InProgress/', 'Done/', 'Output/', 'Checkpoints/')
+    taskDefinitionCache = TtlCache(ttl=15 * 60, refreshAfter=5 * 60)
+    securityGroupCache = TtlCache(ttl=60 * 60, refreshAfter=30 * 60)
+
     def __init__(self, event: dict, test: bool = False) -> None:
         """Constructs an EcsPresenter object.
 
@@ -33,9 +56,11 @@ class EcsPresenter:
             test (bool, optional): whether the task is being tested; defaults to False
         """
 
-        self.ecsClient = boto3.client('ecs', region_name='us-west-2')
+        awsSession = AwsSession()
+        # Adaptive retries back off and rate limit the client when ECS throttles batch submissions
+        self.ecsClient = awsSession.getClient('ecs', retries={'mode': 'adaptive', 'max_attempts': 10})
 
-        self.ec2Client = boto3.client('ec2', region_name='us-west-2')
+        self.ec2Client = awsSession.getClient('ec2')
         self.securityGroupName = f'{PROJECT_NAME}-fargate-sg'
 
         self.s3 = S3Service()
@@ -45,20 +70,43 @@ class EcsPresenter:
         self.PRIVATE_SUBNET_A_ID = envVar['PRIVATE_SUBNET_A_ID']
         self.PRIVATE_SUBNET_B_ID = envVar['PRIVATE_SUBNET_B_ID']
         self.VPC_ID = envVar['VPC_ID']
+        self.filesPerTask = int(envVar.get('FILES_PER_TASK', '1'))
+        self.jobQueue = self._createJobQueue()
+
+        BugReporterFacade.setVars(test)
 
-        parameterService = ParameterService()
-        BugReporter.setVars(parameterService.getGithubCredentials(), PROJECT_NAME, 'byuawsfhtl', test)
+    def _createJobQueue(self) -> JobQueue | None:
+        """Factory method to create the queue ECS workers receive jobs from.
+
+        Returns:
+            JobQueue | None: the queue named by JOB_QUEUE_URL, or None if it isn't set
+        """
+        queueUrl = EnvVar().get('JOB_QUEUE_URL')
+        return SqsJobQueue(queueUrl) if queueUrl else None
 
     def _getTaskDefinitionArn(self) -> str:
         """Retrieves the task definition ARN with the latest revision number.
 
+        The ARN is served from `taskDefinitionCache` when possible.
+
+        Raises:
+            Exception: no task definitions found for the cluster
+
+        Returns:
+            str: task definition ARN
+        """
+        return self.taskDefinitionCache.get(self.TASK_DEFINITION_FAMILY, self._fetchTaskDefinitionArn)
+
+    def _fetchTaskDefinitionArn(self) -> str:
+        """Looks up the task definition ARN with the latest revision number in ECS.
+
         Raises:
             Exception: no task definitions found for the cluster
 
         Returns:
             str: task definition ARN
         """
-        response = self.ecsClient.list_task_definitions(familyPrefix=f'{PROJECT_NAME}-def', sort='DESC')
+        response = self.ecsClient.list_task_definitions(familyPrefix=self.TASK_DEFINITION_FAMILY, sort='DESC')
         arns = response['taskDefinitionArns']
         if len(arns) <= 0:
             raise Exception('No task definitions found for:', PROJECT_NAME)
@@ -67,6 +115,19 @@ class EcsPresenter:
     def _getSecGroupId(self) -> str:
         """Retrieves the security group ID for the cluster.
 
+        The ID is served from `securityGroupCache` when possible.
+
+        Raises:
+            Exception: couldn't find the security group
+
+        Returns:
+            str: security group ID
+        """
+        return self.securityGroupCache.get((self.VPC_ID, self.securityGroupName), self._fetchSecGroupId)
+
+    def _fetchSecGroupId(self) -> str:
+        """Looks up the security group ID for the cluster in EC2.
+
         Raises:
             Exception: couldn't find the security group
 
@@ -109,24 +170,296 @@ class EcsPresenter:
     def _reportBug(self, e: Exception) -> None:
         """Reports a bug to the BugReporter.
 
+        The report is sent in the background, so it doesn't delay the response.
+
         Args:
             e (Exception): the exception to report
         """
-        excType = type(e).__name__
-        tb = traceback.extract_tb(sys.exc_info()[2])
-        functionName = tb[-1][2]
+        title, description = BugReporterFacade.describeError(e)
+        description += f'\nEnvironment: {EnvVar()["ENV"]}'
 
-        # title for bug report
-        title = f"{PROJECT_NAME} had a {excType} error with the {functionName} function"
+        BugReporterFacade.report(title, description)
 
-        # description for bug report
-        description = f'Type: {excType}\nError text: {e}\nFunction Name: {functionName}\n\n{traceback.format_exc()}'
-        description += f'\nEnvironment: {EnvVar()["ENV"]}'
+    def _runTask(self, infile: str) -> dict:
+        """Starts the Fargate task for the given input file.
+
+        Args:
+            infile (str): key of the input file to pass to the task
+
+        Returns:
+            dict: response of `ECS.Client.run_task` operation
+        """
+        return self.ecsClient.run_task(
+            cluster = PROJECT_NAME,
+            count = 1,
+            taskDefinition = self._getTaskDefinitionArn(),
+            launchType = 'FARGATE',
+            networkConfiguration = self._getVpcConfig(),
+            overrides={
+                'containerOverrides': [
+                    {
+                        'name': f'{PROJECT_NAME}Container',
+                        'environment': [
+                            {
+                                'name': 'INFILE',
+                                'value': infile
+                            }
+                        ]
+                    }
+                ]
+            }
+        )
+
+    def _invalidateStaleConfig(self, e: ClientError) -> bool:
+        """Drops cached values that `run_task` rejected.
+
+        Args:
+            e (ClientError): the error raised by `run_task`
+
+        Returns:
+            bool: whether a cached value was dropped, meaning `run_task` is worth retrying
+        """
+        if e.response['Error']['Code'] not in ['ClientException', 'InvalidParameterException']:
+            return False
+
+        message = e.response['Error'].get('Message', '').lower()
+        if 'task definition' in message or 'taskdefinition' in message:
+            self.taskDefinitionCache.invalidate(self.TASK_DEFINITION_FAMILY)
+            return True
+        if 'security group' in message:
+            self.securityGroupCache.invalidate((self.VPC_ID, self.securityGroupName))
+            return True
+        return False
+
+    def _runTaskRetrying(self, infile: str) -> dict:
+        """Starts the Fargate task, retrying once if a cached value was stale.
+
+        If `run_task` rejects a cached task definition or security group, the
+        cached value is dropped and `run_task` is retried.
+
+        Args:
+            infile (str): INFILE value to pass to the task
+
+        Returns:
+            dict: response of `ECS.Client.run_task` operation
+        """
+        try:
+            return self._runTask(infile)
+        except ClientError as e:
+            if not self._invalidateStaleConfig(e):
+                raise
+            return self._runTask(infile)
+
+    def _submit(self, infile: str) -> None:
+        """Hands input files to ECS: as a job for the workers if there is a job queue, otherwise as a new task.
+
+        Args:
+            infile (str): INFILE value for the task (a key, or a JSON list of keys)
+        """
+        if self.jobQueue is not None:
+            self.jobQueue.send({'inputFile': infile})
+        else:
+            self._runTaskRetrying(infile)
+
+    def _startTask(self, key: str) -> str:
+        """Moves an input file to the "InProgress" folder and starts a task (or queues a job) for it.
+
+        Args:
+            key (str): key of the input file
+
+        Raises:
+            FileNotFoundError: the input file does not exist
+
+        Returns:
+            str: key of the input file in the "InProgress" folder
+        """
+        newKey = self._moveToInProgress(key)
+        self._submit(newKey)
+        return newKey
+
+    def _moveToInProgress(self, key: str) -> str:
+        """Moves an input file to the "InProgress" folder.
+
+        Args:
+            key (str): key of the input file
+
+        Raises:
+            FileNotFoundError: the input file does not exist
+
+        Returns:
+            str: key of the input file in the "InProgress" folder
+        """
+        fileName = key.split('/')[-1]
+        newKey = f'InProgress/{fileName}'
+        self.s3.moveFile(key, newKey)
+        return newKey
+
+    def _moveBatchFiles(self, keys: list[str]) -> dict[str, dict]:
+        """Moves the input files of a batch to the "InProgress" folder, reporting any errors instead of raising them.
+
+        The files are copied in parallel and their originals are deleted in
+        batches, rather than with a copy and a delete request per file.
+        Files have the same name in "InProgress" however deep they were, so
+        a file whose name was already taken by an earlier file of the batch
+        fails instead of being moved over it.
+
+        Args:
+            keys (list[str]): keys of the input files
+
+        Returns:
+            dict[str, dict]: the result for each file so far, by key
+        """
+        newKeys: dict[str, str] = {}
+        results: dict[str, dict] = {}
+        taken: dict[str, str] = {}
+        for key in keys:
+            newKey = f'InProgress/{key.split("/")[-1]}'
+            if newKey in taken:
+                results[key] = {'status': 'failed', 'error': f'Another input file in this batch has the same name: {taken[newKey]}'}
+            else:
+                newKeys[key] = newKey
+                taken[newKey] = key
+        try:
+            errors, timings = self.s3.moveFiles(newKeys)
+        except Exception as e:
+            print(traceback.format_exc())
+            self._reportBug(e)
+            return {key: results.get(key, {'status': 'failed', 'error': 'Internal Server Error'}) for key in keys}
+
+        for key in newKeys:
+            error = errors[key]
+            if error is None:
+                results[key] = {'status': 'moved', 'inputFile': newKeys[key]}
+                continue
+            print(''.join(traceback.format_exception(error)))
+            self._reportBug(error)
+            if isinstance(error, FileNotFoundError):
+                results[key] = {'status': 'failed', 'error': f'No file found for given infile key: {key}'}
+            else:
+                results[key] = {'status': 'failed', 'error': 'Internal Server Error'}
+        moved = sum(1 for result in results.values() if result['status'] == 'moved')
+        print(f'Moved {moved} of {len(keys)} files to "InProgress" (copy {timings["copy"]:.2f}s, delete {timings["delete"]:.2f}s)')
+        return {key: results[key] for key in keys}
+
+    def _startBatchTask(self, newKeys: list[str]) -> bool:
+        """Starts one task (or queues one job) for a group of moved batch files, reporting any error instead of raising it.
+
+        A group of more than one file is passed to the task as a JSON list of keys.
+
+        Args:
+            newKeys (list[str]): keys of the input files in the "InProgress" folder
+
+        Returns:
+            bool: whether the task started
+        """
+        infile = newKeys[0] if len(newKeys) == 1 else json.dumps(newKeys)
+        try:
+            self._submit(infile)
+        except Exception as e:
+            print(traceback.format_exc())
+            self._reportBug(e)
+            return False
+        return True
 
-        BugReporter.manualBugReport(title, description)
+    def _groupBatchFiles(self, newKeys: list[str]) -> list[list[str]]:
+        """Packs moved batch files into groups that each get one task.
+
+        Groups hold at most `filesPerTask` files, and are kept short enough
+        to fit in a container override.
+
+        Args:
+            newKeys (list[str]): keys of the input files in the "InProgress" folder
+
+        Returns:
+            list[list[str]]: the groups of keys
+        """
+        groups: list[list[str]] = []
+        for newKey in newKeys:
+            if (not groups or len(groups[-1]) >= self.filesPerTask
+                    or len(json.dumps(groups[-1] + [newKey])) > self.MAX_INFILE_LENGTH):
+                groups.append([])
+            groups[-1].append(newKey)
+        return groups
+
+    def _isInputPrefix(self, prefix: str) -> bool:
+        """Checks whether a batch may take the files under a prefix as input.
+
+        The prefix can't be empty, and can't hold or be inside the folders
+        the pipeline writes to, or the batch would move files that are being
+        processed or were already.
+
+        Args:
+            prefix (str): prefix of the input files' keys
+
+        Returns:
+            bool: whether the prefix can be used
+        """
+        if not prefix:
+            return False
+        return not any(folder.startswith(prefix) or prefix.startswith(folder) for folder in self.PIPELINE_FOLDERS)
+
+    def _runBatch(self, body: dict) -> tuple[int, dict]:
+        """Starts tasks for the input files listed in the request body, or found under its prefix.
+
+        Files are moved together with `moveFiles`, then tasks are submitted
+        in parallel, at most `MAX_CONCURRENT_SUBMISSIONS` at a time. Each
+        task is given up to `filesPerTask` files, so small files share one
+        container's start-up cost. ECS throttling is absorbed by the ECS client's adaptive
+        retries, which slow submissions down to the rate ECS accepts.
+
+        Args:
+            body (dict): the request body, with either `inputFiles` (list of keys) or `inputPrefix` (key prefix)
+
+        Returns:
+            tuple[int, dict]:
+                int: the status code (200 if every file's task started, 207 if some did, 500 if none did)
+                dict: the response message, with the result for each input file
+        """
+        if 'inputFiles' in body:
+            keys = body['inputFiles']
+            if not isinstance(keys, list) or not all(isinstance(key, str) for key in keys):
+                return 400, {'error': 'inputFiles must be a list of keys.'}
+        else:
+            prefix = body['inputPrefix']
+            if not isinstance(prefix, str) or not self._isInputPrefix(prefix):
+                return 400, {'error': f'inputPrefix must be a folder of input files, not the whole bucket or one of {list(self.PIPELINE_FOLDERS)}.'}
+            keys = self.s3.listFiles(prefix)
+
+        keys = list(dict.fromkeys(keys))
+        if len(keys) == 0:
+            return 400, {'error': 'No input files provided in request body.'}
+        if len(keys) > self.MAX_BATCH_SIZE:
+            return 400, {'error': f'Too many input files in one batch ({len(keys)}); the limit is {self.MAX_BATCH_SIZE}.'}
+
+        results = self._moveBatchFiles(keys)
+        with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_SUBMISSIONS) as executor:
+            movedKeys = {result['inputFile']: key for key, result in results.items() if result['status'] == 'moved'}
+            groups = self._groupBatchFiles(list(movedKeys))
+            for group, started in zip(groups, executor.map(self._startBatchTask, groups)):
+                for newKey in group:
+                    result = results[movedKeys[newKey]]
+                    if started:
+                        result['status'] = 'started'
+                    else:
+                        results[movedKeys[newKey]] = {'status': 'failed', 'error': 'Internal Server Error', 'inputFile': newKey}
+
+        started = sum(1 for result in results.values() if result['status'] == 'started')
+        if started == len(keys):
+            statusCode = 200
+        elif started > 0:
+            statusCode = 207
+        else:
+            statusCode = 500
+        message = f'Started tasks for {started} of {len(keys)} files.'
+        return statusCode, {'message': message, 'results': results}
 
     def run(self) -> tuple[int, dict]:
         """Runs the task with the given key as an environment variable.
+
+        If the request body has `inputFiles` or `inputPrefix` instead of
+        `inputFile`, a task is started for each of those files. If
+        JOB_QUEUE_URL is set, jobs are queued for the long-running ECS
+        workers instead of starting tasks.
         
         Returns:
             tuple[int, dict]: 
@@ -136,31 +469,13 @@ class EcsPresenter:
         try:
             body = self.event['body']
             body = json.loads(body)
-            self.key = body['inputFile']
-            fileName = self.key.split('/')[-1]
-            newKey = f'InProgress/{fileName}'
-            self.s3.moveFile(self.key, newKey)
-
-            response = self.ecsClient.run_task(
-                cluster = PROJECT_NAME,
-                count = 1,
-                taskDefinition = self._getTaskDefinitionArn(),
-                launchType = 'FARGATE',
-                networkConfiguration = self._getVpcConfig(),
-                overrides={
-                    'containerOverrides': [
-                        {
-                            'name': f'{PROJECT_NAME}Container',
-                            'environment': [
-                                {
-                                    'name': 'INFILE',
-                                    'value': newKey
-                                }
-                            ]
-                        }
-                    ]
-                }
-            )
+            if 'inputFiles' in body or 'inputPrefix' in body:
+                statusCode, response = self._runBatch(body)
+            else:
+                self.key = body['inputFile']
+                newKey = self._startTask(self.key)
+                statusCode = 200
+                response = {'message': f'Successfully started a task with the key: {newKey}'}
         except KeyError as e:
             print(traceback.format_exc())
             statusCode = 400
@@ -181,8 +496,5 @@ class EcsPresenter:
             statusCode = 500
             response = {'error': 'Internal Server Error'}
             self._reportBug(e)
-        else:
-            statusCode = 200
-            response = {'message': f'Successfully started a task with the key: {newKey}'}
         finally:
             return statusCode, response
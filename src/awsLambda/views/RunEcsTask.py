@@ -1,4 +1,3 @@
-from awsLambda.presenters.EcsPresenter import EcsPresenter
 from awsLambda.views.Handle import Handle
 
 class RunEcsTask(Handle):
@@ -16,12 +15,20 @@ class RunEcsTask(Handle):
         """Runs the ECS task presenter.
 
         This method overrides the Handle's _run method and calls the presenter for running an ECS task.
-        This completes the Template Method pattern.
+        This completes the Template Method pattern. Bug reports the presenter queued are sent before
+        returning, since Lambda freezes the thread sending them once the handler returns.
 
         Returns:
             tuple[int, dict]: 
                 int: the status code
                 dict: response from running the Handle
         """
-        ecsPresenter = EcsPresenter(self.event, self.test)
-        return ecsPresenter.run()
+        # Imported here so boto3 is only loaded once the request has passed validation
+        from awsLambda.presenters.EcsPresenter import EcsPresenter
+        from common.models.services.BugReporterFacade import BugReporterFacade
+
+        try:
+            ecsPresenter = EcsPresenter(self.event, self.test)
+            return ecsPresenter.run()
+        finally:
+            BugReporterFacade.flush(BugReporterFacade.HANDLER_FLUSH_TIMEOUT)
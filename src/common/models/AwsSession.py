@@ -1,14 +1,26 @@
+import threading
+
 import boto3
+from botocore.client import BaseClient
+from botocore.config import Config
 
 class AwsSession:
     """Singleton class for the AWS session.
+
+    Also acts as a process-wide registry of AWS clients, so every DAO and
+    presenter shares clients (and their connection pools) across warm
+    invocations instead of building new ones.
     
     Attributes:
         AWS_REGION (str): the AWS region
+        DEFAULT_MAX_POOL_CONNECTIONS (int): default size of each client's connection pool
         session (boto3.Session): the AWS session to use
+        clients (dict): cached clients by service, region and config
+        clientLock (threading.Lock): lock guarding client creation, since sessions are not thread-safe
     """
 
     AWS_REGION = 'us-west-2'
+    DEFAULT_MAX_POOL_CONNECTIONS = 32
 
     def __new__(awsSession: 'AwsSession') -> 'AwsSession':
         """Returns an instance of AwsSession.
@@ -27,6 +39,8 @@ class AwsSession:
 
             # Initialize the class only once and initialize the AWS session
             awsSession.instance.session = AwsSession._initSession()
+            awsSession.instance.clients = {}
+            awsSession.instance.clientLock = threading.Lock()
 
         return awsSession.instance
     
@@ -47,3 +61,39 @@ class AwsSession:
             boto3.Session: the AWS session
         """
         return self.session
+
+    def getClient(self, serviceName: str, regionName: str = None,
+                  maxPoolConnections: int = DEFAULT_MAX_POOL_CONNECTIONS,
+                  tcpKeepalive: bool = True, **configOptions) -> BaseClient:
+        """Gets a cached AWS client, creating it on first use.
+
+        Clients are cached per service, region and config. boto3 clients are
+        thread-safe once created, so the same client can be shared by threads.
+
+        Args:
+            serviceName (str): name of the AWS service (e.g. 's3')
+            regionName (str, optional): AWS region of the client; defaults to AWS_REGION
+            maxPoolConnections (int, optional): size of the client's connection pool; defaults to DEFAULT_MAX_POOL_CONNECTIONS
+            tcpKeepalive (bool, optional): whether to send TCP keep-alive packets; defaults to True
+            **configOptions: other options for `botocore.config.Config`
+
+        Returns:
+            BaseClient: the AWS client
+        """
+        regionName = regionName or self.AWS_REGION
+        options = tuple(sorted((name, repr(value)) for name, value in configOptions.items()))
+        key = (serviceName, regionName, maxPoolConnections, tcpKeepalive, options)
+
+        client = self.clients.get(key)
+        if client is None:
+            with self.clientLock:
+                client = self.clients.get(key)
+                if client is None:
+                    config = Config(
+                        max_pool_connections=maxPoolConnections,
+                        tcp_keepalive=tcpKeepalive,
+                        **configOptions
+                    )
+                    client = self.session.client(service_name=serviceName, region_name=regionName, config=config)
+                    self.clients[key] = client
+        return client
@@ -50,7 +50,19 @@ class EnvVar(object):
             str: the value of the environment variable
         """
         return self.envir(key)
-    
+
+    def get(self, key: str, default: str = None) -> str:
+        """Gets an optional environment variable.
+
+        Args:
+            key (str): the name of the environment variable
+            default (str, optional): the value to return if the variable is not set; defaults to None
+
+        Returns:
+            str: the value of the environment variable, or the default if it is not set
+        """
+        return self.envir(key, default=default)
+
     @classmethod
     def delete(cls) -> None:
         """Deletes instance attribute allowing future constructor calls to reinitialize the singleton.
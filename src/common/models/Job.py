@@ -0,0 +1,28 @@
+class Job:
+    """A job received from a JobQueue.
+
+    Attributes:
+        id (str): ID of the job
+        body (dict): what the job is for, e.g. `{'inputFile': key}`
+        receipt (str): handle for deleting the job or changing its visibility; differs each time the job is received
+    """
+
+    def __init__(self, id: str, body: dict, receipt: str) -> None:
+        """Constructs a Job object.
+
+        Args:
+            id (str): ID of the job
+            body (dict): what the job is for
+            receipt (str): handle for deleting the job or changing its visibility
+        """
+        self.id = id
+        self.body = body
+        self.receipt = receipt
+
+    def __repr__(self) -> str:
+        """Returns a readable representation of the job.
+
+        Returns:
+            str: the job's ID and body
+        """
+        return f'Job({self.id!r}, {self.body!r})'
@@ -0,0 +1,110 @@
+import threading
+from time import monotonic
+from typing import Any, Callable, Hashable
+
+class TtlCache:
+    """Thread-safe cache whose entries expire after a time to live.
+
+    An entry older than `refreshAfter` but younger than `ttl` is still
+    returned, and a background thread reloads it so later callers get a
+    fresh value without waiting. Instances are meant to live at module or
+    class scope so they survive across warm Lambda invocations.
+
+    Attributes:
+        ttl (float): seconds an entry may be served for
+        refreshAfter (float | None): seconds after which an entry is reloaded in the background; None to disable
+        hits (int): number of lookups served from the cache
+        misses (int): number of lookups that had to load the value
+    """
+
+    def __init__(self, ttl: float, refreshAfter: float = None) -> None:
+        """Constructs a TtlCache object.
+
+        Args:
+            ttl (float): seconds an entry may be served for
+            refreshAfter (float, optional): seconds after which an entry is reloaded in the background; defaults to None
+        """
+        self.ttl = ttl
+        self.refreshAfter = refreshAfter
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[Hashable, tuple[Any, float]] = {}
+        self._refreshing: set[Hashable] = set()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Gets a value from the cache, loading it if it is missing or expired.
+
+        Args:
+            key (Hashable): key of the value
+            loader (Callable[[], Any]): function that loads the value
+
+        Returns:
+            Any: the cached or freshly loaded value
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            age = monotonic() - entry[1] if entry else None
+            if entry is None or age >= self.ttl:
+                self.misses += 1
+                entry = None
+            else:
+                self.hits += 1
+                if self.refreshAfter is not None and age >= self.refreshAfter and key not in self._refreshing:
+                    self._refreshing.add(key)
+                    threading.Thread(target=self._refresh, args=(key, loader), daemon=True).start()
+
+        if entry is None:
+            value = loader()
+            self.set(key, value)
+            return value
+        return entry[0]
+
+    def set(self, key: Hashable, value: Any, age: float = 0) -> None:
+        """Stores a value in the cache.
+
+        Args:
+            key (Hashable): key of the value
+            value (Any): value to store
+            age (float, optional): seconds since the value was loaded, if it was loaded elsewhere; defaults to 0
+        """
+        with self._lock:
+            self._entries[key] = (value, monotonic() - age)
+
+    def __len__(self) -> int:
+        """Counts the values in the cache, including expired ones not yet replaced.
+
+        Returns:
+            int: number of cached values
+        """
+        with self._lock:
+            return len(self._entries)
+
+    def invalidate(self, key: Hashable = None) -> None:
+        """Removes a value from the cache, or every value if no key is given.
+
+        Args:
+            key (Hashable, optional): key of the value to remove; defaults to None
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def _refresh(self, key: Hashable, loader: Callable[[], Any]) -> None:
+        """Reloads a value in the background.
+
+        If loading fails, the current value is kept until it expires.
+
+        Args:
+            key (Hashable): key of the value
+            loader (Callable[[], Any]): function that loads the value
+        """
+        try:
+            self.set(key, loader())
+        except Exception as e:
+            print(f'Background refresh of {key} failed: {e}')
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
@@ -0,0 +1,170 @@
+import atexit
+import threading
+import traceback
+from functools import wraps
+from queue import Queue
+from typing import Any, Callable
+
+from common.models.services.ParameterService import ParameterService
+from common.Names import PROJECT_NAME
+
+class BugReporterFacade:
+    """Reports bugs to GitHub through BugReporter without slowing down the code that hit them.
+
+    BugReporter is only imported and set up, and the GitHub token only
+    fetched from Parameter Store, when the first bug is actually reported.
+    Reports are queued and sent by a background worker thread, so the
+    failing request never waits on the GitHub API. Reports still queued when the process
+    exits are sent before it does. Lambda freezes the worker as soon as the
+    handler returns and doesn't run exit handlers, so Lambda views call
+    `flush` before returning.
+
+    Instances are decorators that work like `BugReporter`'s own.
+
+    Attributes:
+        ORG_NAME (str): GitHub organization of the repository bugs are reported to
+        EXIT_FLUSH_TIMEOUT (float): seconds to wait at exit for queued reports to be sent
+        HANDLER_FLUSH_TIMEOUT (float): seconds a Lambda handler waits for queued reports to be sent before returning
+        test (bool): whether reports are only printed instead of sent
+        extraInfo (bool): whether the decorator adds `kwargs` to its reports
+        kwargs (dict): extra info the decorator adds to its reports
+    """
+
+    ORG_NAME = 'byuawsfhtl'
+    EXIT_FLUSH_TIMEOUT = 30
+    HANDLER_FLUSH_TIMEOUT = 10
+    test = False
+    _configured = False
+    _queue: Queue = None
+    _lock = threading.Lock()
+
+    def __init__(self, extraInfo: bool = False, **kwargs) -> None:
+        """Constructs a BugReporterFacade decorator.
+
+        Args:
+            extraInfo (bool, optional): whether to add `kwargs` to reports; defaults to False
+            **kwargs: extra info for reports
+        """
+        self.extraInfo = extraInfo
+        self.kwargs = kwargs
+
+    def __call__(self, func: Callable) -> Callable:
+        """Decorates a function so any exception it raises is reported, then re-raised.
+
+        Args:
+            func (Callable): the function to decorate
+
+        Returns:
+            Callable: the decorated function
+        """
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> Any:
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                title, description = self.describeError(e)
+                description += f'\nArguments: {args}\nKeyword Arguments: {kwargs}'
+                if self.extraInfo:
+                    description += f'\nExtra Info: {self.kwargs}'
+                print(title)
+                print(description)
+                self.report(title, description)
+                raise
+        return wrapper
+
+    @classmethod
+    def setVars(cls, test: bool) -> None:
+        """Sets whether reports are actually sent.
+
+        Args:
+            test (bool): whether reports are only printed instead of sent
+        """
+        cls.test = test
+
+    @staticmethod
+    def describeError(e: Exception) -> tuple[str, str]:
+        """Builds the title and description of a bug report for an exception.
+
+        The report is built from the exception's own traceback, so it can be
+        called after the `except` block that caught the exception, e.g. for
+        errors collected from other threads.
+
+        Args:
+            e (Exception): the exception to report
+
+        Returns:
+            tuple[str, str]:
+                str: title of the report
+                str: description of the report
+        """
+        excType = type(e).__name__
+        tb = traceback.extract_tb(e.__traceback__)
+        functionName = tb[-1][2] if tb else 'unknown'
+
+        title = f'{PROJECT_NAME} had a {excType} error with the {functionName} function'
+        description = f'Type: {excType}\nError text: {e}\nFunction Name: {functionName}\n\n{"".join(traceback.format_exception(e))}'
+        return title, description
+
+    @classmethod
+    def report(cls, title: str, description: str) -> None:
+        """Queues a bug report to be sent in the background.
+
+        Args:
+            title (str): title of the report
+            description (str): description of the report
+        """
+        if cls.test:
+            print('This is a test run and no bug report will be sent.')
+            return
+        cls._startWorker()
+        cls._queue.put((title, description))
+
+    @classmethod
+    def flush(cls, timeout: float = None) -> bool:
+        """Waits for queued reports to be sent.
+
+        Args:
+            timeout (float, optional): most seconds to wait; defaults to waiting until done
+
+        Returns:
+            bool: whether every queued report was sent (or failed) in time
+        """
+        if cls._queue is None:
+            return True
+        with cls._queue.all_tasks_done:
+            return cls._queue.all_tasks_done.wait_for(lambda: not cls._queue.unfinished_tasks, timeout)
+
+    @classmethod
+    def _startWorker(cls) -> None:
+        """Starts the worker thread that sends queued reports, if it isn't running yet."""
+        with cls._lock:
+            if cls._queue is None:
+                cls._queue = Queue()
+                threading.Thread(target=cls._work, daemon=True).start()
+                atexit.register(cls.flush, cls.EXIT_FLUSH_TIMEOUT)
+
+    @classmethod
+    def _work(cls) -> None:
+        """Sends queued reports one at a time, forever."""
+        while True:
+            title, description = cls._queue.get()
+            try:
+                from PyBugReporter.src.BugReporter import BugReporter
+                cls._configure(BugReporter)
+                BugReporter.manualBugReport(title, description)
+            except Exception as e:
+                print(f'Failed to send bug report "{title}": {e}')
+            finally:
+                cls._queue.task_done()
+
+    @classmethod
+    def _configure(cls, bugReporter: type) -> None:
+        """Sets up BugReporter with the GitHub token the first time it is needed.
+
+        Args:
+            bugReporter (type): the BugReporter class
+        """
+        if not cls._configured:
+            parameterService = ParameterService()
+            bugReporter.setVars(parameterService.getGithubCredentials(), PROJECT_NAME, cls.ORG_NAME, cls.test)
+            cls._configured = True
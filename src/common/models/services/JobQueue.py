@@ -0,0 +1,62 @@
+from common.models.Job import Job
+
+class JobQueue:
+    """An abstract base class for queues of jobs with SQS-style visibility timeouts.
+
+    A received job is hidden from other receivers until its visibility
+    timeout runs out; if it isn't deleted by then, it is received again.
+
+    This class is meant to implement the Strategy pattern: the worker and
+    the Lambda presenter only use this interface, so SQS can be swapped for
+    an in-process queue in tests and local runs.
+    """
+
+    def send(self, body: dict) -> None:
+        """Adds a job to the queue.
+
+        Args:
+            body (dict): what the job is for
+
+        Raises:
+            NotImplementedError: the subclass must implement this method
+        """
+        raise NotImplementedError('Subclasses must implement this method.')
+
+    def receive(self, maxJobs: int, waitSeconds: float, visibilityTimeout: int) -> list[Job]:
+        """Receives jobs from the queue, waiting for some to arrive if there are none.
+
+        Args:
+            maxJobs (int): most jobs to receive
+            waitSeconds (float): most seconds to wait for a job
+            visibilityTimeout (int): seconds the received jobs are hidden from other receivers
+
+        Raises:
+            NotImplementedError: the subclass must implement this method
+
+        Returns:
+            list[Job]: the received jobs; empty if none arrived in time
+        """
+        raise NotImplementedError('Subclasses must implement this method.')
+
+    def delete(self, job: Job) -> None:
+        """Removes a finished job from the queue.
+
+        Args:
+            job (Job): the job to remove
+
+        Raises:
+            NotImplementedError: the subclass must implement this method
+        """
+        raise NotImplementedError('Subclasses must implement this method.')
+
+    def changeVisibility(self, job: Job, seconds: int) -> None:
+        """Changes how long a received job stays hidden, counting from now.
+
+        Args:
+            job (Job): the received job
+            seconds (int): seconds to keep the job hidden; 0 makes it available again right away
+
+        Raises:
+            NotImplementedError: the subclass must implement this method
+        """
+        raise NotImplementedError('Subclasses must implement this method.')
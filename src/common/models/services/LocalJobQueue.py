@@ -0,0 +1,100 @@
+import threading
+import uuid
+from time import monotonic
+
+from common.models.Job import Job
+from common.models.services.JobQueue import JobQueue
+
+class LocalJobQueue(JobQueue):
+    """An in-process JobQueue with the same visibility timeout behaviour as SQS.
+
+    Meant for tests and local runs; jobs are lost when the process exits.
+
+    Attributes:
+        POLL_SECONDS (float): how often `receive` checks for hidden jobs becoming visible
+    """
+
+    POLL_SECONDS = 0.05
+
+    def __init__(self) -> None:
+        """Constructs a LocalJobQueue object."""
+        self._jobs: dict[str, tuple[dict, float]] = {}  # body and when it is next visible, by job ID
+        self._receipts: dict[str, str] = {}  # job ID by current receipt
+        self._condition = threading.Condition()
+
+    def __len__(self) -> int:
+        """Returns the number of jobs not yet deleted, including hidden ones.
+
+        Returns:
+            int: number of jobs in the queue
+        """
+        with self._condition:
+            return len(self._jobs)
+
+    def send(self, body: dict) -> None:
+        """Adds a job to the queue.
+
+        Args:
+            body (dict): what the job is for
+        """
+        with self._condition:
+            self._jobs[uuid.uuid4().hex] = (body, 0)
+            self._condition.notify_all()
+
+    def receive(self, maxJobs: int, waitSeconds: float, visibilityTimeout: int) -> list[Job]:
+        """Receives visible jobs, waiting for some to arrive or become visible if there are none.
+
+        Args:
+            maxJobs (int): most jobs to receive
+            waitSeconds (float): most seconds to wait for a job
+            visibilityTimeout (int): seconds the received jobs are hidden from other receivers
+
+        Returns:
+            list[Job]: the received jobs; empty if none arrived in time
+        """
+        deadline = monotonic() + waitSeconds
+        with self._condition:
+            while True:
+                now = monotonic()
+                visible = [jobId for jobId, (_, visibleAt) in self._jobs.items() if visibleAt <= now][:maxJobs]
+                if visible or now >= deadline:
+                    break
+                # Polls as well as waiting for `send`, since hidden jobs become visible without a notification
+                self._condition.wait(min(deadline - now, self.POLL_SECONDS))
+
+            jobs = []
+            for jobId in visible:
+                body, _ = self._jobs[jobId]
+                self._jobs[jobId] = (body, now + visibilityTimeout)
+                receipt = uuid.uuid4().hex
+                self._receipts = {r: i for r, i in self._receipts.items() if i != jobId}
+                self._receipts[receipt] = jobId
+                jobs.append(Job(jobId, body, receipt))
+            return jobs
+
+    def delete(self, job: Job) -> None:
+        """Removes a finished job from the queue.
+
+        Does nothing if the job was received again since, like SQS with a stale receipt.
+
+        Args:
+            job (Job): the job to remove
+        """
+        with self._condition:
+            jobId = self._receipts.pop(job.receipt, None)
+            if jobId is not None:
+                self._jobs.pop(jobId, None)
+
+    def changeVisibility(self, job: Job, seconds: int) -> None:
+        """Changes how long a received job stays hidden, counting from now.
+
+        Args:
+            job (Job): the received job
+            seconds (int): seconds to keep the job hidden; 0 makes it available again right away
+        """
+        with self._condition:
+            jobId = self._receipts.get(job.receipt)
+            if jobId in self._jobs:
+                body, _ = self._jobs[jobId]
+                self._jobs[jobId] = (body, monotonic() + seconds)
+                self._condition.notify_all()
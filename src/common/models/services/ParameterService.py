@@ -1,27 +1,54 @@
 import json
+import os
+import time
+from functools import partial
 
 from common.models.AwsSession import AwsSession
+from common.models.EnvVar import EnvVar
+from common.models.TtlCache import TtlCache
 
 class ParameterService:
     """Gets parameters from Parameter Store.
-    
-    Attributes: 
+
+    Parameters are cached at class level, so they are shared by every
+    instance and survive across warm Lambda invocations. A cached parameter
+    is refreshed in the background before it expires, and the first lookup
+    of any known parameter fetches all of them with one `get_parameters` call.
+
+    Attributes:
         PYFS_PARAMETER_NAME (str): AWS Parameter Store parameter name for PyFS credentials
         GITHUB_PARAMETER_NAME (str): AWS Parameter Store parameter name for Github token
+        KNOWN_PARAMETER_NAMES (list[str]): parameters fetched together in one call
+        CACHE_TTL (int): seconds a parameter is cached for
+        CACHE_REFRESH_AFTER (int): seconds after which a cached parameter is refreshed in the background
+        cache (TtlCache): cached parameters by name, shared across instances
         client (boto3.Session.client): AWS client object for AWS Systems Manager Parameter Store
+        cacheFile (str | None): file the cached parameters are also persisted to, if any
     """
 
     PYFS_PARAMETER_NAME = '/growth-spurt/DataFinder/credentials'
     GITHUB_PARAMETER_NAME = '/growth-spurt/github/access-token'
-    
+    KNOWN_PARAMETER_NAMES = [PYFS_PARAMETER_NAME, GITHUB_PARAMETER_NAME]
+    CACHE_TTL = 15 * 60
+    CACHE_REFRESH_AFTER = 10 * 60
+    cache = TtlCache(ttl=CACHE_TTL, refreshAfter=CACHE_REFRESH_AFTER)
+
     def __init__(self) -> None:
-        """Constructs a ParameterService object."""
+        """Constructs a ParameterService object.
+
+        If the optional PARAMETER_CACHE_FILE environment variable is set, the
+        cached parameters are persisted to that file (e.g. in Lambda's /tmp)
+        and loaded from it when the class-level cache is empty, so it is read
+        once per process rather than by every instance.
+        """
         awsSession = AwsSession()
-        session = awsSession.getSession()
-        self.client = session.client(service_name='ssm')
-        
+        self.client = awsSession.getClient('ssm')
+        self.cacheFile: str | None = EnvVar().get('PARAMETER_CACHE_FILE')
+        if self.cacheFile and not len(self.cache):
+            self._readCacheFile()
+
     def _getParameter(self, parameterName: str) -> dict:
-        """Gets a parameter from AWS Parameter Store.
+        """Gets a parameter from AWS Parameter Store, using the cache when possible.
 
         Args:
             parameterName (str): parameter name to get from AWS Parameter Store
@@ -29,12 +56,92 @@ class ParameterService:
         Returns:
             dict: parameter from AWS Parameter Store
         """
+        return self.cache.get(parameterName, partial(self._loadParameter, parameterName))
+
+    def _loadParameter(self, parameterName: str) -> dict:
+        """Loads a parameter from AWS Parameter Store, bypassing the cache.
+
+        Known parameters are loaded all together with `prefetch`.
+
+        Args:
+            parameterName (str): parameter name to get from AWS Parameter Store
+
+        Returns:
+            dict: parameter from AWS Parameter Store
+        """
+        if parameterName in self.KNOWN_PARAMETER_NAMES:
+            parameters = self.prefetch()
+            if parameterName in parameters:
+                return parameters[parameterName]
+
         response = self.client.get_parameter(
             Name=parameterName,
             WithDecryption=True
         )
         return response['Parameter']
-    
+
+    def prefetch(self) -> dict[str, dict]:
+        """Loads every known parameter with a single call and caches them.
+
+        Returns:
+            dict[str, dict]: parameters from AWS Parameter Store by name
+        """
+        response = self.client.get_parameters(
+            Names=self.KNOWN_PARAMETER_NAMES,
+            WithDecryption=True
+        )
+        parameters = {parameter['Name']: parameter for parameter in response['Parameters']}
+        for name, parameter in parameters.items():
+            self.cache.set(name, parameter)
+        if self.cacheFile:
+            self._writeCacheFile(parameters)
+        return parameters
+
+    def getCacheStats(self) -> dict[str, int]:
+        """Gets how often parameters were served from the cache.
+
+        Returns:
+            dict[str, int]: number of cache hits and misses
+        """
+        return {'hits': self.cache.hits, 'misses': self.cache.misses}
+
+    def _readCacheFile(self) -> None:
+        """Loads unexpired parameters from the cache file into the cache.
+
+        A missing or unreadable file is ignored.
+        """
+        try:
+            with open(self.cacheFile) as file:
+                contents = json.load(file)
+            age = time.time() - contents['storedAt']
+            parameters: dict = contents['parameters']
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+
+        if age < self.CACHE_TTL:
+            for name, parameter in parameters.items():
+                self.cache.set(name, parameter, age)
+
+    def _writeCacheFile(self, parameters: dict[str, dict]) -> None:
+        """Persists parameters to the cache file.
+
+        The file is only readable by the current user and is replaced
+        atomically so readers never see a partial write.
+
+        Args:
+            parameters (dict[str, dict]): parameters from AWS Parameter Store by name
+        """
+        contents = {
+            'storedAt': time.time(),
+            'parameters': {
+                name: {'Name': name, 'Value': parameter['Value']} for name, parameter in parameters.items()
+            }
+        }
+        tempPath = f'{self.cacheFile}.{os.getpid()}.tmp'
+        with open(os.open(tempPath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'w') as file:
+            json.dump(contents, file)
+        os.replace(tempPath, self.cacheFile)
+
     def getPyFSCredentials(self) -> dict:
         """Gets the PyFS GrowthSpurt key needed to run threaded PyFS calls.
 
@@ -44,7 +151,7 @@ class ParameterService:
         parameter = self._getParameter(self.PYFS_PARAMETER_NAME)['Value']
         credentials = json.loads(parameter)
         return credentials
-    
+
     def getGithubCredentials(self) -> str:
         """Gets the Github token needed to run threaded PyFS calls.
 
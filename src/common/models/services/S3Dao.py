@@ -1,25 +1,45 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from botocore.exceptions import ClientError
+
 from common.models.AwsSession import AwsSession
 
 class S3Dao:
     """Contains methods for communicating with S3.
 
     Attributes:
+        MAX_COPY_SIZE (int): largest object in bytes S3 can copy in a single request
+        DEFAULT_COPY_PART_SIZE (int): default size in bytes of each part of a multipart copy
+        DEFAULT_COPY_CONCURRENCY (int): default number of parts (or files, when moving many) copied at once
+        MAX_DELETE_BATCH (int): most keys S3 deletes in a single request
+        COPIED_FIELDS (list[str]): fields of `head_object` a multipart copy gives the new file, as `copy_object` does
         client: AWS client object for Amazon S3
     """
+
+    MAX_COPY_SIZE = 5 * 1024 * 1024 * 1024
+    DEFAULT_COPY_PART_SIZE = 512 * 1024 * 1024
+    DEFAULT_COPY_CONCURRENCY = 8
+    MAX_DELETE_BATCH = 1000
+    COPIED_FIELDS = ['CacheControl', 'ContentDisposition', 'ContentEncoding', 'ContentLanguage', 'ContentType', 'Metadata']
     
     def __init__(self) -> None:
         """Constructs an S3Dao object."""
         awsSession = AwsSession()
-        session = awsSession.getSession()
-        self.client = session.client(service_name='s3')
+        self.client = awsSession.getClient('s3')
 
     def moveFile(self, oldBucket: str, oldKey: str,
-                 destBucket: str, destKey: str) -> tuple[dict, dict]:
+                 destBucket: str, destKey: str) -> tuple[dict, dict, dict[str, float]]:
         """Moves file between S3 buckets.
 
         If the move is to the same bucket, then this is essentially a 
         'rename' operation.
 
+        The file is looked up first, so a move that lost a race for the file
+        fails before copying anything. The copy only goes ahead if the file
+        still has the ETag it was looked up with, and files over
+        `MAX_COPY_SIZE` are copied in parts (see `copyFile`).
+
         Args:
             oldBucket (str): name of bucket to move file from
             oldKey (str): key of original file
@@ -27,20 +47,205 @@ class S3Dao:
             destKey (str): key of destination file
         
         Returns:
-            tuple[dict, dict]:
-                dict: response of `S3.Client.copy_object` operation
+            tuple[dict, dict, dict[str, float]]:
+                dict: response of `S3.Client.copy_object` operation (or `complete_multipart_upload` for a multipart copy)
                 dict: response of `S3.Client.delete_object` operation
+                dict[str, float]: seconds spent looking up, copying and deleting the file
         """
-        copyResponse = self.client.copy_object(
-            Bucket=destBucket,
-            Key=destKey,
-            CopySource={
-                'Bucket': oldBucket,
-                'Key': oldKey
-            }
-        )
+        timings: dict[str, float] = {}
+        start = time.perf_counter()
+        head: dict = self.client.head_object(Bucket=oldBucket, Key=oldKey)
+        timings['head'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        copyResponse = self.copyFile(oldBucket, oldKey, destBucket, destKey, head['ContentLength'], head['ETag'], self._getCopiedFields(head))
+        timings['copy'] = time.perf_counter() - start
+
+        start = time.perf_counter()
         delResponse = self.client.delete_object(
             Bucket=oldBucket,
             Key=oldKey
         )
-        return copyResponse, delResponse
+        timings['delete'] = time.perf_counter() - start
+        return copyResponse, delResponse, timings
+
+    def moveFiles(self, oldBucket: str, destBucket: str, keys: dict[str, str]) -> tuple[dict[str, Exception | None], dict[str, float]]:
+        """Moves many files between S3 buckets.
+
+        Files are looked up and copied like in `moveFile`, up to
+        `DEFAULT_COPY_CONCURRENCY` at once; then every copied file is deleted
+        with `delete_objects`, up to `MAX_DELETE_BATCH` keys per request.
+        A file that fails doesn't stop the others. A file whose destination
+        key was already given to an earlier file fails without being copied,
+        so no original is deleted after its copy was overwritten.
+
+        Args:
+            oldBucket (str): name of bucket to move files from
+            destBucket (str): name of bucket to move files to
+            keys (dict[str, str]): key of each destination file, by key of its original file
+
+        Returns:
+            tuple[dict[str, Exception | None], dict[str, float]]:
+                dict[str, Exception | None]: error moving each file, or None if it moved, by key of its original file
+                dict[str, float]: seconds spent copying and deleting the files
+        """
+        results: dict[str, Exception | None] = dict.fromkeys(keys)
+        timings: dict[str, float] = {}
+        destinations: dict[str, str] = {}
+        for oldKey, destKey in keys.items():
+            if destKey in destinations:
+                results[oldKey] = ValueError(f'{destKey} is also the destination of {destinations[destKey]}')
+            else:
+                destinations[destKey] = oldKey
+        unique = list(destinations.values())
+
+        def copy(oldKey: str) -> Exception | None:
+            try:
+                head: dict = self.client.head_object(Bucket=oldBucket, Key=oldKey)
+                self.copyFile(oldBucket, oldKey, destBucket, keys[oldKey], head['ContentLength'], head['ETag'], self._getCopiedFields(head))
+            except Exception as e:
+                return e
+            return None
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.DEFAULT_COPY_CONCURRENCY) as executor:
+            results.update(zip(unique, executor.map(copy, unique)))
+        timings['copy'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        copied = [oldKey for oldKey in unique if results[oldKey] is None]
+        for i in range(0, len(copied), self.MAX_DELETE_BATCH):
+            batch = copied[i:i + self.MAX_DELETE_BATCH]
+            try:
+                response: dict = self.client.delete_objects(
+                    Bucket=oldBucket,
+                    Delete={'Objects': [{'Key': oldKey} for oldKey in batch], 'Quiet': True}
+                )
+            except Exception as e:
+                results.update((oldKey, e) for oldKey in batch)
+                continue
+            for error in response.get('Errors', []):
+                results[error['Key']] = ClientError({'Error': {'Code': error['Code'], 'Message': error['Message']}}, 'DeleteObjects')
+        timings['delete'] = time.perf_counter() - start
+        return results, timings
+
+    def listFiles(self, bucket: str, prefix: str) -> list[str]:
+        """Lists the keys of every file in an S3 bucket under a prefix.
+
+        Args:
+            bucket (str): name of bucket to list files in
+            prefix (str): prefix the keys must start with
+
+        Returns:
+            list[str]: keys of the files, excluding folder placeholders
+        """
+        paginator = self.client.get_paginator('list_objects_v2')
+        keys = []
+        for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+            keys.extend(obj['Key'] for obj in page.get('Contents', []) if not obj['Key'].endswith('/'))
+        return keys
+
+    def copyFile(self, oldBucket: str, oldKey: str, destBucket: str, destKey: str,
+                 size: int = None, etag: str = None, fields: dict = None) -> dict:
+        """Copies file between S3 buckets without downloading it.
+
+        Files up to `MAX_COPY_SIZE` are copied with a single request. Larger
+        files are copied with a multipart upload whose parts are copied in
+        parallel with `upload_part_copy`; if any part fails, the upload is aborted.
+        The multipart upload is given the file's `COPIED_FIELDS` (e.g. its
+        Content-Type, Content-Encoding and metadata), as a single copy would.
+        Given an ETag, every request only copies the file if it still has it,
+        failing with PreconditionFailed otherwise.
+
+        Args:
+            oldBucket (str): name of bucket to copy file from
+            oldKey (str): key of original file
+            destBucket (str): name of bucket to copy file to
+            destKey (str): key of destination file
+            size (int, optional): size of the file in bytes; looked up with `head_object` if not given
+            etag (str, optional): ETag the file must have to be copied; defaults to copying it whatever its ETag
+            fields (dict, optional): the file's `COPIED_FIELDS`, from `_getCopiedFields`; looked up with `head_object` if a multipart copy needs them
+
+        Returns:
+            dict: response of `S3.Client.copy_object` operation,
+                  or of `S3.Client.complete_multipart_upload` for a multipart copy
+        """
+        copySource = {
+            'Bucket': oldBucket,
+            'Key': oldKey
+        }
+        head = None
+        if size is None:
+            head = self.client.head_object(**copySource)
+            size = head['ContentLength']
+        conditions = {'CopySourceIfMatch': etag} if etag else {}
+        if size <= self.MAX_COPY_SIZE:
+            return self.client.copy_object(
+                Bucket=destBucket,
+                Key=destKey,
+                CopySource=copySource,
+                **conditions
+            )
+
+        if fields is None:
+            fields = self._getCopiedFields(head or self.client.head_object(**copySource))
+        uploadId: str = self.client.create_multipart_upload(Bucket=destBucket, Key=destKey, **fields)['UploadId']
+        try:
+            ranges = [
+                (partNumber, start, min(start + self.DEFAULT_COPY_PART_SIZE, size) - 1)
+                for partNumber, start in enumerate(range(0, size, self.DEFAULT_COPY_PART_SIZE), start=1)
+            ]
+            with ThreadPoolExecutor(max_workers=self.DEFAULT_COPY_CONCURRENCY) as executor:
+                parts = list(executor.map(
+                    lambda partRange: self._copyPart(copySource, destBucket, destKey, uploadId, *partRange, conditions),
+                    ranges
+                ))
+            response = self.client.complete_multipart_upload(
+                Bucket=destBucket,
+                Key=destKey,
+                UploadId=uploadId,
+                MultipartUpload={'Parts': parts}
+            )
+        except BaseException:
+            self.client.abort_multipart_upload(Bucket=destBucket, Key=destKey, UploadId=uploadId)
+            raise
+        return response
+
+    def _getCopiedFields(self, head: dict) -> dict:
+        """Gets the fields of a file a copy of it should have.
+
+        Args:
+            head (dict): response of `S3.Client.head_object` for the file
+
+        Returns:
+            dict: the file's `COPIED_FIELDS` that are set, as arguments of `create_multipart_upload`
+        """
+        return {field: head[field] for field in self.COPIED_FIELDS if head.get(field)}
+
+    def _copyPart(self, copySource: dict, destBucket: str, destKey: str, uploadId: str,
+                  partNumber: int, start: int, end: int, conditions: dict = None) -> dict:
+        """Copies one byte range of a file as a part of a multipart upload.
+
+        Args:
+            copySource (dict): bucket and key of the file being copied
+            destBucket (str): name of bucket to copy file to
+            destKey (str): key of destination file
+            uploadId (str): ID of the multipart upload
+            partNumber (int): 1-based number of the part
+            start (int): first byte of the range (inclusive)
+            end (int): last byte of the range (inclusive)
+            conditions (dict, optional): conditions on the file being copied, e.g. CopySourceIfMatch; defaults to none
+
+        Returns:
+            dict: part number and ETag of the copied part
+        """
+        response = self.client.upload_part_copy(
+            Bucket=destBucket,
+            Key=destKey,
+            UploadId=uploadId,
+            PartNumber=partNumber,
+            CopySource=copySource,
+            CopySourceRange=f'bytes={start}-{end}',
+            **(conditions or {})
+        )
+        return {'PartNumber': partNumber, 'ETag': response['CopyPartResult']['ETag']}
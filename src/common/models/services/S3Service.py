@@ -38,25 +38,31 @@ class S3Service:
         """
         NONEXISTENT_FILE_CODE = 'InvalidArgument' # AWS says the given file key is "invalid" when it doesn't exist
         NO_SUCH_KEY_CODE = 'NoSuchKey' # AWS says the given file key doesn't exist
-        if e.response['Error']['Code'] == NONEXISTENT_FILE_CODE or e.response['Error']['Code'] == NO_SUCH_KEY_CODE:
+        NOT_FOUND_CODE = '404' # HEAD requests have no body, so AWS only gives the status
+        if e.response['Error']['Code'] in (NONEXISTENT_FILE_CODE, NO_SUCH_KEY_CODE, NOT_FOUND_CODE):
             return True
         else:
             return False
     
-    def moveFile(self, oldKey: str, newKey: str) -> tuple[dict, dict]:
+    def moveFile(self, oldKey: str, newKey: str) -> tuple[dict, dict, dict[str, float]]:
         """Moves file in S3 bucket. 
 
+        Files of any size can be moved, and a file that's changed while it's
+        being moved isn't copied (see `S3Dao.moveFile`).
+
         Args:
             oldKey (str): key to where file is located
             newKey (str): key to where file will be moved
 
         Raises:
             FileNotFoundError: if file does not exist
+            ClientError: if file changed while it was being moved (PreconditionFailed), or S3 failed for another reason
 
         Returns:
-            tuple[dict, dict]:
+            tuple[dict, dict, dict[str, float]]:
                 dict: response of `S3.Client.copy_object` operation
                 dict: response of `S3.Client.delete_object` operation
+                dict[str, float]: seconds spent looking up, copying and deleting the file
         """
         try:
             return self.s3Dao.moveFile(self.dataBucketName, oldKey, self.dataBucketName, newKey)
@@ -65,3 +71,31 @@ class S3Service:
                 raise FileNotFoundError(e)
             else: 
                 raise e
+
+    def moveFiles(self, keys: dict[str, str]) -> tuple[dict[str, Exception | None], dict[str, float]]:
+        """Moves many files in S3 bucket, deleting the originals in batches.
+
+        Args:
+            keys (dict[str, str]): key to where each file will be moved, by key to where it is located
+
+        Returns:
+            tuple[dict[str, Exception | None], dict[str, float]]:
+                dict[str, Exception | None]: error moving each file (FileNotFoundError if it does not exist), or None if it moved
+                dict[str, float]: seconds spent copying and deleting the files
+        """
+        results, timings = self.s3Dao.moveFiles(self.dataBucketName, self.dataBucketName, keys)
+        for oldKey, error in results.items():
+            if isinstance(error, ClientError) and self._isNonexistentFileError(error):
+                results[oldKey] = FileNotFoundError(error)
+        return results, timings
+
+    def listFiles(self, prefix: str) -> list[str]:
+        """Lists the keys of every file in the data bucket under a prefix.
+
+        Args:
+            prefix (str): prefix the keys must start with
+
+        Returns:
+            list[str]: keys of the files
+        """
+        return self.s3Dao.listFiles(self.dataBucketName, prefix)
@@ -0,0 +1,98 @@
+import json
+
+from common.models.AwsSession import AwsSession
+from common.models.Job import Job
+from common.models.services.JobQueue import JobQueue
+
+class SqsJobQueue(JobQueue):
+    """A JobQueue backed by Amazon SQS.
+
+    Jobs are sent as JSON message bodies.
+
+    Attributes:
+        MAX_RECEIVE (int): most messages SQS returns from one receive call
+        MAX_WAIT_SECONDS (int): longest long poll SQS allows
+        queueUrl (str): URL of the SQS queue
+        client: AWS client object for Amazon SQS
+    """
+
+    MAX_RECEIVE = 10
+    MAX_WAIT_SECONDS = 20
+
+    def __init__(self, queueUrl: str) -> None:
+        """Constructs an SqsJobQueue object.
+
+        Args:
+            queueUrl (str): URL of the SQS queue
+        """
+        self.queueUrl = queueUrl
+        awsSession = AwsSession()
+        self.client = awsSession.getClient('sqs')
+
+    def send(self, body: dict) -> None:
+        """Adds a job to the queue.
+
+        Args:
+            body (dict): what the job is for
+        """
+        self.client.send_message(
+            QueueUrl=self.queueUrl,
+            MessageBody=json.dumps(body)
+        )
+
+    def receive(self, maxJobs: int, waitSeconds: float, visibilityTimeout: int) -> list[Job]:
+        """Receives jobs from the queue with a long poll.
+
+        A message whose body isn't a JSON object is received with an empty
+        body, so the worker fails it and SQS's redrive policy can move it
+        to a dead-letter queue.
+
+        Args:
+            maxJobs (int): most jobs to receive (SQS returns at most 10)
+            waitSeconds (float): most seconds to wait for a job (SQS waits at most 20)
+            visibilityTimeout (int): seconds the received jobs are hidden from other receivers
+
+        Returns:
+            list[Job]: the received jobs; empty if none arrived in time
+        """
+        response = self.client.receive_message(
+            QueueUrl=self.queueUrl,
+            MaxNumberOfMessages=max(1, min(maxJobs, self.MAX_RECEIVE)),
+            WaitTimeSeconds=int(min(waitSeconds, self.MAX_WAIT_SECONDS)),
+            VisibilityTimeout=visibilityTimeout
+        )
+        jobs = []
+        for message in response.get('Messages', []):
+            try:
+                body = json.loads(message['Body'])
+            except ValueError:
+                body = None
+            if not isinstance(body, dict):
+                print(f'Job {message["MessageId"]} has an invalid body: {message["Body"]}')
+                body = {}
+            jobs.append(Job(message['MessageId'], body, message['ReceiptHandle']))
+        return jobs
+
+    def delete(self, job: Job) -> None:
+        """Removes a finished job from the queue.
+
+        Args:
+            job (Job): the job to remove
+        """
+        self.client.delete_message(
+            QueueUrl=self.queueUrl,
+            ReceiptHandle=job.receipt
+        )
+
+    def changeVisibility(self, job: Job, seconds: int) -> None:
+        """Changes how long a received job stays hidden, counting from now.
+
+        Args:
+            job (Job): the received job
+            seconds (int): seconds to keep the job hidden; 0 makes it available again right away
+        """
+        self.client.change_message_visibility(
+            QueueUrl=self.queueUrl,
+            ReceiptHandle=job.receipt,
+            VisibilityTimeout=seconds
+        )
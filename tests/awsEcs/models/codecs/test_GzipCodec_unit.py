@@ -0,0 +1,46 @@
+import gzip
+import unittest
+from io import BytesIO
+
+from awsEcs.models.codecs.GzipCodec import GzipCodec
+
+class TestGzipCodecUnit(unittest.TestCase):
+    """Unit tests for GzipCodec."""
+
+    def setUp(self):
+        """Sets up the test case."""
+        self.codec = GzipCodec()
+        self.data = b'ark,pid,score\n' + b'abc,1,2\n' * 10000
+
+    def test_iterCompress(self):
+        """Tests if the chunks iterCompress yields form one gzip member of the whole data."""
+        # Arrange
+        chunks = [self.data[:100], self.data[100:]]
+
+        # Act
+        outData = b''.join(self.codec.iterCompress(chunks))
+
+        # Assert
+        self.assertEqual(self.data, gzip.decompress(outData))
+
+    def test_openReader_members(self):
+        """Tests if concatenated gzip members read back as one stream."""
+        # Arrange
+        compressed = gzip.compress(self.data[:100]) + gzip.compress(self.data[100:])
+
+        # Act
+        with self.codec.openReader(BytesIO(compressed)) as reader:
+            result = reader.read()
+
+        # Assert
+        self.assertEqual(self.data, result)
+
+    def test_openReader_corrupt(self):
+        """Tests if corrupt data raises an error from the reader."""
+        # Arrange
+        compressed = b'not gzip data'
+
+        # Act / Assert
+        with self.codec.openReader(BytesIO(compressed)) as reader:
+            with self.assertRaises(gzip.BadGzipFile):
+                reader.read()
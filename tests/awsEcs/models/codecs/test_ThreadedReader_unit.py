@@ -0,0 +1,51 @@
+import unittest
+from io import BytesIO
+from unittest.mock import Mock
+
+from awsEcs.models.codecs.ThreadedReader import ThreadedReader
+
+class TestThreadedReaderUnit(unittest.TestCase):
+    """Unit tests for ThreadedReader."""
+
+    def test_read(self):
+        """Tests if the reader gives back the source's bytes in order."""
+        # Arrange
+        data = bytes(range(256)) * 1000
+        reader = ThreadedReader(BytesIO(data))
+        reader.READ_SIZE = 1000
+
+        # Act
+        result = reader.readall()
+
+        # Assert
+        self.assertEqual(data, result)
+        self.assertEqual(b'', reader.read(10))
+        reader.close()
+
+    def test_read_error(self):
+        """Tests if an error reading the source is raised by the reader."""
+        # Arrange
+        source = Mock()
+        source.read.side_effect = OSError('connection reset')
+        reader = ThreadedReader(source)
+
+        # Act / Assert
+        with self.assertRaises(OSError):
+            reader.read(10)
+        reader.close()
+
+    def test_close(self):
+        """Tests if closing the reader early stops the thread and closes the source."""
+        # Arrange
+        source = Mock()
+        source.read.return_value = b'x' * 10
+        reader = ThreadedReader(source, maxBlocks=1)
+        reader.read(5)
+
+        # Act
+        reader.close()
+
+        # Assert
+        self.assertFalse(reader._thread.is_alive())
+        source.close.assert_called_once()
+        self.assertTrue(reader.closed)
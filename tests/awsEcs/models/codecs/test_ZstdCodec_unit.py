@@ -0,0 +1,44 @@
+import unittest
+from io import BytesIO
+
+import zstandard
+
+from awsEcs.models.codecs.ZstdCodec import ZstdCodec
+
+class TestZstdCodecUnit(unittest.TestCase):
+    """Unit tests for ZstdCodec."""
+
+    def setUp(self):
+        """Sets up the test case."""
+        self.codec = ZstdCodec()
+        self.data = b'ark,pid,score\n' + b'abc,1,2\n' * 10000
+
+    def test_iterCompress(self):
+        """Tests if the chunks iterCompress yields form one zstd frame of the whole data."""
+        # Arrange
+        chunks = [self.data[:100], self.data[100:]]
+
+        # Act
+        outData = b''.join(self.codec.iterCompress(chunks))
+
+        # Assert
+        self.assertEqual(self.data, zstandard.ZstdDecompressor().decompressobj().decompress(outData))
+        self.assertLess(len(outData), len(self.data))
+
+    def test_openReader_frames(self):
+        """Tests if concatenated frames, e.g. from separately compressed shards, read back as one stream."""
+        # Arrange
+        compressed = b''.join(self.codec.iterCompress([self.data[:100]])) + b''.join(self.codec.iterCompress([self.data[100:]]))
+
+        # Act
+        with self.codec.openReader(BytesIO(compressed)) as reader:
+            result = reader.read()
+
+        # Assert
+        self.assertEqual(self.data, result)
+
+    def test_matches(self):
+        """Tests if matches checks the compression extension."""
+        # Act / Assert
+        self.assertTrue(ZstdCodec.matches('ToDo/hints.csv.ZST'))
+        self.assertFalse(ZstdCodec.matches('ToDo/hints.csv.gz'))
@@ -0,0 +1,49 @@
+import unittest
+from io import BytesIO
+
+import pandas as pd
+
+from awsEcs.models.formats.ArrowFormat import ArrowFormat
+
+class TestArrowFormatUnit(unittest.TestCase):
+    """Unit tests for ArrowFormat."""
+
+    TEST_FILE = 'tests/common/testData/CompletedHints.csv'
+
+    def setUp(self):
+        """Sets up the test case."""
+        self.fileFormat = ArrowFormat()
+        self.df = pd.read_csv(self.TEST_FILE)
+
+    def test_write_read(self):
+        """Tests if a written file reads back the same, with and without column projection."""
+        # Arrange
+        data = self.fileFormat.write(self.df)
+
+        # Act
+        df = self.fileFormat.read(BytesIO(data))
+        projected = self.fileFormat.read(BytesIO(data), ['ark', 'score'])
+
+        # Assert
+        pd.testing.assert_frame_equal(self.df, df)
+        pd.testing.assert_frame_equal(self.df[['ark', 'score']], projected)
+
+    def test_iterWrite_iterRead(self):
+        """Tests if a file written in chunks can be read back in chunks of the given size."""
+        # Arrange
+        data = b''.join(self.fileFormat.iterWrite([self.df[:2], self.df[2:]]))
+
+        # Act
+        chunks = list(self.fileFormat.iterRead(BytesIO(data), 2, ['ark', 'score']))
+
+        # Assert
+        self.assertTrue(all(len(chunk) <= 2 for chunk in chunks))
+        pd.testing.assert_frame_equal(self.df[['ark', 'score']], pd.concat(chunks, ignore_index=True))
+
+    def test_iterWrite_noChunks(self):
+        """Tests if writing no chunks still gives a valid Arrow file, with no rows."""
+        # Act
+        data = b''.join(self.fileFormat.iterWrite([]))
+
+        # Assert
+        self.assertTrue(self.fileFormat.read(BytesIO(data)).empty)
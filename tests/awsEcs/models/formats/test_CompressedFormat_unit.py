@@ -0,0 +1,70 @@
+import unittest
+from io import BytesIO
+
+import pandas as pd
+
+from awsEcs.models.codecs.GzipCodec import GzipCodec
+from awsEcs.models.codecs.ZstdCodec import ZstdCodec
+from awsEcs.models.formats.CompressedFormat import CompressedFormat
+from awsEcs.models.formats.CsvFormat import CsvFormat
+from awsEcs.models.formats.ParquetFormat import ParquetFormat
+
+class TestCompressedFormatUnit(unittest.TestCase):
+    """Unit tests for CompressedFormat."""
+
+    TEST_FILE = 'tests/common/testData/CompletedHints.csv'
+
+    def setUp(self):
+        """Sets up the test case."""
+        self.zstdCsvFormat = CompressedFormat(CsvFormat(), ZstdCodec())
+        self.df = pd.read_csv(self.TEST_FILE)
+
+    def test_init(self):
+        """Tests if the name, extensions and metadata combine the format's and the codec's."""
+        # Act
+        fileFormat = CompressedFormat(ParquetFormat(), GzipCodec())
+
+        # Assert
+        self.assertEqual('parquet.gz', fileFormat.NAME)
+        self.assertEqual(['.parquet.gz', '.pq.gz'], fileFormat.EXTENSIONS)
+        self.assertEqual(ParquetFormat.CONTENT_TYPE, fileFormat.CONTENT_TYPE)
+        self.assertEqual('gzip', fileFormat.CONTENT_ENCODING)
+        self.assertTrue(fileFormat.matches('Output/hints.PQ.gz'))
+        self.assertFalse(fileFormat.matches('Output/hints.pq'))
+
+    def test_read(self):
+        """Tests if a written file reads back to the same data."""
+        # Arrange
+        data = BytesIO(self.zstdCsvFormat.write(self.df))
+
+        # Act
+        df = self.zstdCsvFormat.read(data, columns=['ark', 'score'])
+
+        # Assert
+        pd.testing.assert_frame_equal(self.df[['ark', 'score']], df)
+
+    def test_iterRead(self):
+        """Tests if a file written in parts can be read back in chunks."""
+        # Arrange
+        data = BytesIO(
+            b''.join(self.zstdCsvFormat.iterWrite([self.df[:2]]))
+            + b''.join(self.zstdCsvFormat.iterWrite([self.df[2:]], header=False))
+        )
+
+        # Act
+        chunks = list(self.zstdCsvFormat.iterRead(data, 2))
+
+        # Assert
+        pd.testing.assert_frame_equal(self.df, pd.concat(chunks, ignore_index=True))
+
+    def test_read_seekable(self):
+        """Tests if formats that need to seek are read from decompressed data buffered in memory."""
+        # Arrange
+        parquetFormat = CompressedFormat(ParquetFormat(), ZstdCodec())
+        data = BytesIO(parquetFormat.write(self.df))
+
+        # Act
+        df = parquetFormat.read(data)
+
+        # Assert
+        pd.testing.assert_frame_equal(self.df, df)
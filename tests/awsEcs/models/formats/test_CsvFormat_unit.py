@@ -0,0 +1,71 @@
+import unittest
+from io import BytesIO
+
+import pandas as pd
+
+from awsEcs.models.formats.CsvFormat import CsvFormat
+
+class TestCsvFormatUnit(unittest.TestCase):
+    """Unit tests for CsvFormat."""
+
+    TEST_FILE = 'tests/common/testData/CompletedHints.csv'
+
+    def setUp(self):
+        """Sets up the test case."""
+        self.csvFormat = CsvFormat()
+        self.df = pd.read_csv(self.TEST_FILE)
+
+    def test_read_columns(self):
+        """Tests if read only loads the requested columns."""
+        # Arrange
+        data = BytesIO(self.df.to_csv(index=False).encode('utf8'))
+
+        # Act
+        df = self.csvFormat.read(data, ['ark', 'pid'])
+
+        # Assert
+        pd.testing.assert_frame_equal(self.df[['ark', 'pid']], df)
+
+    def test_read_bytes(self):
+        """Tests if read decodes UTF-8 bytes itself, handling any kind of newline."""
+        # Arrange
+        text = self.df.to_csv(index=False)
+        data = BytesIO(text.replace('\n', '\r\n').encode('utf8'))
+
+        # Act
+        df = self.csvFormat.read(data)
+
+        # Assert
+        pd.testing.assert_frame_equal(self.df, df)
+
+    def test_read_Utf16(self):
+        """Tests if read fails loudly when passed a file encoded as something other than UTF-8."""
+        # Arrange
+        data = BytesIO(self.df.to_csv(index=False).encode('utf-16'))
+
+        # Act & Assert
+        with self.assertRaises(UnicodeDecodeError):
+            self.csvFormat.read(data)
+
+    def test_iterWrite(self):
+        """Tests if iterWrite only writes the header with the first chunk."""
+        # Arrange
+        chunks = [self.df[:2], self.df[2:]]
+
+        # Act
+        outData = b''.join(self.csvFormat.iterWrite(chunks))
+
+        # Assert
+        self.assertEqual(self.df.to_csv(index=False).encode('utf8'), outData)
+
+    def test_iterRead(self):
+        """Tests if iterRead splits the file into chunks of the given size."""
+        # Arrange
+        data = BytesIO(self.df.to_csv(index=False).encode('utf8'))
+
+        # Act
+        chunks = list(self.csvFormat.iterRead(data, 2))
+
+        # Assert
+        self.assertTrue(all(len(chunk) <= 2 for chunk in chunks))
+        pd.testing.assert_frame_equal(self.df, pd.concat(chunks, ignore_index=True))
@@ -0,0 +1,78 @@
+import unittest
+
+from awsEcs.models.codecs.GzipCodec import GzipCodec
+from awsEcs.models.codecs.ZstdCodec import ZstdCodec
+from awsEcs.models.formats.ArrowFormat import ArrowFormat
+from awsEcs.models.formats.CompressedFormat import CompressedFormat
+from awsEcs.models.formats.CsvFormat import CsvFormat
+from awsEcs.models.formats.FileFormatFactory import FileFormatFactory
+from awsEcs.models.formats.GzipCsvFormat import GzipCsvFormat
+from awsEcs.models.formats.ParquetFormat import ParquetFormat
+
+class TestFileFormatFactoryUnit(unittest.TestCase):
+    """Unit tests for FileFormatFactory."""
+
+    def test_getFormat_extension(self):
+        """Tests if getFormat chooses formats by extension, falling back to CSV."""
+        # Act / Assert
+        self.assertIsInstance(FileFormatFactory.getFormat('ToDo/hints.csv'), CsvFormat)
+        self.assertIsInstance(FileFormatFactory.getFormat('ToDo/hints.CSV.GZ'), GzipCsvFormat)
+        self.assertIsInstance(FileFormatFactory.getFormat('ToDo/hints.parquet'), ParquetFormat)
+        self.assertIsInstance(FileFormatFactory.getFormat('ToDo/hints.feather'), ArrowFormat)
+        self.assertIs(type(FileFormatFactory.getFormat('ToDo/hints')), CsvFormat)
+
+    def test_getFormat_name(self):
+        """Tests if a format name overrides the extension."""
+        # Act
+        fileFormat = FileFormatFactory.getFormat('ToDo/hints.csv', 'Parquet')
+
+        # Assert
+        self.assertIsInstance(fileFormat, ParquetFormat)
+
+    def test_getFormat_compressed(self):
+        """Tests if compressed formats are chosen by name or by compression extension."""
+        # Act
+        byName = FileFormatFactory.getFormat('ToDo/hints.csv', 'parquet.zst')
+        byExtension = FileFormatFactory.getFormat('ToDo/hints.csv.zst')
+        unknownInner = FileFormatFactory.getFormat('ToDo/hints.gz')
+
+        # Assert
+        self.assertIsInstance(byName, CompressedFormat)
+        self.assertEqual('parquet.zst', byName.NAME)
+        self.assertEqual('csv.zst', byExtension.NAME)
+        self.assertEqual('csv.gz', unknownInner.NAME)
+        self.assertIsInstance(FileFormatFactory.getFormat(name='csv.gz'), GzipCsvFormat)
+        self.assertIsInstance(FileFormatFactory.getFormat('ToDo/hints.arrow.gz').fileFormat, ArrowFormat)
+
+    def test_applyContentEncoding(self):
+        """Tests if a Content-Encoding wraps the format in its codec unless the format is already compressed with it."""
+        # Act
+        zstdCsv = FileFormatFactory.applyContentEncoding(CsvFormat(), 'ZSTD')
+        gzipCsv = FileFormatFactory.applyContentEncoding(GzipCsvFormat(), 'gzip')
+        identity = FileFormatFactory.applyContentEncoding(ParquetFormat(), 'identity')
+        none = FileFormatFactory.applyContentEncoding(ParquetFormat(), None)
+
+        # Assert
+        self.assertIsInstance(zstdCsv, CompressedFormat)
+        self.assertIsInstance(zstdCsv.codec, ZstdCodec)
+        self.assertIs(type(gzipCsv), GzipCsvFormat)
+        self.assertIs(type(identity), ParquetFormat)
+        self.assertIs(type(none), ParquetFormat)
+
+    def test_getFormat_unknownName(self):
+        """Tests if getFormat raises a ValueError for an unknown format name."""
+        # Act / Assert
+        with self.assertRaises(ValueError):
+            FileFormatFactory.getFormat(name='xlsx')
+        with self.assertRaises(ValueError):
+            FileFormatFactory.getFormat(name='xlsx.zst')
+
+    def test_rename(self):
+        """Tests if rename swaps recognized extensions and appends otherwise."""
+        # Act / Assert
+        self.assertEqual('hints.parquet', FileFormatFactory.rename('hints.csv', ParquetFormat()))
+        self.assertEqual('hints.csv', FileFormatFactory.rename('hints.csv.gz', CsvFormat()))
+        self.assertEqual('hints.pq', FileFormatFactory.rename('hints.pq', ParquetFormat()))
+        self.assertEqual('hints.arrow', FileFormatFactory.rename('hints', ArrowFormat()))
+        self.assertEqual('hints.parquet.gz', FileFormatFactory.rename('hints.csv.zst', CompressedFormat(ParquetFormat(), GzipCodec())))
+        self.assertEqual('hints.csv.zst', FileFormatFactory.rename('hints.csv', CompressedFormat(CsvFormat(), ZstdCodec())))
@@ -0,0 +1,39 @@
+import gzip
+import unittest
+from io import BytesIO
+
+import pandas as pd
+
+from awsEcs.models.formats.GzipCsvFormat import GzipCsvFormat
+
+class TestGzipCsvFormatUnit(unittest.TestCase):
+    """Unit tests for GzipCsvFormat."""
+
+    TEST_FILE = 'tests/common/testData/CompletedHints.csv'
+
+    def setUp(self):
+        """Sets up the test case."""
+        self.gzipCsvFormat = GzipCsvFormat()
+        self.df = pd.read_csv(self.TEST_FILE)
+
+    def test_iterWrite(self):
+        """Tests if the chunks iterWrite yields form a single gzip stream of the whole CSV."""
+        # Arrange
+        chunks = [self.df[:2], self.df[2:]]
+
+        # Act
+        outData = b''.join(self.gzipCsvFormat.iterWrite(chunks))
+
+        # Assert
+        self.assertEqual(self.df.to_csv(index=False).encode('utf8'), gzip.decompress(outData))
+
+    def test_iterRead(self):
+        """Tests if a written file can be read back in chunks."""
+        # Arrange
+        data = BytesIO(self.gzipCsvFormat.write(self.df))
+
+        # Act
+        chunks = list(self.gzipCsvFormat.iterRead(data, 2))
+
+        # Assert
+        pd.testing.assert_frame_equal(self.df, pd.concat(chunks, ignore_index=True))
@@ -0,0 +1,62 @@
+import unittest
+from io import BytesIO
+
+import pandas as pd
+
+from awsEcs.models.formats.ParquetFormat import ParquetFormat
+
+class TestParquetFormatUnit(unittest.TestCase):
+    """Unit tests for ParquetFormat."""
+
+    TEST_FILE = 'tests/common/testData/CompletedHints.csv'
+
+    def setUp(self):
+        """Sets up the test case."""
+        self.fileFormat = ParquetFormat()
+        self.df = pd.read_csv(self.TEST_FILE)
+
+    def test_write_read(self):
+        """Tests if a written file reads back the same, with and without column projection."""
+        # Arrange
+        data = self.fileFormat.write(self.df)
+
+        # Act
+        df = self.fileFormat.read(BytesIO(data))
+        projected = self.fileFormat.read(BytesIO(data), ['ark', 'score'])
+
+        # Assert
+        pd.testing.assert_frame_equal(self.df, df)
+        pd.testing.assert_frame_equal(self.df[['ark', 'score']], projected)
+
+    def test_iterWrite_iterRead(self):
+        """Tests if a file written in chunks can be read back in chunks of the given size."""
+        # Arrange
+        data = b''.join(self.fileFormat.iterWrite([self.df[:2], self.df[2:]]))
+
+        # Act
+        chunks = list(self.fileFormat.iterRead(BytesIO(data), 2, ['ark', 'score']))
+
+        # Assert
+        self.assertTrue(all(len(chunk) <= 2 for chunk in chunks))
+        pd.testing.assert_frame_equal(self.df[['ark', 'score']], pd.concat(chunks, ignore_index=True))
+
+    def test_iterWrite_noChunks(self):
+        """Tests if writing no chunks still gives a valid Parquet file, with no rows."""
+        # Act
+        data = b''.join(self.fileFormat.iterWrite([]))
+
+        # Assert
+        self.assertTrue(self.fileFormat.read(BytesIO(data)).empty)
+
+    def test_iterWrite_wideningCategories(self):
+        """Tests if a later chunk can have more categories than fit in the first chunk's category codes."""
+        # Arrange
+        first = pd.DataFrame({'county': pd.Categorical(['Utah', 'Salt Lake'])})
+        second = pd.DataFrame({'county': pd.Categorical([f'County {i}' for i in range(300)])})
+
+        # Act
+        data = b''.join(self.fileFormat.iterWrite([first, second]))
+
+        # Assert
+        df = self.fileFormat.read(BytesIO(data))
+        self.assertEqual(['Utah', 'Salt Lake'] + [f'County {i}' for i in range(300)], df['county'].astype(str).tolist())
@@ -1,7 +1,11 @@
 import unittest
-from unittest.mock import Mock, patch
+from io import BytesIO
+from unittest.mock import Mock, call, patch
+
+from botocore.exceptions import ClientError
 
 from awsEcs.models.services.EcsS3Dao import EcsS3Dao
+from awsEcs.models.services.S3RangeReader import S3RangeReader
 
 class TestEcsS3DaoUnit(unittest.TestCase):
     """Unit tests for EcsS3Dao."""
@@ -16,7 +20,7 @@ class TestEcsS3DaoUnit(unittest.TestCase):
 
         self.mockClient = Mock()
         config = {
-            'getSession.return_value.client.return_value': self.mockClient
+            'getClient.return_value': self.mockClient
         }
         mockAwsSessionInstance.configure_mock(**config)
 
@@ -44,6 +48,77 @@ class TestEcsS3DaoUnit(unittest.TestCase):
         # Assert
         self.assertEqual(actual, expected)
 
+    def test_readFileParallel(self):
+        """Tests if readFileParallel returns a reader of the file that checks its ETag."""
+        # Arrange
+        self.mockClient.head_object.return_value = {'ContentLength': 0, 'ETag': '"etag"'}
+
+        # Act
+        reader = self.ecsS3Dao.readFileParallel('test-bucket', 'test-key')
+
+        # Assert
+        self.assertIsInstance(reader, S3RangeReader)
+        self.assertEqual((reader.size, reader.etag, reader.partSize), (0, '"etag"', EcsS3Dao.DEFAULT_DOWNLOAD_PART_SIZE))
+        reader.close()
+
+    def test_readFileRange(self):
+        """Tests if readFileRange calls get_object with an inclusive byte range."""
+        # Arrange
+        bucket = 'test-bucket'
+        key = 'test-key'
+
+        # Act
+        self.ecsS3Dao.readFileRange(bucket, key, 5, 8)
+
+        # Assert
+        self.mockClient.get_object.assert_called_once_with(Bucket=bucket, Key=key, Range='bytes=5-8')
+
+    def test_getFileSize(self):
+        """Tests if getFileSize returns the file's content length."""
+        # Arrange
+        self.mockClient.head_object.return_value = {'ContentLength': 42}
+
+        # Act
+        actual = self.ecsS3Dao.getFileSize('test-bucket', 'test-key')
+
+        # Assert
+        self.assertEqual(actual, 42)
+        self.mockClient.head_object.assert_called_once_with(Bucket='test-bucket', Key='test-key')
+
+    def test_getContentEncoding(self):
+        """Tests if getContentEncoding returns the file's Content-Encoding, or None if it has none."""
+        # Arrange
+        self.mockClient.head_object.side_effect = [{'ContentLength': 42, 'ContentEncoding': 'zstd'}, {'ContentLength': 42}]
+
+        # Act
+        encoded = self.ecsS3Dao.getContentEncoding('test-bucket', 'test-key')
+        plain = self.ecsS3Dao.getContentEncoding('test-bucket', 'test-key')
+
+        # Assert
+        self.assertEqual('zstd', encoded)
+        self.assertIsNone(plain)
+        self.mockClient.head_object.assert_called_with(Bucket='test-bucket', Key='test-key')
+
+    def test_getETag(self):
+        """Tests if getETag returns the file's ETag."""
+        # Arrange
+        self.mockClient.head_object.return_value = {'ContentLength': 42, 'ETag': '"test-etag"'}
+
+        # Act
+        actual = self.ecsS3Dao.getETag('test-bucket', 'test-key')
+
+        # Assert
+        self.assertEqual('"test-etag"', actual)
+        self.mockClient.head_object.assert_called_once_with(Bucket='test-bucket', Key='test-key')
+
+    def test_deleteFile(self):
+        """Tests if deleteFile calls delete_object with the correct parameters."""
+        # Act
+        self.ecsS3Dao.deleteFile('test-bucket', 'test-key')
+
+        # Assert
+        self.mockClient.delete_object.assert_called_once_with(Bucket='test-bucket', Key='test-key')
+
     def test_writeFile(self):
         """Tests if writeFile calls put_object with the correct parameters."""
         # Arrange
@@ -58,4 +133,190 @@ class TestEcsS3DaoUnit(unittest.TestCase):
         # Assert
         self.mockClient.put_object.assert_called_once_with(Bucket=bucket, Key=key, Body=data)
 
+    def _setUpMultipart(self):
+        """Helper function to allow tiny parts and fake multipart upload responses."""
+        self.ecsS3Dao.MIN_PART_SIZE = 1
+        self.mockClient.create_multipart_upload.return_value = {'UploadId': 'test-upload-id'}
+        self.mockClient.upload_part.side_effect = lambda **kwargs: {'ETag': f'etag-{kwargs["PartNumber"]}'}
+
+    def test_writeFileMultipart(self):
+        """Tests if writeFileMultipart regroups an iterator into parts and completes the upload in order."""
+        # Arrange
+        self._setUpMultipart()
+        bucket = 'test-bucket'
+        key = 'test-key'
+        data = iter([b'ab', b'cdefg', b'h'])
+
+        # Act
+        self.ecsS3Dao.writeFileMultipart(bucket, key, data, partSize=3, maxConcurrency=2)
+
+        # Assert
+        self.mockClient.put_object.assert_not_called()
+        self.mockClient.create_multipart_upload.assert_called_once_with(Bucket=bucket, Key=key)
+        uploaded = sorted((c.kwargs['PartNumber'], c.kwargs['Body']) for c in self.mockClient.upload_part.call_args_list)
+        self.assertEqual(uploaded, [(1, b'abc'), (2, b'def'), (3, b'gh')])
+        self.mockClient.complete_multipart_upload.assert_called_once_with(
+            Bucket=bucket,
+            Key=key,
+            UploadId='test-upload-id',
+            MultipartUpload={'Parts': [
+                {'PartNumber': 1, 'ETag': 'etag-1'},
+                {'PartNumber': 2, 'ETag': 'etag-2'},
+                {'PartNumber': 3, 'ETag': 'etag-3'}
+            ]}
+        )
+        self.mockClient.abort_multipart_upload.assert_not_called()
+
+    def test_writeFileMultipart_FileObject(self):
+        """Tests if writeFileMultipart reads parts from a binary file."""
+        # Arrange
+        self._setUpMultipart()
+
+        # Act
+        self.ecsS3Dao.writeFileMultipart('test-bucket', 'test-key', BytesIO(b'abcdefgh'), partSize=4)
+
+        # Assert
+        uploaded = sorted((c.kwargs['PartNumber'], c.kwargs['Body']) for c in self.mockClient.upload_part.call_args_list)
+        self.assertEqual(uploaded, [(1, b'abcd'), (2, b'efgh')])
+        self.mockClient.complete_multipart_upload.assert_called_once()
+
+    def test_writeFileMultipart_Bytes(self):
+        """Tests if writeFileMultipart slices bytes and bytearrays into parts of bytes botocore accepts."""
+        for data in [b'abcdefghij', bytearray(b'abcdefghij')]:
+            with self.subTest(data=type(data)):
+                # Arrange
+                self.mockClient.reset_mock()
+                self._setUpMultipart()
+
+                # Act
+                self.ecsS3Dao.writeFileMultipart('test-bucket', 'test-key', data, partSize=4)
+
+                # Assert
+                uploaded = sorted((c.kwargs['PartNumber'], c.kwargs['Body']) for c in self.mockClient.upload_part.call_args_list)
+                self.assertEqual(uploaded, [(1, b'abcd'), (2, b'efgh'), (3, b'ij')])
+                self.assertTrue(all(type(body) is bytes for _, body in uploaded))
+
+    def test_writeFileMultipart_SinglePart(self):
+        """Tests if writeFileMultipart falls back to put_object when the data fits in one part."""
+        # Arrange
+        self._setUpMultipart()
+
+        # Act
+        self.ecsS3Dao.writeFileMultipart('test-bucket', 'test-key', BytesIO(b'abc'), partSize=4)
+
+        # Assert
+        self.mockClient.put_object.assert_called_once_with(Bucket='test-bucket', Key='test-key', Body=b'abc')
+        self.mockClient.create_multipart_upload.assert_not_called()
+
+    def test_writeFileMultipart_ExtraArgs(self):
+        """Tests if writeFileMultipart passes extra arguments to both kinds of upload."""
+        # Arrange
+        self._setUpMultipart()
+        extraArgs = {'ContentType': 'text/csv', 'ContentEncoding': 'zstd'}
+
+        # Act
+        self.ecsS3Dao.writeFileMultipart('test-bucket', 'small-key', b'abc', partSize=4, extraArgs=extraArgs)
+        self.ecsS3Dao.writeFileMultipart('test-bucket', 'large-key', b'abcdefg', partSize=4, extraArgs=extraArgs)
+
+        # Assert
+        self.mockClient.put_object.assert_called_once_with(Bucket='test-bucket', Key='small-key', Body=b'abc', **extraArgs)
+        self.mockClient.create_multipart_upload.assert_called_once_with(Bucket='test-bucket', Key='large-key', **extraArgs)
+
+    def test_writeFileMultipart_EmptyData(self):
+        """Tests if writeFileMultipart writes an empty file when there is no data."""
+        # Arrange
+        self._setUpMultipart()
+
+        # Act
+        self.ecsS3Dao.writeFileMultipart('test-bucket', 'test-key', iter([]), partSize=4)
+
+        # Assert
+        self.mockClient.put_object.assert_called_once_with(Bucket='test-bucket', Key='test-key', Body=b'')
+        self.mockClient.create_multipart_upload.assert_not_called()
+
+    def test_writeFileMultipart_PartFails(self):
+        """Tests if writeFileMultipart aborts the upload and re-raises when a part fails."""
+        # Arrange
+        self._setUpMultipart()
+        self.mockClient.upload_part.side_effect = RuntimeError('upload failed')
+
+        # Act & Assert
+        with self.assertRaises(RuntimeError):
+            self.ecsS3Dao.writeFileMultipart('test-bucket', 'test-key', BytesIO(b'abcdefgh'), partSize=4)
+
+        self.mockClient.abort_multipart_upload.assert_called_once_with(
+            Bucket='test-bucket', Key='test-key', UploadId='test-upload-id'
+        )
+        self.mockClient.complete_multipart_upload.assert_not_called()
+
+    def test_writeFileMultipart_PartSizeTooSmall(self):
+        """Tests if writeFileMultipart rejects parts smaller than S3 allows."""
+        with self.assertRaises(ValueError):
+            self.ecsS3Dao.writeFileMultipart('test-bucket', 'test-key', BytesIO(b'abc'), partSize=1024)
+
+        self.mockClient.create_multipart_upload.assert_not_called()
+
+    def test_createMultipartUpload(self):
+        """Tests if createMultipartUpload passes extra arguments and returns the upload's ID."""
+        # Arrange
+        self.mockClient.create_multipart_upload.return_value = {'UploadId': 'test-upload-id'}
+
+        # Act
+        uploadId = self.ecsS3Dao.createMultipartUpload('test-bucket', 'test-key', {'ContentType': 'text/csv'})
+
+        # Assert
+        self.assertEqual('test-upload-id', uploadId)
+        self.mockClient.create_multipart_upload.assert_called_once_with(Bucket='test-bucket', Key='test-key', ContentType='text/csv')
+
+    def test_uploadPart(self):
+        """Tests if uploadPart returns the part's number and ETag."""
+        # Arrange
+        self._setUpMultipart()
+
+        # Act
+        part = self.ecsS3Dao.uploadPart('test-bucket', 'test-key', 'test-upload-id', 3, b'abc')
+
+        # Assert
+        self.assertEqual({'PartNumber': 3, 'ETag': 'etag-3'}, part)
+        self.mockClient.upload_part.assert_called_once_with(
+            Bucket='test-bucket', Key='test-key', UploadId='test-upload-id', PartNumber=3, Body=b'abc'
+        )
+
+    def test_completeMultipartUpload(self):
+        """Tests if completeMultipartUpload passes the parts in order."""
+        # Arrange
+        parts = [{'PartNumber': 1, 'ETag': 'etag-1'}, {'PartNumber': 2, 'ETag': 'etag-2'}]
+
+        # Act
+        self.ecsS3Dao.completeMultipartUpload('test-bucket', 'test-key', 'test-upload-id', parts)
+
+        # Assert
+        self.mockClient.complete_multipart_upload.assert_called_once_with(
+            Bucket='test-bucket', Key='test-key', UploadId='test-upload-id', MultipartUpload={'Parts': parts}
+        )
+
+    def test_hasMultipartUpload(self):
+        """Tests if hasMultipartUpload is True for an upload in progress and False for one that no longer exists."""
+        # Arrange
+        noSuchUpload = ClientError({'Error': {'Code': 'NoSuchUpload'}}, 'ListParts')
+        self.mockClient.list_parts.side_effect = [{'Parts': []}, noSuchUpload]
+
+        # Act
+        inProgress = self.ecsS3Dao.hasMultipartUpload('test-bucket', 'test-key', 'test-upload-id')
+        gone = self.ecsS3Dao.hasMultipartUpload('test-bucket', 'test-key', 'test-upload-id')
+
+        # Assert
+        self.assertTrue(inProgress)
+        self.assertFalse(gone)
+        self.mockClient.list_parts.assert_called_with(Bucket='test-bucket', Key='test-key', UploadId='test-upload-id', MaxParts=1)
+
+    def test_hasMultipartUpload_OtherError(self):
+        """Tests if hasMultipartUpload re-raises errors other than the upload not existing."""
+        # Arrange
+        self.mockClient.list_parts.side_effect = ClientError({'Error': {'Code': 'AccessDenied'}}, 'ListParts')
+
+        # Act & Assert
+        with self.assertRaises(ClientError):
+            self.ecsS3Dao.hasMultipartUpload('test-bucket', 'test-key', 'test-upload-id')
+
 # writeFile has no failure states that aren't also AWS failure states
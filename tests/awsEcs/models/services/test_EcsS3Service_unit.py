@@ -1,8 +1,8 @@
 import unittest
-from contextlib import redirect_stdout
-from io import BytesIO, StringIO
-from unittest.mock import Mock, call, patch
+from io import BytesIO
+from unittest.mock import Mock, patch
 
+from botocore.exceptions import ClientError
 from botocore.response import StreamingBody
 
 from awsEcs.models.services.EcsS3Dao import EcsS3Dao
@@ -27,112 +27,225 @@ class TestEcsS3ServiceUnit(unittest.TestCase):
         EnvVar.delete()
 
     def test_readFile(self):
-        """Tests if readFile returns the correct file contents."""
+        """Tests if readFile returns the file's bytes from a parallel download, without decoding them."""
         # Arrange
         key = 'test-key'
-        expected = 'test-data\ntest-data\n'
+        expected = 'test-data\r\ntest-data\n'.encode('utf-8')
 
-        dataToEncode = bytes(expected, 'utf-8')
-        self.mockEcsS3DaoInstance.readFile.return_value = {
-            'Body': StreamingBody(BytesIO(dataToEncode), len(dataToEncode))
-        }
+        self.mockEcsS3DaoInstance.readFileParallel.return_value = BytesIO(expected)
 
         # Act
         actual = self.ecsS3Service.readFile(key)
 
         # Assert
-        self.assertEqual(actual.getvalue(), expected)
+        self.assertEqual(actual.read(), expected)
+        self.mockEcsS3DaoInstance.readFileParallel.assert_called_once_with(
+            self.ecsS3Service.dataBucketName, key,
+            self.ecsS3Service.downloadPartSize, self.ecsS3Service.downloadConcurrency, None
+        )
 
-    def test_readFile_Utf16(self):
-        """Tests if readFile fails loudly when passed a file encoded as something other than UTF-8."""
+    def test_readFile_EmptyBody(self):
+        """Tests if readFile returns correctly if pointed at an empty file."""
         # Arrange
         key = 'test-key'
+        self.mockEcsS3DaoInstance.readFileParallel.return_value = BytesIO(b'')
 
-        dataToEncode = bytes('test-data\ntest-data\n', 'utf-16')
-        self.mockEcsS3DaoInstance.readFile.return_value = {
-            'Body': StreamingBody(BytesIO(dataToEncode), len(dataToEncode))
-        }
+        # Act
+        actual = self.ecsS3Service.readFile(key)
 
-        # Act & Assert
-        with self.assertRaises(UnicodeDecodeError):
-            actual = self.ecsS3Service.readFile(key)
+        # Assert
+        self.assertEqual(actual.read(), b'')
 
-    def test_readFile_EmptyBody(self):
-        """Tests if readFile returns correctly if pointed at an empty file."""
+    def test_readFileStream(self):
+        """Tests if readFileStream returns the unread body of the file."""
         # Arrange
         key = 'test-key'
-        expected = ''
+        dataToEncode = bytes('test-data\ntest-data\n', 'utf-8')
+        body = StreamingBody(BytesIO(dataToEncode), len(dataToEncode))
+        self.mockEcsS3DaoInstance.readFile.return_value = {'Body': body}
+
+        # Act
+        actual = self.ecsS3Service.readFileStream(key)
+
+        # Assert
+        self.mockEcsS3DaoInstance.readFile.assert_called_once_with(self.ecsS3Service.dataBucketName, key)
+        self.assertIs(actual, body)
+        self.assertEqual(actual.read(), dataToEncode)
 
-        dataToEncode = bytes(expected, 'utf-8')
-        self.mockEcsS3DaoInstance.readFile.return_value  = {
+    def test_readFileRange(self):
+        """Tests if readFileRange returns the bytes of the requested range."""
+        # Arrange
+        key = 'test-key'
+        dataToEncode = b'data'
+        self.mockEcsS3DaoInstance.readFileRange.return_value = {
             'Body': StreamingBody(BytesIO(dataToEncode), len(dataToEncode))
         }
 
         # Act
-        actual = self.ecsS3Service.readFile(key)
+        actual = self.ecsS3Service.readFileRange(key, 5, 8)
+
+        # Assert
+        self.mockEcsS3DaoInstance.readFileRange.assert_called_once_with(self.ecsS3Service.dataBucketName, key, 5, 8)
+        self.assertEqual(actual, dataToEncode)
+
+    def test_writeOutput(self):
+        """Tests if writeOutput uploads only to the data bucket."""
+        # Arrange
+        data = b'test-data\n'
+
+        # Act
+        self.ecsS3Service.writeOutput(data, 'test-file')
+
+        # Assert
+        self.mockEcsS3DaoInstance.writeFileMultipart.assert_called_once_with(
+            self.ecsS3Service.dataBucketName, 'Output/test-file', data,
+            self.ecsS3Service.uploadPartSize, self.ecsS3Service.uploadConcurrency, None
+        )
+        self.mockEcsS3DaoInstance.writeFile.assert_not_called()
+
+    def test_writeNextAppInput(self):
+        """Tests if writeNextAppInput uploads only to the next app's bucket."""
+        # Arrange
+        data = b'test-data\n'
+
+        # Act
+        self.ecsS3Service.writeNextAppInput(data, 'test-file')
+
+        # Assert
+        self.mockEcsS3DaoInstance.writeFileMultipart.assert_called_once_with(
+            self.ecsS3Service.nextAppDataBucketName, 'ToDo/test-file', data,
+            self.ecsS3Service.uploadPartSize, self.ecsS3Service.uploadConcurrency, None
+        )
+        self.mockEcsS3DaoInstance.writeFile.assert_not_called()
+
+    def test_writeOutput_ExtraArgs(self):
+        """Tests if writeOutput passes extra arguments, e.g. Content-Encoding, to the upload."""
+        # Arrange
+        data = b'test-data\n'
+        extraArgs = {'ContentType': 'text/csv', 'ContentEncoding': 'zstd'}
+
+        # Act
+        self.ecsS3Service.writeOutput(data, 'test-file.csv.zst', extraArgs)
 
         # Assert
-        self.assertEqual(actual.getvalue(), expected)
+        self.mockEcsS3DaoInstance.writeFileMultipart.assert_called_once_with(
+            self.ecsS3Service.dataBucketName, 'Output/test-file.csv.zst', data,
+            self.ecsS3Service.uploadPartSize, self.ecsS3Service.uploadConcurrency, extraArgs
+        )
 
-    def test_writeOutputFile(self):
-        """Tests if writeOutputFile calls writeFile with the correct parameters."""
+    def test_getContentEncoding(self):
+        """Tests if getContentEncoding looks up the file in the data bucket."""
         # Arrange
-        data = Mock()
-        outData = data.read().encode('utf8')
-        fileName = 'test-file'
-        outputKey = 'Output/test-file'
-        nextProcessKey = 'ToDo/test-file'
+        self.mockEcsS3DaoInstance.getContentEncoding.return_value = 'gzip'
 
         # Act
-        with redirect_stdout(None):
-            self.ecsS3Service.writeOutputFile(data, fileName)
+        actual = self.ecsS3Service.getContentEncoding('ToDo/test-file')
 
         # Assert
-        self.mockEcsS3DaoInstance.writeFile.assert_has_calls(
-            [
-                call(self.ecsS3Service.dataBucketName, outputKey, outData),
-                call(self.ecsS3Service.nextAppDataBucketName, nextProcessKey, outData)
-            ]
+        self.assertEqual('gzip', actual)
+        self.mockEcsS3DaoInstance.getContentEncoding.assert_called_once_with(self.ecsS3Service.dataBucketName, 'ToDo/test-file')
+
+    def test_writeNextAppManifest(self):
+        """Tests if writeNextAppManifest writes JSON to the next app's bucket."""
+        # Arrange
+        data = b'{}'
+
+        # Act
+        self.ecsS3Service.writeNextAppManifest(data, 'ToDo/test-file.manifest.json')
+
+        # Assert
+        self.mockEcsS3DaoInstance.writeFile.assert_called_once_with(
+            self.ecsS3Service.nextAppDataBucketName, 'ToDo/test-file.manifest.json', data, {'ContentType': 'application/json'}
         )
 
-    def test_writeOutputFile_EmptyData(self):
-        """Tests if writeOutputFile runs without error if empty data is passed in."""
+    def test_readCheckpoint(self):
+        """Tests if readCheckpoint reads the input file's checkpoint from the data bucket."""
+        # Arrange
+        self.mockEcsS3DaoInstance.readFile.return_value = {'Body': BytesIO(b'{}')}
+
+        # Act
+        actual = self.ecsS3Service.readCheckpoint('ToDo/test-file.csv')
+
+        # Assert
+        self.assertEqual(b'{}', actual)
+        self.mockEcsS3DaoInstance.readFile.assert_called_once_with(self.ecsS3Service.dataBucketName, 'Checkpoints/ToDo/test-file.csv.json')
+
+    def test_readCheckpoint_None(self):
+        """Tests if readCheckpoint returns None when the input file has no checkpoint."""
         # Arrange
-        data = StringIO()
-        outData = data.read().encode('utf8')
-        fileName = 'test-file'
-        outputKey = 'Output/test-file'
-        nextProcessKey = 'ToDo/test-file'
+        self.mockEcsS3DaoInstance.readFile.side_effect = ClientError({'Error': {'Code': 'NoSuchKey'}}, 'GetObject')
 
         # Act
-        with redirect_stdout(None):
-            self.ecsS3Service.writeOutputFile(data, fileName)
+        actual = self.ecsS3Service.readCheckpoint('ToDo/test-file.csv')
 
         # Assert
-        self.mockEcsS3DaoInstance.writeFile.assert_has_calls(
-            [
-                call(self.ecsS3Service.dataBucketName, outputKey, outData),
-                call(self.ecsS3Service.nextAppDataBucketName, nextProcessKey, outData)
-            ]
+        self.assertIsNone(actual)
+
+    def test_readCheckpoint_OtherError(self):
+        """Tests if readCheckpoint re-raises errors other than the checkpoint not existing."""
+        # Arrange
+        self.mockEcsS3DaoInstance.readFile.side_effect = ClientError({'Error': {'Code': 'AccessDenied'}}, 'GetObject')
+
+        # Act & Assert
+        with self.assertRaises(ClientError):
+            self.ecsS3Service.readCheckpoint('ToDo/test-file.csv')
+
+    def test_writeCheckpoint(self):
+        """Tests if writeCheckpoint writes JSON next to the other checkpoints in the data bucket."""
+        # Act
+        self.ecsS3Service.writeCheckpoint('ToDo/test-file.csv', b'{}')
+
+        # Assert
+        self.mockEcsS3DaoInstance.writeFile.assert_called_once_with(
+            self.ecsS3Service.dataBucketName, 'Checkpoints/ToDo/test-file.csv.json', b'{}', {'ContentType': 'application/json'}
         )
 
-    def test_writeOutputFile_EmptyFileName(self):
-        """Tests if writeOutputFile runs without error if empty file name is passed in."""
+    def test_outputUpload(self):
+        """Tests if the output upload methods all act on the output file in the data bucket."""
         # Arrange
-        data = Mock()
-        outData = data.read().encode('utf8')
-        fileName = ''
-        outputKey = 'Output/'
-        nextProcessKey = 'ToDo/'
+        bucket = self.ecsS3Service.dataBucketName
+        self.mockEcsS3DaoInstance.createMultipartUpload.return_value = 'test-upload-id'
+        parts = [{'PartNumber': 1, 'ETag': 'etag-1'}]
+
+        # Act
+        uploadId = self.ecsS3Service.createOutputUpload('test-file', {'ContentType': 'text/csv'})
+        self.ecsS3Service.uploadOutputPart('test-file', uploadId, 1, b'abc')
+        self.ecsS3Service.hasOutputUpload('test-file', uploadId)
+        self.ecsS3Service.completeOutputUpload('test-file', uploadId, parts)
+        self.ecsS3Service.abortOutputUpload('test-file', uploadId)
 
+        # Assert
+        self.assertEqual('test-upload-id', uploadId)
+        self.mockEcsS3DaoInstance.createMultipartUpload.assert_called_once_with(bucket, 'Output/test-file', {'ContentType': 'text/csv'})
+        self.mockEcsS3DaoInstance.uploadPart.assert_called_once_with(bucket, 'Output/test-file', uploadId, 1, b'abc')
+        self.mockEcsS3DaoInstance.hasMultipartUpload.assert_called_once_with(bucket, 'Output/test-file', uploadId)
+        self.mockEcsS3DaoInstance.completeMultipartUpload.assert_called_once_with(bucket, 'Output/test-file', uploadId, parts)
+        self.mockEcsS3DaoInstance.abortMultipartUpload.assert_called_once_with(bucket, 'Output/test-file', uploadId)
+
+    def test_copyOutputToNextApp(self):
+        """Tests if copyOutputToNextApp copies the output file to the next app's bucket."""
         # Act
-        with redirect_stdout(None):
-            self.ecsS3Service.writeOutputFile(data, fileName)
+        self.ecsS3Service.copyOutputToNextApp('test-file')
 
         # Assert
-        self.mockEcsS3DaoInstance.writeFile.assert_has_calls(
-            [
-                call(self.ecsS3Service.dataBucketName, outputKey, outData),
-                call(self.ecsS3Service.nextAppDataBucketName, nextProcessKey, outData)
-            ]
+        self.mockEcsS3DaoInstance.copyFile.assert_called_once_with(
+            self.ecsS3Service.dataBucketName, 'Output/test-file',
+            self.ecsS3Service.nextAppDataBucketName, 'ToDo/test-file'
         )
+
+    @patch.dict('os.environ', {'UPLOAD_PART_SIZE_MB': '16', 'UPLOAD_CONCURRENCY': '8'})
+    def test_constructor_uploadSettings(self):
+        """Tests if the multipart upload settings are read from the environment."""
+        ecsS3Service = EcsS3Service()
+
+        self.assertEqual(ecsS3Service.uploadPartSize, 16 * 1024 * 1024)
+        self.assertEqual(ecsS3Service.uploadConcurrency, 8)
+
+    @patch.dict('os.environ', {'DOWNLOAD_PART_SIZE_MB': '16', 'DOWNLOAD_CONCURRENCY': '12', 'SPOOL_THRESHOLD_MB': '64'})
+    def test_constructor_downloadSettings(self):
+        """Tests if the parallel download settings are read from the environment."""
+        ecsS3Service = EcsS3Service()
+
+        self.assertEqual(ecsS3Service.downloadPartSize, 16 * 1024 * 1024)
+        self.assertEqual(ecsS3Service.downloadConcurrency, 12)
+        self.assertEqual(ecsS3Service.spoolThreshold, 64 * 1024 * 1024)
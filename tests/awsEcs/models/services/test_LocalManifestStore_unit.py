@@ -0,0 +1,43 @@
+import os
+import tempfile
+import unittest
+
+from awsEcs.models.OutputManifest import OutputManifest
+from awsEcs.models.formats.CsvFormat import CsvFormat
+from awsEcs.models.services.LocalManifestStore import LocalManifestStore
+
+class TestLocalManifestStoreUnit(unittest.TestCase):
+    """Unit tests for LocalManifestStore."""
+
+    def setUp(self):
+        """Sets up the test case."""
+        tempDir = tempfile.TemporaryDirectory()
+        self.addCleanup(tempDir.cleanup)
+        self.directory = tempDir.name
+        self.manifestStore = LocalManifestStore(self.directory)
+
+    def test_write(self):
+        """Tests if a manifest is written next to its output file, and only complete manifests are left."""
+        # Arrange
+        manifest = OutputManifest('ToDo/hints.csv', 'InProgress/hints.csv', CsvFormat())
+
+        # Act
+        self.manifestStore.write(manifest)
+
+        # Assert
+        self.assertEqual(os.listdir(os.path.join(self.directory, 'ToDo')), ['hints.csv.manifest.json'])
+
+    def test_list(self):
+        """Tests if list finds the manifests under a prefix, ordered by key, ignoring other files."""
+        # Arrange
+        for name in ['b.csv', 'a.csv']:
+            self.manifestStore.write(OutputManifest(f'ToDo/{name}', f'InProgress/{name}', CsvFormat()))
+        self.manifestStore.write(OutputManifest('Other/c.csv', 'InProgress/c.csv', CsvFormat()))
+        with open(os.path.join(self.directory, 'ToDo', 'a.csv'), 'w') as file:
+            file.write('ark\n')
+
+        # Act
+        manifests = self.manifestStore.list()
+
+        # Assert
+        self.assertEqual([manifest['key'] for manifest in manifests], ['ToDo/a.csv', 'ToDo/b.csv'])
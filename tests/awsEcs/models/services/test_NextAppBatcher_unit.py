@@ -0,0 +1,141 @@
+import json
+import threading
+import time
+from contextlib import redirect_stdout
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import TestCase
+from unittest.mock import patch
+
+import requests
+
+from awsEcs.models.services.NextAppBatcher import NextAppBatcher
+from awsEcs.models.services.NextAppFacade import NextAppFacade
+
+class StandInNextApp(BaseHTTPRequestHandler):
+    """Stand-in for the next app's API that records the bodies posted to it.
+
+    Attributes:
+        bodies (list[dict]): JSON bodies received, in order
+        acceptBatches (bool): whether bodies with 'inputFiles' are accepted; rejected with 400 otherwise
+    """
+
+    bodies: list[dict] = []
+    acceptBatches = True
+
+    def do_POST(self) -> None:
+        """Records the body and responds like the next app would."""
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        self.bodies.append(body)
+        status = 400 if 'inputFiles' in body and not self.acceptBatches else 200
+        self.send_response(status)
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'{}')
+
+    def log_message(self, format: str, *args) -> None:
+        """Keeps the test output quiet."""
+
+class TestNextAppBatcherUnit(TestCase):
+    """Unit tests for NextAppBatcher, against a stand-in for the next app's API."""
+
+    def setUp(self):
+        """Sets up the test case."""
+        StandInNextApp.bodies = []
+        StandInNextApp.acceptBatches = True
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), StandInNextApp)
+        threading.Thread(target=self.server.serve_forever, kwargs={'poll_interval': 0.01}, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        self.nextAppFacade = NextAppFacade('stg')
+        self.nextAppFacade.NEXT_GS_RUN_ENDPOINT = f'http://127.0.0.1:{self.server.server_port}/run'
+        self.addCleanup(NextAppFacade._batchUnsupported.discard, self.nextAppFacade.NEXT_GS_RUN_ENDPOINT)
+
+    def test_add_maxKeys(self):
+        """Tests if files are sent in batches of maxKeys, with the rest sent by close."""
+        # Arrange
+        batcher = NextAppBatcher(self.nextAppFacade, maxKeys=2)
+
+        # Act
+        with redirect_stdout(None):
+            for i in range(5):
+                batcher.add(f'ToDo/{i}.csv')
+            batcher.close()
+
+        # Assert
+        self.assertEqual(StandInNextApp.bodies, [
+            {'inputFiles': ['ToDo/0.csv', 'ToDo/1.csv']},
+            {'inputFiles': ['ToDo/2.csv', 'ToDo/3.csv']},
+            {'inputFile': 'ToDo/4.csv'}
+        ])
+        self.assertEqual((batcher.sent, batcher.requests), (5, 3))
+
+    def test_add_maxBytes(self):
+        """Tests if a batch is sent before another key would take it past maxBytes."""
+        # Arrange
+        batcher = NextAppBatcher(self.nextAppFacade, maxKeys=100, maxBytes=30)
+
+        # Act
+        with redirect_stdout(None):
+            for i in range(3):
+                batcher.add(f'ToDo/{i}.csv')
+            batcher.close()
+
+        # Assert
+        self.assertEqual(StandInNextApp.bodies, [
+            {'inputFiles': ['ToDo/0.csv', 'ToDo/1.csv']},
+            {'inputFile': 'ToDo/2.csv'}
+        ])
+
+    def test_add_maxDelay(self):
+        """Tests if waiting files are sent once maxDelay has passed."""
+        # Arrange
+        batcher = NextAppBatcher(self.nextAppFacade, maxKeys=100, maxDelay=0.05)
+
+        # Act
+        with redirect_stdout(None):
+            batcher.add('ToDo/0.csv')
+            batcher.add('ToDo/1.csv')
+            deadline = time.monotonic() + 5
+            while not StandInNextApp.bodies and time.monotonic() < deadline:
+                time.sleep(0.01)
+            batcher.close()
+
+        # Assert
+        self.assertEqual(StandInNextApp.bodies, [{'inputFiles': ['ToDo/0.csv', 'ToDo/1.csv']}])
+
+    def test_add_batchesUnsupported(self):
+        """Tests if files are sent one at a time once the next app rejects a batch."""
+        # Arrange
+        StandInNextApp.acceptBatches = False
+        batcher = NextAppBatcher(self.nextAppFacade, maxKeys=2)
+
+        # Act
+        with redirect_stdout(None):
+            for i in range(4):
+                batcher.add(f'ToDo/{i}.csv')
+            batcher.close()
+
+        # Assert
+        self.assertEqual(StandInNextApp.bodies, [
+            {'inputFiles': ['ToDo/0.csv', 'ToDo/1.csv']},
+            {'inputFile': 'ToDo/0.csv'},
+            {'inputFile': 'ToDo/1.csv'},
+            {'inputFile': 'ToDo/2.csv'},
+            {'inputFile': 'ToDo/3.csv'}
+        ])
+        self.assertEqual(batcher.sent, 4)
+
+    def test_close_error(self):
+        """Tests if a failed batch doesn't stop adding files, and is raised by close."""
+        # Arrange
+        batcher = NextAppBatcher(self.nextAppFacade, maxKeys=2)
+
+        # Act / Assert
+        with redirect_stdout(None):
+            with patch.object(self.nextAppFacade, 'runBatch', side_effect=[requests.HTTPError('boom'), None]):
+                for i in range(4):
+                    batcher.add(f'ToDo/{i}.csv')
+                with self.assertRaises(requests.HTTPError):
+                    batcher.close()
+        self.assertEqual((batcher.sent, batcher.requests), (2, 2))
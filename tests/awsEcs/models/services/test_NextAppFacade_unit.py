@@ -1,6 +1,9 @@
+import os
 from contextlib import redirect_stdout
 from unittest import TestCase
-from unittest.mock import patch
+from unittest.mock import Mock, patch
+
+import requests
 
 from awsEcs.models.services.NextAppFacade import NextAppFacade
 from common.Names import NEXT_APP_SUBDOMAIN
@@ -53,17 +56,107 @@ class TestNextAppFacadeUnit(TestCase):
         self.assertEqual(nextAppFacade.NEXT_GS_RUN_ENDPOINT, expectedEndpoint)
         self.assertEqual(nextAppFacade.ORIGIN, expectedOrigin)
         
-    @patch('awsEcs.models.services.NextAppFacade.requests')
-    def test_run(self, mockRequests):
+    def _mockSession(self, *responses) -> Mock:
+        """Helper function to make the shared session return the given responses (or raise the given errors) in order."""
+        mockSession = Mock()
+        mockSession.post.side_effect = [
+            response if isinstance(response, Exception) else Mock(status_code=response, text='', headers={})
+            for response in responses
+        ]
+        patcher = patch.object(NextAppFacade, '_getSession', return_value=mockSession)
+        self.addCleanup(patcher.stop)
+        patcher.start()
+        patcher = patch('awsEcs.models.services.NextAppFacade.time.sleep')
+        self.addCleanup(patcher.stop)
+        self.mockSleep = patcher.start()
+        return mockSession
+
+    def test_run(self):
         """Tests if NextAppFacade can be successfully run."""
+        mockSession = self._mockSession(200)
         nextAppFacade = NextAppFacade(self.TEST_ENV)
 
         with redirect_stdout(None):
-            nextAppFacade.run(self.testFileKey)
+            res = nextAppFacade.run(self.testFileKey)
 
-        mockRequests.post.assert_called_once()
-        mockRequests.post.assert_called_with(
+        self.assertEqual(res.status_code, 200)
+        mockSession.post.assert_called_once_with(
             f'https://api.{NEXT_APP_SUBDOMAIN}.{self.STG_DOMAIN}/run', 
             json={ 'inputFile': self.testFileKey },
-            headers={ 'origin': f'https://{NEXT_APP_SUBDOMAIN}.{self.STG_DOMAIN}' }
+            headers={ 'origin': f'https://{NEXT_APP_SUBDOMAIN}.{self.STG_DOMAIN}' },
+            timeout=(nextAppFacade.connectTimeout, nextAppFacade.readTimeout)
         )
+        self.mockSleep.assert_not_called()
+
+    def test_run_retry(self):
+        """Tests if NextAppFacade retries throttled, failed and unreachable requests."""
+        mockSession = self._mockSession(429, 503, requests.ConnectionError('reset'), 200)
+        nextAppFacade = NextAppFacade(self.TEST_ENV)
+
+        with redirect_stdout(None):
+            res = nextAppFacade.run(self.testFileKey)
+
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(mockSession.post.call_count, 4)
+        self.assertEqual(self.mockSleep.call_count, 3)
+
+    def test_run_retriesExhausted(self):
+        """Tests if NextAppFacade raises an error once every attempt has failed."""
+        os.environ['NEXT_APP_MAX_RETRIES'] = '2'
+        self.addCleanup(os.environ.pop, 'NEXT_APP_MAX_RETRIES')
+        mockSession = self._mockSession(500, 502, 504)
+        nextAppFacade = NextAppFacade(self.TEST_ENV)
+
+        with redirect_stdout(None):
+            with self.assertRaises(requests.HTTPError):
+                nextAppFacade.run(self.testFileKey)
+
+        self.assertEqual(mockSession.post.call_count, 3)
+
+    def test_run_clientError(self):
+        """Tests if NextAppFacade raises a client error without retrying it."""
+        mockSession = self._mockSession(400)
+        nextAppFacade = NextAppFacade(self.TEST_ENV)
+
+        with redirect_stdout(None):
+            with self.assertRaises(requests.HTTPError):
+                nextAppFacade.run(self.testFileKey)
+
+        mockSession.post.assert_called_once()
+
+    def test_run_readTimeout(self):
+        """Tests if NextAppFacade doesn't retry a request the next app may already have received."""
+        mockSession = self._mockSession(requests.ReadTimeout('slow'))
+        nextAppFacade = NextAppFacade(self.TEST_ENV)
+
+        with redirect_stdout(None):
+            with self.assertRaises(requests.ReadTimeout):
+                nextAppFacade.run(self.testFileKey)
+
+        mockSession.post.assert_called_once()
+
+    def test_runAsync(self):
+        """Tests if runAsync returns a future of the response."""
+        self._mockSession(200)
+        nextAppFacade = NextAppFacade(self.TEST_ENV)
+
+        with redirect_stdout(None):
+            future = nextAppFacade.runAsync(self.testFileKey)
+            res = future.result(timeout=5)
+
+        self.assertEqual(res.status_code, 200)
+
+    def test_getBackoff(self):
+        """Tests if backoff grows exponentially up to its cap and respects Retry-After."""
+        nextAppFacade = NextAppFacade(self.TEST_ENV)
+
+        for attempt in range(10):
+            backoff = nextAppFacade._getBackoff(attempt)
+            self.assertGreaterEqual(backoff, 0)
+            self.assertLessEqual(backoff, min(NextAppFacade.BACKOFF_MAX, NextAppFacade.BACKOFF_BASE * 2 ** attempt))
+        self.assertGreaterEqual(nextAppFacade._getBackoff(0, '3'), 3)
+        self.assertLessEqual(nextAppFacade._getBackoff(0, '3600'), NextAppFacade.BACKOFF_MAX)
+
+    def test_getSession(self):
+        """Tests if every facade shares one session."""
+        self.assertIs(NextAppFacade('stg')._getSession(), NextAppFacade('prd')._getSession())
@@ -0,0 +1,42 @@
+import json
+import unittest
+from unittest.mock import Mock
+
+from awsEcs.models.OutputManifest import OutputManifest
+from awsEcs.models.formats.CsvFormat import CsvFormat
+from awsEcs.models.services.EcsS3Service import EcsS3Service
+from awsEcs.models.services.S3ManifestStore import S3ManifestStore
+
+class TestS3ManifestStoreUnit(unittest.TestCase):
+    """Unit tests for S3ManifestStore."""
+
+    def setUp(self):
+        """Sets up the test case."""
+        self.mockS3 = Mock(spec=EcsS3Service)
+        self.manifestStore = S3ManifestStore(self.mockS3)
+
+    def test_write(self):
+        """Tests if a manifest is written to the next app's bucket next to its output file."""
+        # Arrange
+        manifest = OutputManifest('ToDo/hints.csv', 'InProgress/hints.csv', CsvFormat())
+
+        # Act
+        self.manifestStore.write(manifest)
+
+        # Assert
+        data, key = self.mockS3.writeNextAppManifest.call_args.args
+        self.assertEqual(key, 'ToDo/hints.csv.manifest.json')
+        self.assertEqual(json.loads(data)['key'], 'ToDo/hints.csv')
+
+    def test_list(self):
+        """Tests if list reads only the manifests in the next app's bucket."""
+        # Arrange
+        self.mockS3.listNextAppFiles.return_value = ['ToDo/b.csv.manifest.json', 'ToDo/b.csv', 'ToDo/a.csv.manifest.json']
+        self.mockS3.readNextAppFile.side_effect = lambda key: json.dumps({'key': key}).encode('utf8')
+
+        # Act
+        manifests = self.manifestStore.list()
+
+        # Assert
+        self.mockS3.listNextAppFiles.assert_called_once_with('ToDo/')
+        self.assertEqual(manifests, [{'key': 'ToDo/a.csv.manifest.json'}, {'key': 'ToDo/b.csv.manifest.json'}])
@@ -0,0 +1,93 @@
+import io
+import unittest
+from io import BytesIO
+from unittest.mock import Mock
+
+import pandas as pd
+from botocore.exceptions import ClientError
+from botocore.response import StreamingBody
+
+from awsEcs.models.services.S3RangeReader import S3RangeReader
+
+class TestS3RangeReaderUnit(unittest.TestCase):
+    """Unit tests for S3RangeReader."""
+
+    TEST_FILE = 'tests/common/testData/CompletedHints.csv'
+
+    def setUp(self):
+        """Sets up the test case."""
+        with open(self.TEST_FILE, 'rb') as file:
+            self.data = file.read()
+        self.mockClient = Mock()
+        self.mockClient.head_object.side_effect = lambda **kwargs: {'ContentLength': len(self.data), 'ETag': '"etag"'}
+        self.mockClient.get_object.side_effect = self._getObject
+
+    def _getObject(self, Bucket, Key, Range, IfMatch):
+        """Helper function that answers a ranged GET from the test file."""
+        start, end = (int(position) for position in Range.removeprefix('bytes=').split('-'))
+        body = self.data[start:end + 1]
+        return {'Body': StreamingBody(BytesIO(body), len(body)), 'ETag': '"etag"'}
+
+    def _createReader(self, partSize: int = 100, spoolThreshold: int = None) -> S3RangeReader:
+        """Helper function to create a reader of the test file."""
+        reader = S3RangeReader(self.mockClient, 'bucket', 'key', partSize, 4, spoolThreshold)
+        self.addCleanup(reader.close)
+        return reader
+
+    def test_read(self):
+        """Tests if the object is downloaded in byte ranges of the part size and read back whole."""
+        reader = self._createReader()
+
+        actual = reader.read()
+
+        self.assertEqual(actual, self.data)
+        self.assertEqual(self.mockClient.get_object.call_count, -(-len(self.data) // 100))
+        self.mockClient.get_object.assert_any_call(Bucket='bucket', Key='key', Range='bytes=0-99', IfMatch='"etag"')
+
+    def test_read_seek(self):
+        """Tests if reads across part boundaries after seeking return the right bytes."""
+        reader = self._createReader(partSize=7)
+
+        reader.seek(95)
+        first = reader.read(20)
+        reader.seek(-10, io.SEEK_END)
+        last = reader.read(100)
+
+        self.assertEqual(first, self.data[95:115])
+        self.assertEqual(last, self.data[-10:])
+        self.assertEqual(reader.tell(), len(self.data))
+
+    def test_read_pandas(self):
+        """Tests if pandas can read from the reader like a file."""
+        reader = self._createReader()
+
+        df = pd.read_csv(reader)
+
+        pd.testing.assert_frame_equal(df, pd.read_csv(self.TEST_FILE))
+
+    def test_read_spooled(self):
+        """Tests if an object over the spool threshold is downloaded to disk and read back whole."""
+        reader = self._createReader(spoolThreshold=len(self.data) - 1)
+
+        df = pd.read_csv(reader)
+
+        self.assertTrue(reader.spooled)
+        pd.testing.assert_frame_equal(df, pd.read_csv(self.TEST_FILE))
+        self.assertFalse(self._createReader(spoolThreshold=len(self.data)).spooled)
+
+    def test_read_empty(self):
+        """Tests if an empty object is read without any ranged GETs."""
+        self.data = b''
+        reader = self._createReader()
+
+        self.assertEqual(reader.read(), b'')
+        self.mockClient.get_object.assert_not_called()
+
+    def test_read_overwritten(self):
+        """Tests if reading fails when the object is overwritten mid-download."""
+        error = ClientError({'Error': {'Code': 'PreconditionFailed'}}, 'GetObject')
+        self.mockClient.get_object.side_effect = [self._getObject('bucket', 'key', 'bytes=0-99', '"etag"'), error] * 100
+        reader = self._createReader()
+
+        with self.assertRaises(RuntimeError):
+            reader.read()
@@ -0,0 +1,45 @@
+import unittest
+
+import pandas as pd
+
+from awsEcs.models.stages.DedupeStage import DedupeStage
+
+class TestDedupeStageUnit(unittest.TestCase):
+    """Unit tests for DedupeStage."""
+
+    def setUp(self):
+        """Sets up the test case."""
+        self.dedupeStage = DedupeStage()
+        self.df = pd.DataFrame({
+            'ark': ['a', 'a', 'b', 'a', 'c'],
+            'pid': ['1', '1', '1', '2', '3'],
+            'score': [1, 2, 3, 4, 5]
+        })
+
+    def test_transform(self):
+        """Tests if transform keeps the first hint with each ark and pid."""
+        df = self.dedupeStage.transform(self.df)
+
+        self.assertEqual(df['score'].tolist(), [1, 3, 4, 5])
+
+    def test_transform_chunks(self):
+        """Tests if transform drops hints repeating a hint from an earlier chunk."""
+        chunks = [self.dedupeStage.transform(self.df[i:i + 2]) for i in range(0, len(self.df), 2)]
+
+        pd.testing.assert_frame_equal(pd.concat(chunks), self.df.drop_duplicates(['ark', 'pid']))
+
+    def test_transform_missingColumns(self):
+        """Tests if transform only uses the key columns in the data."""
+        df = self.dedupeStage.transform(self.df[['ark', 'score']])
+
+        self.assertEqual(df['score'].tolist(), [1, 3, 5])
+
+    def test_transform_manyChunks(self):
+        """Tests if transform keeps its seen hashes sorted and complete across many chunks."""
+        df = pd.DataFrame({'ark': [str(i % 50) for i in range(200)], 'pid': 'p'}).sample(frac=1, random_state=0)
+
+        chunks = [self.dedupeStage.transform(df[i:i + 7]) for i in range(0, len(df), 7)]
+
+        self.assertEqual(sorted(str(i) for i in range(50)), sorted(pd.concat(chunks)['ark']))
+        self.assertEqual(50, len(self.dedupeStage.seen))
+        self.assertTrue((self.dedupeStage.seen[:-1] < self.dedupeStage.seen[1:]).all())
@@ -0,0 +1,22 @@
+import unittest
+
+import pandas as pd
+
+from awsEcs.models.stages.EnrichStage import EnrichStage
+
+class TestEnrichStageUnit(unittest.TestCase):
+    """Unit tests for EnrichStage."""
+
+    def test_transform(self):
+        """Tests if transform adds computed and constant columns, in order."""
+        enrichStage = EnrichStage({
+            'double': lambda df: df['score'] * 2,
+            'quadruple': lambda df: df['double'] * 2,
+            'source': 'template'
+        })
+        df = pd.DataFrame({'score': [1, 2]})
+
+        df = enrichStage.transform(df)
+
+        self.assertEqual(df['quadruple'].tolist(), [4, 8])
+        self.assertEqual(df['source'].tolist(), ['template', 'template'])
@@ -0,0 +1,17 @@
+import unittest
+
+import pandas as pd
+
+from awsEcs.models.stages.FilterStage import FilterStage
+
+class TestFilterStageUnit(unittest.TestCase):
+    """Unit tests for FilterStage."""
+
+    def test_transform(self):
+        """Tests if transform keeps the hints matching the condition, treating missing values as not matching."""
+        filterStage = FilterStage(lambda df: df['score'] > 1)
+        df = pd.DataFrame({'score': pd.array([1, 2, None, 3], dtype='Int8')})
+
+        df = filterStage.transform(df)
+
+        self.assertEqual(df['score'].tolist(), [2, 3])
@@ -0,0 +1,31 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from awsEcs.models.stages.NormalizeCoordinatesStage import NormalizeCoordinatesStage
+
+class TestNormalizeCoordinatesStageUnit(unittest.TestCase):
+    """Unit tests for NormalizeCoordinatesStage."""
+
+    def setUp(self):
+        """Sets up the test case."""
+        self.normalizeCoordinatesStage = NormalizeCoordinatesStage()
+
+    def test_transform(self):
+        """Tests if transform strips the leading quote and drops unparseable or out-of-range coordinates."""
+        df = pd.DataFrame({
+            'latitude': ['33.5', "'41.25", '95', 'none'],
+            'longitude': ["'-117.5", '-99.75', '10', '200']
+        })
+
+        df = self.normalizeCoordinatesStage.transform(df)
+
+        np.testing.assert_array_equal(df['latitude'].to_numpy(), np.array([33.5, 41.25, np.nan, np.nan], dtype='float32'))
+        np.testing.assert_array_equal(df['longitude'].to_numpy(), np.array([-117.5, -99.75, 10, np.nan], dtype='float32'))
+
+    def test_transform_missingColumns(self):
+        """Tests if transform leaves data without coordinates alone."""
+        df = pd.DataFrame({'ark': ['a']})
+
+        pd.testing.assert_frame_equal(self.normalizeCoordinatesStage.transform(df), df)
@@ -0,0 +1,33 @@
+import unittest
+
+from awsEcs.models.Checkpoint import Checkpoint
+
+class TestCheckpointUnit(unittest.TestCase):
+    """Unit tests for Checkpoint."""
+
+    def setUp(self):
+        """Sets up the test case."""
+        self.checkpoint = Checkpoint('ToDo/hints.csv', '"test-etag"', 'hints.csv', 4, 'test-upload-id')
+
+    def test_toJson(self):
+        """Tests if a checkpoint reads back from JSON with all of its progress."""
+        # Arrange
+        self.checkpoint.parts.append({'PartNumber': 1, 'ETag': 'etag-1'})
+        self.checkpoint.nextShard = 2
+        self.checkpoint.offset = 1234
+        self.checkpoint.rowsOut = 10
+        self.checkpoint.size = 567
+        self.checkpoint.schema = {'ark': 'object'}
+
+        # Act
+        actual = Checkpoint.fromJson(self.checkpoint.toJson())
+
+        # Assert
+        self.assertEqual(vars(self.checkpoint), vars(actual))
+
+    def test_matches(self):
+        """Tests if a checkpoint only applies to the same input file, output file and shards."""
+        self.assertTrue(self.checkpoint.matches('"test-etag"', 'hints.csv', 4))
+        self.assertFalse(self.checkpoint.matches('"other-etag"', 'hints.csv', 4))
+        self.assertFalse(self.checkpoint.matches('"test-etag"', 'hints.csv.zst', 4))
+        self.assertFalse(self.checkpoint.matches('"test-etag"', 'hints.csv', 3))
@@ -0,0 +1,61 @@
+import unittest
+
+from awsEcs.models.CsvShard import CsvShard
+
+class TestCsvShardUnit(unittest.TestCase):
+    """Unit tests for CsvShard."""
+
+    TEST_FILE = 'tests/common/testData/CompletedHints.csv'
+
+    def setUp(self):
+        """Sets up the test case."""
+        with open(self.TEST_FILE, 'rb') as file:
+            self.data = file.read()
+        self.reads = []
+
+    def _readRange(self, start: int, end: int) -> bytes:
+        """Helper function to read an inclusive byte range of the test file, like a ranged GET."""
+        self.reads.append((start, end))
+        return self.data[start:end + 1]
+
+    def test_readHeader(self):
+        """Tests if readHeader reads through the first newline."""
+        header = CsvShard.readHeader(self._readRange, len(self.data))
+
+        self.assertEqual(header, self.data[:self.data.index(b'\n') + 1])
+
+    def test_readHeader_longHeader(self):
+        """Tests if readHeader keeps reading when the header is longer than one lookahead."""
+        self.data = b'a' * (CsvShard.LOOKAHEAD_SIZE + 10) + b'\n1\n'
+
+        header = CsvShard.readHeader(self._readRange, len(self.data))
+
+        self.assertEqual(header, self.data[:-2])
+        self.assertEqual(len(self.reads), 2)
+
+    def test_readRows(self):
+        """Tests if every row is read by exactly one shard, whatever the shard count."""
+        header = CsvShard.readHeader(self._readRange, len(self.data))
+        for count in range(1, 40):
+            with self.subTest(count=count):
+                shards = CsvShard.split(header, len(self.data), count)
+
+                rows = b''.join(shard.readRows(self._readRange) for shard in shards)
+
+                self.assertEqual(header + rows, self.data)
+
+    def test_readRows_noTrailingNewline(self):
+        """Tests if the last row is read when the file doesn't end with a newline."""
+        self.data = b'a,b\n1,2\n3,4'
+        shards = CsvShard.split(b'a,b\n', len(self.data), 3)
+
+        rows = [shard.readRows(self._readRange) for shard in shards]
+
+        self.assertEqual(b''.join(rows), b'1,2\n3,4')
+        self.assertIn(b'', rows)
+
+    def test_split(self):
+        """Tests if split covers the rows with contiguous shards."""
+        shards = CsvShard.split(b'a,b\n', 104, 4)
+
+        self.assertEqual([(shard.index, shard.start, shard.end) for shard in shards], [(0, 4, 29), (1, 29, 54), (2, 54, 79), (3, 79, 104)])
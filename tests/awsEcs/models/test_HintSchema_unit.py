@@ -0,0 +1,97 @@
+import unittest
+from io import BytesIO
+
+import pandas as pd
+
+from awsEcs.models.HintSchema import HintSchema
+from awsEcs.models.formats.CsvFormat import CsvFormat
+
+class TestHintSchemaUnit(unittest.TestCase):
+    """Unit tests for HintSchema."""
+
+    TEST_FILE = 'tests/common/testData/CompletedHints.csv'
+
+    def setUp(self):
+        """Sets up the test case."""
+        self.schema = HintSchema()
+        with open(self.TEST_FILE, 'rb') as file:
+            self.data = file.read()
+
+    def _read(self) -> pd.DataFrame:
+        """Helper function to read the test file with the declared types."""
+        return self.schema.apply(CsvFormat().read(BytesIO(self.data), dtype=self.schema.getDtypes()))
+
+    def test_getDtypes_columns(self):
+        """Tests if getDtypes only gives types for the columns being read."""
+        dtypes = self.schema.getDtypes(['ark', 'hinttype', 'latitude'])
+
+        self.assertEqual({'hinttype': 'category', 'latitude': 'str'}, dtypes)
+
+    def test_apply(self):
+        """Tests if apply gives each hint column its declared type."""
+        df = self._read()
+
+        self.assertIsInstance(df['hinttype'].dtype, pd.CategoricalDtype)
+        self.assertEqual(df['score'].dtype, 'Int8')
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(df['dateadded']))
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(df['datecompleted']))
+
+    def test_apply_coordinates(self):
+        """Tests if apply keeps coordinates as the text they were read as, leading quote included."""
+        expected = pd.read_csv(BytesIO(self.data), dtype=str)[HintSchema.COORDINATE_COLUMNS]
+
+        df = self._read()
+
+        pd.testing.assert_frame_equal(expected, df[HintSchema.COORDINATE_COLUMNS])
+        self.assertEqual("'-117.86442", df['longitude'][0])
+
+    def test_apply_parseCoordinates(self):
+        """Tests if apply parses coordinates as float32 without their leading quote when parseCoordinates is on."""
+        textUsage = self.schema.memoryUsage(self._read()[HintSchema.COORDINATE_COLUMNS])
+        self.schema = HintSchema(parseCoordinates=True)
+
+        df = self._read()
+
+        for column in HintSchema.COORDINATE_COLUMNS:
+            self.assertEqual(HintSchema.COORDINATE_TYPE, df[column].dtype)
+        self.assertAlmostEqual(-117.86442, df['longitude'][0], places=4)
+        self.assertLess(sum(self.schema.memoryUsage(df[HintSchema.COORDINATE_COLUMNS]).values()), sum(textUsage.values()))
+
+    def test_apply_inferred(self):
+        """Tests if apply also converts data read without the declared types, leaving their coordinates alone."""
+        expected = self._read()
+        inferred = pd.read_csv(BytesIO(self.data))
+        coordinates = inferred[HintSchema.COORDINATE_COLUMNS].copy()
+
+        df = self.schema.apply(inferred)
+
+        pd.testing.assert_frame_equal(
+            expected.drop(columns=HintSchema.COORDINATE_COLUMNS), df.drop(columns=HintSchema.COORDINATE_COLUMNS), check_categorical=False
+        )
+        pd.testing.assert_frame_equal(coordinates, df[HintSchema.COORDINATE_COLUMNS])
+
+    def test_prepareCsv(self):
+        """Tests if CSV written from typed data reads back to the same typed data."""
+        df = self._read()
+
+        outData = self.schema.prepareCsv(df).to_csv(index=False).encode('utf8')
+        roundTrip = self.schema.apply(CsvFormat().read(BytesIO(outData), dtype=self.schema.getDtypes()))
+
+        pd.testing.assert_frame_equal(df, roundTrip)
+
+    def test_prepareCsv_sameAsInput(self):
+        """Tests if CSV written from typed data has the same values as the file it was read from."""
+        df = self._read()
+
+        outData = self.schema.prepareCsv(df).to_csv(index=False).encode('utf8')
+
+        pd.testing.assert_frame_equal(pd.read_csv(BytesIO(self.data), dtype=str), pd.read_csv(BytesIO(outData), dtype=str))
+
+    def test_memoryUsage(self):
+        """Tests if memoryUsage reports less memory for typed data than inferred data."""
+        inferred = self.schema.memoryUsage(pd.read_csv(BytesIO(self.data)))
+
+        usage = self.schema.memoryUsage(self._read())
+
+        self.assertEqual(list(inferred), list(usage))
+        self.assertLess(sum(usage.values()), sum(inferred.values()))
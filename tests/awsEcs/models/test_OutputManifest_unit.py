@@ -0,0 +1,58 @@
+import hashlib
+import json
+import unittest
+
+import pandas as pd
+
+from awsEcs.models.OutputManifest import OutputManifest
+from awsEcs.models.formats.FileFormatFactory import FileFormatFactory
+
+class TestOutputManifestUnit(unittest.TestCase):
+    """Unit tests for OutputManifest."""
+
+    TEST_FILE = 'tests/common/testData/CompletedHints.csv'
+
+    def setUp(self):
+        """Sets up the test case."""
+        self.df = pd.read_csv(self.TEST_FILE)
+        self.manifest = OutputManifest('ToDo/hints.csv.zst', 'InProgress/hints.csv', FileFormatFactory.getFormat(name='csv.zst'))
+
+    def test_track(self):
+        """Tests if tracked chunks add up to the whole output's rows, size and checksum."""
+        # Arrange
+        frames = [self.df[:2], self.df[2:]]
+        chunks = [b'abc', b'', b'defg']
+
+        # Act
+        passedFrames = list(self.manifest.trackFrames(frames))
+        passedChunks = list(self.manifest.trackBytes(chunks))
+
+        # Assert
+        self.assertEqual(passedFrames, frames)
+        self.assertEqual(passedChunks, chunks)
+        self.assertEqual(self.manifest.rows, len(self.df))
+        self.assertEqual(self.manifest.size, 7)
+        self.assertEqual(self.manifest.sha256, hashlib.sha256(b'abcdefg').hexdigest())
+        self.assertEqual(self.manifest.schema, {column: str(dtype) for column, dtype in self.df.dtypes.items()})
+
+    def test_toJson(self):
+        """Tests if the manifest serializes where the output is, what it holds and how to check it."""
+        # Arrange
+        self.manifest.addFrame(self.df)
+        self.manifest.addBytes(b'data')
+
+        # Act
+        manifest = json.loads(self.manifest.toJson())
+
+        # Assert
+        self.assertEqual(self.manifest.manifestKey, 'ToDo/hints.csv.zst.manifest.json')
+        self.assertEqual(manifest['key'], 'ToDo/hints.csv.zst')
+        self.assertEqual(manifest['sourceKey'], 'InProgress/hints.csv')
+        self.assertEqual(manifest['format'], 'csv.zst')
+        self.assertEqual(manifest['contentType'], 'text/csv')
+        self.assertEqual(manifest['contentEncoding'], 'zstd')
+        self.assertEqual(manifest['rows'], len(self.df))
+        self.assertEqual(manifest['size'], 4)
+        self.assertEqual(manifest['sha256'], hashlib.sha256(b'data').hexdigest())
+        self.assertEqual([column['name'] for column in manifest['schema']], list(self.df.columns))
+        self.assertIn('createdAt', manifest)
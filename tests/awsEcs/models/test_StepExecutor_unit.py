@@ -0,0 +1,81 @@
+import threading
+import unittest
+from contextlib import redirect_stdout
+
+from awsEcs.models.StepExecutor import StepExecutor
+
+class TestStepExecutorUnit(unittest.TestCase):
+    """Unit tests for StepExecutor."""
+
+    def setUp(self):
+        """Sets up the test case."""
+        self.stepExecutor = StepExecutor()
+
+    def test_run(self):
+        """Tests if run returns the result of every step and records their timings."""
+        self.stepExecutor.addStep('a', lambda: 1)
+        self.stepExecutor.addStep('b', lambda: 2)
+
+        with redirect_stdout(None):
+            results = self.stepExecutor.run()
+
+        self.assertEqual(results, {'a': 1, 'b': 2})
+        self.assertEqual(set(self.stepExecutor.timings), {'a', 'b'})
+
+    def test_run_dependencies(self):
+        """Tests if a step only starts after the steps it depends on have finished."""
+        order = []
+        self.stepExecutor.addStep('trigger', lambda: order.append('trigger'), dependsOn=['write'])
+        self.stepExecutor.addStep('write', lambda: order.append('write'))
+
+        with redirect_stdout(None):
+            self.stepExecutor.run()
+
+        self.assertEqual(order, ['write', 'trigger'])
+
+    def test_run_concurrent(self):
+        """Tests if independent steps run at the same time."""
+        barrier = threading.Barrier(2, timeout=5)
+        self.stepExecutor.addStep('a', barrier.wait)
+        self.stepExecutor.addStep('b', barrier.wait)
+
+        with redirect_stdout(None):
+            self.stepExecutor.run() # would raise BrokenBarrierError if the steps ran one after another
+
+    def test_run_failure(self):
+        """Tests if a failing step raises its error and stops its dependents from running."""
+        dependent = []
+        def fail():
+            raise RuntimeError('step failed')
+        self.stepExecutor.addStep('write', fail)
+        self.stepExecutor.addStep('trigger', lambda: dependent.append('trigger'), dependsOn=['write'])
+        self.stepExecutor.addStep('move', lambda: 'moved')
+
+        with redirect_stdout(None):
+            with self.assertRaises(RuntimeError):
+                self.stepExecutor.run()
+
+        self.assertEqual(dependent, [])
+        self.assertIn('write', self.stepExecutor.timings)
+
+    def test_run_unknownDependency(self):
+        """Tests if run raises a ValueError when a step depends on a step that was never added."""
+        self.stepExecutor.addStep('trigger', lambda: None, dependsOn=['write'])
+
+        with self.assertRaises(ValueError):
+            self.stepExecutor.run()
+
+    def test_run_circularDependency(self):
+        """Tests if run raises a ValueError when steps depend on each other."""
+        self.stepExecutor.addStep('a', lambda: None, dependsOn=['b'])
+        self.stepExecutor.addStep('b', lambda: None, dependsOn=['a'])
+
+        with self.assertRaises(ValueError):
+            self.stepExecutor.run()
+
+    def test_addStep_duplicate(self):
+        """Tests if addStep raises a ValueError when a step name is reused."""
+        self.stepExecutor.addStep('a', lambda: None)
+
+        with self.assertRaises(ValueError):
+            self.stepExecutor.addStep('a', lambda: None)
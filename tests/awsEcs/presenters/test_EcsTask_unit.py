@@ -1,16 +1,25 @@
+import hashlib
 import io
+import json
 import os
+import tempfile
 from contextlib import redirect_stdout
-from io import StringIO
+from io import BytesIO, StringIO
 from unittest import TestCase
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 
 import pandas as pd
+import zstandard
 from environ.compat import ImproperlyConfigured
 
+from awsEcs.models.Checkpoint import Checkpoint
 from awsEcs.models.services.EcsS3Service import EcsS3Service
+from awsEcs.models.services.LocalManifestStore import LocalManifestStore
+from awsEcs.models.stages.DedupeStage import DedupeStage
 from awsEcs.models.services.NextAppFacade import NextAppFacade
 from awsEcs.presenters.EcsTask import EcsTask
+from awsEcs.presenters.ShardWorker import ShardWorker
 from common.models.EnvVar import EnvVar
 
 class TestEcsTaskUnit(TestCase):
@@ -44,7 +53,8 @@ class TestEcsTaskUnit(TestCase):
         mockNextAppFacade = patcher.start()
 
         self.mockS3ServiceInstance = Mock(spec=EcsS3Service)
-        self.mockS3ServiceInstance.readFile.return_value = self.csvStringIO
+        self.mockS3ServiceInstance.readFile.return_value = StringIO(self.csvStringIO.getvalue())
+        self.mockS3ServiceInstance.getContentEncoding.return_value = None
         mockS3Service.return_value = self.mockS3ServiceInstance
 
         self.ecsTask = EcsTask(test=True)
@@ -57,6 +67,18 @@ class TestEcsTaskUnit(TestCase):
         EnvVar.delete()
         os.environ.pop('INFILE', None)
         os.environ.pop('ENV', None)
+        os.environ.pop('CHUNK_SIZE', None)
+        os.environ.pop('SERVER_SIDE_COPY', None)
+        os.environ.pop('OUTPUT_FORMAT', None)
+        os.environ.pop('COLUMNS', None)
+        os.environ.pop('HINT_SCHEMA', None)
+        os.environ.pop('PARSE_COORDINATES', None)
+        os.environ.pop('PARALLEL_WORKERS', None)
+        os.environ.pop('CHECKPOINTS', None)
+        os.environ.pop('NEXT_APP_BATCH_SIZE', None)
+        os.environ.pop('NEXT_APP_HANDOFF', None)
+        os.environ.pop('SPOOL_THRESHOLD_MB', None)
+        ShardWorker.task = None
         if self.csvStringIO:
             self.csvStringIO.seek(0)
 
@@ -108,14 +130,9 @@ class TestEcsTaskUnit(TestCase):
         self.csvStringIO.seek(0) # reset CSV input
 
         self.ecsTask.s3.readFile.assert_called_once_with(self.ecsTask.INFILE_KEY)
-        self.assertEqual(
-                self.ecsTask.s3.writeOutputFile.call_args.args[0].getvalue(),
-                StringIO(pd.read_csv(self.csvStringIO).to_csv(index=False)).getvalue()
-            )
-        self.assertEqual(
-                self.ecsTask.s3.writeOutputFile.call_args.args[1],
-                self.ecsTask.INFILE_NAME
-            )
+        expected = pd.read_csv(self.csvStringIO).to_csv(index=False).encode('utf8')
+        self.ecsTask.s3.writeOutput.assert_called_once_with(expected, self.ecsTask.INFILE_NAME)
+        self.ecsTask.s3.writeNextAppInput.assert_called_once_with(expected, self.ecsTask.INFILE_NAME)
         self.ecsTask.s3.moveFile.assert_called_once_with(self.ecsTask.INFILE_KEY, f'Done/{self.ecsTask.INFILE_NAME}')
         self.ecsTask.nextAppFacade.run.assert_called_once_with(f'ToDo/{self.ecsTask.INFILE_NAME}')
 
@@ -131,14 +148,9 @@ class TestEcsTaskUnit(TestCase):
         self.csvStringIO.seek(0) # reset CSV input
 
         self.ecsTask.s3.readFile.assert_called_once_with(self.ecsTask.INFILE_KEY)
-        self.assertEqual(
-                self.ecsTask.s3.writeOutputFile.call_args.args[0].getvalue(),
-                StringIO(pd.read_csv(self.csvStringIO).to_csv(index=False)).getvalue()
-            )
-        self.assertEqual(
-                self.ecsTask.s3.writeOutputFile.call_args.args[1],
-                self.ecsTask.INFILE_NAME
-            )
+        expected = pd.read_csv(self.csvStringIO).to_csv(index=False).encode('utf8')
+        self.ecsTask.s3.writeOutput.assert_called_once_with(expected, self.ecsTask.INFILE_NAME)
+        self.ecsTask.s3.writeNextAppInput.assert_called_once_with(expected, self.ecsTask.INFILE_NAME)
         self.ecsTask.s3.moveFile.assert_called_once_with(self.ecsTask.INFILE_KEY, f'Done/{self.ecsTask.INFILE_NAME}')
         self.ecsTask.nextAppFacade.run.assert_called_once_with(f'ToDo/{self.ecsTask.INFILE_NAME}')
 
@@ -156,14 +168,9 @@ class TestEcsTaskUnit(TestCase):
         self.csvStringIO.seek(0) # reset CSV input
 
         self.ecsTask.s3.readFile.assert_called_once_with(self.ecsTask.INFILE_KEY)
-        self.assertEqual(
-                self.ecsTask.s3.writeOutputFile.call_args.args[0].getvalue(),
-                StringIO(pd.read_csv(self.csvStringIO).to_csv(index=False)).getvalue()
-            )
-        self.assertEqual(
-                self.ecsTask.s3.writeOutputFile.call_args.args[1],
-                self.ecsTask.INFILE_NAME
-            )
+        expected = pd.read_csv(self.csvStringIO).to_csv(index=False).encode('utf8')
+        self.ecsTask.s3.writeOutput.assert_called_once_with(expected, self.ecsTask.INFILE_NAME)
+        self.ecsTask.s3.writeNextAppInput.assert_called_once_with(expected, self.ecsTask.INFILE_NAME)
         self.ecsTask.s3.moveFile.assert_called_once_with(self.ecsTask.INFILE_KEY, f'Done/{self.ecsTask.INFILE_NAME}')
         self.ecsTask.nextAppFacade.run.assert_called_once_with(f'ToDo/{self.ecsTask.INFILE_NAME}')
 
@@ -177,3 +184,601 @@ class TestEcsTaskUnit(TestCase):
         with redirect_stdout(None):
             with self.assertRaises(pd.errors.EmptyDataError):
                 self.ecsTask.run()
+
+    def test_run_ClosesInput(self):
+        """Tests if EcsTask closes the input it read, whether or not the file could be parsed."""
+        self._instantiateEcsTask()
+        for data in [self.csvStringIO.getvalue(), '']:
+            with self.subTest(empty=not data):
+                inData = StringIO(data)
+                self.mockS3ServiceInstance.readFile.return_value = inData
+
+                with redirect_stdout(None):
+                    try:
+                        self.ecsTask.run()
+                    except pd.errors.EmptyDataError:
+                        pass
+
+                self.assertTrue(inData.closed)
+
+    def test_run_Streaming(self):
+        """Tests if EcsTask streams the input in chunks when CHUNK_SIZE is set."""
+        os.environ['CHUNK_SIZE'] = '2'
+        self._instantiateEcsTask()
+        expected = pd.read_csv(self.csvStringIO).to_csv(index=False)
+        self.mockS3ServiceInstance.readFileStream.return_value = BytesIO(expected.encode('utf8'))
+        outputs = {}
+        def captureOutput(name):
+            def capture(data, fileName):
+                outputs[name] = (data.read(), fileName)
+            return capture
+        self.mockS3ServiceInstance.writeOutput.side_effect = captureOutput('output')
+        self.mockS3ServiceInstance.writeNextAppInput.side_effect = captureOutput('nextApp')
+
+        with patch.object(self.ecsTask, 'processData', side_effect=lambda df: df) as mockProcessData:
+            with redirect_stdout(None):
+                self.ecsTask.run()
+
+        self.assertEqual(self.ecsTask.CHUNK_SIZE, 2)
+        self.assertEqual(mockProcessData.call_count, 3) # 5 rows in chunks of 2
+        self.ecsTask.s3.readFile.assert_not_called()
+        self.ecsTask.s3.readFileStream.assert_called_once_with(self.ecsTask.INFILE_KEY)
+        self.assertEqual(outputs['output'], (expected.encode('utf8'), self.ecsTask.INFILE_NAME))
+        self.assertEqual(outputs['nextApp'], (expected.encode('utf8'), self.ecsTask.INFILE_NAME))
+        self.ecsTask.s3.moveFile.assert_called_once_with(self.ecsTask.INFILE_KEY, f'Done/{self.ecsTask.INFILE_NAME}')
+        self.ecsTask.nextAppFacade.run.assert_called_once_with(f'ToDo/{self.ecsTask.INFILE_NAME}')
+
+    def test_run_Streaming_Stages(self):
+        """Tests if EcsTask runs each chunk through the stages from getStages, keeping their state across chunks."""
+        os.environ['CHUNK_SIZE'] = '2'
+        self._instantiateEcsTask()
+        df = pd.read_csv(self.csvStringIO)
+        self.mockS3ServiceInstance.readFileStream.return_value = BytesIO(pd.concat([df, df]).to_csv(index=False).encode('utf8'))
+        outputs = []
+        self.mockS3ServiceInstance.writeOutput.side_effect = lambda data, fileName: outputs.append(data.read())
+
+        with patch.object(self.ecsTask, 'getStages', return_value=[DedupeStage()]):
+            with redirect_stdout(None):
+                self.ecsTask.run()
+
+        self.assertEqual(outputs, [df.to_csv(index=False).encode('utf8')])
+
+    def test_run_Streaming_EmptyInfile(self):
+        """Tests that EcsTask errors out in streaming mode if run with an empty infile."""
+        os.environ['CHUNK_SIZE'] = '2'
+        self._instantiateEcsTask()
+        self.mockS3ServiceInstance.readFileStream.return_value = BytesIO()
+
+        with redirect_stdout(None):
+            with self.assertRaises(pd.errors.EmptyDataError):
+                self.ecsTask.run()
+        self.ecsTask.s3.writeOutput.assert_not_called()
+
+    def test_run_ServerSideCopy(self):
+        """Tests if EcsTask uploads the output once and copies it to the next app when SERVER_SIDE_COPY is set."""
+        os.environ['SERVER_SIDE_COPY'] = 'true'
+        self._instantiateEcsTask()
+        expected = pd.read_csv(self.csvStringIO).to_csv(index=False).encode('utf8')
+        self.csvStringIO.seek(0)
+
+        with redirect_stdout(None):
+            self.ecsTask.run()
+
+        self.assertTrue(self.ecsTask.SERVER_SIDE_COPY)
+        self.ecsTask.s3.writeOutput.assert_called_once_with(expected, self.ecsTask.INFILE_NAME)
+        self.ecsTask.s3.writeNextAppInput.assert_not_called()
+        self.ecsTask.s3.copyOutputToNextApp.assert_called_once_with(self.ecsTask.INFILE_NAME)
+        self.ecsTask.s3.moveFile.assert_called_once_with(self.ecsTask.INFILE_KEY, f'Done/{self.ecsTask.INFILE_NAME}')
+        self.ecsTask.nextAppFacade.run.assert_called_once_with(f'ToDo/{self.ecsTask.INFILE_NAME}')
+
+    def test_run_ServerSideCopy_Streaming(self):
+        """Tests if EcsTask uploads streamed chunks directly when SERVER_SIDE_COPY and CHUNK_SIZE are set."""
+        os.environ['SERVER_SIDE_COPY'] = 'true'
+        os.environ['CHUNK_SIZE'] = '2'
+        self._instantiateEcsTask()
+        expected = pd.read_csv(self.csvStringIO).to_csv(index=False)
+        self.mockS3ServiceInstance.readFileStream.return_value = BytesIO(expected.encode('utf8'))
+        outputs = []
+        self.mockS3ServiceInstance.writeOutput.side_effect = lambda data, fileName: outputs.append(b''.join(data))
+
+        with redirect_stdout(None):
+            self.ecsTask.run()
+
+        self.assertEqual(outputs, [expected.encode('utf8')])
+        self.ecsTask.s3.writeNextAppInput.assert_not_called()
+        self.ecsTask.s3.copyOutputToNextApp.assert_called_once_with(self.ecsTask.INFILE_NAME)
+        self.ecsTask.s3.moveFile.assert_called_once_with(self.ecsTask.INFILE_KEY, f'Done/{self.ecsTask.INFILE_NAME}')
+        self.ecsTask.nextAppFacade.run.assert_called_once_with(f'ToDo/{self.ecsTask.INFILE_NAME}')
+
+    def test_run_NextAppWaitsForWrite(self):
+        """Tests if EcsTask only runs the next app after the output is written to the next app's bucket."""
+        self._instantiateEcsTask()
+        order = []
+        self.mockS3ServiceInstance.writeNextAppInput.side_effect = lambda data, fileName: order.append('writeNextAppInput')
+        self.ecsTask.nextAppFacade.run.side_effect = lambda key: order.append('runNextApp')
+
+        with redirect_stdout(None):
+            self.ecsTask.run()
+
+        self.assertEqual(order, ['writeNextAppInput', 'runNextApp'])
+
+    def test_run_WriteFails(self):
+        """Tests if EcsTask raises and does not run the next app when writing to the next app's bucket fails."""
+        self._instantiateEcsTask()
+        self.mockS3ServiceInstance.writeNextAppInput.side_effect = RuntimeError('write failed')
+
+        with redirect_stdout(None):
+            with self.assertRaises(RuntimeError):
+                self.ecsTask.run()
+
+        self.ecsTask.nextAppFacade.run.assert_not_called()
+
+    def test_run_MultipleFiles(self):
+        """Tests if EcsTask processes every key when INFILE is a JSON list of keys."""
+        self.testFileKey = '["InProgress/a.csv", "InProgress/b.csv"]'
+        self._instantiateEcsTask()
+        csvData = self.csvStringIO.getvalue()
+        self.mockS3ServiceInstance.readFile.side_effect = lambda key: StringIO(csvData)
+
+        with redirect_stdout(None):
+            self.ecsTask.run()
+
+        expected = pd.read_csv(StringIO(csvData)).to_csv(index=False).encode('utf8')
+        for name in ['a.csv', 'b.csv']:
+            self.ecsTask.s3.readFile.assert_any_call(f'InProgress/{name}')
+            self.ecsTask.s3.writeOutput.assert_any_call(expected, name)
+            self.ecsTask.s3.writeNextAppInput.assert_any_call(expected, name)
+            self.ecsTask.s3.moveFile.assert_any_call(f'InProgress/{name}', f'Done/{name}')
+            self.ecsTask.nextAppFacade.run.assert_any_call(f'ToDo/{name}')
+        self.assertEqual(self.ecsTask.nextAppFacade.run.call_count, 2)
+
+        self.testFileKey = 'bucket/key'
+
+    def test_run_MultipleFiles_NextAppBatch(self):
+        """Tests if EcsTask starts the next app on batches of outputs with NEXT_APP_BATCH_SIZE."""
+        self.testFileKey = '["InProgress/a.csv", "InProgress/b.csv", "InProgress/c.csv"]'
+        os.environ['NEXT_APP_BATCH_SIZE'] = '2'
+        self._instantiateEcsTask()
+        csvData = self.csvStringIO.getvalue()
+        self.mockS3ServiceInstance.readFile.side_effect = lambda key: StringIO(csvData)
+
+        with redirect_stdout(None):
+            self.ecsTask.run()
+
+        batches = [c.args[0] for c in self.ecsTask.nextAppFacade.runBatch.call_args_list]
+        self.assertEqual([len(batch) for batch in batches], [2, 1])
+        self.assertCountEqual([key for batch in batches for key in batch], ['ToDo/a.csv', 'ToDo/b.csv', 'ToDo/c.csv'])
+        self.ecsTask.nextAppFacade.run.assert_not_called()
+        self.assertIsNone(self.ecsTask.nextAppBatcher)
+
+        self.testFileKey = 'bucket/key'
+
+    def test_run_Prefix(self):
+        """Tests if EcsTask processes every file under INFILE when it is a prefix."""
+        self.testFileKey = 'InProgress/batch/'
+        self._instantiateEcsTask()
+        csvData = self.csvStringIO.getvalue()
+        self.mockS3ServiceInstance.readFile.side_effect = lambda key: StringIO(csvData)
+        self.mockS3ServiceInstance.listFiles.return_value = ['InProgress/batch/a.csv', 'InProgress/batch/b.csv']
+
+        with redirect_stdout(None):
+            self.ecsTask.run()
+
+        self.ecsTask.s3.listFiles.assert_called_once_with('InProgress/batch/')
+        self.ecsTask.s3.moveFile.assert_any_call('InProgress/batch/a.csv', 'Done/a.csv')
+        self.ecsTask.s3.moveFile.assert_any_call('InProgress/batch/b.csv', 'Done/b.csv')
+
+        self.testFileKey = 'bucket/key'
+
+    def test_run_MultipleFiles_OneFails(self):
+        """Tests if EcsTask keeps processing the other files when one fails, then raises."""
+        self.testFileKey = '["InProgress/a.csv", "InProgress/empty.csv"]'
+        os.environ['MAX_CONCURRENT_FILES'] = '2'
+        self._instantiateEcsTask()
+        csvData = self.csvStringIO.getvalue()
+        self.mockS3ServiceInstance.readFile.side_effect = lambda key: StringIO('' if 'empty' in key else csvData)
+
+        with redirect_stdout(None):
+            with self.assertRaises(RuntimeError) as context:
+                self.ecsTask.run()
+
+        self.assertIsInstance(context.exception.__cause__, pd.errors.EmptyDataError)
+        self.ecsTask.s3.moveFile.assert_called_once_with('InProgress/a.csv', 'Done/a.csv')
+        self.ecsTask.nextAppFacade.run.assert_called_once_with('ToDo/a.csv')
+
+        self.testFileKey = 'bucket/key'
+        os.environ.pop('MAX_CONCURRENT_FILES')
+
+    def test_run_OutputFormat(self):
+        """Tests if EcsTask converts the output to OUTPUT_FORMAT and renames it to match."""
+        self.testFileKey = 'InProgress/hints.csv'
+        os.environ['OUTPUT_FORMAT'] = 'parquet'
+        os.environ['COLUMNS'] = 'ark, score'
+        self._instantiateEcsTask()
+        expected = pd.read_csv(self.csvStringIO)[['ark', 'score']]
+        self.csvStringIO.seek(0)
+
+        with redirect_stdout(None):
+            self.ecsTask.run()
+
+        outData, outName = self.ecsTask.s3.writeOutput.call_args.args
+        self.assertEqual(outName, 'hints.parquet')
+        pd.testing.assert_frame_equal(pd.read_parquet(BytesIO(outData)), expected)
+        self.ecsTask.s3.writeNextAppInput.assert_called_once_with(outData, 'hints.parquet')
+        self.ecsTask.s3.moveFile.assert_called_once_with('InProgress/hints.csv', 'Done/hints.csv')
+        self.ecsTask.nextAppFacade.run.assert_called_once_with('ToDo/hints.parquet')
+
+        self.testFileKey = 'bucket/key'
+
+    def test_run_CompressedInput(self):
+        """Tests if EcsTask decompresses an input file whose Content-Encoding is zstd."""
+        self.testFileKey = 'InProgress/hints.csv'
+        self._instantiateEcsTask()
+        expected = pd.read_csv(self.csvStringIO).to_csv(index=False).encode('utf8')
+        self.mockS3ServiceInstance.getContentEncoding.return_value = 'zstd'
+        self.mockS3ServiceInstance.readFileStream.return_value = BytesIO(zstandard.ZstdCompressor().compress(expected))
+
+        with redirect_stdout(None):
+            self.ecsTask.run()
+
+        self.ecsTask.s3.getContentEncoding.assert_called_once_with('InProgress/hints.csv')
+        self.ecsTask.s3.readFile.assert_not_called()
+        self.ecsTask.s3.writeOutput.assert_called_once_with(expected, 'hints.csv')
+
+        self.testFileKey = 'bucket/key'
+
+    def test_run_CompressedOutput(self):
+        """Tests if EcsTask compresses the output with OUTPUT_FORMAT and labels its Content-Type and Content-Encoding."""
+        self.testFileKey = 'InProgress/hints.csv'
+        os.environ['OUTPUT_FORMAT'] = 'csv.zst'
+        self._instantiateEcsTask()
+        expected = pd.read_csv(self.csvStringIO).to_csv(index=False).encode('utf8')
+        self.csvStringIO.seek(0)
+
+        with redirect_stdout(None):
+            self.ecsTask.run()
+
+        outData, outName = self.ecsTask.s3.writeOutput.call_args.args
+        extraArgs = {'ContentType': 'text/csv', 'ContentEncoding': 'zstd'}
+        self.assertEqual(outName, 'hints.csv.zst')
+        self.assertEqual(self.ecsTask.s3.writeOutput.call_args.kwargs, {'extraArgs': extraArgs})
+        self.assertEqual(zstandard.ZstdDecompressor().decompressobj().decompress(outData), expected)
+        self.ecsTask.s3.writeNextAppInput.assert_called_once_with(outData, 'hints.csv.zst', extraArgs=extraArgs)
+        self.ecsTask.nextAppFacade.run.assert_called_once_with('ToDo/hints.csv.zst')
+
+        self.testFileKey = 'bucket/key'
+
+    def _useLocalManifestStore(self) -> LocalManifestStore:
+        """Helper function to hand outputs off through manifests in a temporary directory."""
+        tempDir = tempfile.TemporaryDirectory()
+        self.addCleanup(tempDir.cleanup)
+        self.ecsTask.manifestStore = LocalManifestStore(tempDir.name)
+        return self.ecsTask.manifestStore
+
+    def test_run_ManifestHandoff(self):
+        """Tests if EcsTask writes a manifest of the output instead of calling the next app with NEXT_APP_HANDOFF."""
+        self.testFileKey = 'InProgress/hints.csv'
+        os.environ['NEXT_APP_HANDOFF'] = 'manifest'
+        self._instantiateEcsTask()
+        manifestStore = self._useLocalManifestStore()
+        expected = pd.read_csv(self.csvStringIO)
+        self.csvStringIO.seek(0)
+
+        with redirect_stdout(None):
+            self.ecsTask.run()
+
+        outData = self.ecsTask.s3.writeNextAppInput.call_args.args[0]
+        [manifest] = manifestStore.list()
+        self.assertEqual(manifest['key'], 'ToDo/hints.csv')
+        self.assertEqual(manifest['sourceKey'], 'InProgress/hints.csv')
+        self.assertEqual(manifest['rows'], len(expected))
+        self.assertEqual(manifest['size'], len(outData))
+        self.assertEqual(manifest['sha256'], hashlib.sha256(outData).hexdigest())
+        self.assertEqual([column['name'] for column in manifest['schema']], list(expected.columns))
+        self.ecsTask.nextAppFacade.run.assert_not_called()
+
+        self.testFileKey = 'bucket/key'
+
+    def test_run_ManifestHandoff_Streaming(self):
+        """Tests if the manifest of a streamed output describes the bytes uploaded."""
+        os.environ['NEXT_APP_HANDOFF'] = 'manifest'
+        os.environ['CHUNK_SIZE'] = '2'
+        os.environ['OUTPUT_FORMAT'] = 'csv.zst'
+        self._instantiateEcsTask()
+        manifestStore = self._useLocalManifestStore()
+        self.mockS3ServiceInstance.readFileStream.return_value = BytesIO(self.csvStringIO.getvalue().encode('utf8'))
+        uploads = []
+        self.mockS3ServiceInstance.writeNextAppInput.side_effect = lambda data, fileName, **kwargs: uploads.append(data.read())
+
+        with redirect_stdout(None):
+            self.ecsTask.run()
+
+        [manifest] = manifestStore.list()
+        self.assertEqual(manifest['rows'], len(pd.read_csv(self.csvStringIO)))
+        self.assertEqual(manifest['sha256'], hashlib.sha256(uploads[0]).hexdigest())
+        self.assertEqual(manifest['contentEncoding'], 'zstd')
+        self.ecsTask.nextAppFacade.run.assert_not_called()
+
+    def test_constructor_invalidHandoff(self):
+        """Tests if EcsTask rejects an unknown NEXT_APP_HANDOFF."""
+        os.environ['NEXT_APP_HANDOFF'] = 'email'
+
+        with self.assertRaises(ValueError):
+            self._instantiateEcsTask()
+
+    def test_run_HintSchema(self):
+        """Tests if EcsTask loads hints with HINT_SCHEMA and writes the same CSV it would without it."""
+        os.environ['HINT_SCHEMA'] = 'true'
+        self._instantiateEcsTask()
+        expected = pd.read_csv(self.csvStringIO)
+        self.csvStringIO.seek(0)
+
+        with redirect_stdout(None):
+            self.ecsTask.run()
+
+        outData = self.ecsTask.s3.writeOutput.call_args.args[0]
+        df = pd.read_csv(BytesIO(outData))
+        pd.testing.assert_frame_equal(df, expected)
+        pd.testing.assert_frame_equal(
+            pd.read_csv(BytesIO(outData), dtype=str)[['latitude', 'longitude']],
+            pd.read_csv(StringIO(self.csvStringIO.getvalue()), dtype=str)[['latitude', 'longitude']]
+        )
+
+    def test_run_HintSchema_parseCoordinates(self):
+        """Tests if EcsTask parses coordinates as numbers with HINT_SCHEMA and PARSE_COORDINATES."""
+        os.environ['HINT_SCHEMA'] = 'true'
+        os.environ['PARSE_COORDINATES'] = 'true'
+        self._instantiateEcsTask()
+        expected = pd.read_csv(self.csvStringIO, dtype={'latitude': str, 'longitude': str})
+        self.csvStringIO.seek(0)
+
+        with redirect_stdout(None):
+            self.ecsTask.run()
+
+        self.assertTrue(self.ecsTask.schema.parseCoordinates)
+        df = pd.read_csv(BytesIO(self.ecsTask.s3.writeOutput.call_args.args[0]))
+        for column in ['latitude', 'longitude']:
+            self.assertTrue(pd.api.types.is_float_dtype(df[column]))
+            pd.testing.assert_series_equal(df[column], expected[column].str.lstrip("'").astype(float), check_exact=False, atol=1e-4)
+
+    def _runSharded(self, data: bytes) -> list[bytes]:
+        """Helper function to run EcsTask in parallel mode on some CSV data, with threads standing in for processes."""
+        self.mockS3ServiceInstance.getFileSize.return_value = len(data)
+        self.mockS3ServiceInstance.readFileRange.side_effect = lambda key, start, end: data[start:end + 1]
+        outputs = []
+        self.mockS3ServiceInstance.writeOutput.side_effect = lambda outData, fileName, **kwargs: outputs.append(outData.read())
+        ShardWorker.task = self.ecsTask
+
+        with patch.object(EcsTask, 'MIN_SHARD_SIZE', 100), \
+             patch.object(self.ecsTask, '_createShardExecutor', return_value=ThreadPoolExecutor(max_workers=2)):
+            with redirect_stdout(None):
+                self.ecsTask.run()
+        return outputs
+
+    def test_run_Parallel(self):
+        """Tests if EcsTask splits a CSV input into shards with PARALLEL_WORKERS and joins their outputs in order."""
+        os.environ['PARALLEL_WORKERS'] = '2'
+        self._instantiateEcsTask()
+        data = self.csvStringIO.getvalue().encode('utf8')
+
+        outputs = self._runSharded(data)
+
+        self.assertEqual(outputs, [data])
+        self.ecsTask.s3.readFile.assert_not_called()
+        self.assertGreater(self.ecsTask.s3.readFileRange.call_count, 2)
+        self.ecsTask.nextAppFacade.run.assert_called_once_with(f'ToDo/{self.ecsTask.INFILE_NAME}')
+
+    def test_run_Parallel_GzipOutput(self):
+        """Tests if shards written as gzip CSV join into one readable file with a single header."""
+        os.environ['PARALLEL_WORKERS'] = '2'
+        os.environ['OUTPUT_FORMAT'] = 'csv.gz'
+        self._instantiateEcsTask()
+        data = self.csvStringIO.getvalue().encode('utf8')
+
+        outputs = self._runSharded(data)
+
+        pd.testing.assert_frame_equal(pd.read_csv(BytesIO(outputs[0]), compression='gzip'), pd.read_csv(BytesIO(data)))
+
+    def test_run_Parallel_ZstdOutput(self):
+        """Tests if shards written as zstd CSV join into one readable file."""
+        os.environ['PARALLEL_WORKERS'] = '2'
+        os.environ['OUTPUT_FORMAT'] = 'csv.zst'
+        self._instantiateEcsTask()
+        data = self.csvStringIO.getvalue().encode('utf8')
+
+        outputs = self._runSharded(data)
+
+        with zstandard.ZstdDecompressor().stream_reader(BytesIO(outputs[0]), read_across_frames=True) as reader:
+            self.assertEqual(reader.read(), data)
+        self.assertGreater(self.ecsTask.s3.readFileRange.call_count, 2)
+
+    def test_run_Parallel_ManifestHandoff(self):
+        """Tests if the manifest of a sharded output counts every shard's rows and checksums the joined output."""
+        os.environ['PARALLEL_WORKERS'] = '2'
+        os.environ['NEXT_APP_HANDOFF'] = 'manifest'
+        self._instantiateEcsTask()
+        manifestStore = self._useLocalManifestStore()
+        data = self.csvStringIO.getvalue().encode('utf8')
+
+        outputs = self._runSharded(data)
+
+        [manifest] = manifestStore.list()
+        self.assertEqual(manifest['rows'], len(pd.read_csv(BytesIO(data))))
+        self.assertEqual(manifest['sha256'], hashlib.sha256(outputs[0]).hexdigest())
+        self.assertTrue(manifest['schema'])
+
+    def test_run_Parallel_SmallFile(self):
+        """Tests if EcsTask processes a file too small for two shards in one piece."""
+        os.environ['PARALLEL_WORKERS'] = '2'
+        self._instantiateEcsTask()
+        self.mockS3ServiceInstance.getFileSize.return_value = 10
+
+        with redirect_stdout(None):
+            self.ecsTask.run()
+
+        self.ecsTask.s3.readFileRange.assert_not_called()
+        self.ecsTask.s3.readFile.assert_called_once()
+
+    def _useFakeCheckpoints(self, data: bytes) -> dict:
+        """Helper function to keep checkpoints and output uploads in memory, with CSV data as the input file."""
+        s3 = {'checkpoints': {}, 'uploads': {}, 'outputs': {}, 'aborted': []}
+        def createOutputUpload(fileName, extraArgs=None):
+            uploadId = f'upload-{len(s3["uploads"]) + 1}'
+            s3['uploads'][uploadId] = {}
+            return uploadId
+        def uploadOutputPart(fileName, uploadId, partNumber, body):
+            s3['uploads'][uploadId][partNumber] = body
+            return {'PartNumber': partNumber, 'ETag': f'etag-{partNumber}'}
+        def completeOutputUpload(fileName, uploadId, parts):
+            upload = s3['uploads'].pop(uploadId)
+            s3['outputs'][fileName] = b''.join(upload[part['PartNumber']] for part in parts)
+        mock = self.mockS3ServiceInstance
+        mock.uploadPartSize = 1
+        mock.getFileSize.return_value = len(data)
+        mock.readFileRange.side_effect = lambda key, start, end: data[start:end + 1]
+        mock.getETag.return_value = '"test-etag"'
+        mock.readCheckpoint.side_effect = lambda key: s3['checkpoints'].get(key)
+        mock.writeCheckpoint.side_effect = lambda key, checkpoint: s3['checkpoints'].__setitem__(key, checkpoint)
+        mock.deleteCheckpoint.side_effect = lambda key: s3['checkpoints'].pop(key)
+        mock.createOutputUpload.side_effect = createOutputUpload
+        mock.uploadOutputPart.side_effect = uploadOutputPart
+        mock.completeOutputUpload.side_effect = completeOutputUpload
+        mock.hasOutputUpload.side_effect = lambda fileName, uploadId: uploadId in s3['uploads']
+        mock.abortOutputUpload.side_effect = lambda fileName, uploadId: s3['aborted'].append(uploadId)
+        mock.readFileStream.side_effect = lambda key: Mock(iter_chunks=lambda: iter([s3['outputs'][key.split('/')[-1]]]))
+        ShardWorker.task = self.ecsTask
+        return s3
+
+    def _runCheckpointed(self) -> list[int]:
+        """Helper function to run EcsTask in checkpointed mode, returning the indexes of the shards it processed."""
+        processShard = self.ecsTask.processShard
+        processed = []
+        def recordShard(key, shard):
+            processed.append(shard.index)
+            return processShard(key, shard)
+
+        with patch.object(EcsTask, 'MIN_SHARD_SIZE', 100), \
+             patch.object(self.ecsTask, 'processShard', side_effect=recordShard), \
+             patch.object(self.ecsTask, '_createShardExecutor', side_effect=lambda key: ThreadPoolExecutor(max_workers=1)):
+            with redirect_stdout(None):
+                self.ecsTask.run()
+        return processed
+
+    def test_run_Checkpoints(self):
+        """Tests if EcsTask uploads a sharded output part by part with CHECKPOINTS, and deletes its checkpoint once done."""
+        os.environ['PARALLEL_WORKERS'] = '4'
+        os.environ['CHECKPOINTS'] = 'true'
+        self._instantiateEcsTask()
+        data = self.csvStringIO.getvalue().encode('utf8')
+        s3 = self._useFakeCheckpoints(data)
+
+        processed = self._runCheckpointed()
+
+        self.assertEqual(processed, [0, 1, 2, 3])
+        self.assertEqual(s3['outputs'], {self.ecsTask.INFILE_NAME: data})
+        self.assertEqual(s3['checkpoints'], {})
+        self.assertGreater(self.ecsTask.s3.writeCheckpoint.call_count, 2)
+        self.ecsTask.s3.writeOutput.assert_not_called()
+        self.ecsTask.s3.copyOutputToNextApp.assert_called_once_with(self.ecsTask.INFILE_NAME)
+        self.ecsTask.nextAppFacade.run.assert_called_once_with(f'ToDo/{self.ecsTask.INFILE_NAME}')
+
+    def test_run_Checkpoints_Resume(self):
+        """Tests if a rerun of EcsTask after a failed part skips the shards already uploaded and finishes the same upload."""
+        os.environ['PARALLEL_WORKERS'] = '4'
+        os.environ['CHECKPOINTS'] = 'true'
+        self._instantiateEcsTask()
+        data = self.csvStringIO.getvalue().encode('utf8')
+        s3 = self._useFakeCheckpoints(data)
+        uploadOutputPart = self.mockS3ServiceInstance.uploadOutputPart.side_effect
+        def failSecondPart(fileName, uploadId, partNumber, body):
+            if partNumber == 2:
+                raise RuntimeError('task stopped')
+            return uploadOutputPart(fileName, uploadId, partNumber, body)
+        self.mockS3ServiceInstance.uploadOutputPart.side_effect = failSecondPart
+        with self.assertRaises(RuntimeError):
+            self._runCheckpointed()
+        self.mockS3ServiceInstance.uploadOutputPart.side_effect = uploadOutputPart
+        nextShard = json.loads(s3['checkpoints'][self.testFileKey])['nextShard']
+
+        processed = self._runCheckpointed()
+
+        self.assertGreater(nextShard, 0)
+        self.assertEqual(processed, list(range(nextShard, 4)))
+        self.assertEqual(s3['outputs'], {self.ecsTask.INFILE_NAME: data})
+        self.ecsTask.s3.createOutputUpload.assert_called_once()
+        self.assertEqual(s3['checkpoints'], {})
+
+    def test_run_Checkpoints_AlreadyComplete(self):
+        """Tests if a rerun of EcsTask after its output was completed only retries the steps after it."""
+        os.environ['PARALLEL_WORKERS'] = '4'
+        os.environ['CHECKPOINTS'] = 'true'
+        os.environ['NEXT_APP_HANDOFF'] = 'manifest'
+        self._instantiateEcsTask()
+        manifestStore = self._useLocalManifestStore()
+        data = self.csvStringIO.getvalue().encode('utf8')
+        s3 = self._useFakeCheckpoints(data)
+        self.mockS3ServiceInstance.moveFile.side_effect = [RuntimeError('move failed'), None]
+        with self.assertRaises(RuntimeError):
+            self._runCheckpointed()
+
+        processed = self._runCheckpointed()
+
+        self.assertEqual(processed, [])
+        self.assertEqual(s3['outputs'], {self.ecsTask.INFILE_NAME: data})
+        self.assertEqual(s3['checkpoints'], {})
+        [manifest] = manifestStore.list()
+        self.assertEqual(manifest['rows'], len(pd.read_csv(BytesIO(data))))
+        self.assertEqual(manifest['size'], len(data))
+        self.assertEqual(manifest['sha256'], hashlib.sha256(data).hexdigest())
+        self.assertTrue(manifest['schema'])
+
+    def test_run_Checkpoints_InputChanged(self):
+        """Tests if EcsTask starts over, aborting the old upload, when the input file changed since its checkpoint."""
+        os.environ['PARALLEL_WORKERS'] = '4'
+        os.environ['CHECKPOINTS'] = 'true'
+        self._instantiateEcsTask()
+        data = self.csvStringIO.getvalue().encode('utf8')
+        s3 = self._useFakeCheckpoints(data)
+        s3['uploads']['upload-0'] = {1: b'stale'}
+        s3['checkpoints'][self.testFileKey] = Checkpoint(
+            self.testFileKey, '"old-etag"', self.ecsTask.INFILE_NAME, 4, 'upload-0', [{'PartNumber': 1, 'ETag': 'etag-1'}], nextShard=2
+        ).toJson()
+
+        processed = self._runCheckpointed()
+
+        self.assertEqual(processed, [0, 1, 2, 3])
+        self.assertEqual(s3['aborted'], ['upload-0'])
+        self.assertEqual(s3['outputs'], {self.ecsTask.INFILE_NAME: data})
+
+    def test_run_SpoolOutput(self):
+        """Tests if EcsTask stages output larger than SPOOL_THRESHOLD_MB on disk and uploads it from there."""
+        os.environ['SPOOL_THRESHOLD_MB'] = '1'
+        self._instantiateEcsTask()
+        expected = pd.read_csv(self.csvStringIO).to_csv(index=False).encode('utf8')
+        self.csvStringIO.seek(0)
+        self.ecsTask.SPOOL_THRESHOLD = 100
+        outputs = {}
+        def captureOutput(name):
+            def capture(data, fileName):
+                outputs[name] = data.read()
+            return capture
+        self.mockS3ServiceInstance.writeOutput.side_effect = captureOutput('output')
+        self.mockS3ServiceInstance.writeNextAppInput.side_effect = captureOutput('nextApp')
+
+        with patch.object(EcsTask, 'STAGING_CHUNK_SIZE', 2):
+            with redirect_stdout(None):
+                self.ecsTask.run()
+
+        self.assertEqual(outputs, {'output': expected, 'nextApp': expected})
+
+    def test_run_SpoolOutput_Small(self):
+        """Tests if EcsTask keeps output under SPOOL_THRESHOLD_MB in memory."""
+        os.environ['SPOOL_THRESHOLD_MB'] = '1'
+        self._instantiateEcsTask()
+        expected = pd.read_csv(self.csvStringIO).to_csv(index=False).encode('utf8')
+        self.csvStringIO.seek(0)
+
+        with redirect_stdout(None):
+            self.ecsTask.run()
+
+        self.ecsTask.s3.writeOutput.assert_called_once_with(expected, self.ecsTask.INFILE_NAME)
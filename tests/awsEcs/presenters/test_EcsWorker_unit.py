@@ -0,0 +1,124 @@
+import os
+import threading
+import time
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import Mock
+
+from awsEcs.presenters.EcsWorker import EcsWorker
+from common.models.EnvVar import EnvVar
+from common.models.services.LocalJobQueue import LocalJobQueue
+
+class TestEcsWorkerUnit(unittest.TestCase):
+    """Unit tests for EcsWorker."""
+
+    def setUp(self):
+        """Sets up the test case."""
+        os.environ.update({'WORKER_CONCURRENCY': '2', 'VISIBILITY_TIMEOUT': '60', 'SHUTDOWN_TIMEOUT': '5'})
+        self.jobQueue = LocalJobQueue()
+        self.ran = []
+        self.lock = threading.Lock()
+        self.worker = EcsWorker(self.jobQueue, self._createTask)
+        self.worker.WAIT_SECONDS = 0.05
+        self.taskSeconds = 0
+        self.running = 0
+        self.maxRunning = 0
+
+    def tearDown(self):
+        """Tears down the test case."""
+        for key in ['WORKER_CONCURRENCY', 'VISIBILITY_TIMEOUT', 'SHUTDOWN_TIMEOUT']:
+            os.environ.pop(key, None)
+        EnvVar.delete()
+
+    def _createTask(self, infile):
+        """Creates a mock EcsTask that records the input file it ran, and fails for keys containing "bad"."""
+        def run():
+            with self.lock:
+                self.running += 1
+                self.maxRunning = max(self.maxRunning, self.running)
+            time.sleep(self.taskSeconds)
+            with self.lock:
+                self.running -= 1
+                self.ran.append(infile)
+            if 'bad' in infile:
+                raise RuntimeError('task failed')
+        task = Mock()
+        task.run.side_effect = run
+        return task
+
+    def _runUntil(self, condition, timeout=5):
+        """Runs the worker on a thread until the condition holds, then stops it."""
+        thread = threading.Thread(target=self.worker.run)
+        with redirect_stdout(None):
+            thread.start()
+            deadline = time.monotonic() + timeout
+            while not condition() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.worker.stop()
+            thread.join(timeout)
+        self.assertFalse(thread.is_alive())
+
+    def test_run(self):
+        """Tests if the worker runs a task for every job and deletes the jobs that succeeded."""
+        # Arrange
+        for key in ['a', 'bad', 'c']:
+            self.jobQueue.send({'inputFile': key})
+
+        # Act
+        self._runUntil(lambda: len(self.ran) == 3)
+
+        # Assert
+        self.assertEqual(['a', 'bad', 'c'], sorted(self.ran))
+        self.assertEqual(2, self.worker.processed)
+        self.assertEqual(1, self.worker.failed)
+        self.assertEqual(1, len(self.jobQueue))
+
+    def test_run_boundedConcurrency(self):
+        """Tests if the worker runs at most WORKER_CONCURRENCY jobs at once."""
+        # Arrange
+        self.taskSeconds = 0.05
+        for i in range(6):
+            self.jobQueue.send({'inputFile': str(i)})
+
+        # Act
+        self._runUntil(lambda: len(self.ran) == 6)
+
+        # Assert
+        self.assertEqual(2, self.maxRunning)
+        self.assertEqual(0, len(self.jobQueue))
+
+    def test_run_extendsVisibility(self):
+        """Tests if a long job's visibility is extended so it isn't received twice."""
+        # Arrange
+        self.worker.visibilityTimeout = 0.3
+        self.taskSeconds = 0.8
+        self.jobQueue.send({'inputFile': 'a'})
+
+        # Act
+        self._runUntil(lambda: len(self.ran) == 1)
+
+        # Assert
+        self.assertEqual(['a'], self.ran)
+        self.assertEqual(1, self.maxRunning)
+        self.assertEqual(0, len(self.jobQueue))
+
+    def test_stop_keepsUnfinishedJobsHidden(self):
+        """Tests if a job still running after the shutdown timeout stays hidden while it runs, and is deleted when it finishes."""
+        # Arrange
+        self.worker.visibilityTimeout = 0.3
+        self.worker.shutdownTimeout = 0.05
+        self.taskSeconds = 1
+        self.jobQueue.send({'inputFile': 'a'})
+
+        # Act
+        self._runUntil(lambda: self.running == 1)
+        time.sleep(0.6)
+        receivedWhileRunning = self.jobQueue.receive(1, 0, 60)
+        deadline = time.monotonic() + 5
+        while len(self.jobQueue) and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        # Assert
+        self.assertEqual([], receivedWhileRunning)
+        self.assertEqual(['a'], self.ran)
+        self.assertEqual(0, len(self.jobQueue))
@@ -0,0 +1,61 @@
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+
+import pandas as pd
+
+from awsEcs.models.stages.DedupeStage import DedupeStage
+from awsEcs.models.stages.FilterStage import FilterStage
+from awsEcs.models.stages.FunctionStage import FunctionStage
+from awsEcs.presenters.HintPipeline import HintPipeline
+
+class TestHintPipelineUnit(unittest.TestCase):
+    """Unit tests for HintPipeline."""
+
+    TEST_FILE = 'tests/common/testData/CompletedHints.csv'
+
+    def setUp(self):
+        """Sets up the test case."""
+        self.df = pd.read_csv(self.TEST_FILE)
+        self.df = pd.concat([self.df, self.df], ignore_index=True)
+        self.pipeline = HintPipeline([
+            FilterStage(lambda df: df['score'] > 1),
+            DedupeStage(),
+            FunctionStage('select', lambda df: df[['ark', 'pid', 'score']])
+        ])
+
+    def test_run(self):
+        """Tests if run passes the data through every stage in order and times them."""
+        expected = self.df[self.df['score'] > 1].drop_duplicates(['ark', 'pid'])[['ark', 'pid', 'score']]
+
+        df = self.pipeline.run(self.df)
+
+        pd.testing.assert_frame_equal(df, expected)
+        self.assertEqual(list(self.pipeline.timings), ['filter', 'dedupe', 'select'])
+        self.assertEqual((self.pipeline.rowsIn, self.pipeline.rowsOut), (len(self.df), len(expected)))
+
+    def test_iterRun(self):
+        """Tests if iterRun gives the same result in chunks as run does on the whole data."""
+        expected = HintPipeline(self.pipeline.stages[:1] + [DedupeStage()] + self.pipeline.stages[2:]).run(self.df)
+
+        chunks = list(self.pipeline.iterRun(self.df[i:i + 3] for i in range(0, len(self.df), 3)))
+
+        pd.testing.assert_frame_equal(pd.concat(chunks), expected)
+        self.assertEqual(self.pipeline.rowsOut, len(expected))
+
+    def test_constructor_duplicateNames(self):
+        """Tests if stages with the same name are rejected."""
+        with self.assertRaises(ValueError):
+            HintPipeline([DedupeStage(), DedupeStage()])
+
+    def test_printTimings(self):
+        """Tests if printTimings prints every stage, and nothing when there are no stages."""
+        self.pipeline.run(self.df)
+        output = StringIO()
+
+        with redirect_stdout(output):
+            self.pipeline.printTimings()
+            HintPipeline([]).printTimings()
+
+        lines = output.getvalue().splitlines()
+        self.assertEqual([line.split(':')[0].strip() for line in lines[1:]], ['filter', 'dedupe', 'select', 'total'])
@@ -1,3 +1,4 @@
+import json
 from contextlib import redirect_stdout
 from unittest import TestCase
 from unittest.mock import patch
@@ -5,6 +6,7 @@ from unittest.mock import patch
 from botocore.exceptions import ClientError
 
 from awsLambda.presenters.EcsPresenter import EcsPresenter
+from common.models.services.BugReporterFacade import BugReporterFacade
 
 class TestEcsPresenterUnit(TestCase):
     """Unit tests the Lambda EcsPresenter class."""
@@ -14,21 +16,28 @@ class TestEcsPresenterUnit(TestCase):
         patcher = patch('awsLambda.presenters.EcsPresenter.S3Service')
         self.addCleanup(patcher.stop)
         mockS3Service = patcher.start()
+        self.mockS3 = mockS3Service.return_value
+        self.mockS3.moveFiles.side_effect = lambda keys: ({key: None for key in keys}, {'copy': 0.0, 'delete': 0.0})
 
-        patcher = patch('awsLambda.presenters.EcsPresenter.boto3.client')
+        patcher = patch('awsLambda.presenters.EcsPresenter.AwsSession')
         self.addCleanup(patcher.stop)
-        self.mockBoto3Client = patcher.start()
+        mockAwsSession = patcher.start()
+        self.mockGetClient = mockAwsSession.return_value.getClient
 
-        patcher = patch('awsLambda.presenters.EcsPresenter.ParameterService')
+        patcher = patch('awsLambda.presenters.EcsPresenter.BugReporterFacade')
         self.addCleanup(patcher.stop)
-        mockParameterService = patcher.start()
+        self.mockBugReporterFacade = patcher.start()
+        self.mockBugReporterFacade.describeError.return_value = ('title', 'description')
 
-        self.mockBoto3Client.return_value.list_task_definitions.return_value = {'taskDefinitionArns': ['1', '2', '3']}
-        self.mockBoto3Client.return_value.describe_security_groups.return_value = {'SecurityGroups': [{'GroupId': '123'}]}
+        self.mockGetClient.return_value.list_task_definitions.return_value = {'taskDefinitionArns': ['1', '2', '3']}
+        self.mockGetClient.return_value.describe_security_groups.return_value = {'SecurityGroups': [{'GroupId': '123'}]}
+
+        EcsPresenter.taskDefinitionCache.invalidate()
+        EcsPresenter.securityGroupCache.invalidate()
 
         self.key = 'key'
-        event = {'body': '{\"inputFile\": \"key\"}'}
-        self.ecsPresenter = EcsPresenter(event, True)
+        self.event = {'body': '{\"inputFile\": \"key\"}'}
+        self.ecsPresenter = EcsPresenter(self.event, True)
 
     def test_run(self):
         """Tests if the run method calls the correct client methods and returns correct values."""
@@ -38,15 +47,16 @@ class TestEcsPresenterUnit(TestCase):
         self.assertEqual(200, statusCode)
         self.assertEqual(expectedResponse, response)
 
-        self.mockBoto3Client.return_value.list_task_definitions.assert_called_once()
-        self.mockBoto3Client.return_value.describe_security_groups.assert_called_once()
-        self.mockBoto3Client.return_value.run_task.assert_called_once()
+        self.mockGetClient.return_value.list_task_definitions.assert_called_once()
+        self.mockGetClient.return_value.describe_security_groups.assert_called_once()
+        self.mockGetClient.return_value.run_task.assert_called_once()
+        self.mockBugReporterFacade.report.assert_not_called()
     
     def test_run_KeyError(self):
         """Tests if run method correctly handles KeyError."""
         expectedResponse = {'error': 'No infile key provided in request body.'}
 
-        self.mockBoto3Client.return_value.run_task.side_effect = KeyError()
+        self.mockGetClient.return_value.run_task.side_effect = KeyError()
         with redirect_stdout(None):
             statusCode, response = self.ecsPresenter.run()
         self.assertEqual(400, statusCode)
@@ -58,7 +68,7 @@ class TestEcsPresenterUnit(TestCase):
 
         error_response = {'Error': {'Code': 'InvalidArgument'}}
         operation_name = 'test-operation-name'
-        self.mockBoto3Client.return_value.run_task.side_effect = FileNotFoundError(error_response, operation_name)
+        self.mockGetClient.return_value.run_task.side_effect = FileNotFoundError(error_response, operation_name)
 
         with redirect_stdout(None):
             statusCode, response = self.ecsPresenter.run()
@@ -69,7 +79,7 @@ class TestEcsPresenterUnit(TestCase):
         """Tests if run method correctly handles ClientError with existing file."""
         expectedResponse = {'error': 'Internal Server Error'}
 
-        self.mockBoto3Client.return_value.run_task.side_effect = ClientError
+        self.mockGetClient.return_value.run_task.side_effect = ClientError
 
         with redirect_stdout(None):
             statusCode, response = self.ecsPresenter.run()
@@ -80,9 +90,191 @@ class TestEcsPresenterUnit(TestCase):
         """Tests if run method correctly handles other kinds of Exceptions."""
         expectedResponse = {'error': 'Internal Server Error'}
 
-        self.mockBoto3Client.return_value.run_task.side_effect = RuntimeError
+        self.mockGetClient.return_value.run_task.side_effect = RuntimeError
 
         with redirect_stdout(None):
             statusCode, response = self.ecsPresenter.run()
         self.assertEqual(500, statusCode)
         self.assertEqual(expectedResponse, response)
+        self.mockBugReporterFacade.report.assert_called_once()
+
+    def test_run_cachesTaskConfig(self):
+        """Tests if the task definition ARN and security group ID are reused by later presenters."""
+        with redirect_stdout(None):
+            self.ecsPresenter.run()
+            statusCode, response = EcsPresenter(self.event, True).run()
+
+        self.assertEqual(200, statusCode)
+        self.mockGetClient.return_value.list_task_definitions.assert_called_once()
+        self.mockGetClient.return_value.describe_security_groups.assert_called_once()
+        self.assertEqual(2, self.mockGetClient.return_value.run_task.call_count)
+
+    def test_run_invalidTaskDefinition(self):
+        """Tests if a rejected cached task definition is dropped and run_task is retried with a fresh one."""
+        EcsPresenter.taskDefinitionCache.set(EcsPresenter.TASK_DEFINITION_FAMILY, 'stale-arn')
+        error = ClientError({'Error': {'Code': 'ClientException', 'Message': 'TaskDefinition is inactive'}}, 'RunTask')
+        self.mockGetClient.return_value.run_task.side_effect = [error, {}]
+
+        with redirect_stdout(None):
+            statusCode, response = self.ecsPresenter.run()
+
+        self.assertEqual(200, statusCode)
+        self.mockGetClient.return_value.list_task_definitions.assert_called_once()
+        taskDefinitions = [c.kwargs['taskDefinition'] for c in self.mockGetClient.return_value.run_task.call_args_list]
+        self.assertEqual(['stale-arn', '1'], taskDefinitions)
+
+    def test_run_otherClientErrorNotRetried(self):
+        """Tests if run_task errors unrelated to the cached values are not retried."""
+        error = ClientError({'Error': {'Code': 'AccessDeniedException', 'Message': 'Denied'}}, 'RunTask')
+        self.mockGetClient.return_value.run_task.side_effect = error
+
+        with redirect_stdout(None):
+            statusCode, response = self.ecsPresenter.run()
+
+        self.assertEqual(500, statusCode)
+        self.mockGetClient.return_value.run_task.assert_called_once()
+
+    def test_run_batch(self):
+        """Tests if a batch request starts one task per distinct input file."""
+        event = {'body': json.dumps({'inputFiles': ['ToDo/a.csv', 'ToDo/b.csv', 'ToDo/a.csv']})}
+
+        with redirect_stdout(None):
+            statusCode, response = EcsPresenter(event, True).run()
+
+        self.assertEqual(200, statusCode)
+        self.assertEqual({
+            'ToDo/a.csv': {'status': 'started', 'inputFile': 'InProgress/a.csv'},
+            'ToDo/b.csv': {'status': 'started', 'inputFile': 'InProgress/b.csv'}
+        }, response['results'])
+        self.assertEqual(2, self.mockGetClient.return_value.run_task.call_count)
+        self.mockS3.moveFiles.assert_called_once_with({'ToDo/a.csv': 'InProgress/a.csv', 'ToDo/b.csv': 'InProgress/b.csv'})
+        self.mockS3.moveFile.assert_not_called()
+        self.mockGetClient.return_value.list_task_definitions.assert_called_once()
+
+    def test_run_batchPrefix(self):
+        """Tests if a batch request with a prefix starts a task for each file under it."""
+        self.mockS3.listFiles.return_value = ['ToDo/a.csv', 'ToDo/b.csv']
+        event = {'body': json.dumps({'inputPrefix': 'ToDo/'})}
+
+        with redirect_stdout(None):
+            statusCode, response = EcsPresenter(event, True).run()
+
+        self.assertEqual(200, statusCode)
+        self.assertEqual(['ToDo/a.csv', 'ToDo/b.csv'], list(response['results']))
+        self.mockS3.listFiles.assert_called_once_with('ToDo/')
+
+    def test_run_batchPartialFailure(self):
+        """Tests if a batch request reports files that failed without stopping the others."""
+        self.mockS3.moveFiles.side_effect = lambda keys: (
+            {key: FileNotFoundError(key) if 'missing' in key else None for key in keys}, {'copy': 0.0, 'delete': 0.0}
+        )
+        event = {'body': json.dumps({'inputFiles': ['ToDo/a.csv', 'ToDo/missing.csv']})}
+
+        with redirect_stdout(None):
+            statusCode, response = EcsPresenter(event, True).run()
+
+        self.assertEqual(207, statusCode)
+        self.assertEqual('started', response['results']['ToDo/a.csv']['status'])
+        self.assertEqual({'status': 'failed', 'error': 'No file found for given infile key: ToDo/missing.csv'}, response['results']['ToDo/missing.csv'])
+        self.mockGetClient.return_value.run_task.assert_called_once()
+        self.mockBugReporterFacade.report.assert_called_once()
+
+    def test_run_batchPartialFailure_reportsError(self):
+        """Tests if a file that failed to move is reported without failing the files that moved."""
+        self.mockBugReporterFacade.describeError.side_effect = BugReporterFacade.describeError
+        def moveFiles(keys):
+            try:
+                raise FileNotFoundError('ToDo/missing.csv')
+            except FileNotFoundError as e:
+                error = e
+            return {'ToDo/a.csv': None, 'ToDo/missing.csv': error}, {'copy': 0.0, 'delete': 0.0}
+        self.mockS3.moveFiles.side_effect = moveFiles
+        event = {'body': json.dumps({'inputFiles': ['ToDo/a.csv', 'ToDo/missing.csv']})}
+
+        with redirect_stdout(None):
+            statusCode, response = EcsPresenter(event, True).run()
+
+        self.assertEqual(207, statusCode)
+        self.assertEqual({'status': 'started', 'inputFile': 'InProgress/a.csv'}, response['results']['ToDo/a.csv'])
+        self.mockGetClient.return_value.run_task.assert_called_once()
+        title, description = self.mockBugReporterFacade.report.call_args.args
+        self.assertIn('FileNotFoundError error with the moveFiles function', title)
+
+    def test_run_batchInvalid(self):
+        """Tests if batch requests without a usable list of files are rejected."""
+        for inputFiles in ['ToDo/a.csv', [], [1, 2]]:
+            with self.subTest(inputFiles=inputFiles):
+                event = {'body': json.dumps({'inputFiles': inputFiles})}
+
+                statusCode, response = EcsPresenter(event, True).run()
+
+                self.assertEqual(400, statusCode)
+                self.mockGetClient.return_value.run_task.assert_not_called()
+
+    def test_run_batchSameName(self):
+        """Tests if a batch file whose name is taken by an earlier file fails instead of being moved over it."""
+        self.mockS3.listFiles.return_value = ['ToDo/a/x.csv', 'ToDo/b/x.csv', 'ToDo/b/y.csv']
+        event = {'body': json.dumps({'inputPrefix': 'ToDo/'})}
+
+        with redirect_stdout(None):
+            statusCode, response = EcsPresenter(event, True).run()
+
+        self.assertEqual(207, statusCode)
+        self.mockS3.moveFiles.assert_called_once_with({'ToDo/a/x.csv': 'InProgress/x.csv', 'ToDo/b/y.csv': 'InProgress/y.csv'})
+        self.assertEqual({'status': 'started', 'inputFile': 'InProgress/x.csv'}, response['results']['ToDo/a/x.csv'])
+        self.assertEqual('failed', response['results']['ToDo/b/x.csv']['status'])
+        self.assertIn('ToDo/a/x.csv', response['results']['ToDo/b/x.csv']['error'])
+        self.assertEqual(2, self.mockGetClient.return_value.run_task.call_count)
+
+    def test_run_batchInvalidPrefix(self):
+        """Tests if batch requests for the whole bucket or the pipeline's own folders are rejected."""
+        for inputPrefix in ['', 'In', 'InProgress/', 'Done/2024/', 'Output/', 'Checkpoints/', None]:
+            with self.subTest(inputPrefix=inputPrefix):
+                event = {'body': json.dumps({'inputPrefix': inputPrefix})}
+
+                statusCode, response = EcsPresenter(event, True).run()
+
+                self.assertEqual(400, statusCode)
+                self.mockS3.listFiles.assert_not_called()
+                self.mockS3.moveFiles.assert_not_called()
+
+    def test_run_batchMoveFails(self):
+        """Tests if a batch request fails every file without starting tasks when moving them fails."""
+        self.mockS3.moveFiles.side_effect = ClientError({'Error': {'Code': 'AccessDenied'}}, 'ListObjectsV2')
+        event = {'body': json.dumps({'inputFiles': ['ToDo/a.csv', 'ToDo/b.csv']})}
+
+        with redirect_stdout(None):
+            statusCode, response = EcsPresenter(event, True).run()
+
+        self.assertEqual(500, statusCode)
+        self.assertTrue(all(result['status'] == 'failed' for result in response['results'].values()))
+        self.mockGetClient.return_value.run_task.assert_not_called()
+
+    def test_run_batchPacked(self):
+        """Tests if a batch request packs several files into each task when FILES_PER_TASK is set."""
+        event = {'body': json.dumps({'inputFiles': ['ToDo/a.csv', 'ToDo/b.csv', 'ToDo/c.csv']})}
+
+        with patch.dict('os.environ', {'FILES_PER_TASK': '2'}):
+            ecsPresenter = EcsPresenter(event, True)
+        with redirect_stdout(None):
+            statusCode, response = ecsPresenter.run()
+
+        self.assertEqual(200, statusCode)
+        infiles = sorted(
+            c.kwargs['overrides']['containerOverrides'][0]['environment'][0]['value']
+            for c in self.mockGetClient.return_value.run_task.call_args_list
+        )
+        self.assertEqual(['InProgress/c.csv', '["InProgress/a.csv", "InProgress/b.csv"]'], infiles)
+        self.assertTrue(all(result['status'] == 'started' for result in response['results'].values()))
+
+    def test_run_jobQueue(self):
+        """Tests if jobs are queued for the ECS workers instead of starting tasks when JOB_QUEUE_URL is set."""
+        with patch('awsLambda.presenters.EcsPresenter.SqsJobQueue') as mockSqsJobQueue:
+            with patch.dict('os.environ', {'JOB_QUEUE_URL': 'https://sqs.example.com/queue'}):
+                ecsPresenter = EcsPresenter(self.event, True)
+            statusCode, response = ecsPresenter.run()
+
+        self.assertEqual(200, statusCode)
+        mockSqsJobQueue.assert_called_once_with('https://sqs.example.com/queue')
+        mockSqsJobQueue.return_value.send.assert_called_once_with({'inputFile': f'InProgress/{self.key}'})
+        self.mockGetClient.return_value.run_task.assert_not_called()
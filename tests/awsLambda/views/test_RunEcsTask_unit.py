@@ -7,6 +7,7 @@ from awsLambda.presenters.EcsPresenter import EcsPresenter
 from awsLambda.presenters.Validator import Validator
 from awsLambda.views.RunEcsTask import RunEcsTask
 from common.models.EnvVar import EnvVar
+from common.models.services.BugReporterFacade import BugReporterFacade
 from common.Names import SUBDOMAIN
 
 class TestRunEcsTaskUnit(unittest.TestCase):
@@ -14,7 +15,7 @@ class TestRunEcsTaskUnit(unittest.TestCase):
 
     def setUp(self):
         """Sets up the test case."""
-        patcher = patch('awsLambda.views.RunEcsTask.EcsPresenter')
+        patcher = patch('awsLambda.presenters.EcsPresenter.EcsPresenter')
         self.addCleanup(patcher.stop)
         mockEcsPresenter = patcher.start()
 
@@ -112,3 +113,15 @@ class TestRunEcsTaskUnit(unittest.TestCase):
         self.mockEcsPresenterInstance.run.assert_called_once()
 
         EnvVar.delete()
+
+    def test_run_flushesBugReports(self):
+        """Ensure the _run method waits for queued bug reports, even when the presenter raises."""
+        self.mockEcsPresenterInstance.run.side_effect = Exception('An uncaught exception occurred.')
+
+        with patch('common.models.services.BugReporterFacade.BugReporterFacade.flush') as mockFlush:
+            with self.assertRaises(Exception):
+                self.runEcsTask._run()
+
+        mockFlush.assert_called_once_with(BugReporterFacade.HANDLER_FLUSH_TIMEOUT)
+
+        EnvVar.delete()
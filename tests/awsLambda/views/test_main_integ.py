@@ -35,16 +35,17 @@ class TestLambdaIntegration(unittest.TestCase):
             Key=self.testFileKey
         )
 
-        mockClient = Mock()
-        mockClient.return_value.list_task_definitions.return_value = {'taskDefinitionArns': ['fakeArn']}
-        mockClient.return_value.describe_security_groups.return_value = {'SecurityGroups': [{'GroupId': 'fakeGroupId'}]}
+        mockGetClient = Mock()
+        mockGetClient.return_value.list_task_definitions.return_value = {'taskDefinitionArns': ['fakeArn']}
+        mockGetClient.return_value.describe_security_groups.return_value = {'SecurityGroups': [{'GroupId': 'fakeGroupId'}]}
 
-        self.patcher = patch('boto3.client', mockClient)
-        self.patcher.start()
+        self.patcher = patch('awsLambda.presenters.EcsPresenter.AwsSession')
+        self.patcher.start().return_value.getClient = mockGetClient
 
-        patcher = patch('awsLambda.presenters.EcsPresenter.BugReporter')
+        patcher = patch('awsLambda.presenters.EcsPresenter.BugReporterFacade')
         self.addCleanup(patcher.stop)
-        self.mockBugReporter = patcher.start()
+        self.mockBugReporterFacade = patcher.start()
+        self.mockBugReporterFacade.describeError.return_value = ('title', 'description')
 
         origin = f'https://{SUBDOMAIN}.{"rll" if self.TEST_ENV == "prd" else "rll-dev"}.byu.edu'
         self.mockEvent = {
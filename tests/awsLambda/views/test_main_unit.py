@@ -0,0 +1,102 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+currentDir = os.path.dirname(os.path.realpath(__file__))
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(currentDir))), 'src')
+
+def profileImports(code: str, env: dict = None) -> tuple[list[tuple[str, int, int]], str]:
+    """Runs code in a fresh interpreter with `-X importtime` and parses the import profile.
+
+    Args:
+        code (str): Python code to run, with `src` on the path
+        env (dict, optional): extra environment variables for the interpreter; defaults to none
+
+    Returns:
+        tuple[list[tuple[str, int, int]], str]:
+            list[tuple[str, int, int]]: name, self time and cumulative time (in microseconds) of each imported module
+            str: what the code printed
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True,
+        text=True,
+        cwd=SRC_DIR,
+        env={**os.environ, 'PYTHONPATH': SRC_DIR, **(env or {})},
+        check=True
+    )
+    profile = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        selfTime, cumulative, name = line[len('import time:'):].split('|')
+        profile.append((name.strip(), int(selfTime), int(cumulative)))
+    return profile, result.stdout
+
+def formatProfile(profile: list[tuple[str, int, int]], top: int = 15) -> str:
+    """Formats the slowest imports of a profile as a report.
+
+    Args:
+        profile (list[tuple[str, int, int]]): profile from `profileImports`
+        top (int, optional): number of modules to include; defaults to 15
+
+    Returns:
+        str: the report
+    """
+    lines = [f'{"cumulative [us]":>16} | {"self [us]":>10} | module']
+    for name, selfTime, cumulative in sorted(profile, key=lambda module: module[2], reverse=True)[:top]:
+        lines.append(f'{cumulative:>16} | {selfTime:>10} | {name}')
+    return '\n'.join(lines)
+
+class TestMainUnit(unittest.TestCase):
+    """Unit tests the cold start cost of the Lambda handler module.
+
+    Run this file directly to print its import profile.
+    """
+
+    MAX_IMPORT_SECONDS = 0.25
+    MAX_MODULES = 75
+    DEFERRED_MODULES = ['boto3', 'botocore', 'PyBugReporter', 'pandas']
+
+    def test_importBudget(self):
+        """Tests if importing the handler stays within the time and module budgets."""
+        # Act
+        profile, stdout = profileImports(
+            'import sys\n'
+            'before = set(sys.modules)\n'
+            'import awsLambda.views.main\n'
+            'print(len(set(sys.modules) - before))'
+        )
+
+        # Assert
+        report = formatProfile(profile)
+        handlerTime = next(cumulative for name, _, cumulative in profile if name == 'awsLambda.views.main')
+        self.assertLessEqual(handlerTime / 1e6, self.MAX_IMPORT_SECONDS, f'Handler import is too slow:\n{report}')
+        self.assertLessEqual(int(stdout), self.MAX_MODULES, f'Handler imports too many modules:\n{report}')
+        for name, _, _ in profile:
+            self.assertNotIn(name.split('.')[0], self.DEFERRED_MODULES, f'{name} is imported eagerly:\n{report}')
+
+    def test_forbiddenRequest(self):
+        """Tests if a request rejected by validation never imports the AWS SDK."""
+        # Arrange
+        event = {'headers': {'origin': 'https://not.allowed.com'}, 'body': '{"inputFile": "key"}'}
+
+        # Act
+        _, stdout = profileImports(
+            'import json, sys\n'
+            'from awsLambda.views.main import handle_runEcsTask\n'
+            f'response = handle_runEcsTask({event!r}, {{}})\n'
+            'print(json.dumps([response["statusCode"], sorted(name for name in sys.modules if name.startswith(("boto3", "botocore")))]))',
+            {'ENV': 'stg'}
+        )
+
+        # Assert
+        statusCode, awsModules = json.loads(stdout.splitlines()[-1])
+        self.assertEqual(403, statusCode)
+        self.assertEqual([], awsModules)
+
+if __name__ == '__main__':
+    profile, _ = profileImports('import awsLambda.views.main')
+    print(formatProfile(profile))
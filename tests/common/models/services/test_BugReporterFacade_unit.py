@@ -0,0 +1,128 @@
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+from common.models.services.BugReporterFacade import BugReporterFacade
+from common.Names import PROJECT_NAME
+
+class TestBugReporterFacadeUnit(unittest.TestCase):
+    """Unit tests for BugReporterFacade."""
+
+    def setUp(self):
+        """Sets up the test case."""
+        patcher = patch('PyBugReporter.src.BugReporter.BugReporter')
+        self.addCleanup(patcher.stop)
+        self.mockBugReporter = patcher.start()
+
+        patcher = patch('common.models.services.BugReporterFacade.ParameterService')
+        self.addCleanup(patcher.stop)
+        self.mockParameterService = patcher.start()
+        self.mockParameterService.return_value.getGithubCredentials.return_value = 'token'
+
+        BugReporterFacade.setVars(False)
+        BugReporterFacade._configured = False
+
+    def tearDown(self):
+        """Tears down the test case."""
+        BugReporterFacade.flush(5)
+
+    def test_report(self):
+        """Tests if reports are sent in the background and credentials are fetched only once."""
+        # Act
+        BugReporterFacade.report('title1', 'description1')
+        BugReporterFacade.report('title2', 'description2')
+        flushed = BugReporterFacade.flush(5)
+
+        # Assert
+        self.assertTrue(flushed)
+        self.mockParameterService.assert_called_once()
+        self.mockBugReporter.setVars.assert_called_once_with('token', PROJECT_NAME, 'byuawsfhtl', False)
+        self.mockBugReporter.manualBugReport.assert_any_call('title1', 'description1')
+        self.mockBugReporter.manualBugReport.assert_any_call('title2', 'description2')
+
+    def test_report_test(self):
+        """Tests if nothing is sent, and no credentials are fetched, in test mode."""
+        # Arrange
+        BugReporterFacade.setVars(True)
+
+        # Act
+        with redirect_stdout(None):
+            BugReporterFacade.report('title', 'description')
+        BugReporterFacade.flush(5)
+
+        # Assert
+        self.mockParameterService.assert_not_called()
+        self.mockBugReporter.manualBugReport.assert_not_called()
+
+    def test_report_sendFails(self):
+        """Tests if a report that fails to send doesn't stop later reports."""
+        # Arrange
+        self.mockBugReporter.manualBugReport.side_effect = [Exception('GitHub is down'), None]
+
+        # Act
+        with redirect_stdout(None):
+            BugReporterFacade.report('title1', 'description1')
+            BugReporterFacade.report('title2', 'description2')
+            BugReporterFacade.flush(5)
+
+        # Assert
+        self.assertEqual(2, self.mockBugReporter.manualBugReport.call_count)
+
+    def test_decorator(self):
+        """Tests if the decorator reports and re-raises exceptions."""
+        # Arrange
+        @BugReporterFacade(extraInfo=True, env='dev')
+        def fail(value):
+            raise ValueError(value)
+
+        # Act
+        with redirect_stdout(None):
+            with self.assertRaises(ValueError):
+                fail('bad value')
+            BugReporterFacade.flush(5)
+
+        # Assert
+        title, description = self.mockBugReporter.manualBugReport.call_args.args
+        self.assertIn('ValueError error with the fail function', title)
+        self.assertIn("Arguments: ('bad value',)", description)
+        self.assertIn("Extra Info: {'env': 'dev'}", description)
+
+    def test_decorator_noError(self):
+        """Tests if the decorator returns the function's result without setting up reporting."""
+        # Arrange
+        @BugReporterFacade(extraInfo=True)
+        def succeed():
+            return 'result'
+
+        # Act
+        actual = succeed()
+
+        # Assert
+        self.assertEqual('result', actual)
+        self.mockParameterService.assert_not_called()
+
+    def test_describeError(self):
+        """Tests if describeError describes an exception after the except block that caught it."""
+        # Arrange
+        def fail():
+            raise ValueError('bad value')
+        try:
+            fail()
+        except ValueError as e:
+            error = e
+
+        # Act
+        title, description = BugReporterFacade.describeError(error)
+
+        # Assert
+        self.assertIn('ValueError error with the fail function', title)
+        self.assertIn("raise ValueError('bad value')", description)
+
+    def test_describeError_notRaised(self):
+        """Tests if describeError describes an exception that was never raised."""
+        # Act
+        title, description = BugReporterFacade.describeError(ValueError('bad value'))
+
+        # Assert
+        self.assertIn('ValueError error with the unknown function', title)
+        self.assertIn('Error text: bad value', description)
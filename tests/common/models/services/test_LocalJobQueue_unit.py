@@ -0,0 +1,72 @@
+import time
+import unittest
+
+from common.models.services.LocalJobQueue import LocalJobQueue
+
+class TestLocalJobQueueUnit(unittest.TestCase):
+    """Unit tests for LocalJobQueue."""
+
+    def setUp(self):
+        """Sets up the test case."""
+        self.jobQueue = LocalJobQueue()
+
+    def test_receive(self):
+        """Tests if received jobs are hidden from later receives until deleted or timed out."""
+        # Arrange
+        self.jobQueue.send({'inputFile': 'a'})
+        self.jobQueue.send({'inputFile': 'b'})
+
+        # Act
+        first = self.jobQueue.receive(1, 0, 60)
+        second = self.jobQueue.receive(5, 0, 60)
+        third = self.jobQueue.receive(5, 0, 60)
+
+        # Assert
+        self.assertEqual([{'inputFile': 'a'}], [job.body for job in first])
+        self.assertEqual([{'inputFile': 'b'}], [job.body for job in second])
+        self.assertEqual([], third)
+        self.assertEqual(2, len(self.jobQueue))
+
+    def test_receive_waits(self):
+        """Tests if receive waits for a hidden job to become visible again."""
+        # Arrange
+        self.jobQueue.send({'inputFile': 'a'})
+        first = self.jobQueue.receive(1, 0, 0.1)
+
+        # Act
+        start = time.monotonic()
+        second = self.jobQueue.receive(1, 5, 60)
+
+        # Assert
+        self.assertEqual(first[0].id, second[0].id)
+        self.assertNotEqual(first[0].receipt, second[0].receipt)
+        self.assertLess(time.monotonic() - start, 5)
+
+    def test_delete(self):
+        """Tests if delete removes a job, but not with a receipt that has been replaced."""
+        # Arrange
+        self.jobQueue.send({'inputFile': 'a'})
+        stale = self.jobQueue.receive(1, 0, 0)[0]
+        current = self.jobQueue.receive(1, 0, 60)[0]
+
+        # Act
+        self.jobQueue.delete(stale)
+        lenAfterStale = len(self.jobQueue)
+        self.jobQueue.delete(current)
+
+        # Assert
+        self.assertEqual(1, lenAfterStale)
+        self.assertEqual(0, len(self.jobQueue))
+
+    def test_changeVisibility(self):
+        """Tests if a job released with a visibility of 0 can be received again right away."""
+        # Arrange
+        self.jobQueue.send({'inputFile': 'a'})
+        job = self.jobQueue.receive(1, 0, 60)[0]
+
+        # Act
+        self.jobQueue.changeVisibility(job, 0)
+        actual = self.jobQueue.receive(1, 0, 60)
+
+        # Assert
+        self.assertEqual([job.id], [received.id for received in actual])
@@ -1,10 +1,15 @@
+import json
+import os
+import tempfile
+import time
 import unittest
 from unittest.mock import Mock, patch
 
+from common.models.EnvVar import EnvVar
 from common.models.services.ParameterService import ParameterService
 
 class TestParameterServiceUnit(unittest.TestCase):
-    """Unit tests for S3Dao."""
+    """Unit tests for ParameterService."""
 
     def setUp(self):
         """Sets up the test case."""
@@ -12,25 +17,41 @@ class TestParameterServiceUnit(unittest.TestCase):
         self.addCleanup(patcher.stop)
         mockAwsSession = patcher.start()
 
-        mockAwsSessionInstance = Mock()  # S3Dao receives instance when calling AwsSession()
+        mockAwsSessionInstance = Mock()  # ParameterService receives instance when calling AwsSession()
         mockAwsSession.return_value = mockAwsSessionInstance
         
         self.mockClient = Mock()
         config = {
-            'getSession.return_value.client.return_value': self.mockClient
+            'getClient.return_value': self.mockClient
         }
         mockAwsSessionInstance.configure_mock(**config)
 
+        self.mockClient.get_parameters.return_value = {
+            'Parameters': [
+                {
+                    'Name': ParameterService.PYFS_PARAMETER_NAME,
+                    'Value': '{"username":"DataFinder","password":"fakepass"}'
+                },
+                {
+                    'Name': ParameterService.GITHUB_PARAMETER_NAME,
+                    'Value': 'test-value'
+                }
+            ]
+        }
+
+        ParameterService.cache.invalidate()
+        ParameterService.cache.hits = 0
+        ParameterService.cache.misses = 0
         self.parameterService = ParameterService()
 
+    def tearDown(self):
+        """Tears down the test case."""
+        ParameterService.cache.invalidate()
+        EnvVar.delete()
+
     def test_getPyFSCredentials(self):
-        """Tests if getPyFSCredentials calls get_parameter with the correct parameters."""
+        """Tests if getPyFSCredentials returns the parsed PyFS credentials."""
         # Arrange
-        self.mockClient.get_parameter.return_value = {
-            'Parameter': {
-                'Value': '{"username":"DataFinder","password":"fakepass"}'
-            }
-        }
         expected = {
             'username': 'DataFinder',
             'password': 'fakepass'
@@ -43,16 +64,117 @@ class TestParameterServiceUnit(unittest.TestCase):
         self.assertEqual(actual, expected)
 
     def test_getGithubCredentials(self):
-        """Tests if getGithubCredentials calls get_parameter with the correct parameters."""
+        """Tests if getGithubCredentials returns the Github token."""
+        # Act
+        actual = self.parameterService.getGithubCredentials()
+
+        # Assert
+        self.assertEqual(actual, 'test-value')
+
+    def test_prefetch(self):
+        """Tests if the first lookup fetches every known parameter with a single call."""
+        # Act
+        self.parameterService.getGithubCredentials()
+        self.parameterService.getPyFSCredentials()
+        ParameterService().getGithubCredentials()
+
+        # Assert
+        self.mockClient.get_parameters.assert_called_once_with(
+            Names=ParameterService.KNOWN_PARAMETER_NAMES,
+            WithDecryption=True
+        )
+        self.mockClient.get_parameter.assert_not_called()
+        self.assertEqual(self.parameterService.getCacheStats(), {'hits': 2, 'misses': 1})
+
+    def test_getParameter_unknown(self):
+        """Tests if a parameter that is not known is fetched on its own and cached."""
         # Arrange
-        self.mockClient.get_parameter.return_value = {
-            'Parameter': {
-                'Value': 'test-value'
-            }
-        }
+        self.mockClient.get_parameter.return_value = {'Parameter': {'Name': 'other', 'Value': 'other-value'}}
+
+        # Act
+        self.parameterService._getParameter('other')
+        actual = self.parameterService._getParameter('other')
+
+        # Assert
+        self.assertEqual(actual['Value'], 'other-value')
+        self.mockClient.get_parameter.assert_called_once_with(Name='other', WithDecryption=True)
+        self.mockClient.get_parameters.assert_not_called()
+
+    def test_getParameter_missingKnownParameter(self):
+        """Tests if a known parameter missing from the batch response is fetched on its own."""
+        # Arrange
+        self.mockClient.get_parameters.return_value = {'Parameters': []}
+        self.mockClient.get_parameter.return_value = {'Parameter': {'Value': 'test-value'}}
 
         # Act
         actual = self.parameterService.getGithubCredentials()
 
         # Assert
         self.assertEqual(actual, 'test-value')
+        self.mockClient.get_parameter.assert_called_once_with(
+            Name=ParameterService.GITHUB_PARAMETER_NAME,
+            WithDecryption=True
+        )
+
+    def test_cacheFile(self):
+        """Tests if parameters are persisted to the cache file and reused by a fresh cache."""
+        with tempfile.TemporaryDirectory() as tempDir:
+            cacheFile = os.path.join(tempDir, 'parameters.json')
+            with patch.dict('os.environ', {'PARAMETER_CACHE_FILE': cacheFile}):
+                # Act
+                ParameterService().getGithubCredentials()
+                ParameterService.cache.invalidate()
+                actual = ParameterService().getGithubCredentials()
+
+            # Assert
+            self.assertEqual(actual, 'test-value')
+            self.mockClient.get_parameters.assert_called_once()
+            self.assertEqual(os.stat(cacheFile).st_mode & 0o777, 0o600)
+            with open(cacheFile) as file:
+                self.assertIn(ParameterService.GITHUB_PARAMETER_NAME, json.load(file)['parameters'])
+
+    def test_cacheFile_cacheNotEmpty(self):
+        """Tests if the cache file isn't read over parameters already in the class-level cache."""
+        with tempfile.TemporaryDirectory() as tempDir:
+            cacheFile = os.path.join(tempDir, 'parameters.json')
+            with open(cacheFile, 'w') as file:
+                json.dump({'storedAt': time.time(), 'parameters': {ParameterService.GITHUB_PARAMETER_NAME: {'Value': 'old'}}}, file)
+            ParameterService.cache.set(ParameterService.GITHUB_PARAMETER_NAME, {'Value': 'fresh'})
+
+            with patch.dict('os.environ', {'PARAMETER_CACHE_FILE': cacheFile}):
+                with patch('builtins.open', wraps=open) as mockOpen:
+                    # Act
+                    actual = ParameterService().getGithubCredentials()
+
+            # Assert
+            self.assertEqual(actual, 'fresh')
+            mockOpen.assert_not_called()
+
+    def test_cacheFile_expired(self):
+        """Tests if an expired cache file is ignored."""
+        with tempfile.TemporaryDirectory() as tempDir:
+            cacheFile = os.path.join(tempDir, 'parameters.json')
+            with open(cacheFile, 'w') as file:
+                json.dump({'storedAt': 0, 'parameters': {ParameterService.GITHUB_PARAMETER_NAME: {'Value': 'old'}}}, file)
+
+            with patch.dict('os.environ', {'PARAMETER_CACHE_FILE': cacheFile}):
+                # Act
+                actual = ParameterService().getGithubCredentials()
+
+            # Assert
+            self.assertEqual(actual, 'test-value')
+            self.mockClient.get_parameters.assert_called_once()
+
+    def test_cacheFile_invalid(self):
+        """Tests if an unreadable cache file is ignored."""
+        with tempfile.TemporaryDirectory() as tempDir:
+            cacheFile = os.path.join(tempDir, 'parameters.json')
+            with open(cacheFile, 'w') as file:
+                file.write('not json')
+
+            with patch.dict('os.environ', {'PARAMETER_CACHE_FILE': cacheFile}):
+                # Act
+                actual = ParameterService().getGithubCredentials()
+
+            # Assert
+            self.assertEqual(actual, 'test-value')
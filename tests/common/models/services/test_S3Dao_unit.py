@@ -1,5 +1,7 @@
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call, patch
+
+from botocore.exceptions import ClientError
 
 from common.models.services.S3Dao import S3Dao
 
@@ -17,14 +19,14 @@ class TestS3DaoUnit(unittest.TestCase):
 
         self.mockClient = Mock()
         config = {
-            'getSession.return_value.client.return_value': self.mockClient
+            'getClient.return_value': self.mockClient
         }
         mockAwsSessionInstance.configure_mock(**config)
 
         self.s3Dao = S3Dao()
 
     def test_moveFile(self):
-        """Tests if moveFile calls copy_object and delete_object with the correct parameters."""
+        """Tests if moveFile looks up the file, copies it only if it still has the same ETag, then deletes it."""
         self.mockClient.copy_object.assert_not_called()
         self.mockClient.delete_object.assert_not_called()
 
@@ -33,19 +35,252 @@ class TestS3DaoUnit(unittest.TestCase):
         oldKey = 'test-key'
         destBucket = 'test-bucket'
         destKey = 'test-key'
+        self.mockClient.head_object.return_value = {'ContentLength': 100, 'ETag': '"test-etag"'}
 
         # Act
-        self.s3Dao.moveFile(oldBucket, oldKey, destBucket, destKey)
+        _, _, timings = self.s3Dao.moveFile(oldBucket, oldKey, destBucket, destKey)
 
         # Assert
+        self.mockClient.head_object.assert_called_once_with(Bucket=oldBucket, Key=oldKey)
         self.mockClient.copy_object.assert_called_once_with(
             Bucket=destBucket,
             Key=destKey,
             CopySource={
                 'Bucket': oldBucket,
                 'Key': oldKey
-            }
+            },
+            CopySourceIfMatch='"test-etag"'
         )
         self.mockClient.delete_object.assert_called_once_with(Bucket=oldBucket, Key=oldKey)
+        self.assertEqual(['head', 'copy', 'delete'], list(timings))
+
+    def test_moveFile_multipart(self):
+        """Tests if moveFile copies files over the single request limit in parts, each only if the file is unchanged."""
+        # Arrange
+        self._setUpMultipartCopy()
+
+        # Act
+        self.s3Dao.moveFile('old-bucket', 'old-key', 'dest-bucket', 'dest-key')
+
+        # Assert
+        self.mockClient.head_object.assert_called_once_with(Bucket='old-bucket', Key='old-key')
+        self.mockClient.create_multipart_upload.assert_called_once_with(
+            Bucket='dest-bucket', Key='dest-key', ContentType='text/csv', ContentEncoding='zstd', Metadata={'source': 'test'}
+        )
+        self.mockClient.copy_object.assert_not_called()
+        self.assertEqual(3, self.mockClient.upload_part_copy.call_count)
+        self.assertTrue(all(c.kwargs['CopySourceIfMatch'] == '"test-etag"' for c in self.mockClient.upload_part_copy.call_args_list))
+        self.mockClient.complete_multipart_upload.assert_called_once()
+        self.mockClient.delete_object.assert_called_once_with(Bucket='old-bucket', Key='old-key')
+
+    def test_moveFile_lookupFails(self):
+        """Tests if moveFile copies and deletes nothing when the file can't be looked up."""
+        # Arrange
+        self.mockClient.head_object.side_effect = ClientError({'Error': {'Code': '404'}}, 'HeadObject')
+
+        # Act & Assert
+        with self.assertRaises(ClientError):
+            self.s3Dao.moveFile('test-bucket', 'test-key', 'test-bucket', 'new-key')
+
+        self.mockClient.copy_object.assert_not_called()
+        self.mockClient.delete_object.assert_not_called()
 
-    # moveFile has no failure states that aren't also AWS failure states
+    def test_moveFile_copyFails(self):
+        """Tests if moveFile keeps the original file when it changed before it was copied."""
+        # Arrange
+        self.mockClient.head_object.return_value = {'ContentLength': 100, 'ETag': '"test-etag"'}
+        self.mockClient.copy_object.side_effect = ClientError({'Error': {'Code': 'PreconditionFailed'}}, 'CopyObject')
+
+        # Act & Assert
+        with self.assertRaises(ClientError):
+            self.s3Dao.moveFile('test-bucket', 'test-key', 'test-bucket', 'new-key')
+
+        self.mockClient.delete_object.assert_not_called()
+
+    def test_moveFiles(self):
+        """Tests if moveFiles copies each file and deletes the copied ones in batches, reporting each file's error."""
+        # Arrange
+        self.s3Dao.MAX_DELETE_BATCH = 2
+        def headObject(Bucket, Key):
+            if 'missing' in Key:
+                raise ClientError({'Error': {'Code': '404'}}, 'HeadObject')
+            return {'ContentLength': 100, 'ETag': f'"{Key}"'}
+        self.mockClient.head_object.side_effect = headObject
+        self.mockClient.delete_objects.side_effect = [
+            {},
+            {'Errors': [{'Key': 'ToDo/c.csv', 'Code': 'AccessDenied', 'Message': 'Access Denied'}]}
+        ]
+        keys = {f'ToDo/{name}': f'InProgress/{name}' for name in ['a.csv', 'missing.csv', 'b.csv', 'c.csv']}
+
+        # Act
+        results, timings = self.s3Dao.moveFiles('test-bucket', 'test-bucket', keys)
+
+        # Assert
+        self.assertEqual(list(keys), list(results))
+        self.assertIsNone(results['ToDo/a.csv'])
+        self.assertIsNone(results['ToDo/b.csv'])
+        self.assertEqual('404', results['ToDo/missing.csv'].response['Error']['Code'])
+        self.assertEqual('AccessDenied', results['ToDo/c.csv'].response['Error']['Code'])
+        self.assertEqual(3, self.mockClient.copy_object.call_count)
+        self.mockClient.copy_object.assert_any_call(
+            Bucket='test-bucket', Key='InProgress/a.csv', CopySource={'Bucket': 'test-bucket', 'Key': 'ToDo/a.csv'},
+            CopySourceIfMatch='"ToDo/a.csv"'
+        )
+        self.assertEqual([
+            call(Bucket='test-bucket', Delete={'Objects': [{'Key': 'ToDo/a.csv'}, {'Key': 'ToDo/b.csv'}], 'Quiet': True}),
+            call(Bucket='test-bucket', Delete={'Objects': [{'Key': 'ToDo/c.csv'}], 'Quiet': True})
+        ], self.mockClient.delete_objects.call_args_list)
+        self.mockClient.delete_object.assert_not_called()
+        self.assertEqual(['copy', 'delete'], list(timings))
+
+    def test_moveFiles_sameDestination(self):
+        """Tests if moveFiles fails a file whose destination is taken by an earlier file without copying or deleting it."""
+        # Arrange
+        self.mockClient.head_object.return_value = {'ContentLength': 100, 'ETag': '"test-etag"'}
+        self.mockClient.delete_objects.return_value = {}
+        keys = {'ToDo/a/x.csv': 'InProgress/x.csv', 'ToDo/b/x.csv': 'InProgress/x.csv', 'ToDo/y.csv': 'InProgress/y.csv'}
+
+        # Act
+        results, timings = self.s3Dao.moveFiles('test-bucket', 'test-bucket', keys)
+
+        # Assert
+        self.assertEqual(list(keys), list(results))
+        self.assertIsNone(results['ToDo/a/x.csv'])
+        self.assertIsNone(results['ToDo/y.csv'])
+        self.assertIsInstance(results['ToDo/b/x.csv'], ValueError)
+        self.assertEqual(2, self.mockClient.copy_object.call_count)
+        self.mockClient.delete_objects.assert_called_once_with(
+            Bucket='test-bucket',
+            Delete={'Objects': [{'Key': 'ToDo/a/x.csv'}, {'Key': 'ToDo/y.csv'}], 'Quiet': True}
+        )
+
+    def test_listFiles(self):
+        """Tests if listFiles collects keys from every page and skips folder placeholders."""
+        # Arrange
+        self.mockClient.get_paginator.return_value.paginate.return_value = [
+            {'Contents': [{'Key': 'ToDo/'}, {'Key': 'ToDo/a.csv'}]},
+            {'Contents': [{'Key': 'ToDo/b.csv'}]},
+            {}
+        ]
+
+        # Act
+        actual = self.s3Dao.listFiles('test-bucket', 'ToDo/')
+
+        # Assert
+        self.assertEqual(['ToDo/a.csv', 'ToDo/b.csv'], actual)
+        self.mockClient.get_paginator.assert_called_once_with('list_objects_v2')
+        self.mockClient.get_paginator.return_value.paginate.assert_called_once_with(Bucket='test-bucket', Prefix='ToDo/')
+
+    def test_copyFile(self):
+        """Tests if copyFile uses a single copy_object call for small files."""
+        # Act
+        self.s3Dao.copyFile('old-bucket', 'old-key', 'dest-bucket', 'dest-key', size=100)
+
+        # Assert
+        self.mockClient.head_object.assert_not_called()
+        self.mockClient.copy_object.assert_called_once_with(
+            Bucket='dest-bucket',
+            Key='dest-key',
+            CopySource={
+                'Bucket': 'old-bucket',
+                'Key': 'old-key'
+            }
+        )
+        self.mockClient.create_multipart_upload.assert_not_called()
+
+    def test_copyFile_etag(self):
+        """Tests if copyFile only copies the file if it still has the given ETag."""
+        # Act
+        self.s3Dao.copyFile('old-bucket', 'old-key', 'dest-bucket', 'dest-key', size=100, etag='"test-etag"')
+
+        # Assert
+        self.mockClient.copy_object.assert_called_once_with(
+            Bucket='dest-bucket',
+            Key='dest-key',
+            CopySource={
+                'Bucket': 'old-bucket',
+                'Key': 'old-key'
+            },
+            CopySourceIfMatch='"test-etag"'
+        )
+
+    def test_copyFile_noSize(self):
+        """Tests if copyFile looks up the file size when it is not given."""
+        # Arrange
+        self.mockClient.head_object.return_value = {'ContentLength': 100}
+
+        # Act
+        self.s3Dao.copyFile('old-bucket', 'old-key', 'dest-bucket', 'dest-key')
+
+        # Assert
+        self.mockClient.head_object.assert_called_once_with(Bucket='old-bucket', Key='old-key')
+        self.mockClient.copy_object.assert_called_once()
+
+    def _setUpMultipartCopy(self):
+        """Helper function to allow tiny copy parts and fake multipart copy responses."""
+        self.s3Dao.MAX_COPY_SIZE = 10
+        self.mockClient.head_object.return_value = {
+            'ContentLength': 11,
+            'ETag': '"test-etag"',
+            'ContentType': 'text/csv',
+            'ContentEncoding': 'zstd',
+            'Metadata': {'source': 'test'},
+            'LastModified': 'yesterday'
+        }
+        self.s3Dao.DEFAULT_COPY_PART_SIZE = 4
+        self.mockClient.create_multipart_upload.return_value = {'UploadId': 'test-upload-id'}
+        self.mockClient.upload_part_copy.side_effect = lambda **kwargs: {
+            'CopyPartResult': {'ETag': f'etag-{kwargs["PartNumber"]}'}
+        }
+
+    def test_copyFile_multipart(self):
+        """Tests if copyFile copies files over the single request limit in parallel parts."""
+        # Arrange
+        self._setUpMultipartCopy()
+
+        # Act
+        self.s3Dao.copyFile('old-bucket', 'old-key', 'dest-bucket', 'dest-key', size=11)
+
+        # Assert
+        self.mockClient.copy_object.assert_not_called()
+        ranges = sorted((c.kwargs['PartNumber'], c.kwargs['CopySourceRange']) for c in self.mockClient.upload_part_copy.call_args_list)
+        self.assertEqual(ranges, [(1, 'bytes=0-3'), (2, 'bytes=4-7'), (3, 'bytes=8-10')])
+        self.mockClient.complete_multipart_upload.assert_called_once_with(
+            Bucket='dest-bucket',
+            Key='dest-key',
+            UploadId='test-upload-id',
+            MultipartUpload={'Parts': [
+                {'PartNumber': 1, 'ETag': 'etag-1'},
+                {'PartNumber': 2, 'ETag': 'etag-2'},
+                {'PartNumber': 3, 'ETag': 'etag-3'}
+            ]}
+        )
+
+    def test_copyFile_multipart_fields(self):
+        """Tests if a multipart copy gives the new file the original's Content-Type, Content-Encoding and metadata."""
+        # Arrange
+        self._setUpMultipartCopy()
+
+        # Act
+        self.s3Dao.copyFile('old-bucket', 'old-key', 'dest-bucket', 'dest-key', size=11)
+
+        # Assert
+        self.mockClient.head_object.assert_called_once_with(Bucket='old-bucket', Key='old-key')
+        self.mockClient.create_multipart_upload.assert_called_once_with(
+            Bucket='dest-bucket', Key='dest-key', ContentType='text/csv', ContentEncoding='zstd', Metadata={'source': 'test'}
+        )
+
+    def test_copyFile_multipartFails(self):
+        """Tests if copyFile aborts a multipart copy when a part fails."""
+        # Arrange
+        self._setUpMultipartCopy()
+        self.mockClient.upload_part_copy.side_effect = RuntimeError('copy failed')
+
+        # Act & Assert
+        with self.assertRaises(RuntimeError):
+            self.s3Dao.copyFile('old-bucket', 'old-key', 'dest-bucket', 'dest-key', size=11)
+
+        self.mockClient.abort_multipart_upload.assert_called_once_with(
+            Bucket='dest-bucket', Key='dest-key', UploadId='test-upload-id'
+        )
+        self.mockClient.complete_multipart_upload.assert_not_called()
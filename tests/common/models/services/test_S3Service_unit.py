@@ -1,6 +1,8 @@
 import unittest
 from unittest.mock import Mock, patch
 
+from botocore.exceptions import ClientError
+
 from common.models.EnvVar import EnvVar
 from common.models.services.S3Dao import S3Dao
 from common.models.services.S3Service import S3Service
@@ -33,3 +35,39 @@ class TestS3ServiceUnit(unittest.TestCase):
         self.mockS3DaoInstance.moveFile.assert_called_once_with(
             self.s3Service.dataBucketName, oldKey, self.s3Service.dataBucketName, newKey
         )
+
+    def test_moveFile_FileNotFoundError(self):
+        """Ensure the moveFile method raises FileNotFoundError when the file can't be found."""
+        self.mockS3DaoInstance.moveFile.side_effect = ClientError({'Error': {'Code': '404'}}, 'HeadObject')
+
+        with self.assertRaises(FileNotFoundError):
+            self.s3Service.moveFile('ToDo/fileName.csv', 'InProgress/fileName.csv')
+
+    def test_moveFile_PreconditionFailed(self):
+        """Ensure the moveFile method re-raises the error when the file changed while it was moved."""
+        self.mockS3DaoInstance.moveFile.side_effect = ClientError({'Error': {'Code': 'PreconditionFailed'}}, 'CopyObject')
+
+        with self.assertRaises(ClientError):
+            self.s3Service.moveFile('ToDo/fileName.csv', 'InProgress/fileName.csv')
+
+    def test_moveFiles(self):
+        """Ensure the moveFiles method moves files within the data bucket, reporting missing ones as FileNotFoundError."""
+        keys = {'ToDo/a.csv': 'InProgress/a.csv', 'ToDo/b.csv': 'InProgress/b.csv'}
+        missing = ClientError({'Error': {'Code': 'NoSuchKey'}}, 'CopyObject')
+        self.mockS3DaoInstance.moveFiles.return_value = ({'ToDo/a.csv': None, 'ToDo/b.csv': missing}, {'copy': 0.1, 'delete': 0.2})
+
+        results, timings = self.s3Service.moveFiles(keys)
+
+        self.assertIsNone(results['ToDo/a.csv'])
+        self.assertIsInstance(results['ToDo/b.csv'], FileNotFoundError)
+        self.assertEqual({'copy': 0.1, 'delete': 0.2}, timings)
+        self.mockS3DaoInstance.moveFiles.assert_called_once_with(self.s3Service.dataBucketName, self.s3Service.dataBucketName, keys)
+
+    def test_listFiles(self):
+        """Ensure the listFiles method lists files in the data bucket."""
+        self.mockS3DaoInstance.listFiles.return_value = ['ToDo/a.csv']
+
+        actual = self.s3Service.listFiles('ToDo/')
+
+        self.assertEqual(['ToDo/a.csv'], actual)
+        self.mockS3DaoInstance.listFiles.assert_called_once_with(self.s3Service.dataBucketName, 'ToDo/')
@@ -0,0 +1,74 @@
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import Mock, patch
+
+from common.models.Job import Job
+from common.models.services.SqsJobQueue import SqsJobQueue
+
+class TestSqsJobQueueUnit(unittest.TestCase):
+    """Unit tests for SqsJobQueue."""
+
+    def setUp(self):
+        """Sets up the test case."""
+        patcher = patch('common.models.services.SqsJobQueue.AwsSession')
+        self.addCleanup(patcher.stop)
+        mockAwsSession = patcher.start()
+
+        self.mockClient = Mock()
+        mockAwsSession.return_value.getClient.return_value = self.mockClient
+
+        self.queueUrl = 'https://sqs.example.com/queue'
+        self.jobQueue = SqsJobQueue(self.queueUrl)
+
+    def test_send(self):
+        """Tests if send sends the body as JSON."""
+        # Act
+        self.jobQueue.send({'inputFile': 'a'})
+
+        # Assert
+        self.mockClient.send_message.assert_called_once_with(QueueUrl=self.queueUrl, MessageBody='{"inputFile": "a"}')
+
+    def test_receive(self):
+        """Tests if receive long polls within SQS's limits and parses the messages."""
+        # Arrange
+        self.mockClient.receive_message.return_value = {'Messages': [
+            {'MessageId': '1', 'Body': '{"inputFile": "a"}', 'ReceiptHandle': 'r1'},
+            {'MessageId': '2', 'Body': 'not json', 'ReceiptHandle': 'r2'}
+        ]}
+
+        # Act
+        with redirect_stdout(None):
+            actual = self.jobQueue.receive(50, 60, 300)
+
+        # Assert
+        self.mockClient.receive_message.assert_called_once_with(
+            QueueUrl=self.queueUrl,
+            MaxNumberOfMessages=10,
+            WaitTimeSeconds=20,
+            VisibilityTimeout=300
+        )
+        self.assertEqual([('1', {'inputFile': 'a'}, 'r1'), ('2', {}, 'r2')], [(job.id, job.body, job.receipt) for job in actual])
+
+    def test_receive_empty(self):
+        """Tests if receive returns no jobs when no messages arrived."""
+        # Arrange
+        self.mockClient.receive_message.return_value = {}
+
+        # Act
+        actual = self.jobQueue.receive(1, 1, 300)
+
+        # Assert
+        self.assertEqual([], actual)
+
+    def test_deleteAndChangeVisibility(self):
+        """Tests if delete and changeVisibility use the job's receipt."""
+        # Arrange
+        job = Job('1', {}, 'r1')
+
+        # Act
+        self.jobQueue.changeVisibility(job, 0)
+        self.jobQueue.delete(job)
+
+        # Assert
+        self.mockClient.change_message_visibility.assert_called_once_with(QueueUrl=self.queueUrl, ReceiptHandle='r1', VisibilityTimeout=0)
+        self.mockClient.delete_message.assert_called_once_with(QueueUrl=self.queueUrl, ReceiptHandle='r1')
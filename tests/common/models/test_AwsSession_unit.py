@@ -0,0 +1,64 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+from common.models.AwsSession import AwsSession
+
+class TestAwsSessionUnit(unittest.TestCase):
+    """Unit tests for the Singleton AwsSession class."""
+
+    def setUp(self):
+        """Sets up the test case with a mock boto3 session."""
+        if hasattr(AwsSession, 'instance'):
+            del AwsSession.instance
+
+        patcher = patch('common.models.AwsSession.boto3.Session')
+        self.addCleanup(patcher.stop)
+        self.mockSession = patcher.start().return_value
+        self.mockSession.client.side_effect = lambda **kwargs: Mock()
+
+    def tearDown(self):
+        """Removes the instance so other tests get a real session."""
+        del AwsSession.instance
+
+    def test_new(self):
+        """Tests if multiple initializations return the same instance."""
+        self.assertIs(AwsSession(), AwsSession())
+
+    def test_getClient(self):
+        """Tests if getClient creates a client once and reuses it afterwards."""
+        client1 = AwsSession().getClient('s3')
+        client2 = AwsSession().getClient('s3')
+
+        self.assertIs(client1, client2)
+        self.mockSession.client.assert_called_once()
+        kwargs = self.mockSession.client.call_args.kwargs
+        self.assertEqual(kwargs['service_name'], 's3')
+        self.assertEqual(kwargs['region_name'], AwsSession.AWS_REGION)
+        self.assertEqual(kwargs['config'].max_pool_connections, AwsSession.DEFAULT_MAX_POOL_CONNECTIONS)
+        self.assertTrue(kwargs['config'].tcp_keepalive)
+
+    def test_getClient_differentKeys(self):
+        """Tests if getClient caches clients separately by service, region and config."""
+        awsSession = AwsSession()
+
+        clients = [
+            awsSession.getClient('s3'),
+            awsSession.getClient('ssm'),
+            awsSession.getClient('s3', regionName='us-east-1'),
+            awsSession.getClient('s3', maxPoolConnections=2),
+            awsSession.getClient('s3', retries={'max_attempts': 2})
+        ]
+
+        self.assertEqual(len(set(map(id, clients))), 5)
+        self.assertIs(awsSession.getClient('s3', retries={'max_attempts': 2}), clients[4])
+
+    def test_getClient_threads(self):
+        """Tests if concurrent getClient calls share a single client."""
+        awsSession = AwsSession()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            clients = list(executor.map(lambda _: awsSession.getClient('s3'), range(32)))
+
+        self.assertEqual(len(set(map(id, clients))), 1)
+        self.mockSession.client.assert_called_once()
@@ -50,6 +50,19 @@ class TestEnvVarUnit(unittest.TestCase):
         with self.assertRaises(ImproperlyConfigured):
             envVar['invalid key']
 
+    def test_get(self):
+        """Tests if envVar get method returns the correct value for a set variable."""
+        envVar = EnvVar()
+
+        self.assertEqual(envVar.get('ENV', 'default'), os.environ['ENV'])
+
+    def test_get_default(self):
+        """Tests if envVar get method returns the default for an unset variable."""
+        envVar = EnvVar()
+
+        self.assertEqual(envVar.get('invalid key', 'default'), 'default')
+        self.assertIsNone(envVar.get('invalid key'))
+
     def test_delete(self):
         """Tests if envVar class method deletes instance attribute."""
         envVar = EnvVar()
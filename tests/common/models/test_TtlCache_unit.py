@@ -0,0 +1,109 @@
+import threading
+import time
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import Mock, patch
+
+from common.models.TtlCache import TtlCache
+
+class TestTtlCacheUnit(unittest.TestCase):
+    """Unit tests for TtlCache."""
+
+    def setUp(self):
+        """Sets up the test case with a controllable clock."""
+        patcher = patch('common.models.TtlCache.monotonic')
+        self.addCleanup(patcher.stop)
+        self.mockMonotonic = patcher.start()
+        self.mockMonotonic.return_value = 0
+
+        self.ttlCache = TtlCache(ttl=10, refreshAfter=5)
+
+    def test_get(self):
+        """Tests if get loads a missing value once and then serves it from the cache."""
+        loader = Mock(return_value='value')
+
+        self.assertEqual(self.ttlCache.get('key', loader), 'value')
+        self.assertEqual(self.ttlCache.get('key', loader), 'value')
+
+        loader.assert_called_once()
+        self.assertEqual(self.ttlCache.hits, 1)
+        self.assertEqual(self.ttlCache.misses, 1)
+
+    def test_get_expired(self):
+        """Tests if get reloads a value once it is older than the time to live."""
+        loader = Mock(side_effect=['old', 'new'])
+        self.ttlCache.get('key', loader)
+
+        self.mockMonotonic.return_value = 10
+
+        self.assertEqual(self.ttlCache.get('key', loader), 'new')
+        self.assertEqual(self.ttlCache.misses, 2)
+
+    def test_get_backgroundRefresh(self):
+        """Tests if get serves a stale value while it is reloaded in the background."""
+        self.ttlCache.set('key', 'old')
+        refreshed = threading.Event()
+        def loader():
+            refreshed.set()
+            return 'new'
+
+        self.mockMonotonic.return_value = 6
+        self.assertEqual(self.ttlCache.get('key', loader), 'old')
+        self.assertTrue(refreshed.wait(5))
+
+        for _ in range(100): # wait for the background thread to store the value
+            if self.ttlCache.get('key', Mock()) == 'new':
+                break
+            time.sleep(0.01)
+        self.assertEqual(self.ttlCache.get('key', Mock()), 'new')
+
+    def test_get_backgroundRefreshFails(self):
+        """Tests if a failed background refresh keeps the current value."""
+        self.ttlCache.set('key', 'old')
+        done = threading.Event()
+        def loader():
+            done.set()
+            raise RuntimeError('refresh failed')
+
+        self.mockMonotonic.return_value = 6
+        with redirect_stdout(None):
+            self.assertEqual(self.ttlCache.get('key', loader), 'old')
+            self.assertTrue(done.wait(5))
+
+        self.assertEqual(self.ttlCache.get('key', Mock(return_value='unused')), 'old')
+
+    def test_invalidate(self):
+        """Tests if invalidate removes a single value."""
+        self.ttlCache.set('key', 'value')
+        self.ttlCache.set('other', 'value')
+
+        self.ttlCache.invalidate('key')
+
+        self.assertEqual(self.ttlCache.get('key', Mock(return_value='new')), 'new')
+        self.assertEqual(self.ttlCache.get('other', Mock()), 'value')
+
+    def test_invalidate_all(self):
+        """Tests if invalidate without a key removes every value."""
+        self.ttlCache.set('key', 'value')
+        self.ttlCache.set('other', 'value')
+
+        self.ttlCache.invalidate()
+
+        self.assertEqual(self.ttlCache.get('key', Mock(return_value='new')), 'new')
+        self.assertEqual(self.ttlCache.get('other', Mock(return_value='new')), 'new')
+
+    def test_len(self):
+        """Tests if len counts the values in the cache."""
+        self.assertEqual(0, len(self.ttlCache))
+        self.ttlCache.set('key', 'value')
+        self.ttlCache.set('other', 'value')
+
+        self.assertEqual(2, len(self.ttlCache))
+
+    def test_set_age(self):
+        """Tests if a value stored with an age expires that much sooner."""
+        self.ttlCache.set('key', 'old', age=8)
+
+        self.mockMonotonic.return_value = 2
+
+        self.assertEqual(self.ttlCache.get('key', Mock(return_value='new')), 'new')